@@ -233,6 +233,7 @@ from arkouda.numpy import (
     maxk,
     mean,
     median,
+    merge_sorted,
     min,
     mink,
     mod,
@@ -303,6 +304,7 @@ from arkouda.numpy import (
     take,
     tan,
     tanh,
+    top_k_frequent,
     tile,
     timeclass,
     timedelta64,
@@ -363,7 +365,18 @@ from arkouda.client import (
     shutdown,
 )
 from arkouda.client_dtypes import BitVector, BitVectorizer, Fields, IPv4, ip_address, is_ipv4, is_ipv6
-from arkouda.groupbyclass import GROUPBY_REDUCTION_TYPES, GroupBy, broadcast, groupable, unique
+from arkouda.groupbyclass import (
+    GROUPBY_REDUCTION_TYPES,
+    GroupBy,
+    GroupByCacheInfo,
+    broadcast,
+    clear_groupby_cache,
+    disable_groupby_cache,
+    enable_groupby_cache,
+    groupable,
+    groupby_cache_info,
+    unique,
+)
 from arkouda.categorical import Categorical
 from arkouda.logger import LogLevel, disableVerbose, enableVerbose, write_log
 from arkouda.infoclass import (
@@ -382,8 +395,12 @@ from arkouda.dataframe import (
     intx,
     invert_permutation,
     merge,
+    merge_asof,
 )
 from arkouda.index import Index, MultiIndex
+from arkouda.hashmap import HashMap
+from arkouda.bloomfilter import BloomFilter
+from arkouda.lazyframe import Expr, LazyFrame, LazyGroupBy, col, scan_hdf, scan_parquet
 from arkouda.alignment import (
     NonUniqueError,
     align,
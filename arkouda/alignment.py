@@ -177,7 +177,31 @@ class NonUniqueError(ValueError):
     pass
 
 
-def find(query, space, all_occurrences=False, remove_missing=False):
+def _find_hashed(query, space, all_occurrences, remove_missing):
+    """Find query items in space by probing a hash table of space."""
+    from arkouda.index import _HashLookup
+
+    queries = [query] if isinstance(query, (pdarray, Strings)) else list(query)
+    table = _HashLookup([space] if isinstance(space, (pdarray, Strings)) else list(space))
+    if table.has_duplicates():
+        if all_occurrences:
+            if len(queries) > 1:
+                raise TypeError("finding all_occurrences is not yet supported on sequences of arrays")
+
+            from arkouda.numpy.segarray import SegArray
+
+            counts, rows = table.occurrences(queries)
+            return SegArray(cumsum(counts) - counts, rows)
+        else:
+            warn(
+                "Duplicate terms present in search space. Only first instance of each query term"
+                " will be reported. To return all occurrences, set all_occurrences=True."
+            )
+    pda = table.first(queries)
+    return pda[pda != -1] if remove_missing else pda
+
+
+def find(query, space, all_occurrences=False, remove_missing=False, method="auto"):
     """
     Return indices of query items in a search list of items.
 
@@ -196,6 +220,12 @@ def find(query, space, all_occurrences=False, remove_missing=False):
         If all_occurrences is True, remove_missing is automatically enabled.
         If False, return -1 for any items in query not found in space. If True,
         remove these and only return indices of items that are found.
+    method : {"auto", "hash", "sort"}, default="auto"
+        "hash" builds a hash table of space on the server and probes it with
+        query. "sort" groups space and query together with a GroupBy, which
+        sorts both. "auto" uses "hash" unless the arguments are Categoricals
+        or bigint arrays, or pdarrays of different dtypes, which only "sort"
+        supports.
 
     Returns
     -------
@@ -207,6 +237,22 @@ def find(query, space, all_occurrences=False, remove_missing=False):
         the space. If all_occurrences is True, remove_missing is automatically enabled.
         If remove_missing is True, exclude missing values, otherwise return -1.
 
+    Raises
+    ------
+    TypeError
+        Raised if query and space have different types, or are sequences of
+        arrays with different dtypes, or if method is "hash" and it does not
+        support them
+    ValueError
+        Raised if method is not "auto", "hash" or "sort"
+
+    Notes
+    -----
+    With the hash method, keys other than a single array of integers are
+    compared by their 128-bit hash, as GroupBy compares Strings and multi-array
+    keys, and each lookup costs one pass over space and query instead of a
+    sort of both.
+
     Examples
     --------
     >>> import arkouda as ak
@@ -257,13 +303,14 @@ def find(query, space, all_occurrences=False, remove_missing=False):
      [0, 4]]
 
     """
-    # Concatenate the space and query in fast (block interleaved) mode
+    if method not in ("auto", "hash", "sort"):
+        raise ValueError(f"Unexpected value of {method} for method. Must be 'auto', 'hash' or 'sort'")
     if isinstance(query, (pdarray, Strings, Categorical)):
         if type(query) is not type(space):
             raise TypeError("Arguments must have same type")
-        c = concatenate((space, query), ordered=False)
         spacesize = space.size
         querysize = query.size
+        keys = [query, space]
     else:
         if len(query) != len(space):
             raise TypeError("Multi-array arguments must have same number of arrays")
@@ -277,6 +324,22 @@ def find(query, space, all_occurrences=False, remove_missing=False):
         btypes = np.array([bi.dtype for bi in space])
         if not (atypes == btypes).all():
             raise TypeError("Array dtypes of arguments must match")
+        keys = list(query) + list(space)
+
+    hashable = all(
+        isinstance(k, Strings) or (isinstance(k, pdarray) and k.dtype != bigint) for k in keys
+    )
+    if isinstance(query, pdarray) and query.dtype != space.dtype:
+        hashable = False
+    if method == "hash" and not hashable:
+        raise TypeError("The hash method does not support these arguments; use method='sort'")
+    if method != "sort" and hashable:
+        return _find_hashed(query, space, all_occurrences, remove_missing)
+
+    # Concatenate the space and query in fast (block interleaved) mode
+    if isinstance(query, (pdarray, Strings, Categorical)):
+        c = concatenate((space, query), ordered=False)
+    else:
         c = [concatenate((si, qi), ordered=False) for si, qi in zip(space, query)]
     # Combined index of space and query elements, in block interleaved order
     # All space indices are less than all query indices
@@ -758,6 +821,9 @@ def is_cosorted(arrays):
     # fail fast if the first array isn't sorted
     if not arrays[0].is_sorted():
         return False
+    # a strictly increasing first array decides the order by itself
+    if len(arrays) == 1 or arrays[0].is_known_unique:
+        return True
 
     # initialize the array to track boundary
     boundary = arrays[0][:-1] != arrays[0][1:]
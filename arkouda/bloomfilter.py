@@ -0,0 +1,205 @@
+"""
+Bloom filters for arkouda.
+
+A ``BloomFilter`` is a compact, probabilistic set of the rows of one or more
+arrays, kept on the server with a full copy on every locale. Testing keys
+against it takes one pass over the keys with no communication, and never
+misses a key that is in the set, so it cheaply rules out most of the keys of
+an ``in1d`` whose test set is very large and rarely matched.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, List, Optional, Sequence, Union, cast
+
+from arkouda.client import generic_msg
+from arkouda.index import _HashLookup
+from arkouda.numpy.dtypes import bigint
+from arkouda.numpy.pdarrayclass import create_pdarray, pdarray
+from arkouda.numpy.pdarraycreation import arange
+from arkouda.numpy.strings import Strings
+
+__all__ = ["BloomFilter"]
+
+
+class BloomFilter:
+    """
+    A Bloom filter of the rows of one or more arrays.
+
+    Parameters
+    ----------
+    values : pdarray, Strings, or sequence of pdarray and Strings
+        The set of values, as one array or as several arrays of equal size
+        whose rows are the values
+    fp_rate : float
+        The target rate of false positives, between 0 and 1 exclusive
+
+    Attributes
+    ----------
+    values : List[Union[pdarray, Strings]]
+        The arrays the filter was built from
+    size : int
+        The number of values
+    fp_rate : float
+        The target rate of false positives
+    nbits : int
+        The number of bits of the filter
+    nhash : int
+        The number of bits set for each value
+
+    Raises
+    ------
+    TypeError
+        Raised if the values are not pdarray or Strings, or are bigint
+    ValueError
+        Raised if the arrays differ in size or fp_rate is not between 0 and 1
+
+    See Also
+    --------
+    arkouda.in1d
+
+    Notes
+    -----
+    The filter is sized for ``size`` values as ``nbits = -size * ln(fp_rate) / ln(2)**2``
+    and ``nhash = nbits / size * ln(2)``, about 10 bits per value for a 1%
+    rate, and every locale holds all ``nbits`` bits. Values are keyed as in
+    ``ak.find``: a single array of integers by its values, and anything else
+    by its 128-bit ``ak.hash``.
+
+    ``contains`` may report values that are not in the set; ``in1d`` checks
+    the values that pass the filter against a hash table of the set, which is
+    built on its first call and reused by later ones.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> bf = ak.BloomFilter(ak.arange(0, 1000, 10))
+    >>> bf.in1d(ak.array([10, 15, 990]))
+    array([True False True])
+    >>> bf.contains(ak.array([10, 990]))
+    array([True True])
+
+    """
+
+    values: List[Union[pdarray, Strings]]
+    size: int
+    fp_rate: float
+    nbits: int
+    nhash: int
+
+    def __init__(
+        self,
+        values: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+        fp_rate: float = 0.01,
+    ) -> None:
+        levels = [values] if isinstance(values, (pdarray, Strings)) else list(values)
+        if len(levels) == 0:
+            raise ValueError("BloomFilter requires at least one array")
+        for v in levels:
+            if not isinstance(v, (pdarray, Strings)):
+                raise TypeError("BloomFilter values must be pdarray or Strings")
+            if isinstance(v, pdarray) and v.dtype == bigint:
+                raise TypeError("BloomFilter values cannot be bigint")
+        if any(v.size != levels[0].size for v in levels):
+            raise ValueError("All arrays must be the same size")
+        if not 0 < fp_rate < 1:
+            raise ValueError("fp_rate must be between 0 and 1")
+        self.values = levels
+        self.size = int(levels[0].size)
+        self.fp_rate = fp_rate
+        n = max(self.size, 1)
+        nwords = max(1, math.ceil(-n * math.log(fp_rate) / math.log(2) ** 2 / 64))
+        self.nbits = 64 * nwords
+        self.nhash = max(1, round(self.nbits / n * math.log(2)))
+        self._kinds = [_HashLookup._kind(v) for v in levels]
+        self._build()
+        self._table: Optional[_HashLookup] = None
+
+    def _build(self) -> None:
+        self._versions = [getattr(v, "_version", None) for v in self.values]
+        keys = _HashLookup._keys(self.values)
+        args: Dict[str, Any] = {"nkeys": len(keys), "nwords": self.nbits // 64, "nhash": self.nhash}
+        args.update({f"key{i}": k for i, k in enumerate(keys)})
+        self._words = create_pdarray(cast(str, generic_msg(cmd="buildBloomFilter", args=args)))
+
+    def _args(self, values) -> List[Union[pdarray, Strings]]:
+        args = [values] if isinstance(values, (pdarray, Strings)) else list(values)
+        if not _HashLookup._compatible(self._kinds, args):
+            raise TypeError("values must match the number and types of the arrays of the filter")
+        if any(getattr(v, "_version", None) != ver for v, ver in zip(self.values, self._versions)):
+            # the values were modified in place since the filter was built
+            self._build()
+            self._table = None
+        return args
+
+    def __len__(self) -> int:
+        return int(self.size)
+
+    def __repr__(self) -> str:
+        return f"BloomFilter(size={self.size}, nbits={self.nbits}, nhash={self.nhash})"
+
+    def contains(self, values: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]]) -> pdarray:
+        """
+        Whether each value may be in the set.
+
+        Parameters
+        ----------
+        values : pdarray, Strings, or sequence of pdarray and Strings
+            The values to test, with the same number and types of arrays as
+            the filter
+
+        Returns
+        -------
+        pdarray, bool
+            False where the value is certainly not in the set, and True where
+            it is in the set or is a false positive
+
+        Raises
+        ------
+        TypeError
+            Raised if the values do not match the arrays of the filter
+
+        """
+        keys = _HashLookup._keys(self._args(values))
+        args: Dict[str, Any] = {
+            "nkeys": len(keys),
+            "filter": self._words,
+            "nwords": self.nbits // 64,
+            "nhash": self.nhash,
+        }
+        args.update({f"key{i}": k for i, k in enumerate(keys)})
+        return create_pdarray(cast(str, generic_msg(cmd="probeBloomFilter", args=args)))
+
+    def in1d(
+        self,
+        values: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+        invert: bool = False,
+    ) -> pdarray:
+        """
+        Whether each value is in the set, exactly.
+
+        The filter rules out most values that are not in the set; only those
+        that pass it are looked up in a hash table of the set.
+
+        Parameters
+        ----------
+        values : pdarray, Strings, or sequence of pdarray and Strings
+            The values to test
+        invert : bool
+            If True, return whether each value is not in the set
+
+        Returns
+        -------
+        pdarray, bool
+            The same as ``ak.in1d(values, self.values)``
+
+        """
+        args = self._args(values)
+        truth = self.contains(args)
+        candidates = arange(truth.size)[truth]
+        if candidates.size > 0:
+            if self._table is None:
+                self._table = _HashLookup(self.values)
+            truth[candidates] = self._table.first([a[candidates] for a in args]) >= 0
+        return ~truth if invert else truth
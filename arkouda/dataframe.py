@@ -27,30 +27,38 @@ from typeguard import typechecked
 from arkouda.categorical import Categorical
 from arkouda.client import generic_msg, maxTransferBytes
 from arkouda.client_dtypes import BitVector, Fields, IPv4
-from arkouda.groupbyclass import GROUPBY_REDUCTION_TYPES, GroupBy, unique
+from arkouda.groupbyclass import (
+    GROUPBY_REDUCTION_TYPES,
+    GroupBy,
+    _groupby_cache,
+    unique,
+)
 from arkouda.index import Index, MultiIndex
 from arkouda.numpy import cast as akcast
-from arkouda.numpy import cumsum, where
+from arkouda.numpy import cumsum, hash, where
 from arkouda.numpy.dtypes import _is_dtype_in_union, bigint
 from arkouda.numpy.dtypes import bool_ as akbool
 from arkouda.numpy.dtypes import float64 as akfloat64
+from arkouda.numpy.dtypes import get_server_byteorder
 from arkouda.numpy.dtypes import int64 as akint64
 from arkouda.numpy.dtypes import numeric_scalars
 from arkouda.numpy.dtypes import uint64 as akuint64
 from arkouda.numpy.pdarrayclass import RegistrationError, pdarray
 from arkouda.numpy.pdarraycreation import arange, array, create_pdarray, full, zeros
 from arkouda.numpy.pdarraysetops import concatenate, in1d, intersect1d
-from arkouda.numpy.sorting import argsort, coargsort
+from arkouda.numpy.sorting import _top_n_mask, argsort, coargsort, merge_sorted
 from arkouda.numpy.sorting import sort as aksort
 from arkouda.numpy.strings import Strings
 from arkouda.numpy.timeclass import Datetime, Timedelta
-from arkouda.pandas.join import inner_join
+from arkouda.pandas.join import _hash_join, inner_join
 from arkouda.pandas.row import Row
 
 if TYPE_CHECKING:
+    from arkouda.lazyframe import LazyFrame
     from arkouda.numpy.segarray import SegArray
     from arkouda.pandas.series import Series
 else:
+    LazyFrame = TypeVar("LazyFrame")
     Series = TypeVar("Series")
     SegArray = TypeVar("SegArray")
 
@@ -66,6 +74,7 @@ __all__ = [
     "invert_permutation",
     "intx",
     "merge",
+    "merge_asof",
 ]
 
 
@@ -167,10 +176,46 @@ class DataFrameGroupBy:
         else:
             return self.df.data[c][self.where_not_nan]
 
+    def _aggregate_columns(self, colnames, agg, allow_bigint=True):
+        # helper applying agg (a function from a column to one value per group)
+        # to the numeric, non-key columns in colnames
+        numerical_dtypes = [akfloat64, akint64, akuint64] + ([bigint] if allow_bigint else [])
+
+        if colnames is None:
+            colnames = list(self.df.data.keys())
+        elif isinstance(colnames, str):
+            colnames = [colnames]
+        colnames = [
+            c
+            for c in colnames
+            if self.df.data[c].dtype in numerical_dtypes
+            and (
+                (isinstance(self.gb_key_names, str) and (c != self.gb_key_names))
+                or (isinstance(self.gb_key_names, list) and c not in self.gb_key_names)
+            )
+        ]
+
+        if isinstance(colnames, List):
+            if isinstance(self.gb_key_names, str):
+                return DataFrame(
+                    {c: agg(self._get_df_col(c)) for c in colnames},
+                    index=Index(self.gb.unique_keys, name=self.gb_key_names),
+                )
+            elif isinstance(self.gb_key_names, list) and len(self.gb_key_names) == 1:
+                return DataFrame(
+                    {c: agg(self._get_df_col(c)) for c in colnames},
+                    index=Index(self.gb.unique_keys, name=self.gb_key_names[0]),
+                )
+            elif isinstance(self.gb_key_names, list):
+                column_dict = dict(zip(self.gb_key_names, self.unique_keys))
+                for c in colnames:
+                    column_dict[c] = agg(self._get_df_col(c))
+                return DataFrame(column_dict)
+            else:
+                return None
+
     @classmethod
     def _make_aggop(cls, opname):
-        numerical_dtypes = [akfloat64, akint64, akuint64]
-
         def aggop(self, colnames=None):
             """
             Aggregate the operation, with the grouped column(s) values as keys.
@@ -185,41 +230,48 @@ class DataFrameGroupBy:
             DataFrame
 
             """
-            if colnames is None:
-                colnames = list(self.df.data.keys())
-            elif isinstance(colnames, str):
-                colnames = [colnames]
-            colnames = [
-                c
-                for c in colnames
-                if ((self.df.data[c].dtype in numerical_dtypes) or self.df.data[c].dtype == bigint)
-                and (
-                    (isinstance(self.gb_key_names, str) and (c != self.gb_key_names))
-                    or (isinstance(self.gb_key_names, list) and c not in self.gb_key_names)
-                )
-            ]
-
-            if isinstance(colnames, List):
-                if isinstance(self.gb_key_names, str):
-                    return DataFrame(
-                        {c: self.gb.aggregate(self._get_df_col(c), opname)[1] for c in colnames},
-                        index=Index(self.gb.unique_keys, name=self.gb_key_names),
-                    )
-                elif isinstance(self.gb_key_names, list) and len(self.gb_key_names) == 1:
-                    return DataFrame(
-                        {c: self.gb.aggregate(self._get_df_col(c), opname)[1] for c in colnames},
-                        index=Index(self.gb.unique_keys, name=self.gb_key_names[0]),
-                    )
-                elif isinstance(self.gb_key_names, list):
-                    column_dict = dict(zip(self.gb_key_names, self.unique_keys))
-                    for c in colnames:
-                        column_dict[c] = self.gb.aggregate(self._get_df_col(c), opname)[1]
-                    return DataFrame(column_dict)
-                else:
-                    return None
+            return self._aggregate_columns(colnames, lambda col: self.gb.aggregate(col, opname)[1])
 
         return aggop
 
+    def quantile(self, q=0.5, colnames=None):
+        """
+        Compute the q-th quantile of each group's values, with the grouped column(s) values as keys.
+
+        Parameters
+        ----------
+        q : float, default=0.5
+            Quantile to compute, between 0 and 1 inclusive.
+        colnames : (list of) str, default=None
+            Column name or list of column names to compute the quantile over.
+
+        Returns
+        -------
+        DataFrame
+
+        See Also
+        --------
+        arkouda.groupbyclass.GroupBy.quantile
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> df = ak.DataFrame({"A":[1,2,1,2,1],"B":[1,2,3,4,5]})
+        >>> df.groupby("A").quantile(0.25)
+
+        +----+-----+
+        |  A |   B |
+        +====+=====+
+        |  1 | 2   |
+        +----+-----+
+        |  2 | 2.5 |
+        +----+-----+
+
+        """
+        return self._aggregate_columns(
+            colnames, lambda col: self.gb.quantile(col, q)[1], allow_bigint=False
+        )
+
     def size(self, as_series=None, sort_index=True):
         """
         Compute the size of each value as the total number of rows, including NaN values.
@@ -1041,6 +1093,18 @@ class DataFrame(UserDict):
                 self._set_index(index)
             self.update_nrows()
 
+    @property
+    def data(self):
+        """The columns of the DataFrame keyed by name, with any deferred appends applied."""
+        if self.__dict__.get("_pending_appends"):
+            self.compact()
+        return self.__dict__["_data"]
+
+    @data.setter
+    def data(self, value):
+        self.__dict__["_data"] = value
+        self.__dict__["_pending_appends"] = []
+
     def __getattr__(self, key):
         from arkouda.pandas.series import Series
 
@@ -1073,15 +1137,9 @@ class DataFrame(UserDict):
         if isinstance(key, Series):
             key = key.values
 
-        # Select rows using an integer pdarray
+        # Select rows using an integer or boolean pdarray
         if isinstance(key, pdarray):
-            if key.dtype == akbool:
-                key = arange(key.size)[key]
-            result = {}
-            for k in self._columns:
-                result[k] = UserDict.__getitem__(self, k)[key]
-            # To stay consistent with numpy, provide the old index values
-            return DataFrame(initialdata=result, index=self.index.index[key])
+            return self._take(key)
 
         # Select rows or columns using a list
         if isinstance(key, (list, tuple)):
@@ -1123,7 +1181,7 @@ class DataFrame(UserDict):
             s = key
             for k in self._columns:
                 rtn_data[k] = UserDict.__getitem__(self, k)[s]
-            return DataFrame(initialdata=rtn_data, index=self.index.index[arange(self._nrows)[s]])
+            return DataFrame(initialdata=rtn_data, index=self.index[s])
         else:
             raise IndexError("Invalid selector: unknown error.")
 
@@ -1170,6 +1228,9 @@ class DataFrame(UserDict):
                 raise ValueError(f"Expected size {self._nrows} but received size {value.size}.")
             else:
                 self._empty = False
+                if key in self.data:
+                    # GroupBy objects cached for the replaced column are now unreachable
+                    _groupby_cache.invalidate(self.data[key])
                 UserDict.__setitem__(self, key, value)
                 # Update the index values
                 if key not in self._columns:
@@ -1441,7 +1502,7 @@ class DataFrame(UserDict):
         return self._columns
 
     @classmethod
-    def from_pandas(cls, pd_df):
+    def from_pandas(cls, pd_df, engine="default"):
         """
         Copy the data from a pandas DataFrame into a new arkouda.dataframe.DataFrame.
 
@@ -1449,11 +1510,21 @@ class DataFrame(UserDict):
         ----------
         pd_df : pandas.DataFrame
             A pandas DataFrame to convert.
+        engine : {"default", "arrow"}, default="default"
+            How the columns are sent to the server. "default" sends them one at a
+            time. "arrow" converts the frame to a pyarrow Table and sends the buffers
+            of all columns in one message (see :meth:`from_arrow`), which avoids
+            encoding string columns in Python.
 
         Returns
         -------
         DataFrame
 
+        Raises
+        ------
+        ValueError
+            Raised if engine is not "default" or "arrow"
+
         Examples
         --------
         >>> import arkouda as ak
@@ -1486,7 +1557,61 @@ class DataFrame(UserDict):
         +----+-----+-----+
 
         """
-        return DataFrame(initialdata=pd_df)
+        if engine == "default":
+            return DataFrame(initialdata=pd_df)
+        if engine != "arrow":
+            raise ValueError(f"engine must be 'default' or 'arrow', got {engine!r}")
+        import pyarrow as pa  # type: ignore
+
+        table = pa.Table.from_pandas(pd_df, preserve_index=False)
+        columns = _arrays_from_arrow(dict(zip(pd_df.columns, table.columns)))
+        return cls(columns, index=pd_df.index)
+
+    @classmethod
+    def from_arrow(cls, table):
+        """
+        Copy the data from a pyarrow Table into a new arkouda.dataframe.DataFrame.
+
+        The buffers of all columns are sent to the server in one message. String
+        columns become Strings, dictionary columns of strings Categoricals, list
+        columns of numbers SegArrays, and timestamp and duration columns Datetimes
+        and Timedeltas.
+
+        Parameters
+        ----------
+        table : pyarrow.Table
+            A pyarrow Table to convert.
+
+        Returns
+        -------
+        DataFrame
+
+        Raises
+        ------
+        TypeError
+            Raised if a column has an Arrow type with no arkouda equivalent
+        ValueError
+            Raised if a column other than a floating point or dictionary column
+            contains nulls
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> import pyarrow as pa
+        >>> table = pa.table({"A": [1, 2], "B": ["x", "y"]})
+        >>> display(ak.DataFrame.from_arrow(table))
+
+        +----+-----+-----+
+        |    |   A | B   |
+        +====+=====+=====+
+        |  0 |   1 | x   |
+        +----+-----+-----+
+        |  1 |   2 | y   |
+        +----+-----+-----+
+
+        """
+        return cls(_arrays_from_arrow(dict(zip(table.column_names, table.columns))))
 
     def _drop_column(self, keys):
         """
@@ -1627,13 +1752,19 @@ class DataFrame(UserDict):
         ----------
         subset : Iterable
             Iterable of column names to use to dedupe.
-        keep : {'first', 'last'}, default='first'
-            Determines which duplicates (if any) to keep.
+        keep : {'first', 'last', False}, default='first'
+            Determines which duplicates (if any) to keep. With False, all
+            duplicated rows are dropped.
 
         Returns
         -------
         DataFrame
-            DataFrame with duplicates removed.
+            DataFrame with duplicates removed, with the remaining rows in their
+            original order.
+
+        See Also
+        --------
+        duplicated
 
         Example
         -------
@@ -1668,27 +1799,71 @@ class DataFrame(UserDict):
         """
         if self._empty:
             return self
+        return self[~self.duplicated(subset, keep)]
 
-        if not subset:
-            subset = self._columns
+    def duplicated(self, subset=None, keep="first"):
+        """
+        Return a boolean mask of the rows that duplicate an earlier or later row.
 
-        if len(subset) == 1:
-            if subset[0] not in self.data:
-                raise KeyError(f"{subset[0]} is not a column in the DataFrame.")
-            gp = GroupBy(self.data[subset[0]])
+        Rows are compared by hashing the subset columns and looking the hashes up
+        in hash tables, without sorting. As in GroupBy, rows whose 128-bit hashes
+        are equal are treated as equal.
 
-        else:
-            for col in subset:
-                if col not in self.data:
-                    raise KeyError(f"{subset[0]} is not a column in the DataFrame.")
+        Parameters
+        ----------
+        subset : Iterable, optional
+            Iterable of column names to compare. By default, all columns are used.
+        keep : {'first', 'last', False}, default='first'
+            Which occurrence of each duplicated row is not marked. With False,
+            every occurrence is marked.
+
+        Returns
+        -------
+        pdarray
+            A bool pdarray that is True at the duplicated rows.
+
+        Raises
+        ------
+        KeyError
+            Raised if a subset column is not in the DataFrame
+        ValueError
+            Raised if keep is not 'first', 'last' or False
 
-            gp = GroupBy([self.data[col] for col in subset])
+        Example
+        -------
+        >>> df = ak.DataFrame({'col1': [1, 2, 2, 3, 2], 'col2': [4, 5, 5, 6, 5]})
+        >>> df.duplicated()
+        array([False False True False True])
+        >>> df.duplicated(keep="last")
+        array([False True True False False])
+        >>> df.duplicated(keep=False)
+        array([False True True False True])
 
-        if keep == "last":
-            _segment_ends = concatenate([gp.segments[1:] - 1, array([gp.permutation.size - 1])])
-            return self[gp.permutation[_segment_ends]]
+        """
+        if keep is False:
+            keep = "none"
+        elif keep not in ("first", "last"):
+            raise ValueError(f"keep must be 'first', 'last' or False, got {keep!r}")
+        if isinstance(subset, str):
+            subset = [subset]
+        elif not subset:
+            subset = self._columns
+        for col in subset:
+            if col not in self.data:
+                raise KeyError(f"{col} is not a column in the DataFrame.")
+
+        keys = [self.data[col] for col in subset]
+        if (
+            len(keys) == 1
+            and isinstance(keys[0], pdarray)
+            and keys[0].dtype in (akint64, akuint64, akbool)
+        ):
+            hashes = [akcast(keys[0], akuint64)]
         else:
-            return self[gp.permutation[gp.segments]]
+            hashes = list(hash(keys))
+        args = {"nkeys": len(hashes), "keep": keep}
+        args.update({f"key{i}": h for i, h in enumerate(hashes)})
+        return create_pdarray(generic_msg(cmd="hashDuplicated", args=args))
 
     @property
     def size(self):
@@ -1905,6 +2080,8 @@ class DataFrame(UserDict):
         Index(array([0 1]), dtype='int64')
 
         """
+        if self.__dict__.get("_pending_appends"):
+            self.compact()
         return self._index
 
     def _set_index(self, value):
@@ -2302,7 +2479,7 @@ class DataFrame(UserDict):
         else:
             raise RuntimeError("Rename expects index or columns to be specified.")
 
-    def append(self, other, ordered=True):
+    def append(self, other, ordered=True, defer=False):
         """
         Concatenate data from 'other' onto the end of this DataFrame, in place.
 
@@ -2320,6 +2497,12 @@ class DataFrame(UserDict):
             If False, allow rows to be interleaved for better performance (but
             data within a row remains together). By default, append all rows
             to the end, in input order.
+        defer: bool, default=False
+            If True, only record the columns of other, without copying any data.
+            The recorded batches are concatenated onto the columns in one pass by
+            :meth:`compact`, which runs the first time the columns or index are
+            read. Appending many small batches this way copies the DataFrame
+            once, rather than once per batch.
 
         Returns
         -------
@@ -2368,8 +2551,10 @@ class DataFrame(UserDict):
         if other.empty:
             return self
 
-        # Check all the columns to make sure they can be concatenated
-        self.update_nrows()
+        # Check all the columns to make sure they can be concatenated. Reading the
+        # columns of a frame with deferred appends would compact it.
+        if not (defer and self.__dict__["_pending_appends"]):
+            self.update_nrows()
 
         keyset = set(self._columns)
         keylist = list(self._columns)
@@ -2380,6 +2565,19 @@ class DataFrame(UserDict):
         # Keys don't match
         elif keyset != set(other._columns):
             raise KeyError("Key mismatch; keys must be identical in both DataFrames.")
+        elif defer:
+            # Record the batch, checking now for columns that cannot be concatenated
+            batch = {}
+            for key in keylist:
+                col = self.__dict__["_data"][key]
+                if type(col) is not type(other[key]):
+                    raise TypeError(
+                        f"Incompatible types for column {key}: {type(col)} vs {type(other[key])}"
+                    )
+                batch[key] = other[key]
+            self.__dict__["_pending_appends"].append((batch, ordered))
+            self._nrows += len(other)
+            return self
         # Keys do match
         else:
             tmp_data = {}
@@ -2399,6 +2597,65 @@ class DataFrame(UserDict):
         self._empty = False
         return self
 
+    def compact(self):
+        """
+        Apply the appends deferred by ``append(other, defer=True)``, in place.
+
+        The columns of all recorded batches are concatenated onto each column in
+        one concatenate, and the index is reset. This runs automatically the first
+        time the columns or index are read after a deferred append.
+
+        Returns
+        -------
+        self
+            Compaction occurs in-place, but the result is returned for chaining.
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df = ak.DataFrame({'col1': [1, 2], 'col2': [3, 4]})
+        >>> for i in range(3):
+        ...     df.append(ak.DataFrame({'col1': [i], 'col2': [i]}), defer=True)
+        >>> df.compact()
+
+        +----+--------+--------+
+        |    |   col1 |   col2 |
+        +====+========+========+
+        |  0 |      1 |      3 |
+        +----+--------+--------+
+        |  1 |      2 |      4 |
+        +----+--------+--------+
+        |  2 |      0 |      0 |
+        +----+--------+--------+
+        |  3 |      1 |      1 |
+        +----+--------+--------+
+        |  4 |      2 |      2 |
+        +----+--------+--------+
+
+        """
+        from arkouda.numpy.util import generic_concat as util_concatenate
+
+        pending = self.__dict__.get("_pending_appends")
+        if not pending:
+            return self
+        columns = self.__dict__["_data"]
+        # Clear the batches first, so that reading the columns below does not recurse
+        self.__dict__["_pending_appends"] = []
+        ordered = all(o for _, o in pending)
+        tmp_data = {}
+        for key in self._columns:
+            try:
+                tmp_data[key] = util_concatenate(
+                    [columns[key]] + [batch[key] for batch, _ in pending], ordered=ordered
+                )
+            except TypeError as e:
+                raise TypeError(f"Incompatible types for column {key}") from e
+        self.data = tmp_data
+        self.update_nrows()
+        self.reset_index(inplace=True)
+        return self
+
     @classmethod
     def concat(cls, items, ordered=True):
         """Essentially an append, but different formatting."""
@@ -2429,6 +2686,79 @@ class DataFrame(UserDict):
                 raise TypeError(f"Incompatible types for column {col}")
         return ret
 
+    @classmethod
+    def merge_sorted(cls, frames, on):
+        """
+        Combine DataFrames that are each sorted by the same column into one sorted DataFrame.
+
+        This is concat followed by sort_values(on), but merges the sorted
+        frames in one pass with ak.merge_sorted instead of sorting all their
+        rows again.
+
+        Parameters
+        ----------
+        frames : list of DataFrame
+            The DataFrames to combine, with the same columns, each sorted in
+            ascending order by `on`.
+        on : str or list of str
+            The column that every frame is sorted by (int64, uint64, float64,
+            Strings, Datetime, or Timedelta). With more than one column, the
+            combined rows are sorted with coargsort instead of merged.
+
+        Returns
+        -------
+        DataFrame
+            The rows of all frames, sorted by `on`, with the index labels
+            they had in their frames. Rows with equal keys keep the order of
+            their frames.
+
+        Raises
+        ------
+        KeyError
+            Raised if the frames have mismatched columns
+
+        See Also
+        --------
+        concat, sort_values, arkouda.numpy.sorting.merge_sorted
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> ak.connect()
+        >>> df1 = ak.DataFrame({'t': [1, 4, 7], 'v': [10, 40, 70]})
+        >>> df2 = ak.DataFrame({'t': [2, 4, 9], 'v': [20, 41, 90]})
+        >>> display(ak.DataFrame.merge_sorted([df1, df2], on='t'))
+
+        +----+-----+-----+
+        |    |   t |   v |
+        +====+=====+=====+
+        |  0 |   1 |  10 |
+        +----+-----+-----+
+        |  0 |   2 |  20 |
+        +----+-----+-----+
+        |  1 |   4 |  40 |
+        +----+-----+-----+
+        |  1 |   4 |  41 |
+        +----+-----+-----+
+        |  2 |   7 |  70 |
+        +----+-----+-----+
+        |  2 |   9 |  90 |
+        +----+-----+-----+
+
+        """
+        frames = [df for df in frames if not df.empty]
+        keys = [on] if isinstance(on, str) else list(on)
+        combined = cls.concat(frames)
+        if combined.empty:
+            return combined
+        # keep the index labels of the rows, which concat replaces with a fresh range
+        combined._set_index(reduce(lambda x, y: x.concat(y), [df.index for df in frames]))
+        if len(keys) == 1:
+            _, perm = merge_sorted([df[keys[0]] for df in frames])
+        else:
+            perm = combined.coargsort(keys)
+        return combined[perm]
+
     def head(self, n=5):
         """
         Return the first `n` rows.
@@ -2735,7 +3065,9 @@ class DataFrame(UserDict):
 
         from arkouda.groupbyclass import GroupBy as GroupBy_class
 
-        gb: Union[DataFrameGroupBy, GroupBy_class] = GroupBy_class(cols, dropna=dropna)
+        gb: Union[DataFrameGroupBy, GroupBy_class] = _groupby_cache.get(
+            cols, assume_sorted=False, dropna=dropna
+        )
         if use_series:
             gb = DataFrameGroupBy(gb, self, gb_key_names=keys, as_index=as_index)
         return gb
@@ -2975,9 +3307,14 @@ class DataFrame(UserDict):
             warn(msg, UserWarning)
             return None
 
-        # Proceed with conversion if possible
+        # Proceed with conversion if possible. Columns are transferred together
+        # as Arrow buffers where their types allow it.
+        arrow_data = _arrow_to_pandas({key: self[key] for key in self._columns})
         pandas_data = {}
         for key in self._columns:
+            if key in arrow_data:
+                pandas_data[key] = arrow_data[key]
+                continue
             val = self[key]
             try:
                 # in order for proper pandas functionality, SegArrays must be seen as 1d
@@ -3720,14 +4057,32 @@ class DataFrame(UserDict):
         return i
 
     def _reindex(self, idx):
-        if isinstance(self.index, MultiIndex):
-            new_index = MultiIndex(self.index[idx].values, name=self.index.name, names=self.index.names)
-        elif isinstance(self.index, Index):
-            new_index = Index(self.index[idx], name=self.index.name)
-        else:
-            new_index = Index(self.index[idx])
+        return self._take(idx)
 
-        return DataFrame(self[idx], index=new_index)
+    def _take(self, key: pdarray) -> DataFrame:
+        """
+        Select rows by a boolean mask or an integer index.
+
+        All columns and index levels are selected with a single server message,
+        which scans a boolean mask only once.
+        """
+        columns = [UserDict.__getitem__(self, k) for k in self._columns]
+        index = self.index
+        if isinstance(index, MultiIndex):
+            levels = list(index.levels)
+        elif isinstance(index, Index) and isinstance(index.values, (pdarray, Strings, Categorical)):
+            levels = [index.values]
+        else:
+            levels = []
+        taken = _take_rows(columns + levels, key)
+        new_index: Optional[Index]
+        if isinstance(index, MultiIndex):
+            new_index = MultiIndex(taken[len(columns) :], name=index.name, names=index.names)
+        elif levels:
+            new_index = Index(taken[len(columns)], name=index.name)
+        else:
+            new_index = None if index is None else index[key]
+        return DataFrame(initialdata=dict(zip(self._columns, taken)), index=new_index)
 
     def sort_index(self, ascending=True):
         """
@@ -3776,7 +4131,7 @@ class DataFrame(UserDict):
 
         return self._reindex(idx)
 
-    def sort_values(self, by=None, ascending=True):
+    def sort_values(self, by=None, ascending=True, limit=None):
         """
         Sort the DataFrame by one or more columns.
 
@@ -3790,10 +4145,15 @@ class DataFrame(UserDict):
             The name(s) of the column(s) to sort by.
         ascending : bool, default = True
             Sort values in ascending (default) or descending order.
+        limit : int, optional
+            If given, return only the first `limit` rows of the sorted DataFrame.
+            When the first sort column is numeric, the rows that can be among them
+            are selected with ak.maxk / ak.mink before sorting, so only those
+            candidates are sorted.
 
         See Also
         --------
-        apply_permutation
+        apply_permutation, nlargest, nsmallest
 
         Examples
         --------
@@ -3839,6 +4199,16 @@ class DataFrame(UserDict):
         """
         if self._empty:
             return array([], dtype=akint64)
+        if limit is not None:
+            if limit < 0:
+                raise ValueError("limit must be non-negative")
+            if by is None:
+                first = self._columns[0]
+            else:
+                first = by if isinstance(by, str) else by[0]
+            mask = _top_n_mask(self[first], limit, largest=not ascending)
+            candidates = self if mask is None else self[mask]
+            return candidates.sort_values(by, ascending=ascending)[:limit]
         if by is None:
             if len(self._columns) == 1:
                 i = self.argsort(self._columns[0], ascending=ascending)
@@ -3852,6 +4222,132 @@ class DataFrame(UserDict):
             raise TypeError("Column name(s) must be str or list/tuple of str")
         return self[i]
 
+    def nlargest(self, n: int, columns: Union[str, List[str]], keep: str = "first") -> DataFrame:
+        """
+        Return the first `n` rows ordered by `columns` in descending order.
+
+        Only the rows whose first column is at least its n-th largest value, found
+        with ak.maxk, are sorted, so this is much cheaper than sort_values when n
+        is small.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to return.
+        columns : str or list of str
+            Column name(s) to order by. Later columns break ties in earlier ones.
+        keep : {"first", "last"}, default = "first"
+            Which of the rows with equal values to prefer: those that come first
+            or last in the DataFrame.
+
+        Returns
+        -------
+        DataFrame
+            The first `n` rows ordered by `columns` in descending order.
+
+        Raises
+        ------
+        ValueError
+            Raised if keep is not "first" or "last".
+
+        See Also
+        --------
+        nsmallest, sort_values
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> df = ak.DataFrame({'a': [1, 10, 8, 10, 3], 'b': [5, 2, 7, 4, 1]})
+        >>> df.nlargest(2, 'a')
+
+        +----+-----+-----+
+        |    |   a |   b |
+        +====+=====+=====+
+        |  1 |  10 |   2 |
+        +----+-----+-----+
+        |  3 |  10 |   4 |
+        +----+-----+-----+
+
+        >>> df.nlargest(2, ['a', 'b'])
+
+        +----+-----+-----+
+        |    |   a |   b |
+        +====+=====+=====+
+        |  3 |  10 |   4 |
+        +----+-----+-----+
+        |  1 |  10 |   2 |
+        +----+-----+-----+
+
+        """
+        return self._select_n(n, columns, keep, largest=True)
+
+    def nsmallest(self, n: int, columns: Union[str, List[str]], keep: str = "first") -> DataFrame:
+        """
+        Return the first `n` rows ordered by `columns` in ascending order.
+
+        Only the rows whose first column is at most its n-th smallest value, found
+        with ak.mink, are sorted, so this is much cheaper than sort_values when n
+        is small.
+
+        Parameters
+        ----------
+        n : int
+            Number of rows to return.
+        columns : str or list of str
+            Column name(s) to order by. Later columns break ties in earlier ones.
+        keep : {"first", "last"}, default = "first"
+            Which of the rows with equal values to prefer: those that come first
+            or last in the DataFrame.
+
+        Returns
+        -------
+        DataFrame
+            The first `n` rows ordered by `columns` in ascending order.
+
+        Raises
+        ------
+        ValueError
+            Raised if keep is not "first" or "last".
+
+        See Also
+        --------
+        nlargest, sort_values
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> df = ak.DataFrame({'a': [1, 10, 8, 10, 3], 'b': [5, 2, 7, 4, 1]})
+        >>> df.nsmallest(2, 'a')
+
+        +----+-----+-----+
+        |    |   a |   b |
+        +====+=====+=====+
+        |  0 |   1 |   5 |
+        +----+-----+-----+
+        |  4 |   3 |   1 |
+        +----+-----+-----+
+
+        """
+        return self._select_n(n, columns, keep, largest=False)
+
+    def _select_n(self, n: int, columns: Union[str, List[str]], keep: str, largest: bool) -> DataFrame:
+        if keep not in ("first", "last"):
+            raise ValueError(f"Unexpected value of {keep} for keep. Must choose: 'first' or 'last'")
+        if n <= 0:
+            return self[zeros(0, dtype=akint64)]
+        columns = [columns] if isinstance(columns, str) else list(columns)
+        mask = _top_n_mask(self[columns[0]], n, largest=largest)
+        candidates = self if mask is None else self[mask]
+        size = len(candidates)
+        n = min(n, size)
+        pos = arange(size)
+        # the position breaks ties; the permutation is reversed for descending order
+        tiebreak = -pos if largest == (keep == "first") else pos
+        perm = coargsort([candidates[c] for c in columns] + [tiebreak])
+        if largest:
+            return candidates[perm[arange(size - 1, size - 1 - n, -1)]]
+        return candidates[perm[:n]]
+
     def apply_permutation(self, perm):
         """
         Apply a permutation to an entire DataFrame.
@@ -3909,9 +4405,10 @@ class DataFrame(UserDict):
             raise ValueError("The indicated permutation is invalid.")
         if unique(perm).size != perm.size:
             raise ValueError("The indicated permutation is invalid.")
-        for key, val in self.data.items():
-            self[key] = self[key][perm]
-        self._set_index(self.index[perm])
+        permuted = self._take(perm)
+        for key in self._columns:
+            self[key] = permuted[key]
+        self._set_index(permuted.index)
 
     def filter_by_range(self, keys, low=1, high=None):
         """
@@ -4148,6 +4645,36 @@ class DataFrame(UserDict):
         """
         return self.GroupBy(keys, use_series, as_index=as_index, dropna=dropna)
 
+    def lazy(self) -> LazyFrame:
+        """
+        Start a lazily evaluated query over the DataFrame.
+
+        Returns
+        -------
+        arkouda.lazyframe.LazyFrame
+            A query plan scanning this DataFrame. Filters, selections,
+            assignments, groupby aggregations and merges applied to it are
+            only executed, after optimization, by ``collect``.
+
+        See Also
+        --------
+        arkouda.lazyframe.LazyFrame, arkouda.scan_parquet, arkouda.scan_hdf
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> df = ak.DataFrame({"a": ak.arange(4), "b": ak.array([1, 0, 1, 0])})
+        >>> df.lazy().filter(ak.col("b") == 1).select("a").collect()
+           a
+        0  0
+        2  2 (2 rows x 1 columns)
+
+        """
+        from arkouda.lazyframe import LazyFrame as LazyFrame_
+        from arkouda.lazyframe import _Scan, _Source
+
+        return LazyFrame_(_Scan(_Source("frame", self)))
+
     @typechecked
     def isin(self, values: Union[pdarray, Dict, Series, DataFrame]) -> DataFrame:
         """
@@ -4491,6 +5018,7 @@ class DataFrame(UserDict):
         right_suffix: str = "_y",
         convert_ints: bool = True,
         sort: bool = True,
+        method: str = "sort",
     ) -> DataFrame:
         r"""
         Merge Arkouda DataFrames with a database-style join.
@@ -4525,6 +5053,10 @@ class DataFrame(UserDict):
         sort: bool = True
             If True, DataFrame is returned sorted by "on".
             Otherwise, the DataFrame is not sorted.
+        method: {"sort", "hash", "broadcast", "auto"}, default = "sort"
+            How matching rows are found. "broadcast" copies a hash table of the smaller
+            DataFrame's keys to every locale, "hash" partitions both DataFrames by key hash,
+            and "auto" picks one of these by the DataFrames' sizes. See arkouda.merge.
 
         Returns
         -------
@@ -4647,6 +5179,7 @@ class DataFrame(UserDict):
             right_suffix=right_suffix,
             convert_ints=convert_ints,
             sort=sort,
+            method=method,
         )
 
     @typechecked
@@ -5114,7 +5647,7 @@ class DataFrame(UserDict):
                 if self.empty is True:
                     result = DataFrame()
                 else:
-                    result = self[mask].copy(deep=True)
+                    result = self[mask]
             elif (isinstance(axis, int) and axis == 1) or (isinstance(axis, str) and axis == "columns"):
                 result = DataFrame()
                 if isinstance(mask, Series):
@@ -5746,7 +6279,29 @@ def _inner_join_merge(
     left_suffix: str = "_x",
     right_suffix: str = "_y",
     sort: bool = True,
+    method: str = "sort",
 ) -> DataFrame:
+    """
+    Return the inner join of left and right.
+
+    See _inner_join_merge_with_indices for the parameters.
+    """
+    return _inner_join_merge_with_indices(
+        left, right, left_on, right_on, col_intersect, left_suffix, right_suffix, sort, method
+    )[0]
+
+
+def _inner_join_merge_with_indices(
+    left: DataFrame,
+    right: DataFrame,
+    left_on: Union[str, List[str]],
+    right_on: Union[str, List[str]],
+    col_intersect: Union[str, List[str]],
+    left_suffix: str = "_x",
+    right_suffix: str = "_y",
+    sort: bool = True,
+    method: str = "sort",
+) -> Tuple[DataFrame, pdarray, pdarray]:
     """
     Return a DataFrame object containing only rows that are in both the left and right Dataframes.
 
@@ -5777,11 +6332,15 @@ def _inner_join_merge(
     sort: bool = True
         If True, DataFrame is returned sorted by "on".
         Otherwise, the DataFrame is not sorted.
+    method: str = "sort"
+        The join algorithm: "sort" uses ak.join.inner_join, and "hash", "broadcast"
+        or "auto" use hash tables (see merge).
 
     Returns
     -------
-    DataFrame
-        Inner-Joined Arkouda DataFrame
+    Tuple[DataFrame, pdarray, pdarray]
+        Inner-Joined Arkouda DataFrame, and the indices of the left and right rows
+        that make up its rows (before any sorting).
 
     """
     left_cols, right_cols = left.columns.values.copy(), right.columns.values.copy()
@@ -5795,13 +6354,16 @@ def _inner_join_merge(
             new_categoricals = Categorical.standardize_categories([left[lcol], right[rcol]])
             tmp_left[lcol] = new_categoricals[0]
             tmp_right[rcol] = new_categoricals[1]
-    left_inds, right_inds = inner_join(
-        [tmp_left[col].codes if isinstance(left[col], Categorical) else left[col] for col in left_on_],
-        [
-            tmp_right[col].codes if isinstance(right[col], Categorical) else right[col]
-            for col in right_on_
-        ],
-    )
+    left_keys = [
+        tmp_left[col].codes if isinstance(left[col], Categorical) else left[col] for col in left_on_
+    ]
+    right_keys = [
+        tmp_right[col].codes if isinstance(right[col], Categorical) else right[col] for col in right_on_
+    ]
+    if method == "sort":
+        left_inds, right_inds = inner_join(left_keys, right_keys)
+    else:
+        left_inds, right_inds = _hash_join(left_keys, right_keys, method)
     new_dict = {}
     for lcol, rcol in zip(left_on_, right_on_):
         if lcol == rcol:
@@ -5819,7 +6381,7 @@ def _inner_join_merge(
     sort_keys = [left_on] if isinstance(left_on, str) else left_on
     if sort:
         ret_df = ret_df.sort_values(sort_keys).reset_index()
-    return ret_df
+    return ret_df, left_inds, right_inds
 
 
 def _right_join_merge(
@@ -5833,6 +6395,7 @@ def _right_join_merge(
     convert_ints: bool = True,
     sort: bool = True,
     actually_left_join: bool = False,
+    method: str = "sort",
 ) -> DataFrame:
     """
     Perform a right‐join merge of two DataFrames.
@@ -5868,6 +6431,8 @@ def _right_join_merge(
     actually_left_join: bool = False
         If True, this is doing a right join but the columns are switched up because
         left and right were switched when passed into this function.
+    method: str = "sort"
+        The join algorithm: "sort", "hash", "broadcast" or "auto" (see merge).
 
     Returns
     -------
@@ -5883,12 +6448,28 @@ def _right_join_merge(
     left_on_ = [left_on] if isinstance(left_on, str) else left_on
     right_on_ = [right_on] if isinstance(right_on, str) else right_on
     if actually_left_join:
-        in_left = _inner_join_merge(
-            right, left, right_on_, left_on_, col_intersect, right_suffix, left_suffix, sort=False
+        in_left, right_inds, _ = _inner_join_merge_with_indices(
+            right,
+            left,
+            right_on_,
+            left_on_,
+            col_intersect,
+            right_suffix,
+            left_suffix,
+            sort=False,
+            method=method,
         )
     else:
-        in_left = _inner_join_merge(
-            left, right, left_on_, right_on_, col_intersect, left_suffix, right_suffix, sort=False
+        in_left, _, right_inds = _inner_join_merge_with_indices(
+            left,
+            right,
+            left_on_,
+            right_on_,
+            col_intersect,
+            left_suffix,
+            right_suffix,
+            sort=False,
+            method=method,
         )
     in_left_cols, left_cols = in_left.columns.values.copy(), left.columns.values.copy()
     right_cols = right.columns.values.copy()
@@ -5906,7 +6487,10 @@ def _right_join_merge(
         if rcol in in_left_cols:
             in_left_cols.remove(rcol)
 
-    not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
+    if method == "sort":
+        not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
+    else:
+        not_in_left = right[_unmatched(len(right), right_inds)]
     for col in not_in_left.columns:
         if col in left_cols:
             not_in_left[col + right_suffix] = not_in_left[col]
@@ -5936,6 +6520,7 @@ def _outer_join_merge(
     right_suffix: str = "_y",
     convert_ints: bool = True,
     sort: bool = True,
+    method: str = "sort",
 ) -> DataFrame:
     """
     Return a DataFrame object containing all the rows in each DataFrame.
@@ -5973,6 +6558,8 @@ def _outer_join_merge(
     sort: bool = True
         If True, DataFrame is returned sorted by "on".
         Otherwise, the DataFrame is not sorted.
+    method: str = "sort"
+        The join algorithm: "sort", "hash", "broadcast" or "auto" (see merge).
 
     Returns
     -------
@@ -5980,8 +6567,16 @@ def _outer_join_merge(
         Outer-Joined Arkouda DataFrame
 
     """
-    inner = _inner_join_merge(
-        left, right, left_on, right_on, col_intersect, left_suffix, right_suffix, sort=False
+    inner, left_inds, right_inds = _inner_join_merge_with_indices(
+        left,
+        right,
+        left_on,
+        right_on,
+        col_intersect,
+        left_suffix,
+        right_suffix,
+        sort=False,
+        method=method,
     )
     left_cols, right_cols = (
         left.columns.values.copy(),
@@ -5999,13 +6594,19 @@ def _outer_join_merge(
         if rcol in right_cols:
             right_cols.remove(rcol)
 
-    not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
+    if method == "sort":
+        not_in_left = right[in1d(right_at_on, left_at_on, invert=True)]
+    else:
+        not_in_left = right[_unmatched(len(right), right_inds)]
     for col in not_in_left.columns:
         if col in left_cols:
             not_in_left[col + right_suffix] = not_in_left[col]
             not_in_left = not_in_left.drop(col, axis=1)
 
-    not_in_right = left[in1d(left_at_on, right_at_on, invert=True)]
+    if method == "sort":
+        not_in_right = left[in1d(left_at_on, right_at_on, invert=True)]
+    else:
+        not_in_right = left[_unmatched(len(left), left_inds)]
     for col in not_in_right.columns:
         if col in right_cols:
             not_in_right[col + left_suffix] = not_in_right[col]
@@ -6044,6 +6645,347 @@ def _outer_join_merge(
     return ret_df
 
 
+def _take_rows(columns: List, key: pdarray) -> List:
+    """
+    Select the same rows of several equal-length arrays with one server message.
+
+    Parameters
+    ----------
+    columns: List
+        pdarrays (including subclasses such as Datetime), Strings, Categoricals
+        or SegArrays, all of the same size.
+    key: pdarray
+        A boolean mask of that size, or an int64 array of row positions.
+
+    Returns
+    -------
+    List
+        The selected rows of each array, as arrays of the same types.
+
+    """
+    from arkouda.numpy.segarray import SegArray
+
+    if len(columns) == 0:
+        return []
+    msg_list = []
+    for col in columns:
+        if isinstance(col, Categorical):
+            msg_list.append(f"pdarray+{col.codes.name}")
+        elif isinstance(col, SegArray):
+            msg_list.append(f"SegArray+{col.segments.name}+{col.values.name}")
+        elif isinstance(col, Strings):
+            msg_list.append(f"Strings+{col.name}")
+        else:
+            msg_list.append(f"pdarray+{col.name}")
+    repMsg = cast(
+        str,
+        generic_msg(
+            cmd="dataframe_take",
+            args={"size": len(msg_list), "nrows": columns[0].size, "key": key, "columns": msg_list},
+        ),
+    )
+    taken = []
+    for col, m in zip(columns, json.loads(repMsg)):
+        t, created = m.split("+", 1)
+        if isinstance(col, Categorical):
+            taken.append(Categorical.from_codes(create_pdarray(created), col.categories))
+        elif t == "SegArray":
+            segments, values = created.split("+")
+            taken.append(SegArray(create_pdarray(segments), create_pdarray(values)))
+        elif t == "Strings":
+            taken.append(Strings.from_return_msg(created))
+        elif type(col) is pdarray:
+            rows = create_pdarray(created)
+            if col.dtype == bigint and col.max_bits > 0:
+                rows.max_bits = col.max_bits
+            taken.append(rows)
+        elif hasattr(col, "_cast"):
+            # BitVector and Fields carry formatting attributes
+            taken.append(col._cast(create_pdarray(created)))
+        else:
+            taken.append(col.__class__(create_pdarray(created)))
+    return taken
+
+
+def _arrow_to_pandas(columns: Dict) -> Dict:
+    """
+    Transfer several equal-length arrays in one server message and convert them to pandas via Arrow.
+
+    The server sends the columns as Arrow buffers, from which Arrow arrays are built
+    without copying: Strings become large_string arrays, Categoricals dictionary
+    arrays and SegArrays large_list arrays. The arrays are converted to the same
+    representation as the per-column path: Strings to object arrays of str, from
+    which pandas infers the same dtype as from ``Strings.to_ndarray``, and
+    SegArrays to a list of lists as ``SegArray.to_list``. The other columns are
+    converted together with ``pyarrow.Table.to_pandas``.
+
+    Parameters
+    ----------
+    columns: Dict
+        Arrays keyed by column name, all of the same size.
+
+    Returns
+    -------
+    Dict
+        The pandas arrays of the columns that can be sent as Arrow buffers, keyed by
+        column name. Columns of other types (such as bigint, IPv4 or SegArrays of
+        strings) are left out.
+
+    """
+    import pyarrow as pa  # type: ignore
+
+    from arkouda.numpy.segarray import SegArray
+
+    numeric = {"int64": pa.int64(), "uint64": pa.uint64(), "float64": pa.float64(), "bool": pa.bool_()}
+    arrow_types = {pdarray: None, Datetime: pa.timestamp("ns"), Timedelta: pa.duration("ns")}
+
+    def is_numeric(a):
+        return type(a) in arrow_types and a.dtype.name in numeric
+
+    # (key, layout) pairs, where the layout lists the components in the order they are sent
+    layouts = []
+    msg_list = []
+    for key, col in columns.items():
+        if is_numeric(col):
+            msg_list.append(f"pdarray+{col.name}")
+            layouts.append((key, [("values", col)]))
+        elif isinstance(col, Strings):
+            msg_list.append(f"Strings+{col.name}")
+            layouts.append((key, [("strings", col)]))
+        elif isinstance(col, Categorical):
+            msg_list += [f"pdarray+{col.codes.name}", f"Strings+{col.categories.name}"]
+            layouts.append((key, [("values", col.codes), ("strings", col.categories)]))
+        elif isinstance(col, SegArray) and is_numeric(col.values):
+            msg_list.append(f"SegArray+{col.segments.name}+{col.values.name}")
+            layouts.append((key, [("offsets", col.segments), ("values", col.values)]))
+    if len(msg_list) == 0:
+        return {}
+    data = cast(
+        memoryview,
+        generic_msg(
+            cmd="dataframe_to_buffers",
+            args={"size": len(msg_list), "columns": msg_list},
+            recv_binary=True,
+        ),
+    )
+    order = ">" if get_server_byteorder() == "big" else "<"
+    pos = 0
+
+    def take(dt, count):
+        # every buffer is padded to a multiple of 8 bytes
+        nonlocal pos
+        dt = np.dtype(dt).newbyteorder(order)
+        buf = np.frombuffer(data, dtype=dt, count=count, offset=pos)
+        pos += (count * dt.itemsize + 7) // 8 * 8
+        return buf.astype(dt.newbyteorder("="), copy=False)
+
+    def to_arrow(kind, a):
+        if kind == "values":
+            values = pa.array(take(a.dtype, a.size), type=numeric[a.dtype.name])
+            arrow_type = arrow_types.get(type(a))
+            return values if arrow_type is None else values.cast(arrow_type)
+        if kind == "strings":
+            offsets = take(np.int64, a.size + 1)
+            values = take(np.uint8, a.nbytes - a.size)
+            return pa.LargeStringArray.from_buffers(a.size, pa.py_buffer(offsets), pa.py_buffer(values))
+        return pa.array(take(np.int64, a.size + 1))
+
+    arrays = []
+    for key, layout in layouts:
+        parts = [to_arrow(kind, a) for kind, a in layout]
+        if isinstance(columns[key], Categorical):
+            arrays.append(pa.DictionaryArray.from_arrays(parts[0], parts[1]))
+        elif isinstance(columns[key], SegArray):
+            arrays.append(pa.LargeListArray.from_arrays(parts[0], parts[1]))
+        else:
+            arrays.append(parts[0])
+    if pos != len(data):
+        raise RuntimeError(f"Expected {pos} bytes but received {len(data)}")
+
+    result: Dict = {}
+    table_keys: List = []
+    table_arrays: List = []
+    for (key, _), arr in zip(layouts, arrays):
+        if isinstance(columns[key], SegArray):
+            # one list per row, as in SegArray.to_list
+            result[key] = arr.to_pylist()
+        else:
+            table_keys.append(key)
+            table_arrays.append(arr)
+    names = [str(i) for i in range(len(table_arrays))]
+    pd_table = pa.Table.from_arrays(table_arrays, names=names).to_pandas()
+    for key, name in zip(table_keys, names):
+        if isinstance(columns[key], Strings):
+            result[key] = pd_table[name].to_numpy(dtype=object)
+        else:
+            result[key] = pd_table[name].array
+    return result
+
+
+def _arrays_from_arrow(columns: Dict) -> Dict:
+    """
+    Create arkouda arrays from several pyarrow arrays of the same length with one server message.
+
+    The Arrow buffers of all the arrays are sent in a single binary payload, which the
+    server copies into distributed arrays. String arrays become Strings, dictionary
+    arrays of strings Categoricals (with nulls as their NA value), list arrays of
+    numbers SegArrays, timestamps Datetimes and durations Timedeltas. Other numeric
+    arrays become int64, uint64, float64 or bool pdarrays.
+
+    Parameters
+    ----------
+    columns: Dict
+        pyarrow Arrays or ChunkedArrays keyed by column name.
+
+    Returns
+    -------
+    Dict
+        The arkouda arrays keyed by column name.
+
+    Raises
+    ------
+    TypeError
+        Raised if an array has a type with no arkouda equivalent
+    ValueError
+        Raised if an array other than a floating point or dictionary array contains nulls
+    RuntimeError
+        Raised if the payload would exceed ak.client.maxTransferBytes
+
+    """
+    import pyarrow as pa  # type: ignore
+    import pyarrow.compute as pc  # type: ignore
+
+    from arkouda.numpy.segarray import SegArray
+
+    order = ">" if get_server_byteorder() == "big" else "<"
+    buffers: List[np.ndarray] = []
+    msg_list: List[str] = []
+    kinds = []
+
+    def add(a):
+        # every buffer is padded to a multiple of 8 bytes
+        raw = np.ascontiguousarray(a, dtype=a.dtype.newbyteorder(order)).view(np.uint8)
+        buffers.append(raw)
+        if raw.size % 8 != 0:
+            buffers.append(np.zeros(8 - raw.size % 8, dtype=np.uint8))
+
+    def check_nulls(key, arr):
+        if arr.null_count > 0:
+            raise ValueError(f"Column {key!r} of type {arr.type} contains nulls")
+
+    def numeric(key, arr):
+        t = arr.type
+        if pa.types.is_timestamp(t):
+            arr = arr.cast(pa.timestamp("ns", tz=t.tz)).cast(pa.int64())
+        elif pa.types.is_duration(t):
+            arr = arr.cast(pa.duration("ns")).cast(pa.int64())
+        elif pa.types.is_floating(t):
+            arr = arr.cast(pa.float64()).fill_null(np.nan)
+        elif pa.types.is_unsigned_integer(t):
+            arr = arr.cast(pa.uint64())
+        elif pa.types.is_integer(t):
+            arr = arr.cast(pa.int64())
+        elif not pa.types.is_boolean(t):
+            raise TypeError(f"Column {key!r} has unsupported Arrow type {t}")
+        check_nulls(key, arr)
+        return arr.to_numpy(zero_copy_only=False)
+
+    def strings(key, arr):
+        arr = arr.cast(pa.large_string())
+        check_nulls(key, arr)
+        offsets = np.frombuffer(
+            arr.buffers()[1], dtype=np.int64, count=len(arr) + 1, offset=arr.offset * 8
+        )
+        data = np.frombuffer(arr.buffers()[2], dtype=np.uint8)[offsets[0] : offsets[-1]]
+        add(offsets - offsets[0])
+        add(data)
+        return f"Strings+{len(arr)}+{data.size}"
+
+    for key, arr in columns.items():
+        if isinstance(arr, pa.ChunkedArray):
+            if pa.types.is_dictionary(arr.type):
+                arr = arr.unify_dictionaries()
+            arr = arr.combine_chunks()
+        t = arr.type
+        if pa.types.is_string(t) or pa.types.is_large_string(t) or pa.types.is_string_view(t):
+            msg_list.append(strings(key, arr))
+            kinds.append((key, "Strings"))
+        elif pa.types.is_dictionary(t):
+            if not pa.types.is_string(t.value_type) and not pa.types.is_large_string(t.value_type):
+                raise TypeError(f"Column {key!r} has unsupported Arrow type {t}")
+            # nulls take the code of the NA value, which Categorical appends to the
+            # categories unless the dictionary already holds it
+            na_code = pc.index(arr.dictionary, "N/A").as_py()
+            if na_code < 0:
+                na_code = len(arr.dictionary)
+            codes = arr.indices.cast(pa.int64()).fill_null(na_code).to_numpy()
+            add(codes)
+            msg_list += [f"pdarray+int64+{codes.size}", strings(key, arr.dictionary)]
+            kinds.append((key, "Categorical"))
+        elif pa.types.is_list(t) or pa.types.is_large_list(t):
+            arr = arr.cast(pa.large_list(t.value_type))
+            check_nulls(key, arr)
+            offsets = arr.offsets.to_numpy()
+            values = numeric(key, arr.values.slice(offsets[0], offsets[-1] - offsets[0]))
+            add(offsets - offsets[0])
+            add(values)
+            msg_list.append(f"SegArray+{values.dtype.name}+{len(arr)}+{values.size}")
+            kinds.append((key, "SegArray"))
+        else:
+            values = numeric(key, arr)
+            add(values)
+            msg_list.append(f"pdarray+{values.dtype.name}+{values.size}")
+            if pa.types.is_timestamp(t):
+                kinds.append((key, "Datetime"))
+            elif pa.types.is_duration(t):
+                kinds.append((key, "Timedelta"))
+            else:
+                kinds.append((key, "pdarray"))
+    if len(msg_list) == 0:
+        return {}
+
+    payload = np.concatenate(buffers) if buffers else np.zeros(0, dtype=np.uint8)
+    if payload.size > maxTransferBytes:
+        raise RuntimeError(
+            f"Creating the columns would require transferring {payload.size} bytes, which exceeds "
+            f"allowed transfer size. Increase ak.client.maxTransferBytes to force."
+        )
+    repMsg = cast(
+        str,
+        generic_msg(
+            cmd="dataframe_from_buffers",
+            args={"size": len(msg_list), "columns": msg_list},
+            payload=payload.data,
+            send_binary=True,
+        ),
+    )
+    created = [m.split("+", 1)[1] for m in json.loads(repMsg)]
+    result: Dict = {}
+    for key, kind in kinds:
+        if kind == "Strings":
+            result[key] = Strings.from_return_msg(created.pop(0))
+        elif kind == "Categorical":
+            codes = create_pdarray(created.pop(0))
+            result[key] = Categorical.from_codes(codes, Strings.from_return_msg(created.pop(0)))
+        elif kind == "SegArray":
+            segments, values = created.pop(0).split("+")
+            result[key] = SegArray(create_pdarray(segments), create_pdarray(values))
+        elif kind == "Datetime":
+            result[key] = Datetime(create_pdarray(created.pop(0)))
+        elif kind == "Timedelta":
+            result[key] = Timedelta(create_pdarray(created.pop(0)))
+        else:
+            result[key] = create_pdarray(created.pop(0))
+    return result
+
+
+def _unmatched(size: int, matched_inds: pdarray) -> pdarray:
+    """Return a boolean mask of the rows of a join side that do not appear in its join indices."""
+    unmatched = full(size, True, dtype=akbool)
+    unmatched[matched_inds] = False
+    return unmatched
+
+
 def __nulls_like(
     arry: Union[pdarray, Strings, Categorical],
     size: Optional[
@@ -6085,6 +7027,7 @@ def merge(
     right_suffix: str = "_y",
     convert_ints: bool = True,
     sort: bool = True,
+    method: str = "sort",
 ) -> DataFrame:
     r"""
     Merge Arkouda DataFrames with a database-style join.
@@ -6127,12 +7070,30 @@ def merge(
     sort: bool = True
         If True, DataFrame is returned sorted by "on".
         Otherwise, the DataFrame is not sorted.
+    method: {"sort", "hash", "broadcast", "auto"}, default = "sort"
+        How matching rows are found.
+        "sort" groups the keys of both DataFrames by sorting them.
+        "broadcast" builds a hash table of the smaller DataFrame's keys, copies it to
+        every locale and probes it with the local rows of the larger DataFrame, so the
+        larger DataFrame's keys are never sorted or moved. This is the fastest way to
+        join a large table to a small one.
+        "hash" partitions the keys of both DataFrames by hash, so that each locale
+        joins its partitions with local hash tables.
+        "auto" chooses "broadcast" when the smaller DataFrame has at most 2**22 rows,
+        and "hash" otherwise.
+        Keys other than a single integer column are matched on their 128-bit hash by
+        the hash-based methods. Without sort, the order of the rows depends on the method.
 
     Returns
     -------
     DataFrame
         Joined Arkouda DataFrame.
 
+    Raises
+    ------
+    ValueError
+        Raised if how or method is not one of the supported values.
+
     Note
     ----
     Multiple column joins are only supported for integer columns.
@@ -6269,6 +7230,11 @@ def merge(
         for left_col, right_col in zip(left_on_, right_on_)
     ):
         raise ValueError("All columns of a multi-column merge must be pdarrays")
+    if method not in ("sort", "hash", "broadcast", "auto"):
+        raise ValueError(
+            f"Unexpected value of {method} for method. "
+            "Must choose: 'sort', 'hash', 'broadcast' or 'auto'"
+        )
 
     if how == "inner":
         return _inner_join_merge(
@@ -6280,6 +7246,7 @@ def merge(
             left_suffix,
             right_suffix,
             sort=sort,
+            method=method,
         )
     elif how == "right":
         return _right_join_merge(
@@ -6292,6 +7259,7 @@ def merge(
             right_suffix,
             convert_ints=convert_ints,
             sort=sort,
+            method=method,
         )
     elif how == "left":
         return _right_join_merge(
@@ -6305,6 +7273,7 @@ def merge(
             convert_ints=convert_ints,
             sort=sort,
             actually_left_join=True,
+            method=method,
         )
     elif how == "outer":
         warn(
@@ -6322,8 +7291,232 @@ def merge(
             right_suffix,
             convert_ints=convert_ints,
             sort=sort,
+            method=method,
         )
     else:
         raise ValueError(
             f"Unexpected value of {how} for how. Must choose: 'inner', 'left', 'right' or 'outer'"
         )
+
+
+@typechecked
+def merge_asof(
+    left: DataFrame,
+    right: DataFrame,
+    on: Optional[str] = None,
+    left_on: Optional[str] = None,
+    right_on: Optional[str] = None,
+    by: Optional[Union[str, List[str]]] = None,
+    left_suffix: str = "_x",
+    right_suffix: str = "_y",
+    tolerance=None,
+    allow_exact_matches: bool = True,
+    direction: str = "backward",
+    convert_ints: bool = True,
+) -> DataFrame:
+    """
+    Perform a merge by key distance.
+
+    Each row of the left DataFrame is matched to the row of the right DataFrame
+    with the nearest key, rather than an equal one. With by, only rows whose by
+    columns are equal are matched. Every left row appears once in the result, in
+    its original order, with nulls in the right columns if it has no match.
+
+    Based on pandas merge_asof functionality.
+    https://pandas.pydata.org/docs/reference/api/pandas.merge_asof.html
+
+    The match is found on the server by a merge of both DataFrames sorted by
+    (by, on) instead of a binary search per row. A side whose key column is
+    already sorted is only sorted by its by columns, or not at all without by.
+
+    Parameters
+    ----------
+    left: DataFrame
+        The left DataFrame to be joined.
+    right: DataFrame
+        The right DataFrame to be joined.
+    on: str, optional
+        The name of the key column, which must be in both DataFrames. Keys must be
+        numeric, Datetime or Timedelta.
+    left_on: str, optional
+        The name of the key column of the left DataFrame. If this is not None, then
+        right_on must also not be None, and this will override `on`.
+    right_on: str, optional
+        The name of the key column of the right DataFrame.
+    by: str or List of str, optional
+        The name or list of names of columns, in both DataFrames, that must be equal
+        for rows to match.
+    left_suffix: str, default = "_x"
+        A string indicating the suffix to add to columns from the left dataframe for
+        overlapping column names in both left and right.
+    right_suffix: str, default = "_y"
+        A string indicating the suffix to add to columns from the right dataframe for
+        overlapping column names in both left and right.
+    tolerance: int, float or Timedelta-like, optional
+        If given, rows whose keys are further apart than this are not matched.
+        For Datetime and Timedelta keys, anything accepted by pandas.Timedelta.
+    allow_exact_matches: bool, default = True
+        If False, a right key equal to the left key does not match.
+    direction: {"backward", "forward", "nearest"}, default = "backward"
+        "backward" matches the last right key at or before the left key,
+        "forward" the first right key at or after it, and "nearest" the closer
+        of the two.
+    convert_ints: bool = True
+        If True, convert integer and bool columns of the right DataFrame to float64
+        when some left rows have no match, so that they can hold NaN. This is to
+        match pandas.
+
+    Returns
+    -------
+    DataFrame
+        The left DataFrame with the columns of the matching right rows.
+
+    Raises
+    ------
+    ValueError
+        Raised if the key columns are not given, or direction or tolerance is invalid.
+    TypeError
+        Raised if the key columns are not numeric, Datetime or Timedelta, or are of
+        different kinds.
+
+    See Also
+    --------
+    merge
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> ak.connect()
+    >>> trades = ak.DataFrame({'time': ak.array([1, 5, 10]), 'qty': ak.array([100, 200, 300])})
+    >>> quotes = ak.DataFrame({'time': ak.array([0, 4, 9, 12]), 'bid': ak.array([1.0, 2.0, 3.0, 4.0])})
+    >>> ak.merge_asof(trades, quotes, on='time')
+
+    +----+--------+-------+-------+
+    |    |   time |   qty |   bid |
+    +====+========+=======+=======+
+    |  0 |      1 |   100 |   1.0 |
+    +----+--------+-------+-------+
+    |  1 |      5 |   200 |   2.0 |
+    +----+--------+-------+-------+
+    |  2 |     10 |   300 |   3.0 |
+    +----+--------+-------+-------+
+
+    >>> ak.merge_asof(trades, quotes, on='time', direction='forward', tolerance=2)
+
+    +----+--------+-------+-------+
+    |    |   time |   qty |   bid |
+    +====+========+=======+=======+
+    |  0 |      1 |   100 |   nan |
+    +----+--------+-------+-------+
+    |  1 |      5 |   200 |   nan |
+    +----+--------+-------+-------+
+    |  2 |     10 |   300 |   4.0 |
+    +----+--------+-------+-------+
+
+    """
+    if left_on is None and right_on is None:
+        if on is None:
+            raise ValueError("Either on or left_on and right_on must be given")
+        left_on, right_on = on, on
+    elif left_on is None or right_on is None:
+        raise ValueError("If one of left_on or right_on is not None, the other must also be set")
+    if direction not in ("backward", "forward", "nearest"):
+        raise ValueError(
+            f"Unexpected value of {direction} for direction. "
+            "Must choose: 'backward', 'forward' or 'nearest'"
+        )
+    by_ = [] if by is None else [by] if isinstance(by, str) else by
+
+    left_key, right_key = left[left_on], right[right_on]
+    if isinstance(left_key, (Datetime, Timedelta)) or isinstance(right_key, (Datetime, Timedelta)):
+        if type(left_key) is not type(right_key):
+            raise TypeError("Both key columns must be Datetime, or both Timedelta")
+        left_values, right_values = left_key.values, right_key.values
+    elif isinstance(left_key, pdarray) and isinstance(right_key, pdarray):
+        left_values, right_values = left_key, right_key
+        if left_values.dtype == akbool:
+            left_values = akcast(left_values, akint64)
+        if right_values.dtype == akbool:
+            right_values = akcast(right_values, akint64)
+        if left_values.dtype != right_values.dtype:
+            left_values = akcast(left_values, akfloat64)
+            right_values = akcast(right_values, akfloat64)
+    else:
+        raise TypeError("Key columns must be numeric, Datetime or Timedelta")
+    if left_values.dtype not in (akint64, akuint64, akfloat64):
+        raise TypeError(f"Unsupported key dtype {left_values.dtype}")
+
+    if tolerance is not None:
+        if isinstance(left_key, (Datetime, Timedelta)):
+            tolerance = pd.Timedelta(tolerance).value
+        elif left_values.dtype != akfloat64 and not isinstance(tolerance, (int, np.integer)):
+            raise TypeError("tolerance must be an integer for integer keys")
+        if tolerance < 0:
+            raise ValueError("tolerance must be positive")
+
+    # Group ids that are equal exactly when the by columns are
+    left_groups: Optional[pdarray] = None
+    right_groups: Optional[pdarray] = None
+    if len(by_) == 1 and all(
+        isinstance(df[by_[0]], pdarray) and df[by_[0]].dtype == akint64 for df in (left, right)
+    ):
+        left_groups, right_groups = left[by_[0]], right[by_[0]]
+    elif len(by_) > 0:
+        g = GroupBy([concatenate([left[col], right[col]], ordered=True) for col in by_])
+        ids = g.broadcast(arange(g.ngroups))
+        left_groups, right_groups = ids[: len(left)], ids[len(left) :]
+
+    def sort_perm(values: pdarray, groups: Optional[pdarray]) -> Optional[pdarray]:
+        if values.is_sorted():
+            # argsort is stable, so sorting by the groups keeps the keys sorted within them
+            return None if groups is None else argsort(groups)
+        return argsort(values) if groups is None else coargsort([groups, values])
+
+    left_perm = sort_perm(left_values, left_groups)
+    right_perm = sort_perm(right_values, right_groups)
+    args = {
+        "left_on": left_values if left_perm is None else left_values[left_perm],
+        "right_on": right_values if right_perm is None else right_values[right_perm],
+        "grouped": left_groups is not None,
+        "direction": direction,
+        "allow_exact_matches": allow_exact_matches,
+        "has_tolerance": tolerance is not None,
+        "tolerance": 0 if tolerance is None else tolerance,
+    }
+    if left_groups is not None and right_groups is not None:
+        args["left_by"] = left_groups if left_perm is None else left_groups[left_perm]
+        args["right_by"] = right_groups if right_perm is None else right_groups[right_perm]
+    right_inds = create_pdarray(cast(str, generic_msg(cmd="mergeAsof", args=args)))
+    matched = right_inds >= 0
+    if right_perm is not None:
+        right_inds = where(matched, right_perm[where(matched, right_inds, 0)], -1)
+    if left_perm is not None:
+        in_left_order = zeros(len(left), dtype=akint64)
+        in_left_order[left_perm] = right_inds
+        right_inds = in_left_order
+        matched = right_inds >= 0
+    all_matched = bool(matched.all())
+
+    right_cols = [col for col in right.columns.values if col != right_on and col not in by_]
+    col_intersect = set(left.columns.values) & set(right_cols)
+    new_dict = {}
+    for col in left.columns.values:
+        new_dict[col + left_suffix if col in col_intersect else col] = left[col]
+    gather = where(matched, right_inds, 0)
+    for col in right_cols:
+        if len(right) == 0:
+            values = __nulls_like(right[col], len(left))
+        else:
+            values = right[col][gather]
+            if not all_matched:
+                if isinstance(values, (Datetime, Timedelta)):
+                    # the minimum int64 is NaT
+                    nat = np.iinfo(np.int64).min
+                    values = values.__class__(where(matched, values.values, nat))
+                elif isinstance(values, pdarray) and values.dtype in (akint64, akuint64, akbool):
+                    if convert_ints:
+                        values = where(matched, akcast(values, akfloat64), np.nan)
+                else:
+                    values = where(matched, values, __nulls_like(values))
+        new_dict[col + right_suffix if col in col_intersect else col] = values
+    return DataFrame(new_dict)
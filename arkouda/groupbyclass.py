@@ -2,10 +2,12 @@ from __future__ import annotations
 
 import enum
 import json
+from collections import OrderedDict
 from typing import (
     TYPE_CHECKING,
     Dict,
     List,
+    NamedTuple,
     Optional,
     Sequence,
     Tuple,
@@ -20,6 +22,7 @@ from typeguard import typechecked
 from arkouda.client import generic_msg
 from arkouda.logger import ArkoudaLogger, getArkoudaLogger
 from arkouda.numpy.dtypes import _val_isinstance_of_union, bigint
+from arkouda.numpy.dtypes import bool_ as akbool
 from arkouda.numpy.dtypes import dtype as akdtype
 from arkouda.numpy.dtypes import float64 as akfloat64
 from arkouda.numpy.dtypes import float_scalars
@@ -41,7 +44,18 @@ if TYPE_CHECKING:
     from arkouda.categorical import Categorical
 
 
-__all__ = ["unique", "GroupBy", "broadcast", "GROUPBY_REDUCTION_TYPES", "groupable"]
+__all__ = [
+    "unique",
+    "GroupBy",
+    "broadcast",
+    "GROUPBY_REDUCTION_TYPES",
+    "groupable",
+    "GroupByCacheInfo",
+    "enable_groupby_cache",
+    "disable_groupby_cache",
+    "clear_groupby_cache",
+    "groupby_cache_info",
+]
 
 groupable_element_type = Union[pdarray, Strings, "Categorical"]
 groupable = Union[groupable_element_type, Sequence[groupable_element_type]]
@@ -128,6 +142,14 @@ def unique(
 
     if not return_groups and hasattr(pda, "unique"):
         return cast(Categorical_, pda).unique()
+    # the unique keys of a single integer array are sorted, unless a wrong
+    # assume_sorted was passed
+    sorted_result = isinstance(pda, pdarray) and pda.dtype in (akint64, akuint64) and not assume_sorted
+    if isinstance(pda, pdarray) and pda.ndim == 1 and pda.stats.is_sorted:
+        if not return_groups and pda.is_known_unique:
+            return pda[:]
+        assume_sorted = True
+        sorted_result = pda.dtype in (akint64, akuint64)
 
     # Get all grouping keys
     grouping_keys, nkeys = _get_grouping_keys(pda)
@@ -154,6 +176,8 @@ def unique(
 
     if nkeys == 1 and not isinstance(pda, Sequence):
         unique_keys = pda[unique_key_indices]
+        if sorted_result:
+            cast(pdarray, unique_keys)._mark_sorted_unique()
     else:
         unique_keys = tuple(a[unique_key_indices] for a in pda)
     if return_groups:
@@ -165,6 +189,13 @@ def unique(
         return unique_keys
 
 
+# largest number of categories (or range of integer keys with known bounds) for
+# which keys are grouped by counting
+_DENSE_AUTO_MAX_BINS = 2**16
+# largest explicit dense_range; every server task holds an array of this many bins
+_DENSE_MAX_BINS = 2**20
+
+
 class GroupByReductionType(enum.Enum):
     SUM = "sum"
     COUNT = "count"
@@ -236,6 +267,14 @@ class GroupBy:
         The array to group by value, or if list, the column arrays to group by row
     assume_sorted : bool
         If True, assume keys is already sorted (Default: False)
+    dense_range : tuple of int, optional
+        Inclusive bounds ``(lo, hi)`` of a single int64 or uint64 keys array.
+        If given, or if keys is a Categorical with few categories, the groups
+        are found by counting keys per value instead of sorting them, and
+        sum, count, mean and size are computed without permuting the values.
+        Every server task holds one counter per value of the range, so ranges
+        of more than 2**20 values, or reaching past the int64 range, are
+        grouped by sorting instead.
 
     Attributes
     ----------
@@ -276,10 +315,13 @@ class GroupBy:
     If the input is a single array with a .group() method defined, method 2
     will be used; otherwise, method 1 will be used.
 
+    With dense keys, the permutation is only computed (by a single stable
+    counting-sort pass) when an operation other than sum, count, mean or
+    size first needs it.
+
     """
 
     nkeys: int
-    permutation: pdarray
     unique_keys: Union[pdarray, Strings, Categorical, Tuple[Union[pdarray, Strings, Categorical], ...]]
     ngroups: int_scalars
     segments: pdarray
@@ -295,19 +337,24 @@ class GroupBy:
         keys: Optional[groupable] = None,
         assume_sorted: bool = False,
         dropna: bool = True,
+        dense_range: Optional[Tuple[int, int]] = None,
         **kwargs,
     ):
         from arkouda.numpy import isnan
 
         def drop_na_keys():
             if self.dropna is True:
+                # keys known to have no NaN are not filtered
                 if isinstance(self.keys, pdarray) and self.keys.dtype == akfloat64:
-                    self.keys = self.keys[~isnan(self.keys)]
+                    if self.keys.stats.has_nan is not False:
+                        self.keys = self.keys[~isnan(self.keys)]
                 elif isinstance(self.keys, list):
                     is_not_nan = [
                         ~isnan(key)
                         for key in self.keys
-                        if isinstance(key, pdarray) and key.dtype == akfloat64
+                        if isinstance(key, pdarray)
+                        and key.dtype == akfloat64
+                        and key.stats.has_nan is not False
                     ]
 
                     if len(is_not_nan) > 0:
@@ -327,6 +374,9 @@ class GroupBy:
         self.logger = getArkoudaLogger(name=self.__class__.__name__)
         self.assume_sorted = assume_sorted
         self.dropna = dropna
+        self._permutation: Optional[pdarray] = None
+        self._unique_key_indices: Optional[pdarray] = None
+        self._dense: Optional[Tuple[pdarray, int, int, pdarray]] = None
         if (
             "orig_keys" in kwargs
             and "permutation" in kwargs
@@ -351,7 +401,7 @@ class GroupBy:
         ):
             self.keys = cast(groupable, kwargs.get("orig_keys", None))
             drop_na_keys()
-            self._uki = kwargs.get("uki", None)
+            self._uki = cast(pdarray, kwargs["uki"])
             self.permutation = cast(pdarray, kwargs["permutation"])
             self.segments = cast(pdarray, kwargs["segments"])
             self.nkeys = len(self.keys) if isinstance(self.keys, Sequence) else 1
@@ -363,21 +413,116 @@ class GroupBy:
             raise ValueError("No keys passed to GroupBy.")
         else:
             self.keys = cast(groupable, keys)
+            if isinstance(keys, pdarray) and keys.ndim == 1 and keys.stats.is_sorted:
+                # the permutation of sorted keys is the identity
+                self.assume_sorted = True
             drop_na_keys()
-            (
-                self.unique_keys,
-                self.permutation,
-                self.segments,
-                self.nkeys,
-                self._uki,
-            ) = unique(  # type: ignore
-                self.keys,
-                return_groups=True,
-                return_indices=True,
-                assume_sorted=self.assume_sorted,
-            )
-        self.length = self.permutation.size
+            bounds = self._dense_bounds(self.keys, dense_range)
+            if bounds is not None:
+                self._init_dense(*bounds)
+            else:
+                (
+                    self.unique_keys,
+                    self.permutation,
+                    self.segments,
+                    self.nkeys,
+                    self._uki,
+                ) = unique(  # type: ignore
+                    self.keys,
+                    return_groups=True,
+                    return_indices=True,
+                    assume_sorted=self.assume_sorted,
+                )
+        self.length = self._dense[0].size if self._dense is not None else self.permutation.size
         self.ngroups = self.segments.size
+        if isinstance(keys, pdarray) and keys.ndim == 1 and keys.stats.has_nan is False:
+            keys.stats.nunique = self.ngroups
+
+    @staticmethod
+    def _dense_bounds(keys, dense_range) -> Optional[Tuple[int, int]]:
+        # key bounds for the dense path, or None if keys must be sorted
+        from arkouda.categorical import Categorical as Categorical_
+
+        if dense_range is not None:
+            if not isinstance(keys, pdarray) or keys.dtype not in (akint64, akuint64):
+                raise TypeError("dense_range requires a single int64 or uint64 keys array")
+            lo, hi = (int(b) for b in dense_range)
+            if lo > hi:
+                raise ValueError("dense_range must satisfy lo <= hi")
+            return (lo, hi) if hi - lo < _DENSE_MAX_BINS and hi < 2**63 else None
+        if isinstance(keys, Categorical_) and keys.categories.size <= _DENSE_AUTO_MAX_BINS:
+            return 0, int(keys.categories.size) - 1
+        if isinstance(keys, pdarray) and keys.ndim == 1 and keys.dtype in (akint64, akuint64):
+            # integer keys with a known, small range are counted into bins
+            # the server bins keys as int64 offsets, so uint64 keys past the int64 range are sorted
+            kmin, kmax = keys.stats.min, keys.stats.max
+            if (
+                kmin is not None
+                and kmax is not None
+                and int(kmax) - int(kmin) < _DENSE_AUTO_MAX_BINS
+                and int(kmax) < 2**63
+            ):
+                return int(kmin), int(kmax)
+        return None
+
+    def _init_dense(self, lo: int, hi: int) -> None:
+        from arkouda.categorical import Categorical as Categorical_
+        from arkouda.numpy import cast as akcast
+        from arkouda.numpy import cumsum
+
+        keys = self.keys.codes if isinstance(self.keys, Categorical_) else cast(pdarray, self.keys)
+        nbins = hi - lo + 1
+        counts = self._dense_reduce_bins(keys, keys, lo, nbins, "size")
+        bins = arange(nbins)[counts > 0]
+        sizes = counts[bins]
+        self._dense = (keys, lo, nbins, bins)
+        self.nkeys = 1
+        self.segments = cumsum(sizes) - sizes
+        if isinstance(self.keys, Categorical_):
+            self.unique_keys = Categorical_.from_codes(bins, self.keys.categories)
+        else:
+            # offset the bins in the key dtype, so that uint64 keys are not promoted
+            unique_keys = cast(pdarray, akcast(bins, keys.dtype)) + keys.dtype.type(lo)
+            self.unique_keys = unique_keys._mark_sorted_unique()
+
+    def _dense_reduce_bins(
+        self, keys: pdarray, values: pdarray, lo: int, nbins: int, op: str, skipna=True
+    ):
+        repMsg = generic_msg(
+            cmd="denseReduction",
+            args={
+                "keys": keys,
+                "values": values,
+                "lo": lo,
+                "nbins": nbins,
+                "op": op,
+                "skip_nan": skipna,
+            },
+        )
+        self.logger.debug(repMsg)
+        return create_pdarray(repMsg)
+
+    @property
+    def permutation(self) -> pdarray:
+        if self._permutation is None and self._dense is not None:
+            keys, lo, _, _ = self._dense
+            # one stable counting-sort pass over the (small, non-negative) key offsets
+            self._permutation = argsort(keys - lo if lo < 0 and keys.dtype == akint64 else keys)
+        return cast(pdarray, self._permutation)
+
+    @permutation.setter
+    def permutation(self, value: pdarray) -> None:
+        self._permutation = value
+
+    @property
+    def _uki(self) -> pdarray:
+        if self._unique_key_indices is None:
+            self._unique_key_indices = self.permutation[self.segments]
+        return self._unique_key_indices
+
+    @_uki.setter
+    def _uki(self, value: pdarray) -> None:
+        self._unique_key_indices = value
 
     @staticmethod
     def from_return_msg(rep_msg):
@@ -623,6 +768,78 @@ class GroupBy:
         k, v = self.aggregate(values, "count")
         return k, cast(pdarray, v)
 
+    def top_k(
+        self, values: groupable_element_type, k: int_scalars
+    ) -> Tuple[groupable, groupable_element_type, pdarray]:
+        """
+        Find the k most frequent values within each group.
+
+        Parameters
+        ----------
+        values : pdarray, Strings, or Categorical
+            The values to count within each group
+        k : int_scalars
+            The number of most frequent values to return per group
+
+        Returns
+        -------
+        keys : groupable
+            The group of each returned value, in grouped order
+        top_values : pdarray, Strings, or Categorical
+            The at most k most frequent values of each group, in order of
+            decreasing count within the group
+        counts : pdarray, int64
+            The number of occurrences of each returned value in its group
+
+        Raises
+        ------
+        ValueError
+            Raised if k is less than 1 or the values size does not match the keys size
+
+        See Also
+        --------
+        arkouda.top_k_frequent
+
+        Notes
+        -----
+        Only the table of distinct (group, value) pairs is ordered by count,
+        never the full values array. Ties between numeric values are broken
+        by value order; tied Strings and Categorical values, which are grouped
+        by hash and by code, come in an arbitrary order.
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 0, 0, 1, 1, 1, 1]))
+        >>> keys, vals, counts = g.top_k(ak.array([5, 6, 6, 7, 7, 7, 8]), 1)
+        >>> keys
+        array([0 1])
+        >>> vals
+        array([6 7])
+        >>> counts
+        array([2 3])
+
+        """
+        from arkouda.numpy.sorting import coargsort
+
+        if k < 1:
+            raise ValueError("k must be at least 1")
+        if values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        group_ids = self.broadcast(arange(self.ngroups), permute=True)
+        (pair_groups, pair_values), counts = GroupBy([group_ids, values]).size()
+        # order pairs by group, then by decreasing count
+        order = coargsort([pair_groups, -counts])
+        pair_groups = pair_groups[order]
+        rank = GroupBy(pair_groups, assume_sorted=True).rank()
+        keep = order[rank <= k]
+        top_groups = pair_groups[rank <= k]
+        if isinstance(self.unique_keys, tuple):
+            keys: groupable = tuple(u[top_groups] for u in self.unique_keys)
+        else:
+            keys = self.unique_keys[top_groups]
+        return keys, pair_values[keep], counts[keep]
+
     def aggregate(
         self,
         values: groupable,
@@ -697,6 +914,18 @@ class GroupBy:
         if cast(pdarray, values).size != self.length:
             raise ValueError("Attempt to group array using key array of different length")
 
+        if (
+            self._dense is not None
+            and operator in ("sum", "count", "mean")
+            and isinstance(values, pdarray)
+            and values.dtype in (akint64, akuint64, akfloat64, akbool)
+        ):
+            keys, lo, nbins, bins = self._dense
+            return (
+                self.unique_keys,
+                self._dense_reduce_bins(keys, values, lo, nbins, operator, skipna)[bins],
+            )
+
         if self.assume_sorted:
             permuted_values = cast(pdarray, values)
         else:
@@ -1048,7 +1277,8 @@ class GroupBy:
 
         Notes
         -----
-        The return dtype is always float64.
+        The return dtype is always float64. The median is found by
+        selection within each group, so the values are never sorted.
 
         Examples
         --------
@@ -1070,6 +1300,90 @@ class GroupBy:
         k, v = self.aggregate(values, "median", skipna)
         return k, cast(pdarray, v)
 
+    def quantile(
+        self,
+        values: pdarray,
+        q: Union[float_scalars, Sequence[float_scalars]] = 0.5,
+        skipna: bool = True,
+    ) -> Tuple[groupable, Union[pdarray, List[pdarray]]]:
+        """
+        Group another array of values and compute quantiles of each group's values.
+
+        Group using the permutation stored in the GroupBy instance.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to group and find quantiles of
+        q : float or sequence of float
+            Quantile(s) to compute, each between 0 and 1 inclusive (Default: 0.5)
+        skipna: bool
+            boolean which determines if NANs should be skipped
+
+        Returns
+        -------
+        Tuple[groupable, Union[pdarray, List[pdarray]]]
+            unique_keys : (list of) pdarray or Strings
+                The unique keys, in grouped order
+            group_quantiles : pdarray, float64 or list of pdarray, float64
+                One quantile value per unique key in the GroupBy instance,
+                or a list of these, one per element of q, if q is a sequence
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray object
+        ValueError
+            Raised if the key array size does not match the values size
+            or if a quantile is not between 0 and 1
+
+        Notes
+        -----
+        The return dtype is always float64. Quantiles are exact and are
+        interpolated linearly between the two nearest values, as in
+        ``numpy.quantile``. They are found by selection within each group,
+        so the values are never sorted.
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.quantile(ak.array([1, 2, 4, 8, 17]), 0.25)
+        (array([0 1]), array([2.5 3.5]))
+        >>> _, (lows, highs) = g.quantile(ak.array([1, 2, 4, 8, 17]), [0.25, 0.75])
+        >>> lows
+        array([2.5 3.5])
+        >>> highs
+        array([10.5 6.5])
+
+        """
+        if not isinstance(values, pdarray):
+            raise TypeError(f"quantile is only supported for pdarrays, not {type(values).__name__}")
+        if values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        scalar_q = np.isscalar(q)
+        qs = [float(cast(float, q))] if scalar_q else [float(x) for x in cast(Sequence[float], q)]
+        if any(not 0 <= x <= 1 for x in qs):
+            raise ValueError("Quantiles must be between 0 and 1 inclusive")
+
+        if self.assume_sorted:
+            permuted_values = values
+        else:
+            permuted_values = values[self.permutation]
+
+        repMsg = generic_msg(
+            cmd="segmentedQuantile",
+            args={
+                "values": permuted_values,
+                "segments": self.segments,
+                "q": qs,
+                "skip_nan": skipna,
+            },
+        )
+        self.logger.debug(repMsg)
+        results = [create_pdarray(part) for part in cast(str, repMsg).split("+")]
+        return self.unique_keys, results[0] if scalar_q else results
+
     def min(self, values: pdarray, skipna: bool = True) -> Tuple[groupable, pdarray]:
         """
         Group another array of values and return the minimum of each group's values.
@@ -2010,6 +2324,353 @@ class GroupBy:
                 ret = [r[perm] for r in ret]  # type: ignore
         return self.unique_keys, ret
 
+    def _segmented_scan(
+        self,
+        values: pdarray,
+        op: str,
+        n: int_scalars = 0,
+        min_periods: int_scalars = 1,
+        skipna: bool = True,
+        fill_value=0,
+        permutation: Optional[pdarray] = None,
+    ) -> pdarray:
+        """
+        Run a segmented scan over values on the server.
+
+        The values are gathered into grouped order, scanned within each
+        group, and scattered back, so the result is in the original order.
+        """
+        if not isinstance(values, pdarray):
+            raise TypeError(f"{op} is only supported for pdarrays, not {type(values).__name__}")
+        if values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+
+        repMsg = generic_msg(
+            cmd="segmentedScan",
+            args={
+                "values": values,
+                "permutation": self.permutation if permutation is None else permutation,
+                "segments": self.segments,
+                "op": op,
+                "n": n,
+                "min_periods": min_periods,
+                "skip_nan": skipna,
+                "fill_value": fill_value,
+            },
+        )
+        self.logger.debug(repMsg)
+        return create_pdarray(repMsg)
+
+    def cumsum(self, values: pdarray, skipna: bool = True) -> pdarray:
+        """
+        Cumulative sum of values within each group.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to accumulate
+        skipna: bool
+            If True, NaN values are skipped by the running sum and
+            left as NaN in the result
+
+        Returns
+        -------
+        pdarray
+            The running sum of each row's group, in the original row order.
+            bool values are summed as int64.
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cumsum(ak.array([1, 2, 3, 4, 5]))
+        array([1 2 4 6 9])
+
+        """
+        return self._segmented_scan(values, "cumsum", skipna=skipna)
+
+    def cumprod(self, values: pdarray, skipna: bool = True) -> pdarray:
+        """
+        Cumulative product of values within each group.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to accumulate
+        skipna: bool
+            If True, NaN values are skipped by the running product and
+            left as NaN in the result
+
+        Returns
+        -------
+        pdarray
+            The running product of each row's group, in the original row order.
+            bool values are multiplied as int64.
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cumprod(ak.array([1, 2, 3, 4, 5]))
+        array([1 2 3 8 15])
+
+        """
+        return self._segmented_scan(values, "cumprod", skipna=skipna)
+
+    def cummax(self, values: pdarray, skipna: bool = True) -> pdarray:
+        """
+        Cumulative maximum of values within each group.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to accumulate
+        skipna: bool
+            If True, NaN values are skipped by the running maximum and
+            left as NaN in the result
+
+        Returns
+        -------
+        pdarray
+            The running maximum of each row's group, in the original row order
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cummax(ak.array([3, 2, 1, 4, 5]))
+        array([3 2 3 4 5])
+
+        """
+        return self._segmented_scan(values, "cummax", skipna=skipna)
+
+    def cummin(self, values: pdarray, skipna: bool = True) -> pdarray:
+        """
+        Cumulative minimum of values within each group.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to accumulate
+        skipna: bool
+            If True, NaN values are skipped by the running minimum and
+            left as NaN in the result
+
+        Returns
+        -------
+        pdarray
+            The running minimum of each row's group, in the original row order
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.cummin(ak.array([3, 2, 1, 4, 5]))
+        array([3 2 1 2 1])
+
+        """
+        return self._segmented_scan(values, "cummin", skipna=skipna)
+
+    def rank(self, values: Optional[pdarray] = None, ascending: bool = True) -> pdarray:
+        """
+        Rank of each row within its group.
+
+        Ties are broken by the original row order, like ``method="first"``
+        in pandas.
+
+        Parameters
+        ----------
+        values : pdarray, optional
+            The values to rank by. If None (default), rows are ranked by
+            their position in the original array, i.e. the first row of a
+            group has rank 1, the second rank 2, and so on.
+        ascending : bool
+            If True (default), the smallest value in each group has rank 1.
+            Ignored if values is None.
+
+        Returns
+        -------
+        pdarray, int64
+            The 1-based rank of each row within its group, in the original row order
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.rank()
+        array([1 1 2 2 3])
+        >>> g.rank(ak.array([5, 1, 3, 2, 4]))
+        array([3 1 1 2 2])
+
+        """
+        from arkouda.numpy.sorting import coargsort
+
+        if values is None:
+            return self._segmented_scan(self.permutation, "rank")
+
+        if not isinstance(values, pdarray):
+            raise TypeError(f"rank is only supported for pdarrays, not {type(values).__name__}")
+        if values.size != self.length:
+            raise ValueError("Attempt to group array using key array of different length")
+        if not ascending:
+            values = ~values if values.dtype in (akuint64, bool) else -values
+        # Order rows by (group, value). The group ids are sorted the same way
+        # as the GroupBy, so the segments still apply to this permutation.
+        group_ids = self.broadcast(arange(self.ngroups), permute=True)
+        perm = coargsort([group_ids, values])
+        return self._segmented_scan(perm, "rank", permutation=perm)
+
+    def shift(self, values: pdarray, periods: int_scalars = 1, fill_value=None) -> pdarray:
+        """
+        Shift values within each group by the given number of rows.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to shift
+        periods : int_scalars
+            Number of rows to shift by. Negative values shift backwards,
+            i.e. each row gets a later value from its group. (Default: 1)
+        fill_value : scalar, optional
+            The value used for rows with no value ``periods`` rows away in
+            their group. If None (default), NaN is used and non-float values
+            are converted to float64.
+
+        Returns
+        -------
+        pdarray
+            The shifted values, in the original row order
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.shift(ak.array([1, 2, 3, 4, 5]), fill_value=-1)
+        array([-1 -1 1 2 3])
+        >>> g.shift(ak.array([1, 2, 3, 4, 5]), periods=-1, fill_value=-1)
+        array([3 4 5 -1 -1])
+
+        """
+        from arkouda.numpy import cast as akcast
+
+        if fill_value is None:
+            fill_value = np.nan
+            if isinstance(values, pdarray) and values.dtype != akfloat64:
+                values = akcast(values, akfloat64)
+        return self._segmented_scan(values, "shift", n=periods, fill_value=fill_value)
+
+    def diff(self, values: pdarray, periods: int_scalars = 1) -> pdarray:
+        """
+        Difference between each value and the value ``periods`` rows earlier in its group.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to difference
+        periods : int_scalars
+            Number of rows to look back. Negative values look forward. (Default: 1)
+
+        Returns
+        -------
+        pdarray, float64
+            The differences, in the original row order. Rows with no value
+            ``periods`` rows away in their group are NaN.
+
+        Raises
+        ------
+        TypeError
+            Raised if the values array is not a pdarray
+        ValueError
+            Raised if the key array size does not match the values size
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.diff(ak.array([1, 2, 4, 8, 16]))
+        array([nan nan 3.00000000000000000 6.00000000000000000 12.00000000000000000])
+
+        """
+        return self._segmented_scan(values, "diff", n=periods)
+
+    def rolling(self, window: int_scalars, min_periods: Optional[int_scalars] = None) -> GroupByRolling:
+        """
+        Provide rolling window aggregations within each group.
+
+        Parameters
+        ----------
+        window : int_scalars
+            Number of rows in each window, ending at (and including) the current row
+        min_periods : int_scalars, optional
+            Minimum number of non-NaN values in a window required to produce a
+            value; otherwise the result is NaN. Defaults to window. NaNs are
+            skipped by the sums and means.
+
+        Returns
+        -------
+        GroupByRolling
+            An object whose ``sum`` and ``mean`` methods compute the rolling aggregations
+
+        Raises
+        ------
+        ValueError
+            Raised if window is not positive or min_periods is not in [0, window]
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> g = ak.GroupBy(ak.array([0, 1, 0, 1, 0]))
+        >>> g.rolling(2).sum(ak.array([1, 2, 3, 4, 5]))
+        array([nan nan 4.00000000000000000 6.00000000000000000 8.00000000000000000])
+        >>> g.rolling(2, min_periods=1).mean(ak.array([1, 2, 3, 4, 5]))
+        array([1.00000000000000000 2.00000000000000000 2.00000000000000000
+            3.00000000000000000 4.00000000000000000])
+
+        """
+        return GroupByRolling(self, window, min_periods)
+
     @typechecked
     def broadcast(
         self, values: Union[pdarray, Strings], permute: bool = True
@@ -2320,6 +2981,77 @@ class GroupBy:
         return is_registered(self.registered_name)
 
 
+class GroupByRolling:
+    """
+    Rolling window aggregations within the groups of a GroupBy.
+
+    Created by ``GroupBy.rolling``; each window ends at (and includes) the
+    current row and never extends past the start of its group.
+
+    Parameters
+    ----------
+    gb : GroupBy
+        The grouping to compute windows within
+    window : int_scalars
+        Number of rows in each window
+    min_periods : int_scalars, optional
+        Minimum number of non-NaN values in a window required to produce a
+        value; otherwise the result is NaN. Defaults to window.
+
+    """
+
+    def __init__(
+        self, gb: GroupBy, window: int_scalars, min_periods: Optional[int_scalars] = None
+    ) -> None:
+        if min_periods is None:
+            min_periods = window
+        if window < 1:
+            raise ValueError("window must be positive")
+        if min_periods < 0 or min_periods > window:
+            raise ValueError("min_periods must be between 0 and window")
+        self.gb = gb
+        self.window = window
+        self.min_periods = min_periods
+
+    def sum(self, values: pdarray) -> pdarray:
+        """
+        Sum of the values in each row's window.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to sum
+
+        Returns
+        -------
+        pdarray, float64
+            The rolling sums, in the original row order
+
+        """
+        return self.gb._segmented_scan(
+            values, "rolling_sum", n=self.window, min_periods=self.min_periods
+        )
+
+    def mean(self, values: pdarray) -> pdarray:
+        """
+        Mean of the values in each row's window.
+
+        Parameters
+        ----------
+        values : pdarray
+            The values to average
+
+        Returns
+        -------
+        pdarray, float64
+            The rolling means, in the original row order
+
+        """
+        return self.gb._segmented_scan(
+            values, "rolling_mean", n=self.window, min_periods=self.min_periods
+        )
+
+
 def broadcast(
     segments: pdarray,
     values: Union[pdarray, Strings],
@@ -2415,3 +3147,198 @@ def broadcast(
     )
     broadcasted = create_pdarray(repMsg)
     return str_vals[broadcasted] if is_str else broadcasted
+
+
+class GroupByCacheInfo(NamedTuple):
+    """
+    Statistics of the session GroupBy cache, as returned by groupby_cache_info.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups answered from the cache.
+    misses : int
+        Number of lookups that had to build a new GroupBy.
+    evictions : int
+        Number of entries dropped to stay within the memory budget.
+    entries : int
+        Number of GroupBy objects currently cached.
+    nbytes : int
+        Estimated server memory held by the cached GroupBy objects.
+    max_bytes : Optional[int]
+        Memory budget of the cache, or None if the cache is disabled.
+
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    nbytes: int
+    max_bytes: Optional[int]
+
+
+def _key_components(keys: groupable) -> List[Union[pdarray, Strings]]:
+    # the server-side arrays a GroupBy over keys depends on
+    comps: List[Union[pdarray, Strings]] = []
+    for k in keys if isinstance(keys, (list, tuple)) else [keys]:
+        if hasattr(k, "_get_grouping_keys"):
+            comps.extend(cast(List[Union[pdarray, Strings]], k._get_grouping_keys()))
+        else:
+            comps.append(cast(Union[pdarray, Strings], k))
+    return comps
+
+
+def _groupby_nbytes(g: GroupBy) -> int:
+    # estimate of the server memory owned by a GroupBy (permutation, segments, unique keys)
+    def nbytes(x) -> int:
+        if isinstance(x, pdarray):
+            return int(x.nbytes)
+        elif isinstance(x, Strings):
+            return int(x.nbytes) + int(x.size) * np.dtype(akint64).itemsize
+        elif isinstance(x, (list, tuple)):
+            return sum(nbytes(y) for y in x)
+        elif hasattr(x, "codes"):
+            return nbytes(x.codes)
+        return 0
+
+    # dense GroupBy objects may not have built their permutation yet
+    return (
+        nbytes(g._permutation)
+        + nbytes(g.segments)
+        + nbytes(g._unique_key_indices)
+        + nbytes(g.unique_keys)
+    )
+
+
+class _GroupByCache:
+    """
+    LRU cache of GroupBy objects keyed by the identities of their key arrays.
+
+    Each entry also records the version counters of the key arrays when the
+    GroupBy was built, so an entry whose keys were modified in place is
+    rebuilt rather than returned.
+    """
+
+    def __init__(self) -> None:
+        self.max_bytes: Optional[int] = None
+        self.entries: OrderedDict = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _drop(self, key) -> None:
+        _, _, size = self.entries.pop(key)
+        self.nbytes -= size
+
+    def get(self, keys: groupable, assume_sorted: bool, dropna: bool) -> GroupBy:
+        if self.max_bytes is None:
+            return GroupBy(keys, assume_sorted=assume_sorted, dropna=dropna)
+        comps = _key_components(keys)
+        key = (tuple(c.name for c in comps), assume_sorted, dropna)
+        versions = tuple(getattr(c, "_version", 0) for c in comps)
+        if key in self.entries:
+            g, cached_versions, _ = self.entries[key]
+            if cached_versions == versions:
+                self.entries.move_to_end(key)
+                self.hits += 1
+                return g
+            self._drop(key)
+        self.misses += 1
+        g = GroupBy(keys, assume_sorted=assume_sorted, dropna=dropna)
+        size = _groupby_nbytes(g)
+        if size <= self.max_bytes:
+            self.entries[key] = (g, versions, size)
+            self.nbytes += size
+            self._evict()
+        return g
+
+    def _evict(self) -> None:
+        while self.max_bytes is not None and self.nbytes > self.max_bytes and self.entries:
+            self._drop(next(iter(self.entries)))
+            self.evictions += 1
+
+    def invalidate(self, keys: groupable) -> None:
+        names = {c.name for c in _key_components(keys)}
+        for key in [k for k in self.entries if names.intersection(k[0])]:
+            self._drop(key)
+
+    def clear(self) -> None:
+        self.entries.clear()
+        self.nbytes = 0
+
+
+_groupby_cache = _GroupByCache()
+
+
+def enable_groupby_cache(max_bytes: int = 2**30) -> None:
+    """
+    Enable the session cache of GroupBy objects used by DataFrame.groupby.
+
+    While enabled, grouping a DataFrame again by the same key columns reuses the
+    permutation and segments computed the first time instead of repeating the
+    full sort. Entries are keyed by the key arrays (and by ``dropna`` and
+    ``assume_sorted``), are rebuilt if a key array was modified in place, and
+    are evicted least-recently-used first once their estimated server memory
+    exceeds ``max_bytes``.
+
+    Parameters
+    ----------
+    max_bytes : int, default=2**30
+        Memory budget, in bytes, of the server arrays held by cached GroupBy objects.
+
+    Raises
+    ------
+    ValueError
+        Raised if max_bytes is negative.
+
+    See Also
+    --------
+    disable_groupby_cache, clear_groupby_cache, groupby_cache_info
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> ak.enable_groupby_cache()
+    >>> df = ak.DataFrame({"src": ak.array([1, 2, 1]), "val": ak.array([1, 2, 3])})
+    >>> _ = df.groupby("src").sum()
+    >>> _ = df.groupby("src").count()
+    >>> ak.groupby_cache_info().hits
+    1
+
+    """
+    if max_bytes < 0:
+        raise ValueError("max_bytes must be non-negative")
+    _groupby_cache.max_bytes = max_bytes
+    _groupby_cache._evict()
+
+
+def disable_groupby_cache() -> None:
+    """Disable the session GroupBy cache and release its entries."""
+    _groupby_cache.max_bytes = None
+    _groupby_cache.clear()
+
+
+def clear_groupby_cache() -> None:
+    """Release all entries of the session GroupBy cache and reset its statistics."""
+    _groupby_cache.clear()
+    _groupby_cache.hits = _groupby_cache.misses = _groupby_cache.evictions = 0
+
+
+def groupby_cache_info() -> GroupByCacheInfo:
+    """
+    Report the statistics of the session GroupBy cache.
+
+    Returns
+    -------
+    GroupByCacheInfo
+        Named tuple of hits, misses, evictions, entries, nbytes and max_bytes.
+
+    See Also
+    --------
+    enable_groupby_cache
+
+    """
+    c = _groupby_cache
+    return GroupByCacheInfo(c.hits, c.misses, c.evictions, len(c.entries), c.nbytes, c.max_bytes)
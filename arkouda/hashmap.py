@@ -0,0 +1,469 @@
+"""
+Prepared lookup tables for arkouda.
+
+A ``HashMap`` maps unique keys to values, like a Python dict, with a hash
+table of its keys built once on the server and then probed by every lookup.
+Repeated ``ak.lookup`` calls against the same keys rebuild their search
+structure each time; a ``HashMap`` keeps it, can be registered and attached
+by name, and can be saved to and read back from HDF5.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Dict, List, Optional, Sequence, Union, cast
+
+from typeguard import typechecked
+
+from arkouda.alignment import NonUniqueError
+from arkouda.client import generic_msg
+from arkouda.index import _HashLookup
+from arkouda.numpy.dtypes import bigint
+from arkouda.numpy.numeric import where
+from arkouda.numpy.pdarrayclass import RegistrationError, create_pdarray, pdarray
+from arkouda.numpy.pdarraycreation import arange, full
+from arkouda.numpy.pdarraysetops import concatenate
+from arkouda.numpy.strings import Strings
+
+__all__ = ["HashMap"]
+
+
+class HashMap:
+    """
+    A mapping from unique keys to values, backed by a hash table on the server.
+
+    Parameters
+    ----------
+    keys : pdarray, Strings, or sequence of pdarray and Strings
+        The keys, as one array or as several arrays of equal size whose rows
+        are the keys. Every key must be unique.
+    values : pdarray or Strings
+        The value of each key
+
+    Attributes
+    ----------
+    keys : Union[pdarray, Strings, List[Union[pdarray, Strings]]]
+        The keys of the map, as one array or a list of arrays
+    values : Union[pdarray, Strings]
+        The value of each key
+    size : int
+        The number of keys
+
+    Raises
+    ------
+    TypeError
+        Raised if the keys or values are not pdarray or Strings, or the keys
+        are bigint
+    ValueError
+        Raised if the keys and values differ in size
+    NonUniqueError
+        Raised if a key occurs more than once
+
+    See Also
+    --------
+    arkouda.lookup, arkouda.find
+
+    Notes
+    -----
+    Integer and boolean keys in a single array are hashed by their values, and
+    all other keys by their 128-bit ``ak.hash``, as in ``ak.find``. Building
+    the table costs about as much as one ``ak.lookup``; each later ``get`` or
+    ``contains`` only probes it.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> hm = ak.HashMap(ak.array(["a", "b", "c"]), ak.array([1, 2, 3]))
+    >>> hm.get(ak.array(["c", "d", "a"]))
+    array([3 -1 1])
+    >>> hm.get(ak.array(["c", "d", "a"]), default=0)
+    array([3 0 1])
+    >>> hm.contains(ak.array(["c", "d", "a"]))
+    array([True False True])
+
+    """
+
+    objType = "HashMap"
+
+    keys: Union[pdarray, Strings, List[Union[pdarray, Strings]]]
+    values: Union[pdarray, Strings]
+    size: int
+
+    def __init__(
+        self,
+        keys: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+        values: Union[pdarray, Strings],
+    ) -> None:
+        levels = self._levels(keys)
+        if not isinstance(values, (pdarray, Strings)):
+            raise TypeError("values must be a pdarray or Strings")
+        if values.size != levels[0].size:
+            raise ValueError("keys and values must be the same size")
+        table = _HashLookup(levels)
+        if table.has_duplicates():
+            raise NonUniqueError("HashMap keys must be unique")
+        self._setup(levels, values, table)
+
+    @staticmethod
+    def _levels(keys) -> List[Union[pdarray, Strings]]:
+        levels = [keys] if isinstance(keys, (pdarray, Strings)) else list(keys)
+        if len(levels) == 0:
+            raise ValueError("HashMap requires at least one key array")
+        for k in levels:
+            if not isinstance(k, (pdarray, Strings)):
+                raise TypeError("HashMap keys must be pdarray or Strings")
+            if isinstance(k, pdarray) and k.dtype == bigint:
+                raise TypeError("HashMap keys cannot be bigint")
+        if any(k.size != levels[0].size for k in levels):
+            raise ValueError("All key arrays must be the same size")
+        return levels
+
+    def _setup(self, levels, values, table: _HashLookup) -> None:
+        self._key_levels = levels
+        self.keys = levels[0] if len(levels) == 1 else levels
+        self.values = values
+        self._table = table
+        self.size = int(levels[0].size)
+        self.registered_name: Optional[str] = None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __repr__(self) -> str:
+        return f"HashMap(size={self.size}, keys={len(self._key_levels)}, values={self.values.dtype})"
+
+    def _first(self, arguments) -> pdarray:
+        """Return the position of each argument among the keys, or -1 if it is not a key."""
+        args = [arguments] if isinstance(arguments, (pdarray, Strings)) else list(arguments)
+        if not self._table.accepts(args):
+            raise TypeError("arguments must match the number and types of the keys")
+        if not self._table.is_valid(self._key_levels):
+            # the keys were modified in place since the table was built; a registered
+            # map is registered again, so that its registry entry holds the new table
+            name = self.registered_name
+            if name is not None and self.is_registered():
+                self.unregister()
+            self._table = _HashLookup(self._key_levels)
+            if name is not None:
+                self.register(name)
+        return self._table.first(args)
+
+    def get(
+        self,
+        arguments: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+        default=None,
+    ) -> Union[pdarray, Strings]:
+        """
+        Look up the value of each argument.
+
+        Parameters
+        ----------
+        arguments : pdarray, Strings, or sequence of pdarray and Strings
+            The keys to look up, with the same number and types of arrays as
+            the keys of the map
+        default : scalar, optional
+            The value of arguments that are not keys, like the default of
+            ``dict.get`` and the fillvalue of ``ak.lookup``. Defaults to -1 for
+            numeric values and the empty string for Strings values.
+
+        Returns
+        -------
+        pdarray or Strings
+            The value of each argument, as ``ak.lookup`` returns
+
+        Raises
+        ------
+        TypeError
+            Raised if the arguments do not match the keys
+
+        """
+        idx = self._first(arguments)
+        found = idx >= 0
+        if default is None:
+            default = "" if isinstance(self.values, Strings) else -1
+        if self.size == 0:
+            return full(idx.size, default, dtype=self.values.dtype)
+        if isinstance(self.values, Strings):
+            return where(found, self.values[where(found, idx, 0)], default)
+        retvals = full(idx.size, default, dtype=self.values.dtype)
+        retvals[found] = self.values[idx[found]]
+        return retvals
+
+    def contains(self, arguments: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]]) -> pdarray:
+        """
+        Whether each argument is a key of the map.
+
+        Parameters
+        ----------
+        arguments : pdarray, Strings, or sequence of pdarray and Strings
+            The keys to look for
+
+        Returns
+        -------
+        pdarray, bool
+            True where the argument is a key
+
+        """
+        return self._first(arguments) >= 0
+
+    def update(
+        self,
+        keys: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+        values: Union[pdarray, Strings],
+    ) -> HashMap:
+        """
+        Add keys to the map, or replace the values of keys it already has.
+
+        The table is rebuilt once for the whole batch. A registered map stays
+        registered under its name.
+
+        Parameters
+        ----------
+        keys : pdarray, Strings, or sequence of pdarray and Strings
+            The keys to set, unique and matching the keys of the map
+        values : pdarray or Strings
+            The value of each key, of the same type as the values of the map
+
+        Returns
+        -------
+        HashMap
+            The map itself, updated in place
+
+        Raises
+        ------
+        TypeError
+            Raised if the keys or values do not match those of the map
+        NonUniqueError
+            Raised if a key occurs more than once in the update
+
+        """
+        new_levels = self._levels(keys)
+        if type(values) is not type(self.values) or values.dtype != self.values.dtype:
+            raise TypeError("values must be of the same type as the values of the HashMap")
+        if values.size != new_levels[0].size:
+            raise ValueError("keys and values must be the same size")
+        # a key repeated in the update would set its value twice, in no particular order
+        if _HashLookup(new_levels).has_duplicates():
+            raise NonUniqueError("HashMap keys must be unique")
+        idx = self._first(new_levels)
+        found = idx >= 0
+        new_pos = arange(self.size, self.size + values.size)
+        # the position of each value of the updated map in the old values then the new
+        pos = arange(self.size)
+        pos[idx[found]] = new_pos[found]
+        pos = concatenate([pos, new_pos[~found]])
+        new_values = concatenate([self.values, values])[pos]
+        levels = [
+            concatenate([old, new[~found]], ordered=True)
+            for old, new in zip(self._key_levels, new_levels)
+        ]
+        table = _HashLookup(levels)
+        if table.has_duplicates():
+            raise NonUniqueError("HashMap keys must be unique")
+        name = self.registered_name
+        if name is not None and self.is_registered():
+            self.unregister()
+        self._setup(levels, new_values, table)
+        if name is not None:
+            self.register(name)
+        return self
+
+    def to_hdf(
+        self,
+        prefix_path: str,
+        dataset: str = "hashmap",
+        mode: str = "truncate",
+        file_type: str = "distribute",
+    ) -> None:
+        """
+        Save the keys and values of the map to HDF5.
+
+        Parameters
+        ----------
+        prefix_path : str
+            Directory and filename prefix that all output files will share
+        dataset : str
+            Name prefix for saved data within the HDF5 file
+        mode : str {'truncate' | 'append'}
+            By default, truncate (overwrite) output files, if they exist.
+            If 'append', add data as new columns to existing files.
+        file_type : str ("single" | "distribute")
+            Default: "distribute"
+            When set to single, dataset is written to a single file.
+            When distribute, dataset is written on a file per locale.
+
+        See Also
+        --------
+        read_hdf
+
+        Notes
+        -----
+        The hash table itself is not saved; ``read_hdf`` rebuilds it.
+
+        """
+        from arkouda.io import to_hdf
+
+        columns = {f"{dataset}_key{i}": k for i, k in enumerate(self._key_levels)}
+        columns[f"{dataset}_values"] = self.values
+        to_hdf(columns, prefix_path, mode=mode, file_type=file_type)
+
+    @classmethod
+    def read_hdf(cls, prefix_path: str, dataset: str = "hashmap") -> HashMap:
+        """
+        Read a map saved with ``to_hdf``.
+
+        Parameters
+        ----------
+        prefix_path : str
+            Directory and filename prefix of the files
+        dataset : str
+            Name prefix the map was saved under
+
+        Returns
+        -------
+        HashMap
+            The map, with its hash table rebuilt
+
+        """
+        from arkouda.io import get_datasets, read_hdf
+
+        filenames = prefix_path + "*"
+        key_names = sorted(
+            (d for d in get_datasets(filenames) if d.startswith(f"{dataset}_key")),
+            key=lambda d: int(d[len(f"{dataset}_key") :]),
+        )
+        data = cast(
+            Dict[str, Union[pdarray, Strings]],
+            read_hdf(filenames, datasets=key_names + [f"{dataset}_values"]),
+        )
+        return cls([data[k] for k in key_names], data[f"{dataset}_values"])
+
+    def register(self, user_defined_name: str) -> HashMap:
+        """
+        Register this HashMap, its keys, values and hash table with the Arkouda server.
+
+        Parameters
+        ----------
+        user_defined_name : str
+            user defined name the HashMap is to be registered under,
+            this will be the root name for underlying components
+
+        Returns
+        -------
+        HashMap
+            The same HashMap which is now registered with the arkouda server and has an
+            updated name.
+
+        Raises
+        ------
+        RegistrationError
+            If the HashMap is already registered, or the server was unable to register it
+
+        See Also
+        --------
+        unregister, attach, is_registered
+
+        Notes
+        -----
+        Objects registered with the server are immune to deletion until
+        they are unregistered.
+
+        """
+        if self.registered_name is not None and self.is_registered():
+            raise RegistrationError(f"This object is already registered as {self.registered_name}")
+        table_names = list(self._table.arrays.keys())
+        generic_msg(
+            cmd="register",
+            args={
+                "name": user_defined_name,
+                "objType": self.objType,
+                "num_keys": len(self._key_levels),
+                "keys": [k.name for k in self._key_levels],
+                "key_objTypes": [k.objType for k in self._key_levels],
+                "values": self.values.name,
+                "val_type": self.values.objType,
+                "num_table": len(table_names),
+                "table_names": table_names,
+                "table": [self._table.arrays[n].name for n in table_names],
+            },
+        )
+        self.registered_name = user_defined_name
+        return self
+
+    def unregister(self) -> None:
+        """
+        Unregister this HashMap object.
+
+        Raises
+        ------
+        RegistrationError
+            If the object is already unregistered or if there is a server error
+            when attempting to unregister
+
+        See Also
+        --------
+        register, attach, is_registered
+
+        """
+        from arkouda.numpy.util import unregister
+
+        if not self.registered_name:
+            raise RegistrationError(
+                "This item does not have a name and does not appear to be registered."
+            )
+        unregister(self.registered_name)
+        self.registered_name = None
+
+    def is_registered(self) -> bool:
+        """
+        Return True if the object is contained in the registry.
+
+        Returns
+        -------
+        bool
+            Indicates if the object is contained in the registry
+
+        See Also
+        --------
+        register, attach, unregister
+
+        """
+        from arkouda.numpy.util import is_registered
+
+        if self.registered_name is None:
+            return False
+        return is_registered(self.registered_name)
+
+    @classmethod
+    @typechecked
+    def from_return_msg(cls, rep_msg: str) -> HashMap:
+        """
+        Create a HashMap from the components returned by attach.
+
+        Parameters
+        ----------
+        rep_msg : str
+            JSON of the HashMap's components, as returned by the server
+
+        Returns
+        -------
+        HashMap
+
+        """
+        data = json.loads(rep_msg)
+
+        def component(create_data):
+            obj_type, create = create_data.split("+|+")
+            if obj_type == Strings.objType.upper():
+                return Strings.from_return_msg(create)
+            return create_pdarray(create)
+
+        key_names = sorted((k for k in data if k.startswith("KEY_")), key=lambda k: int(k[4:]))
+        levels = [component(data[k]) for k in key_names]
+        values = component(data["values"])
+        arrays = {
+            k[len("TABLE_") :]: create_pdarray(v) for k, v in data.items() if k.startswith("TABLE_")
+        }
+        hm = cast(HashMap, cls.__new__(cls))
+        hm._setup(levels, values, _HashLookup(levels, arrays))
+        return hm
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import builtins
 import json
-from typing import TYPE_CHECKING, List, Optional, Tuple, Union
+import math
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import pandas as pd
@@ -11,17 +12,21 @@ from numpy import dtype as npdtype
 from typeguard import typechecked
 
 from arkouda.categorical import Categorical
+from arkouda.client import generic_msg
 from arkouda.groupbyclass import GroupBy, unique
 from arkouda.numpy import cast as akcast
+from arkouda.numpy import cumsum, hash
 from arkouda.numpy.dtypes import bool_ as akbool
 from arkouda.numpy.dtypes import bool_scalars
 from arkouda.numpy.dtypes import float64 as akfloat64
 from arkouda.numpy.dtypes import int64 as akint64
+from arkouda.numpy.dtypes import uint64 as akuint64
 from arkouda.numpy.pdarrayclass import RegistrationError, pdarray
-from arkouda.numpy.pdarraycreation import arange, array, create_pdarray, ones
+from arkouda.numpy.pdarraycreation import arange, array, create_pdarray, ones, zeros
 from arkouda.numpy.pdarraysetops import argsort, in1d
-from arkouda.numpy.sorting import coargsort
+from arkouda.numpy.sorting import coargsort, searchsorted
 from arkouda.numpy.strings import Strings
+from arkouda.numpy.timeclass import Datetime, Timedelta
 from arkouda.numpy.util import convert_if_categorical, generic_concat, get_callback
 
 __all__ = [
@@ -34,6 +39,104 @@ if TYPE_CHECKING:
     from arkouda.pandas.series import Series
 
 
+class _HashLookup:
+    """
+    A server-side hash table of the labels of an Index, or of the search space of ak.find.
+
+    Labels are keyed as in hash joins: a single level of integers by its values,
+    and anything else by its 128-bit hash. The table holds references to the
+    levels it was built from, and is only valid while the Index still has them
+    and they have not been modified. A table built earlier is reused by passing
+    its arrays, named as in the buildHashIndex reply.
+    """
+
+    _INT_KINDS = ("int64", "uint64", "bool")
+
+    def __init__(self, levels: List[Union[pdarray, Strings]], arrays: Optional[dict] = None):
+        self.levels = list(levels)
+        self.versions = [getattr(level, "_version", None) for level in self.levels]
+        self.kinds = [self._kind(level) for level in self.levels]
+        self.size = self.levels[0].size
+        if arrays is None:
+            keys = self._keys(self.levels)
+            args: Dict[str, Any] = {"nkeys": len(keys)}
+            args.update({f"key{i}": k for i, k in enumerate(keys)})
+            repMsg = cast(str, generic_msg(cmd="buildHashIndex", args=args))
+            names = ["slotKeys0", "slotKeys1"][: len(keys)]
+            names += ["slotStart", "slotCount", "rows", "partSlots", "partSize"]
+            arrays = dict(zip(names, (create_pdarray(name) for name in repMsg.split("+"))))
+        self.arrays = arrays
+
+    @staticmethod
+    def _kind(level) -> Optional[str]:
+        if isinstance(level, Strings):
+            return "str"
+        if isinstance(level, pdarray):
+            return level.dtype.name
+        return None
+
+    @classmethod
+    def _keys(cls, levels: List[Union[pdarray, Strings]]) -> List[pdarray]:
+        """Return the uint64 keys of labels: their values, or the two words of their hashes."""
+        if len(levels) == 1 and cls._kind(levels[0]) in cls._INT_KINDS:
+            return [akcast(levels[0], akuint64)]
+        return list(hash(cast(list, levels)))
+
+    def is_valid(self, levels: List) -> bool:
+        """Return whether the table still describes these levels."""
+        return len(levels) == len(self.levels) and all(
+            a is b and getattr(a, "_version", None) == v
+            for a, b, v in zip(levels, self.levels, self.versions)
+        )
+
+    def accepts(self, keys: List) -> bool:
+        """Return whether the table can be probed with these keys."""
+        return self._compatible(self.kinds, keys)
+
+    @classmethod
+    def _compatible(cls, kinds: List, keys: List) -> bool:
+        """Return whether keys are keyed the same way as labels of these kinds."""
+        if len(keys) != len(kinds):
+            return False
+        if len(keys) == 1 and kinds[0] in cls._INT_KINDS:
+            # keys are cast to uint64, so int64 and uint64 must not meet: -1 would match 2**64-1
+            kind = cls._kind(keys[0])
+            return kind == kinds[0] or (kind in cls._INT_KINDS and "bool" in (kind, kinds[0]))
+        return all(cls._kind(k) == kind for k, kind in zip(keys, kinds))
+
+    def _probe(self, keys: List, mode: str) -> str:
+        probe = self._keys(list(keys))
+        args: Dict[str, Any] = {"nkeys": len(probe), "mode": mode, "size": self.size}
+        args.update(self.arrays)
+        args.update({f"key{i}": k for i, k in enumerate(probe)})
+        return cast(str, generic_msg(cmd="probeHashIndex", args=args))
+
+    def counts(self, keys: List) -> pdarray:
+        """Return the number of labels equal to each key."""
+        return create_pdarray(self._probe(keys, "counts"))
+
+    def occurrences(self, keys: List) -> Tuple[pdarray, pdarray]:
+        """Return the number of labels equal to each key, and their positions for each key in turn."""
+        counts, rows = self._probe(keys, "rows").split("+")
+        return create_pdarray(counts), create_pdarray(rows)
+
+    def rows(self, keys: List) -> pdarray:
+        """Return the positions of the labels equal to each key in turn, as indexof1d does."""
+        return self.occurrences(keys)[1]
+
+    def first(self, keys: List) -> pdarray:
+        """Return the position of the first label equal to each key, or -1 if there is none."""
+        return create_pdarray(self._probe(keys, "first"))
+
+    def has_duplicates(self) -> bool:
+        """Return whether any label occurs more than once."""
+        return bool((self.arrays["slotCount"] > 1).any())
+
+    def mask(self, keys: List) -> pdarray:
+        """Return whether each label is equal to one of the keys, as in1d does."""
+        return create_pdarray(self._probe(keys, "mask"))
+
+
 class Index:
     objType = "Index"
     """
@@ -724,8 +827,129 @@ class Index:
             except Exception:
                 raise TypeError("Lookup must be on an arkouda array")
 
+        table = self._label_lookup([key])
+        if table is not None:
+            return table.mask([key])
+        bounds = self._label_bounds(key)
+        if bounds is not None:
+            # mark the start and end of the run of labels equal to each key
+            lo, hi = bounds
+            found = hi > lo
+            starts = zeros(self.size + 1, dtype=akint64)
+            starts[lo[found]] = 1
+            ends = zeros(self.size + 1, dtype=akint64)
+            ends[hi[found]] = 1
+            return (cumsum(starts - ends) > 0)[: self.size]
         return in1d(self.values, key)
 
+    def _sorted_values(self) -> Optional[pdarray]:
+        """
+        Return the labels as a pdarray to binary search, if they are sorted numbers.
+
+        Whether they are sorted is computed once and kept in the stats of the
+        labels until they are modified.
+        """
+        values = self.values
+        if isinstance(values, (Datetime, Timedelta)):
+            values = values.values
+        if (
+            isinstance(values, pdarray)
+            and values.ndim == 1
+            and values.dtype in (akint64, akuint64, akfloat64)
+            and values.is_sorted()
+        ):
+            return values
+        return None
+
+    def _label_bounds(self, key) -> Optional[Tuple[pdarray, pdarray]]:
+        """Return the range of positions of the labels equal to each key, if the labels are sorted."""
+        values = self._sorted_values()
+        if values is None or not isinstance(key, pdarray) or key.dtype != values.dtype:
+            return None
+        return searchsorted(values, key, side="left"), searchsorted(values, key, side="right")
+
+    def _label_slice(self, key: slice) -> slice:
+        """
+        Return the positional slice of the labels from key.start to key.stop, inclusive.
+
+        Raises
+        ------
+        KeyError
+            Raised if the labels are not sorted numbers.
+
+        """
+        values = self._sorted_values()
+        if values is None:
+            raise KeyError("Slicing by label requires sorted numeric labels")
+
+        def bound(label, side):
+            if isinstance(self.values, Datetime):
+                label = pd.Timestamp(label).value
+            elif isinstance(self.values, Timedelta):
+                label = pd.Timedelta(label).value
+            elif np.issubdtype(values.dtype, np.integer) and not isinstance(label, (int, np.integer)):
+                # the integer labels from a fractional start, or up to a fractional stop
+                label = math.ceil(label) if side == "left" else math.floor(label)
+            return searchsorted(values, values.dtype.type(label), side=side)
+
+        start = 0 if key.start is None else bound(key.start, "left")
+        stop = self.size if key.stop is None else bound(key.stop, "right")
+        return slice(start, stop, key.step)
+
+    def _lookup_levels(self) -> List:
+        return [self.values]
+
+    def build_lookup(self):
+        """
+        Build a hash table of the labels that later lookups by label can probe.
+
+        Lookups such as Index.lookup, Series.locate and Series.loc otherwise
+        compare the keys with every label, sorting or hashing them on each call.
+        The table is kept on the server until the Index is deleted, or it can
+        be dropped sooner with drop_lookup. It is no longer used once the labels
+        of the Index are replaced or modified.
+
+        A table has at least two slots per label, so it takes several times the
+        memory of an integer Index.
+
+        Returns
+        -------
+        Index
+            This Index.
+
+        Raises
+        ------
+        TypeError
+            Raised if the labels are not a pdarray or Strings.
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> idx = ak.Index(ak.arange(5) + 100).build_lookup()
+        >>> idx.lookup(ak.array([101, 103]))
+        array([False True False True False])
+
+        """
+        levels = self._lookup_levels()
+        if not all(isinstance(level, (pdarray, Strings)) for level in levels):
+            raise TypeError("A lookup can only be built for labels that are pdarrays or Strings")
+        self._hash_lookup = _HashLookup(levels)
+        return self
+
+    def drop_lookup(self) -> None:
+        """Delete the hash table of the labels built by build_lookup, if there is one."""
+        self.__dict__.pop("_hash_lookup", None)
+
+    def _label_lookup(self, keys: List) -> Optional[_HashLookup]:
+        """Return the hash table of the labels, if it is current and can be probed with keys."""
+        table = self.__dict__.get("_hash_lookup")
+        if table is None:
+            return None
+        if not table.is_valid(self._lookup_levels()):
+            self.drop_lookup()
+            return None
+        return table if table.accepts(keys) else None
+
     def to_hdf(
         self,
         prefix_path: str,
@@ -1389,8 +1613,17 @@ class MultiIndex(Index):
             dt = self.levels[0].dtype if isinstance(self.levels[0], pdarray) else akint64
             key = [akcast(array([x]), dt) for x in key]
 
+        table = self._label_lookup(key)
+        if table is not None:
+            return table.mask(key)
         return in1d(self.index, key)
 
+    def _lookup_levels(self) -> List:
+        return self.levels
+
+    def _sorted_values(self) -> Optional[pdarray]:
+        return None
+
     def to_hdf(
         self,
         prefix_path: str,
@@ -0,0 +1,846 @@
+"""
+Lazily evaluated DataFrame queries for Arkouda.
+
+A LazyFrame records the operations applied to a data source (scan, filter,
+select, assign, groupby-aggregate and merge) as a query plan instead of
+executing them one by one. Calling ``collect()`` optimizes the plan and runs
+it:
+
+- column projections are pushed down into the scans, so ``read_parquet`` and
+  ``read_hdf`` only read the columns the query uses;
+- filters are pushed down through selections, assignments and joins to the
+  scans, where they are applied as soon as the predicate columns are read,
+  before any other column reaches a later operation.
+
+Functions
+---------
+- scan_parquet: Start a lazy query over Parquet files.
+- scan_hdf: Start a lazy query over HDF5 files.
+- col: Reference a column in a filter or assignment expression.
+
+Classes
+-------
+- LazyFrame: A lazily evaluated query plan producing a DataFrame.
+- LazyGroupBy: A pending groupby of a LazyFrame, completed by ``agg``.
+- Expr: A column expression used by ``LazyFrame.filter`` and ``LazyFrame.assign``.
+
+Examples
+--------
+>>> import arkouda as ak
+>>> df = ak.DataFrame({"src": ak.array([1, 2, 1, 3]), "val": ak.array([5, 6, 7, 8])})
+>>> lf = df.lazy().filter(ak.col("val") > 5).groupby("src").agg(total=("val", "sum"))
+>>> lf.collect()
+   src  total
+0    1      7
+1    2      6
+2    3      8 (3 rows x 2 columns)
+
+"""
+
+from __future__ import annotations
+
+import operator
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from arkouda.dataframe import DataFrame
+
+__all__ = ["Expr", "LazyFrame", "LazyGroupBy", "col", "scan_hdf", "scan_parquet"]
+
+
+class Expr:
+    """
+    A column expression, evaluated against the columns of a DataFrame.
+
+    Expressions are built from ``col(name)`` with the comparison, arithmetic
+    and logical (``&``, ``|``, ``~``) operators, and with ``isin``.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> (ak.col("a") > 5) & ak.col("b").isin(["x", "y"])
+    ((col('a') > 5) & col('b').isin(['x', 'y']))
+
+    """
+
+    def columns(self) -> Set[str]:
+        """Return the names of the columns the expression reads."""
+        raise NotImplementedError
+
+    def evaluate(self, data) -> Any:
+        """Evaluate the expression against a DataFrame or a dict of columns."""
+        raise NotImplementedError
+
+    def _binop(self, other, op: Callable, symbol: str, reflected: bool = False) -> Expr:
+        other = other if isinstance(other, Expr) else _Lit(other)
+        return _BinOp(op, symbol, other, self) if reflected else _BinOp(op, symbol, self, other)
+
+    def __eq__(self, other):  # type: ignore[override]
+        return self._binop(other, operator.eq, "==")
+
+    def __ne__(self, other):  # type: ignore[override]
+        return self._binop(other, operator.ne, "!=")
+
+    def __lt__(self, other):
+        return self._binop(other, operator.lt, "<")
+
+    def __le__(self, other):
+        return self._binop(other, operator.le, "<=")
+
+    def __gt__(self, other):
+        return self._binop(other, operator.gt, ">")
+
+    def __ge__(self, other):
+        return self._binop(other, operator.ge, ">=")
+
+    def __add__(self, other):
+        return self._binop(other, operator.add, "+")
+
+    def __radd__(self, other):
+        return self._binop(other, operator.add, "+", reflected=True)
+
+    def __sub__(self, other):
+        return self._binop(other, operator.sub, "-")
+
+    def __rsub__(self, other):
+        return self._binop(other, operator.sub, "-", reflected=True)
+
+    def __mul__(self, other):
+        return self._binop(other, operator.mul, "*")
+
+    def __rmul__(self, other):
+        return self._binop(other, operator.mul, "*", reflected=True)
+
+    def __truediv__(self, other):
+        return self._binop(other, operator.truediv, "/")
+
+    def __floordiv__(self, other):
+        return self._binop(other, operator.floordiv, "//")
+
+    def __mod__(self, other):
+        return self._binop(other, operator.mod, "%")
+
+    def __and__(self, other):
+        return self._binop(other, operator.and_, "&")
+
+    def __or__(self, other):
+        return self._binop(other, operator.or_, "|")
+
+    def __invert__(self):
+        return _Invert(self)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def isin(self, values: Sequence) -> Expr:
+        """Return an expression that is True where the value is one of values."""
+        return _IsIn(self, list(values))
+
+    def _conjuncts(self) -> List[Expr]:
+        # the terms of a chain of &, so each can be pushed down separately
+        if isinstance(self, _BinOp) and self.symbol == "&":
+            return self.left._conjuncts() + self.right._conjuncts()
+        return [self]
+
+
+class _Col(Expr):
+    def __init__(self, name: str):
+        self.name = name
+
+    def columns(self):
+        return {self.name}
+
+    def evaluate(self, data):
+        return data[self.name]
+
+    def __repr__(self):
+        return f"col({self.name!r})"
+
+
+class _Lit(Expr):
+    def __init__(self, value):
+        self.value = value
+
+    def columns(self):
+        return set()
+
+    def evaluate(self, data):
+        return self.value
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+class _BinOp(Expr):
+    def __init__(self, op: Callable, symbol: str, left: Expr, right: Expr):
+        self.op = op
+        self.symbol = symbol
+        self.left = left
+        self.right = right
+
+    def columns(self):
+        return self.left.columns() | self.right.columns()
+
+    def evaluate(self, data):
+        return self.op(self.left.evaluate(data), self.right.evaluate(data))
+
+    def __repr__(self):
+        return f"({self.left!r} {self.symbol} {self.right!r})"
+
+
+class _Invert(Expr):
+    def __init__(self, operand: Expr):
+        self.operand = operand
+
+    def columns(self):
+        return self.operand.columns()
+
+    def evaluate(self, data):
+        return ~self.operand.evaluate(data)
+
+    def __repr__(self):
+        return f"~{self.operand!r}"
+
+
+class _IsIn(Expr):
+    def __init__(self, operand: Expr, values: list):
+        self.operand = operand
+        self.values = values
+
+    def columns(self):
+        return self.operand.columns()
+
+    def evaluate(self, data):
+        from arkouda.numpy.pdarraycreation import array
+        from arkouda.numpy.pdarraysetops import in1d
+
+        return in1d(self.operand.evaluate(data), array(self.values))
+
+    def __repr__(self):
+        return f"{self.operand!r}.isin({self.values!r})"
+
+
+def col(name: str) -> Expr:
+    """
+    Return a reference to a column, for use in a LazyFrame expression.
+
+    Parameters
+    ----------
+    name : str
+        The column name
+
+    Returns
+    -------
+    Expr
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> ak.col("a") * 2 + 1
+    ((col('a') * 2) + 1)
+
+    """
+    return _Col(name)
+
+
+def _and_all(preds: List[Expr]) -> Optional[Expr]:
+    result: Optional[Expr] = None
+    for p in preds:
+        result = p if result is None else result & p
+    return result
+
+
+# Query plan nodes. Each node is immutable; the optimizer builds new nodes.
+
+
+class _Source:
+    # a DataFrame or a set of files, shared by every copy of a scan so the
+    # file schema is only looked up once
+    def __init__(self, kind: str, data, read_kwargs: Optional[dict] = None):
+        self.kind = kind  # "parquet", "hdf" or "frame"
+        self.data = data
+        self.read_kwargs = read_kwargs or {}
+        self._columns: Optional[List[str]] = None
+
+    @property
+    def columns(self) -> List[str]:
+        if self.kind == "frame":
+            return list(self.data.columns.values)
+        if self._columns is None:
+            from arkouda.io import get_datasets
+
+            # the server expands globs, as it does when reading the files
+            self._columns = get_datasets(self.data)
+        return list(self._columns)
+
+
+class _Scan:
+    def __init__(self, source: _Source, columns=None, predicate=None):
+        self.source = source
+        self.columns: Optional[List[str]] = columns
+        self.predicate: Optional[Expr] = predicate
+
+    def replace(self, **kwargs) -> _Scan:
+        args: Dict[str, Any] = dict(source=self.source, columns=self.columns, predicate=self.predicate)
+        args.update(kwargs)
+        return _Scan(**args)
+
+    def source_columns(self) -> List[str]:
+        return self.source.columns
+
+    def describe(self) -> str:
+        kind = self.source.kind
+        src = "DataFrame" if kind == "frame" else f"{kind} {self.source.data!r}"
+        cols = "*" if self.columns is None else self.columns
+        text = f"Scan {src} columns={cols}"
+        return text if self.predicate is None else f"{text} predicate={self.predicate!r}"
+
+
+class _Filter:
+    def __init__(self, input, predicate: Expr):
+        self.input = input
+        self.predicate = predicate
+
+    def describe(self) -> str:
+        return f"Filter {self.predicate!r}"
+
+
+class _Select:
+    def __init__(self, input, columns: List[str]):
+        self.input = input
+        self.columns = columns
+
+    def describe(self) -> str:
+        return f"Select {self.columns}"
+
+
+class _Assign:
+    def __init__(self, input, name: str, expr: Expr):
+        self.input = input
+        self.name = name
+        self.expr = expr
+
+    def describe(self) -> str:
+        return f"Assign {self.name}={self.expr!r}"
+
+
+class _Aggregate:
+    def __init__(self, input, keys: List[str], aggs: Dict[str, Tuple[str, str]]):
+        self.input = input
+        self.keys = keys
+        self.aggs = aggs
+
+    def describe(self) -> str:
+        return f"Aggregate keys={self.keys} aggs={self.aggs}"
+
+
+class _Merge:
+    def __init__(self, left, right, left_on: List[str], right_on: List[str], merge_kwargs: dict):
+        self.left = left
+        self.right = right
+        self.left_on = left_on
+        self.right_on = right_on
+        self.merge_kwargs = merge_kwargs
+
+    def describe(self) -> str:
+        return f"Merge left_on={self.left_on} right_on={self.right_on} {self.merge_kwargs}"
+
+
+def _children(node) -> list:
+    if isinstance(node, _Scan):
+        return []
+    if isinstance(node, _Merge):
+        return [node.left, node.right]
+    return [node.input]
+
+
+def _schema(node) -> List[str]:
+    # output column names of a plan node
+    if isinstance(node, _Scan):
+        return node.source_columns() if node.columns is None else list(node.columns)
+    if isinstance(node, _Filter):
+        return _schema(node.input)
+    if isinstance(node, _Select):
+        return list(node.columns)
+    if isinstance(node, _Assign):
+        cols = _schema(node.input)
+        return cols if node.name in cols else cols + [node.name]
+    if isinstance(node, _Aggregate):
+        return list(node.keys) + list(node.aggs)
+    left, right = _schema(node.left), _schema(node.right)
+    shared = [c for c in node.left_on if c in node.right_on]
+    lsuf = node.merge_kwargs.get("left_suffix", "_x")
+    rsuf = node.merge_kwargs.get("right_suffix", "_y")
+    out = [c + lsuf if c in right and c not in shared else c for c in left]
+    return out + [c + rsuf if c in left else c for c in right if c not in shared]
+
+
+def _push_predicates(node):
+    # move every filter as close to the scans as the plan allows
+    if isinstance(node, _Filter):
+        child = _push_predicates(node.input)
+        for pred in node.predicate._conjuncts():
+            child = _sink(child, pred)
+        return child
+    if isinstance(node, _Scan):
+        return node
+    if isinstance(node, _Merge):
+        return _Merge(
+            _push_predicates(node.left),
+            _push_predicates(node.right),
+            node.left_on,
+            node.right_on,
+            node.merge_kwargs,
+        )
+    return _copy_with_input(node, _push_predicates(node.input))
+
+
+def _copy_with_input(node, child):
+    if isinstance(node, _Select):
+        return _Select(child, node.columns)
+    if isinstance(node, _Assign):
+        return _Assign(child, node.name, node.expr)
+    if isinstance(node, _Aggregate):
+        return _Aggregate(child, node.keys, node.aggs)
+    if isinstance(node, _Filter):
+        return _Filter(child, node.predicate)
+    raise TypeError(f"Unexpected plan node {type(node).__name__}")
+
+
+def _sink(node, pred: Expr):
+    # place pred at or below node, as far down as its columns allow
+    cols = pred.columns()
+    if isinstance(node, _Scan):
+        return node.replace(predicate=_and_all([p for p in (node.predicate, pred) if p is not None]))
+    if isinstance(node, _Select) and cols <= set(node.columns):
+        return _Select(_sink(node.input, pred), node.columns)
+    if isinstance(node, _Assign) and node.name not in cols:
+        return _Assign(_sink(node.input, pred), node.name, node.expr)
+    if isinstance(node, _Filter):
+        return _Filter(_sink(node.input, pred), node.predicate)
+    if isinstance(node, _Aggregate) and cols <= set(node.keys):
+        # a filter on the grouping keys removes whole groups
+        return _Aggregate(_sink(node.input, pred), node.keys, node.aggs)
+    if isinstance(node, _Merge) and node.merge_kwargs.get("how", "inner") == "inner":
+        left, right = set(_schema(node.left)), set(_schema(node.right))
+        if cols <= left and not cols & right:
+            return _Merge(
+                _sink(node.left, pred), node.right, node.left_on, node.right_on, node.merge_kwargs
+            )
+        if cols <= right and not cols & left:
+            return _Merge(
+                node.left, _sink(node.right, pred), node.left_on, node.right_on, node.merge_kwargs
+            )
+        if node.left_on == node.right_on and cols <= set(node.left_on):
+            # a predicate on shared join keys holds on both sides
+            return _Merge(
+                _sink(node.left, pred),
+                _sink(node.right, pred),
+                node.left_on,
+                node.right_on,
+                node.merge_kwargs,
+            )
+    return _Filter(node, pred)
+
+
+def _prune(node, required: Optional[Set[str]]):
+    # push column projections down; required is None when every column is needed
+    if isinstance(node, _Scan):
+        if required is None:
+            return node
+        cols = node.source_columns() if node.columns is None else node.columns
+        return node.replace(columns=[c for c in cols if c in required])
+    if isinstance(node, _Filter):
+        child_req = None if required is None else required | node.predicate.columns()
+        return _Filter(_prune(node.input, child_req), node.predicate)
+    if isinstance(node, _Select):
+        child_req = set(node.columns) if required is None else set(node.columns) & required
+        return _Select(_prune(node.input, child_req), [c for c in node.columns if c in child_req])
+    if isinstance(node, _Assign):
+        if required is not None and node.name not in required:
+            return _prune(node.input, required)
+        child_req = None if required is None else (required - {node.name}) | node.expr.columns()
+        return _Assign(_prune(node.input, child_req), node.name, node.expr)
+    if isinstance(node, _Aggregate):
+        aggs = {k: v for k, v in node.aggs.items() if required is None or k in required}
+        child_req = set(node.keys) | {c for c, _ in aggs.values()}
+        return _Aggregate(_prune(node.input, child_req), node.keys, aggs)
+    if isinstance(node, _Merge):
+        if required is None:
+            left_req = right_req = None
+        else:
+            # a suffixed output column needs the unsuffixed input column
+            suffixes = (
+                node.merge_kwargs.get("left_suffix", "_x"),
+                node.merge_kwargs.get("right_suffix", "_y"),
+            )
+            names = set(required)
+            for c in required:
+                for s in suffixes:
+                    if s and c.endswith(s):
+                        names.add(c[: -len(s)])
+            left_req = (names | set(node.left_on)) & set(_schema(node.left))
+            right_req = (names | set(node.right_on)) & set(_schema(node.right))
+        return _Merge(
+            _prune(node.left, left_req),
+            _prune(node.right, right_req),
+            node.left_on,
+            node.right_on,
+            node.merge_kwargs,
+        )
+    raise TypeError(f"Unexpected plan node {type(node).__name__}")
+
+
+def _optimize(node):
+    return _prune(_push_predicates(node), None)
+
+
+def _read(scan: _Scan, columns: List[str]) -> dict:
+    from arkouda.dataframe import DataFrame
+    from arkouda.io import read_hdf, read_parquet
+
+    reader = read_parquet if scan.source.kind == "parquet" else read_hdf
+    data = reader(scan.source.data, datasets=columns, **scan.source.read_kwargs)
+    if isinstance(data, DataFrame):
+        return {c: data[c] for c in columns}
+    return dict(data)
+
+
+def _execute(node) -> DataFrame:
+    from arkouda.dataframe import DataFrame, merge
+
+    if isinstance(node, _Scan):
+        if node.source.kind == "frame":
+            df = node.source.data
+            mask = None if node.predicate is None else node.predicate.evaluate(df)
+            df = df[node.columns if node.columns is not None else list(df.columns.values)]
+            return df if mask is None else df[mask]
+        columns = node.source_columns() if node.columns is None else node.columns
+        if node.predicate is None:
+            return DataFrame(_read(node, columns))
+        # read the predicate columns first and filter every column as soon as it is read
+        pred_cols = sorted(node.predicate.columns())
+        data = _read(node, pred_cols)
+        mask = node.predicate.evaluate(data)
+        rest = [c for c in columns if c not in data]
+        if rest:
+            data.update(_read(node, rest))
+        return DataFrame({c: data[c][mask] for c in columns})
+    if isinstance(node, _Filter):
+        df = _execute(node.input)
+        return df[node.predicate.evaluate(df)]
+    if isinstance(node, _Select):
+        return _execute(node.input)[node.columns]
+    if isinstance(node, _Assign):
+        df = _execute(node.input)
+        df[node.name] = node.expr.evaluate(df)
+        return df
+    if isinstance(node, _Aggregate):
+        df = _execute(node.input)
+        dfg = df.groupby(node.keys if len(node.keys) > 1 else node.keys[0])
+        unique_keys = dfg.gb.unique_keys if len(node.keys) > 1 else [dfg.gb.unique_keys]
+        result = dict(zip(node.keys, unique_keys))
+        for name, (c, op) in node.aggs.items():
+            # _get_df_col drops the rows whose keys are NaN, as the GroupBy did
+            result[name] = dfg.gb.aggregate(dfg._get_df_col(c), op)[1]
+        return DataFrame(result)
+    left = _execute(node.left)
+    right = _execute(node.right)
+    return merge(left, right, left_on=node.left_on, right_on=node.right_on, **node.merge_kwargs)
+
+
+def _explain(node, depth: int = 0) -> List[str]:
+    lines = ["  " * depth + node.describe()]
+    for child in _children(node):
+        lines.extend(_explain(child, depth + 1))
+    return lines
+
+
+class LazyFrame:
+    """
+    A lazily evaluated query over a DataFrame or over Parquet or HDF5 files.
+
+    Operations on a LazyFrame return a new LazyFrame that extends the query
+    plan; nothing is read or computed until ``collect`` is called. Create a
+    LazyFrame with ``scan_parquet``, ``scan_hdf`` or ``DataFrame.lazy``.
+
+    See Also
+    --------
+    scan_parquet, scan_hdf, arkouda.DataFrame.lazy
+
+    Notes
+    -----
+    The server readers have no row filter, so a pushed-down predicate is
+    applied right after its columns are read: the predicate columns are read
+    in one command and the remaining projected columns in a second one, and
+    all of them are filtered before any other operation of the plan runs.
+
+    """
+
+    def __init__(self, plan):
+        self._plan = plan
+
+    @property
+    def columns(self) -> List[str]:
+        """The column names of the result of the query."""
+        return _schema(self._plan)
+
+    def filter(self, predicate: Expr) -> LazyFrame:
+        """
+        Keep the rows where predicate is True.
+
+        Parameters
+        ----------
+        predicate : Expr
+            A boolean expression of the columns, e.g. ``(ak.col("a") > 0) & (ak.col("b") == "x")``
+
+        Returns
+        -------
+        LazyFrame
+
+        """
+        if not isinstance(predicate, Expr):
+            raise TypeError("predicate must be an expression built with ak.col")
+        return LazyFrame(_Filter(self._plan, predicate))
+
+    def select(self, columns: Union[str, List[str]]) -> LazyFrame:
+        """
+        Keep only the given columns.
+
+        Parameters
+        ----------
+        columns : str or list of str
+            The names of the columns to keep, in output order
+
+        Returns
+        -------
+        LazyFrame
+
+        """
+        return LazyFrame(_Select(self._plan, [columns] if isinstance(columns, str) else list(columns)))
+
+    def __getitem__(self, columns: Union[str, List[str]]) -> LazyFrame:
+        return self.select(columns)
+
+    def assign(self, **exprs: Expr) -> LazyFrame:
+        """
+        Add or replace columns computed from expressions of the existing columns.
+
+        Parameters
+        ----------
+        **exprs : Expr
+            New column names mapped to the expressions computing them
+
+        Returns
+        -------
+        LazyFrame
+
+        """
+        plan = self._plan
+        for name, expr in exprs.items():
+            plan = _Assign(plan, name, expr if isinstance(expr, Expr) else _Lit(expr))
+        return LazyFrame(plan)
+
+    def groupby(self, keys: Union[str, List[str]]) -> LazyGroupBy:
+        """
+        Group the rows by the values of the key column(s).
+
+        Parameters
+        ----------
+        keys : str or list of str
+            The grouping column name(s)
+
+        Returns
+        -------
+        LazyGroupBy
+            Call ``agg`` on the result to aggregate the groups.
+
+        """
+        return LazyGroupBy(self, [keys] if isinstance(keys, str) else list(keys))
+
+    def merge(
+        self,
+        right: Union[LazyFrame, DataFrame],
+        on: Optional[Union[str, List[str]]] = None,
+        left_on: Optional[Union[str, List[str]]] = None,
+        right_on: Optional[Union[str, List[str]]] = None,
+        how: str = "inner",
+        left_suffix: str = "_x",
+        right_suffix: str = "_y",
+        method: str = "sort",
+    ) -> LazyFrame:
+        """
+        Join with another LazyFrame or DataFrame.
+
+        The parameters have the same meaning as in ``arkouda.merge``.
+
+        Returns
+        -------
+        LazyFrame
+
+        """
+
+        def as_list(x):
+            return [x] if isinstance(x, str) else list(x)
+
+        if on is not None:
+            left_on = right_on = on
+        if left_on is None or right_on is None:
+            raise ValueError("Either on, or both left_on and right_on, must be given")
+        right_plan = right._plan if isinstance(right, LazyFrame) else _Scan(_Source("frame", right))
+        kwargs = {
+            "how": how,
+            "left_suffix": left_suffix,
+            "right_suffix": right_suffix,
+            "method": method,
+        }
+        return LazyFrame(_Merge(self._plan, right_plan, as_list(left_on), as_list(right_on), kwargs))
+
+    def explain(self, optimized: bool = True) -> str:
+        """
+        Describe the query plan, one node per line with inputs indented below.
+
+        Parameters
+        ----------
+        optimized : bool, default=True
+            If True, describe the plan after projection and predicate pushdown.
+
+        Returns
+        -------
+        str
+
+        """
+        return "\n".join(_explain(_optimize(self._plan) if optimized else self._plan))
+
+    def collect(self) -> DataFrame:
+        """
+        Optimize and execute the query.
+
+        Returns
+        -------
+        DataFrame
+
+        """
+        return _execute(_optimize(self._plan))
+
+    def __repr__(self):
+        return "LazyFrame\n" + self.explain(optimized=False)
+
+
+class LazyGroupBy:
+    """
+    A groupby of a LazyFrame waiting for its aggregations.
+
+    See Also
+    --------
+    LazyFrame.groupby
+
+    """
+
+    def __init__(self, frame: LazyFrame, keys: List[str]):
+        self._frame = frame
+        self.keys = keys
+
+    def agg(self, aggs: Optional[Dict[str, str]] = None, **named: Tuple[str, str]) -> LazyFrame:
+        """
+        Aggregate columns within each group.
+
+        Parameters
+        ----------
+        aggs : dict of str to str, optional
+            Column names mapped to a reduction (any of ``GroupBy.Reductions``);
+            the output column has the input column's name.
+        **named : tuple of (str, str)
+            Output column names mapped to ``(column, reduction)`` pairs.
+
+        Returns
+        -------
+        LazyFrame
+            One row per group, with the key column(s) followed by the aggregates.
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> df = ak.DataFrame({"k": ak.array([0, 1, 0]), "v": ak.array([1, 2, 3])})
+        >>> df.lazy().groupby("k").agg({"v": "sum"}, v_max=("v", "max")).collect()
+           k  v  v_max
+        0  0  4      3
+        1  1  2      2 (2 rows x 3 columns)
+
+        """
+        from arkouda.groupbyclass import GroupBy
+
+        spec = {c: (c, op) for c, op in (aggs or {}).items()}
+        spec.update(named)
+        if not spec:
+            raise ValueError("No aggregations given")
+        for c, op in spec.values():
+            if op not in GroupBy.Reductions:
+                raise ValueError(f"Unsupported reduction: {op}")
+        return LazyFrame(_Aggregate(self._frame._plan, self.keys, spec))
+
+
+def scan_parquet(filenames: Union[str, List[str]], **read_kwargs) -> LazyFrame:
+    """
+    Start a lazy query over Parquet files.
+
+    Parameters
+    ----------
+    filenames : str or list of str
+        The file name(s) or glob(s), as accepted by ``read_parquet``
+    **read_kwargs
+        Other keyword arguments passed to ``read_parquet``
+
+    Returns
+    -------
+    LazyFrame
+
+    See Also
+    --------
+    arkouda.read_parquet, LazyFrame
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> lf = ak.scan_parquet("events*").filter(ak.col("port") == 22).select(["src", "bytes"])
+    >>> df = lf.collect()  # reads only the port, src and bytes columns
+
+    """
+    if "datasets" in read_kwargs:
+        raise ValueError("Use LazyFrame.select instead of datasets")
+    return LazyFrame(_Scan(_Source("parquet", filenames, read_kwargs)))
+
+
+def scan_hdf(filenames: Union[str, List[str]], **read_kwargs) -> LazyFrame:
+    """
+    Start a lazy query over HDF5 files.
+
+    Parameters
+    ----------
+    filenames : str or list of str
+        The file name(s) or glob(s), as accepted by ``read_hdf``
+    **read_kwargs
+        Other keyword arguments passed to ``read_hdf``
+
+    Returns
+    -------
+    LazyFrame
+
+    See Also
+    --------
+    arkouda.read_hdf, LazyFrame
+
+    """
+    if "datasets" in read_kwargs:
+        raise ValueError("Use LazyFrame.select instead of datasets")
+    return LazyFrame(_Scan(_Source("hdf", filenames, read_kwargs)))
@@ -192,6 +192,7 @@ from arkouda.numpy.numeric import (
     take,
     tan,
     tanh,
+    top_k_frequent,
     transpose,
     tril,
     triu,
@@ -240,7 +241,14 @@ from arkouda.numpy.pdarrayclass import (
     sum,
     var,
 )
-from arkouda.numpy.sorting import SortingAlgorithm, argsort, coargsort, searchsorted, sort
+from arkouda.numpy.sorting import (
+    SortingAlgorithm,
+    argsort,
+    coargsort,
+    merge_sorted,
+    searchsorted,
+    sort,
+)
 from arkouda.numpy.pdarraysetops import (
     concatenate,
     in1d,
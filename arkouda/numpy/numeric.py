@@ -34,7 +34,7 @@ from arkouda.numpy.pdarrayclass import (
     pdarray,
     sum,
 )
-from arkouda.numpy.pdarraycreation import array, linspace, scalar_array
+from arkouda.numpy.pdarraycreation import arange, array, linspace, scalar_array
 from arkouda.numpy.sorting import sort
 from arkouda.numpy.strings import Strings
 
@@ -115,6 +115,7 @@ __all__ = [
     "histogramdd",
     "median",
     "value_counts",
+    "top_k_frequent",
     "ErrorMode",
     "quantile",
     "percentile",
@@ -2373,6 +2374,104 @@ def value_counts(
     return GroupBy(pda).size()
 
 
+def top_k_frequent(
+    x: Union[pdarray, Strings, Categorical],
+    k: int_scalars,
+    method: str = "exact",
+    sketch_width: int_scalars = 2**16,
+    sketch_depth: int_scalars = 4,
+) -> Tuple[groupable, pdarray]:
+    """
+    Find the k most frequent values of an array and their counts.
+
+    Parameters
+    ----------
+    x : pdarray, Strings, or Categorical
+        The values to count
+    k : int_scalars
+        The number of most frequent values to return
+    method : {"exact", "sketch"}, default="exact"
+        "exact" counts every distinct value and selects the k largest counts
+        without sorting the count table. "sketch" makes a single pass over
+        x with a count-min sketch and never builds the count table, returning
+        approximate counts.
+    sketch_width : int_scalars, default=2**16
+        Number of counters per row of the count-min sketch (method="sketch" only).
+        The overcount of each estimate is at most about ``e * x.size / sketch_width``.
+    sketch_depth : int_scalars, default=4
+        Number of rows (independent hashes) of the count-min sketch
+        (method="sketch" only).
+
+    Returns
+    -------
+    values : pdarray, Strings, or Categorical
+        The at most k most frequent values, in order of decreasing count
+    counts : pdarray, int64
+        The number of occurrences of each value. With method="sketch" these are
+        count-min estimates, which are never below the true counts.
+
+    Raises
+    ------
+    ValueError
+        Raised if k is less than 1 or method is not "exact" or "sketch"
+
+    See Also
+    --------
+    value_counts, arkouda.GroupBy.top_k
+
+    Notes
+    -----
+    Ties between equal counts are broken arbitrarily. The sketch method can
+    miss a value whose true count is within the sketch error of the k-th
+    largest count, and may conflate values whose 64-bit hashes collide.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> A = ak.array([2, 0, 2, 4, 0, 0, 7])
+    >>> ak.top_k_frequent(A, 2)
+    (array([0 2]), array([3 2]))
+    >>> ak.top_k_frequent(A, 2, method="sketch")
+    (array([0 2]), array([3 2]))
+
+    """
+    from arkouda.categorical import Categorical as Categorical_
+
+    if k < 1:
+        raise ValueError("k must be at least 1")
+    if method == "exact":
+        values, counts = GroupBy(x).size()
+        # argmaxk returns the indices of the k largest counts in ascending order
+        idx = counts.argmaxk(min(k, counts.size))
+        idx = idx[arange(idx.size - 1, -1, -1)]
+        if isinstance(values, (list, tuple)):
+            return [v[idx] for v in values], counts[idx]
+        return values[idx], counts[idx]
+    elif method == "sketch":
+        if isinstance(x, Categorical_):
+            keys = cast(x.codes, ak_uint64)
+        elif isinstance(x, Strings):
+            keys = x.hash()[0]
+        elif x.dtype in (ak_int64, ak_uint64, ak_bool):
+            keys = cast(x, ak_uint64)
+        else:
+            keys = cast(type_cast(pdarray, hash(x, full=False)), ak_uint64)
+        rep_msg = generic_msg(
+            cmd="topKSketch",
+            args={
+                "keys": keys,
+                "k": k,
+                "depth": sketch_depth,
+                "width": sketch_width,
+                "capacity": max(4 * k, 64),
+            },
+        )
+        idx, counts = (create_pdarray(part) for part in type_cast(str, rep_msg).split("+"))
+        return x[idx], counts
+    else:
+        raise ValueError(f"method must be 'exact' or 'sketch', not {method!r}")
+
+
 @typechecked
 def clip(
     pda: pdarray,
@@ -2702,6 +2801,7 @@ def putmask(
             "v": Values,
         },
     )
+    A._version += 1
     return
 
 
@@ -190,6 +190,7 @@ __all__ = [
     "mod",
     "fmod",
     "RegistrationError",
+    "ArrayStats",
     "broadcast_to_shape",
     "_to_pdarray",
     "diff",
@@ -212,6 +213,9 @@ SUPPORTED_INDEX_REDUCTION_OPS = ["argmin", "argmax"]
 
 SUPPORTED_STATS_REDUCTION_OPS = ["var", "std"]
 
+# whole-array reductions whose results are recorded in pdarray.stats
+_STATS_REDUCTIONS = {"isSorted": "is_sorted", "min": "min", "max": "max"}
+
 
 def _axis_parser(axis):
     if axis is None:
@@ -457,6 +461,52 @@ def _array_memview(a) -> memoryview:
 
 
 # class for the pdarray
+class ArrayStats:
+    """
+    Facts about the values of a pdarray, recorded as operations discover them.
+
+    Each attribute is None until it is known. Statistics are recorded by the
+    whole-array reductions that compute them (``min``, ``max`` and ``is_sorted``),
+    by functions that create arrays with known properties (``arange``, ``sort``
+    and ``GroupBy``), and by :meth:`pdarray.compute_stats`. They are discarded
+    when the array is modified in place.
+
+    Attributes
+    ----------
+    is_sorted : Optional[bool]
+        Whether the array is monotonically non-decreasing.
+    min : Optional[numeric_scalars]
+        The minimum value, as returned by ``ak.min``.
+    max : Optional[numeric_scalars]
+        The maximum value, as returned by ``ak.max``.
+    has_nan : Optional[bool]
+        Whether the array contains NaN. Always False for non-float arrays.
+    nunique : Optional[int_scalars]
+        The number of distinct values.
+
+    """
+
+    __slots__ = ("is_sorted", "min", "max", "has_nan", "nunique")
+
+    is_sorted: Optional[bool]
+    min: Optional[numeric_scalars]
+    max: Optional[numeric_scalars]
+    has_nan: Optional[bool]
+    nunique: Optional[int_scalars]
+
+    def __init__(self) -> None:
+        for attr in self.__slots__:
+            setattr(self, attr, None)
+
+    def __repr__(self) -> str:
+        known = [f"{a}={getattr(self, a)!r}" for a in self.__slots__ if getattr(self, a) is not None]
+        return f"ArrayStats({', '.join(known)})"
+
+    def _copy_from(self, other: ArrayStats) -> None:
+        for attr in self.__slots__:
+            setattr(self, attr, getattr(other, attr))
+
+
 class pdarray:
     """
     The basic arkouda array class. This class contains only the
@@ -536,11 +586,178 @@ class pdarray:
         self.ndim = ndim
         self._shape = tuple(shape)
         self.itemsize = itemsize
+        # incremented on every in-place modification, so client-side caches
+        # derived from this array can tell when they are stale
+        self._version = 0
         if max_bits:
             self.max_bits = max_bits
 
         self.registered_name: Optional[str] = None
 
+    @property
+    def stats(self) -> ArrayStats:
+        """
+        Statistics known about the values of this array.
+
+        Operations consult these to skip work: sorting an array known to be sorted
+        returns a copy, GroupBy skips the NaN filter for keys known to have no NaN,
+        and whole-array ``min``, ``max`` and ``is_sorted`` return recorded values
+        without a server round trip. The statistics are reset whenever the array
+        is modified in place.
+
+        Returns
+        -------
+        ArrayStats
+            The statistics, with None for those that are not known.
+
+        See Also
+        --------
+        compute_stats
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> a = ak.arange(5)
+        >>> a.stats
+        ArrayStats(is_sorted=np.True_, min=np.int64(0), max=np.int64(4), has_nan=False, nunique=5)
+        >>> a[0] = 7
+        >>> a.stats
+        ArrayStats(has_nan=False)
+
+        """
+        if self.__dict__.get("_stats_version") != self._version:
+            stats = ArrayStats()
+            if self.dtype != akfloat64:
+                stats.has_nan = False
+            self.__dict__["_stats"] = stats
+            self.__dict__["_stats_version"] = self._version
+        return self.__dict__["_stats"]
+
+    def compute_stats(self) -> ArrayStats:
+        """
+        Compute the statistics of this array that are not yet known.
+
+        This costs one pass over the array per statistic: ``is_sorted``, ``min``,
+        ``max`` and, for float arrays, ``has_nan``. ``nunique`` is only computed
+        when the array is sorted, where it needs one more pass.
+
+        Returns
+        -------
+        ArrayStats
+            The statistics of this array.
+
+        Raises
+        ------
+        ValueError
+            Raised if the array is not one-dimensional
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> ak.array([3, 1, 2]).compute_stats()
+        ArrayStats(is_sorted=np.False_, min=np.int64(1), max=np.int64(3), has_nan=False)
+
+        """
+        from arkouda.numpy import isnan
+
+        if self.ndim != 1:
+            raise ValueError("Statistics are only kept for one-dimensional arrays")
+        stats = self.stats
+        if self.size == 0 or self.dtype == bigint:
+            return stats
+        self.is_sorted()
+        self.min()
+        self.max()
+        if stats.has_nan is None:
+            stats.has_nan = builtins.bool(isnan(self).any())
+        if stats.nunique is None and stats.is_sorted and not stats.has_nan:
+            stats.nunique = int((self[1:] != self[:-1]).sum()) + 1
+        return stats
+
+    @property
+    def is_known_sorted(self) -> builtins.bool:
+        """
+        Whether this array is known to be sorted, without a server round trip.
+
+        This is True when an operation has recorded that the array is
+        monotonically non-decreasing, for example because it was returned by
+        ``sort`` or ``arange``, or is an increasing slice or a boolean selection of
+        such an array. False means only that sortedness is not known; use
+        :meth:`is_sorted` to check.
+
+        Returns
+        -------
+        bool
+            True if the array is known to be sorted.
+
+        See Also
+        --------
+        stats, is_known_unique
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> a = ak.arange(10)
+        >>> a[2:8].is_known_sorted
+        True
+        >>> ak.array([1, 2, 3]).is_known_sorted
+        False
+
+        """
+        return self.ndim == 1 and builtins.bool(self.stats.is_sorted)
+
+    @property
+    def is_known_unique(self) -> builtins.bool:
+        """
+        Whether this array is known to hold distinct values, without a server round trip.
+
+        Returns
+        -------
+        bool
+            True if the number of distinct values is known to equal the size.
+
+        See Also
+        --------
+        stats, is_known_sorted
+
+        Examples
+        --------
+        >>> import arkouda as ak
+        >>> ak.unique(ak.array([3, 1, 3])).is_known_unique
+        True
+
+        """
+        return self.ndim == 1 and self.stats.nunique == self.size
+
+    def _mark_sorted_unique(self) -> pdarray:
+        """Record that this array is strictly increasing, and return it."""
+        if self.ndim == 1:
+            self.stats.is_sorted = True
+            self.stats.nunique = self.size
+        return self
+
+    def _inherit_stats(self, result: pdarray, step: int = 1) -> pdarray:
+        """
+        Record on result the statistics it keeps as a selection of this array.
+
+        A selection of elements in their original order (an increasing slice, or
+        a boolean or sorted index) keeps sortedness, a selection of any kind keeps
+        uniqueness and the absence of NaN, and bounds stay valid as bounds.
+        A decreasing slice of a sorted array is only known to be sorted if it holds
+        at most one element.
+        """
+        stats = self.stats
+        if result.ndim != 1:
+            return result
+        rstats = result.stats
+        if stats.has_nan is False:
+            rstats.has_nan = False
+        if stats.is_sorted and (step > 0 or result.size <= 1):
+            rstats.is_sorted = True
+        if stats.nunique is not None and stats.nunique == self.size:
+            rstats.nunique = result.size
+        return result
+
     def __del__(self):
         try:
             logger.debug(f"deleting pdarray with name {self.name}")
@@ -597,6 +814,8 @@ class pdarray:
             cmd = f"set_max_bits<{self.dtype},{self.ndim}>"
             generic_msg(cmd=cmd, args={"array": self, "max_bits": max_bits})
             self._max_bits = max_bits
+            # the values are truncated to the new number of bits
+            self._version += 1
 
     def equals(self, other) -> bool_scalars:
         """
@@ -981,6 +1200,7 @@ class pdarray:
     def opeq(self, other, op):
         if op not in self.OpEqOps:
             raise ValueError(f"bad operator {op}")
+        self._version += 1
         # pdarray op= pdarray
         if isinstance(other, pdarray):
             if self.shape != other.shape:
@@ -1091,7 +1311,7 @@ class pdarray:
                     "max_bits": self.max_bits if self.max_bits is not None else 0,
                 },
             )
-            return create_pdarray(repMsg)
+            return self._inherit_stats(create_pdarray(repMsg), stride)
 
         if isinstance(key, tuple):
             # handle None and Ellipsis in the key tuple
@@ -1197,6 +1417,13 @@ class pdarray:
                     "idx": key,
                 },
             )
+            # a strictly increasing index of non-negative positions keeps the order
+            if key.dtype == "bool" or (
+                key.is_known_sorted
+                and key.is_known_unique
+                and (key.dtype == akuint64 or (key.stats.min is not None and key.stats.min >= 0))
+            ):
+                return self._inherit_stats(create_pdarray(repMsg))
             return create_pdarray(repMsg)
 
         if isinstance(key, slice):
@@ -1216,6 +1443,7 @@ class pdarray:
             raise TypeError(f"Unhandled key type: {key} ({type(key)})")
 
     def __setitem__(self, key, value):
+        self._version += 1
         # convert numpy array value to pdarray value
         if isinstance(value, np.ndarray):
             _value = _to_pdarray(value)
@@ -1454,6 +1682,7 @@ class pdarray:
         TypeError
             Raised if value is not an int, int64, float, or float64
         """
+        self._version += 1
         cmd = f"set<{self.dtype},{self.ndim}>"
         generic_msg(
             cmd=cmd,
@@ -1466,28 +1695,41 @@ class pdarray:
 
     def argsort(
         self,
-        algorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD,
+        algorithm: Union[SortingAlgorithm, str] = SortingAlgorithm.RadixSortLSD,
         axis: int_scalars = 0,
         ascending: bool = True,
+        mem_budget: Optional[int] = None,
     ) -> pdarray:
         """
         Return the permutation that sorts the pdarray.
 
         Parameters
         ----------
-        algorithm : SortingAlgorithm, default SortingAlgorithm.RadixSortLSD
-            The algorithm to use for sorting.
+        algorithm : SortingAlgorithm or str, default SortingAlgorithm.RadixSortLSD
+            The algorithm to use for sorting, or "auto" to let the server choose
+            one (see ak.argsort).
         axis : int_scalars, default 0
             The axis to sort along. Must be between -1 and the array rank.
         ascending : bool, default True
             Whether to sort in ascending order. If False, returns a reversed permutation.
             Note: ascending=False is only supported for 1D arrays.
+        mem_budget : int, optional
+            Bytes of memory per locale that the sort may use beyond the array
+            and the permutation (see ak.argsort).
 
         Returns
         -------
         pdarray
             The indices that would sort the array.
 
+        Raises
+        ------
+        ValueError
+            Raised if axis is invalid, or if mem_budget is not positive or is
+            given for an array other than a 1-D int64, uint64, float64 or bool one
+        RuntimeError
+            Raised if the array cannot be sorted within mem_budget
+
         Examples
         --------
         >>> import arkouda as ak
@@ -1504,13 +1746,21 @@ class pdarray:
 
         from arkouda.numpy.manipulation_functions import flip
         from arkouda.numpy.pdarraycreation import zeros
-        from arkouda.numpy.sorting import coargsort
+        from arkouda.numpy.sorting import _sort_reply, _sorting_algorithm, coargsort
 
+        algorithm = _sorting_algorithm(algorithm)
         ndim = type_cast(Union[int, np.integer], getattr(self, "ndim"))
         is_valid, axis_ = _axis_validation(axis, ndim)
 
         if not is_valid:
             raise ValueError(f"axis={axis} is invalid for array with ndim={self.ndim}")
+        if mem_budget is not None:
+            if mem_budget <= 0:
+                raise ValueError("mem_budget must be a positive number of bytes")
+            if self.ndim != 1 or self.dtype not in (akint64, akuint64, akfloat64, akbool):
+                raise ValueError(
+                    "mem_budget is only supported for 1-D int64, uint64, float64 or bool arrays"
+                )
 
         if self.size == 0:
             return zeros(0, dtype=akint64)
@@ -1526,10 +1776,11 @@ class pdarray:
                 "algoName": algorithm.name,
                 "objType": self.objType,
                 "axis": axis_,
+                "mem_budget": 0 if mem_budget is None else mem_budget,
             },
         )
 
-        sorted_array = create_pdarray(cast(str, repMsg))
+        sorted_array = _sort_reply(cast(str, repMsg))
 
         if ascending:
             return sorted_array
@@ -3402,7 +3653,10 @@ def _common_reduction(
     axis_ = _axis_parser(axis)
 
     if _reduces_to_single_value(axis_, pda.ndim):
-        return parse_single_value(
+        stat = _STATS_REDUCTIONS.get(kind) if pda.ndim == 1 else None
+        if stat is not None and getattr(pda.stats, stat) is not None:
+            return getattr(pda.stats, stat)
+        result = parse_single_value(
             cast(
                 str,
                 generic_msg(
@@ -3411,6 +3665,9 @@ def _common_reduction(
                 ),
             )
         )
+        if stat is not None:
+            setattr(pda.stats, stat, result)
+        return result
     else:
         result = create_pdarray(
             generic_msg(
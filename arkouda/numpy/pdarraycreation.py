@@ -1071,6 +1071,12 @@ def arange(
             cmd=f"arange<{arg_dtype},1>", args={"start": start, "stop": stop, "step": step}
         )
         arr = create_pdarray(repMsg, max_bits=max_bits)
+        if aktype == akint64 and arg_dtype == "int64" and step > 0 and arr.size > 0:
+            stats = arr.stats
+            stats.is_sorted = np.True_
+            stats.min = np.int64(start)
+            stats.max = np.int64(start + (arr.size - 1) * step)
+            stats.nunique = arr.size
         return arr if aktype == akint64 else akcast(arr, dt=aktype)
 
     raise TypeError(f"start, stop, step must be ints; got {args!r}")
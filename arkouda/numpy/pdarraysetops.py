@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Sequence, TypeVar, Union, cast
+from typing import TYPE_CHECKING, Optional, Sequence, TypeVar, Union, cast
 
 import numpy as np
 from typeguard import typechecked
@@ -13,6 +13,7 @@ from arkouda.numpy.dtypes import bigint
 from arkouda.numpy.dtypes import bool_ as akbool
 from arkouda.numpy.dtypes import dtype as akdtype
 from arkouda.numpy.dtypes import int64 as akint64
+from arkouda.numpy.dtypes import numeric_scalars
 from arkouda.numpy.dtypes import uint64 as akuint64
 from arkouda.numpy.pdarrayclass import create_pdarray, pdarray
 from arkouda.numpy.pdarraycreation import array, ones, zeros, zeros_like
@@ -20,8 +21,10 @@ from arkouda.numpy.sorting import argsort
 from arkouda.numpy.strings import Strings
 
 if TYPE_CHECKING:
+    from arkouda.bloomfilter import BloomFilter
     from arkouda.categorical import Categorical
 else:
+    BloomFilter = TypeVar("BloomFilter")
     Categorical = TypeVar("Categorical")
 
 __all__ = ["in1d", "concatenate", "union1d", "intersect1d", "setdiff1d", "setxor1d", "indexof1d"]
@@ -137,10 +140,11 @@ def _in1d_single(
 @typechecked
 def in1d(
     A: groupable,
-    B: groupable,
+    B: Union[groupable, "BloomFilter"],
     assume_unique: bool = False,
     symmetric: bool = False,
     invert: bool = False,
+    method: Optional[str] = None,
 ) -> groupable:
     """
     Test whether each element of a 1-D array is also present in a second array.
@@ -155,7 +159,7 @@ def in1d(
     ----------
     A : list of pdarrays, pdarray, Strings, or Categorical
         Entries will be tested for membership in B
-    B : list of pdarrays, pdarray, Strings, or Categorical
+    B : list of pdarrays, pdarray, Strings, Categorical, or BloomFilter
         The set of elements in which to test membership
     assume_unique : bool, optional, defaults to False
         If true, assume rows of a and b are each unique and sorted.
@@ -167,6 +171,12 @@ def in1d(
         False where an element of `A` is in `B` and True otherwise).
         Default is False. ``ak.in1d(a, b, invert=True)`` is equivalent
         to (but is faster than) ``~ak.in1d(a, b)``.
+    method : {None, 'bloom'}, optional
+        If 'bloom', first rule out the rows of a that a Bloom filter of b
+        shows are not in b, and look up only the rest in a hash table of b.
+        This is faster when b is very large and most rows of a are not in it.
+        A ``BloomFilter`` may be passed as b to reuse it across calls.
+        Not supported for Categorical or bigint arguments, or with symmetric.
 
     Returns
     -------
@@ -178,7 +188,8 @@ def in1d(
     TypeError
         Raised if either A or B is not a pdarray, Strings, or Categorical
         object, or if both are pdarrays and either has rank > 1,
-        or if invert is not a bool
+        or if invert is not a bool, or if method is 'bloom' and the
+        arrays of A do not match those of B in type and dtype
     RuntimeError
         Raised if the dtype of either array is not supported
 
@@ -191,9 +202,12 @@ def in1d(
     >>> ak.in1d(ak.array(['one','two']),ak.array(['two', 'three','four','five']))
     array([False True])
 
+    >>> ak.in1d(ak.array([-1, 0, 1]), ak.array([-2, 0, 2]), method="bloom")
+    array([False True False])
+
     See Also
     --------
-    arkouda.groupbyclass.unique, intersect1d, union1d
+    arkouda.groupbyclass.unique, intersect1d, union1d, arkouda.BloomFilter
 
     Notes
     ------
@@ -205,8 +219,21 @@ def in1d(
     ak.in1d is not supported for bool or float64 pdarrays
     """
     from arkouda.alignment import NonUniqueError
+    from arkouda.bloomfilter import BloomFilter as BloomFilter_
     from arkouda.categorical import Categorical as Categorical_
 
+    if method == "bloom" or isinstance(B, BloomFilter_):
+        if symmetric:
+            raise ValueError("method='bloom' does not support symmetric")
+        if isinstance(A, Categorical_) or isinstance(B, Categorical_):
+            raise TypeError("method='bloom' does not support Categorical arguments")
+        # Categorical arguments are ruled out above, which leaves the arrays a BloomFilter takes
+        values = Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]]
+        bf = B if isinstance(B, BloomFilter_) else BloomFilter_(cast(values, B))
+        return bf.in1d(cast(values, A), invert=invert)
+    elif method is not None:
+        raise ValueError(f"method must be None or 'bloom', not {method!r}")
+
     ua: groupable
     ub: groupable
 
@@ -481,7 +508,8 @@ def concatenate(
             ret = create_pdarray(cast(str, repMsg))
             ret.max_bits = m_bits
             return callback(ret)
-        return callback(create_pdarray(cast(str, repMsg)))
+        ret = create_pdarray(cast(str, repMsg))
+        return callback(_concatenated_stats(cast(Sequence[pdarray], arrays), ret))
     elif objtype == Strings.objType or not ordered:
         repMsg = generic_msg(
             cmd="concatenateStr",
@@ -502,6 +530,47 @@ def concatenate(
 # fmt:on
 
 
+def _concatenated_stats(arrays: Sequence[pdarray], result: pdarray) -> pdarray:
+    """
+    Record on result, the ordered concatenation of arrays, what their statistics imply.
+
+    The concatenation of sorted arrays whose value ranges follow one another is
+    sorted, and it is also unique if the inputs are and the ranges do not touch.
+    """
+    if result.ndim != 1 or any(a.ndim != 1 for a in arrays):
+        return result
+    parts = [a for a in arrays if a.size > 0]
+    stats = [a.stats for a in parts]
+    if all(st.has_nan is False for st in stats):
+        result.stats.has_nan = False
+    if not all(st.is_sorted and st.min is not None and st.max is not None for st in stats):
+        return result
+    bounds = [
+        (cast(numeric_scalars, st.max), cast(numeric_scalars, nxt.min))
+        for st, nxt in zip(stats[:-1], stats[1:])
+    ]
+    if all(hi <= lo for hi, lo in bounds):
+        result.stats.is_sorted = True
+        result.stats.min = stats[0].min
+        result.stats.max = stats[-1].max
+        if all(a.is_known_unique for a in parts) and all(hi < lo for hi, lo in bounds):
+            result.stats.nunique = result.size
+    return result
+
+
+def _known_unique(*arrays) -> bool:
+    """Whether all arrays are pdarrays known to hold distinct values."""
+    return all(isinstance(a, pdarray) and a.is_known_unique for a in arrays)
+
+
+def _sorted_setop_result(result: pdarray, A: pdarray, B: pdarray, assume_unique: bool) -> pdarray:
+    """Record that a sorted set operation result is sorted, and unique unless the inputs may not be."""
+    if not assume_unique or _known_unique(A, B):
+        return result._mark_sorted_unique()
+    result.stats.is_sorted = True
+    return result
+
+
 def multiarray_setop_validation(
     pda1: Sequence[groupable_element_type], pda2: Sequence[groupable_element_type]
 ):
@@ -584,9 +653,21 @@ def union1d(
             return B  # union is B
         if B.size == 0:
             return A  # union is A
-        if A.dtype == int and B.dtype == int or (A.dtype == akuint64 and B.dtype == akuint64):
+        if (
+            isinstance(A, pdarray)
+            and isinstance(B, pdarray)
+            and (A.dtype == int and B.dtype == int or (A.dtype == akuint64 and B.dtype == akuint64))
+        ):
+            if A.is_known_sorted and B.is_known_sorted and _known_unique(A, B):
+                # disjoint sorted ranges only need to be appended
+                a_max, b_min = A.stats.max, B.stats.min
+                b_max, a_min = B.stats.max, A.stats.min
+                if a_max is not None and b_min is not None and a_max < b_min:
+                    return cast(pdarray, concatenate((A, B)))
+                if b_max is not None and a_min is not None and b_max < a_min:
+                    return cast(pdarray, concatenate((B, A)))
             repMsg = generic_msg(cmd="union1d", args={"arg1": A, "arg2": B})
-            return cast(pdarray, create_pdarray(repMsg))
+            return create_pdarray(repMsg)._mark_sorted_unique()
         x = cast(pdarray, unique(cast(pdarray, concatenate((unique(A), unique(B)), ordered=False))))
         return x[argsort(x)]
     elif isinstance(A, Sequence) and isinstance(B, Sequence):
@@ -671,11 +752,16 @@ def intersect1d(A: groupable, B: groupable, assume_unique: bool = False) -> Unio
             return A  # nothing in the intersection
         if B.size == 0:
             return B  # nothing in the intersection
-        if (A.dtype == int and B.dtype == int) or (A.dtype == akuint64 and B.dtype == akuint64):
+        if (
+            isinstance(A, pdarray)
+            and isinstance(B, pdarray)
+            and ((A.dtype == int and B.dtype == int) or (A.dtype == akuint64 and B.dtype == akuint64))
+        ):
             repMsg = generic_msg(
-                cmd="intersect1d", args={"arg1": A, "arg2": B, "assume_unique": assume_unique}
+                cmd="intersect1d",
+                args={"arg1": A, "arg2": B, "assume_unique": assume_unique or _known_unique(A, B)},
             )
-            return create_pdarray(cast(str, repMsg))
+            return _sorted_setop_result(create_pdarray(cast(str, repMsg)), A, B, assume_unique)
         if not assume_unique:
             A = cast(pdarray, unique(A))
             B = cast(pdarray, unique(B))
@@ -787,11 +873,21 @@ def setdiff1d(A: groupable, B: groupable, assume_unique: bool = False) -> Union[
             return A  # return a zero length pdarray
         if B.size == 0:
             return A  # subtracting nothing return orig pdarray
-        if (A.dtype == int and B.dtype == int) or (A.dtype == akuint64 and B.dtype == akuint64):
+        if (
+            isinstance(A, pdarray)
+            and isinstance(B, pdarray)
+            and ((A.dtype == int and B.dtype == int) or (A.dtype == akuint64 and B.dtype == akuint64))
+        ):
+            # with assume_unique the result keeps the order of A, so it is only
+            # skipped implicitly when that order is already sorted
+            skip_unique = A.is_known_sorted and _known_unique(A, B)
             repMsg = generic_msg(
-                cmd="setdiff1d", args={"arg1": A, "arg2": B, "assume_unique": assume_unique}
+                cmd="setdiff1d",
+                args={"arg1": A, "arg2": B, "assume_unique": assume_unique or skip_unique},
             )
-            return create_pdarray(cast(str, repMsg))
+            if assume_unique or skip_unique:
+                return A._inherit_stats(create_pdarray(cast(str, repMsg)))
+            return create_pdarray(cast(str, repMsg))._mark_sorted_unique()
         if not assume_unique:
             A = cast(pdarray, unique(A))
             B = cast(pdarray, unique(B))
@@ -894,11 +990,16 @@ def setxor1d(A: groupable, B: groupable, assume_unique: bool = False) -> Union[p
             return B  # return other pdarray if A is empty
         if B.size == 0:
             return A  # return other pdarray if B is empty
-        if (A.dtype == int and B.dtype == int) or (A.dtype == akuint64 and B.dtype == akuint64):
+        if (
+            isinstance(A, pdarray)
+            and isinstance(B, pdarray)
+            and ((A.dtype == int and B.dtype == int) or (A.dtype == akuint64 and B.dtype == akuint64))
+        ):
             repMsg = generic_msg(
-                cmd="setxor1d", args={"arg1": A, "arg2": B, "assume_unique": assume_unique}
+                cmd="setxor1d",
+                args={"arg1": A, "arg2": B, "assume_unique": assume_unique or _known_unique(A, B)},
             )
-            return create_pdarray(cast(str, repMsg))
+            return _sorted_setop_result(create_pdarray(cast(str, repMsg)), A, B, assume_unique)
         if not assume_unique:
             A = cast(pdarray, unique(A))
             B = cast(pdarray, unique(B))
@@ -675,6 +675,7 @@ class Generator:
             },
         )
         self._state += x.size
+        x._version += 1
 
     def permutation(self, x, method="Argsort"):
         """
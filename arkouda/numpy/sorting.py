@@ -1,32 +1,68 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, Literal, Sequence, TypeVar, Union, cast
+from typing import (
+    TYPE_CHECKING,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 from typeguard import check_type, typechecked
 
 from arkouda.client import generic_msg
+from arkouda.logger import getArkoudaLogger
 from arkouda.numpy.dtypes import bigint, dtype, float64, int64, int_scalars, uint64
 from arkouda.numpy.pdarrayclass import create_pdarray, pdarray
-from arkouda.numpy.pdarraycreation import array, zeros
+from arkouda.numpy.pdarraycreation import arange, array, zeros
 from arkouda.numpy.strings import Strings
 
 numeric_dtypes = {dtype(int64), dtype(uint64), dtype(float64)}
 
-__all__ = ["argsort", "coargsort", "sort", "SortingAlgorithm", "searchsorted"]
+__all__ = ["argsort", "coargsort", "merge_sorted", "sort", "SortingAlgorithm", "searchsorted"]
 
-SortingAlgorithm = Enum("SortingAlgorithm", ["RadixSortLSD", "TwoArrayRadixSort"])
+SortingAlgorithm = Enum("SortingAlgorithm", ["RadixSortLSD", "TwoArrayRadixSort", "Auto"])
+
+logger = getArkoudaLogger(name="sorting")
 
 if TYPE_CHECKING:
     from arkouda.categorical import Categorical
+    from arkouda.numpy.timeclass import Datetime, Timedelta
 else:
     Categorical = TypeVar("Categorical")
+    Datetime = TypeVar("Datetime")
+    Timedelta = TypeVar("Timedelta")
+
+
+def _sorting_algorithm(algorithm: Union[SortingAlgorithm, str]) -> SortingAlgorithm:
+    """Look up a SortingAlgorithm given by member or by (case-insensitive) name."""
+    if isinstance(algorithm, SortingAlgorithm):
+        return algorithm
+    for algo in SortingAlgorithm:
+        if algo.name.lower() == algorithm.lower():
+            return algo
+    raise ValueError(
+        f"Unknown sorting algorithm {algorithm!r}; expected one of {[a.name for a in SortingAlgorithm]}"
+    )
+
+
+def _sort_reply(repMsg: str) -> pdarray:
+    """Create the permutation in a sort reply, logging the algorithm an Auto sort chose."""
+    created, _, chosen = repMsg.partition("+")
+    if chosen:
+        logger.debug(f"Auto sort chose {chosen}")
+    return create_pdarray(created)
 
 
 def argsort(
     pda: Union[pdarray, Strings, Categorical],
-    algorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD,
+    algorithm: Union[SortingAlgorithm, str] = SortingAlgorithm.RadixSortLSD,
     axis: int_scalars = 0,
+    mem_budget: Optional[int] = None,
 ) -> pdarray:
     """
     Return the permutation that sorts the array.
@@ -35,10 +71,16 @@ def argsort(
     ----------
     pda : pdarray, Strings, or Categorical
         The array to sort (int64, uint64, or float64)
-    algorithm : SortingAlgorithm, default=SortingAlgorithm.RadixSortLSD
-        The algorithm to be used for sorting the array.
+    algorithm : SortingAlgorithm or str, default=SortingAlgorithm.RadixSortLSD
+        The algorithm to be used for sorting the array, or "auto" to let the
+        server choose one from a sample of the keys (see Notes).
     axis : int_scalars, default=0
         The axis to sort over.
+    mem_budget : int, optional
+        Bytes of memory per locale that the sort may use on top of the array and
+        the permutation. When given, a 1-D int64, uint64, float64 or bool array
+        is sorted in batches of key ranges that fit in the budget (see Notes).
+        Other arrays cannot be sorted within a budget.
 
     Returns
     -------
@@ -49,6 +91,11 @@ def argsort(
     ------
     TypeError
         Raised if the parameter is other than a pdarray, Strings or Categorical
+    ValueError
+        Raised if mem_budget is not positive, or is given for Strings, a
+        Categorical, or a pdarray other than a 1-D int64, uint64, float64 or bool one
+    RuntimeError
+        Raised if the keys cannot be sorted within mem_budget
 
     See Also
     --------
@@ -59,6 +106,28 @@ def argsort(
     Uses a least-significant-digit radix sort, which is stable and
     resilient to non-uniformity in data but communication intensive.
 
+    With ``algorithm="auto"``, the server samples adjacent pairs of keys to
+    estimate how presorted they are and returns the identity permutation for
+    sorted keys, merges keys made of two sorted runs in one pass, sorts small
+    arrays with TwoArrayRadixSort, and sorts integer keys whose range is
+    narrower than their values as offsets from their minimum, with fewer radix
+    digits. The chosen algorithm is logged at the debug level. All choices are
+    stable, so the result is the same as with any other algorithm.
+
+    A radix sort needs scratch space of about four times the size of the keys.
+    With ``mem_budget``, or when the server tracks memory and that scratch space
+    does not fit, a 1-D numeric array is instead split into ranges of keys
+    chosen from a sample, and the ranges are sorted one batch at a time, each
+    batch within the budget. This costs one extra pass over the keys per batch.
+
+    The budget only bounds that scratch space: the keys, the permutation and
+    each batch stay in memory, and nothing is spilled to disk. A budget that
+    needs more batches than the server's ``boundedSortMaxBatches`` (64 by
+    default), or in which a range of distinct keys chosen from the sample does
+    not fit, raises an error rather than sorting slowly or beyond the budget.
+    Strings, Categoricals and the multi-array sort of ``coargsort`` take no
+    budget.
+
     Examples
     --------
     >>> import arkouda as ak
@@ -75,11 +144,18 @@ def argsort(
 
     >>> ak.argsort(a, ak.sorting.SortingAlgorithm["TwoArrayRadixSort"])
     array([9 3 5 4 2 7 8 0 6 1])
+
+    >>> ak.argsort(a, "auto")
+    array([9 3 5 4 2 7 8 0 6 1])
     """
     from arkouda.categorical import Categorical
 
+    algorithm = _sorting_algorithm(algorithm)
+
     check_type(argname="argsort", value=pda, expected_type=Union[pdarray, Strings, Categorical])
 
+    if mem_budget is not None and not isinstance(pda, pdarray):
+        raise ValueError("mem_budget is only supported for pdarrays")
     if isinstance(pda, Categorical):
         return cast(Categorical, pda).argsort()
     elif isinstance(pda, Strings):
@@ -92,14 +168,17 @@ def argsort(
         )
         return create_pdarray(cast(str, repMsg))
     elif isinstance(pda, pdarray):
-        return pda.argsort(algorithm=algorithm, axis=axis)
+        if pda.ndim == 1 and pda.stats.is_sorted:
+            # a stable sort of sorted values is the identity permutation
+            return arange(pda.size)
+        return pda.argsort(algorithm=algorithm, axis=axis, mem_budget=mem_budget)
     else:
         raise TypeError(f"ak.argsort only supports pdarray, Strings, and Categorical, not {type(pda)}")
 
 
 def coargsort(
     arrays: Sequence[Union[Strings, pdarray, Categorical]],
-    algorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD,
+    algorithm: Union[SortingAlgorithm, str] = SortingAlgorithm.RadixSortLSD,
     ascending: bool = True,
 ) -> pdarray:
     """
@@ -111,8 +190,9 @@ def coargsort(
     ----------
     arrays : Sequence of Strings, pdarray, or Categorical
         The columns (int64, uint64, float64, Strings, or Categorical) to sort by row.
-    algorithm : SortingAlgorithm, default=SortingAlgorithm.RadixSortLSD
-        The algorithm to be used for sorting the arrays.
+    algorithm : SortingAlgorithm or str, default=SortingAlgorithm.RadixSortLSD
+        The algorithm to be used for sorting the arrays, or "auto" to let the
+        server choose one (see argsort).
     ascending : bool, default=True
         Whether to sort in ascending order. Ignored when arrays have ndim > 1.
 
@@ -157,6 +237,7 @@ def coargsort(
     from arkouda.numpy import cast as akcast
 
     check_type("coargsort", arrays, Sequence[Union[pdarray, Strings, Categorical]])
+    algorithm = _sorting_algorithm(algorithm)
 
     size: int_scalars = -1
     anames, atypes, expanded_arrays = [], [], []
@@ -200,6 +281,15 @@ def coargsort(
         dtype = int if isinstance(arrays[0], (Strings, Categorical)) else arrays[0].dtype
         return zeros(0, dtype=dtype)
 
+    first = cast(pdarray, arrays[0])
+    if ascending and all(isinstance(a, pdarray) and a.ndim == 1 for a in arrays):
+        # rows are already in order if every key column is sorted, or the first
+        # one is strictly increasing, so the stable sort is the identity
+        if all(cast(pdarray, a).is_known_sorted for a in arrays) or (
+            first.is_known_sorted and first.is_known_unique
+        ):
+            return arange(size)
+
     repMsg = generic_msg(
         cmd="coargsort",
         args={
@@ -210,7 +300,7 @@ def coargsort(
         },
     )
 
-    sorted_array = create_pdarray(cast(str, repMsg))
+    sorted_array = _sort_reply(cast(str, repMsg))
 
     if ascending or max_dim > 1:
         return sorted_array
@@ -222,7 +312,9 @@ def coargsort(
 
 @typechecked
 def sort(
-    pda: pdarray, algorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD, axis: int_scalars = -1
+    pda: pdarray,
+    algorithm: Union[SortingAlgorithm, str] = SortingAlgorithm.RadixSortLSD,
+    axis: int_scalars = -1,
 ) -> pdarray:
     """
     Return a sorted copy of the array. Only sorts numeric arrays;
@@ -232,8 +324,10 @@ def sort(
     ----------
     pda : pdarray
         The array to sort (int64, uint64, or float64)
-    algorithm : SortingAlgorithm, default=SortingAlgorithm.RadixSortLSD
-        The algorithm to be used for sorting the arrays.
+    algorithm : SortingAlgorithm or str, default=SortingAlgorithm.RadixSortLSD
+        The algorithm to be used for sorting the arrays, or "auto" to let the
+        server sort integer keys as offsets from their minimum when that needs
+        fewer radix digits.
     axis : int_scalars, default=-1
         The axis to sort over. Setting to -1 means that it will sort over axis = ndim - 1.
 
@@ -269,17 +363,126 @@ def sort(
     >>> sorted
     array([0 1 1 4 5 5 5 7 8 9])
     """
+    algorithm = _sorting_algorithm(algorithm)
     if pda.dtype == bigint:
         return pda[coargsort(pda.bigint_to_uint_arrays(), algorithm)]
     if pda.dtype not in numeric_dtypes:
         raise ValueError(f"ak.sort supports int64, uint64, or float64, not {pda.dtype}")
     if pda.size == 0:
         return zeros(0, dtype=pda.dtype)
-    repMsg = generic_msg(
-        cmd=f"sort<{pda.dtype.name},{pda.ndim}>",
-        args={"alg": algorithm.name, "array": pda, "axis": axis},
-    )
-    return create_pdarray(cast(str, repMsg))
+    if pda.ndim == 1 and pda.stats.is_sorted:
+        result = pda[:]
+    else:
+        repMsg = generic_msg(
+            cmd=f"sort<{pda.dtype.name},{pda.ndim}>",
+            args={"alg": algorithm.name, "array": pda, "axis": axis},
+        )
+        result = create_pdarray(cast(str, repMsg))
+    if result.ndim == 1:
+        # sorting keeps the values, so their statistics carry over
+        result.stats._copy_from(pda.stats)
+        result.stats.is_sorted = True
+    return result
+
+
+def merge_sorted(
+    arrays: Sequence[Union[pdarray, Strings, Datetime, Timedelta]],
+    return_permutation: bool = True,
+) -> Union[
+    Union[pdarray, Strings, Datetime, Timedelta],
+    Tuple[Union[pdarray, Strings, Datetime, Timedelta], pdarray],
+]:
+    """
+    Merge arrays that are each sorted into one sorted array.
+
+    Parameters
+    ----------
+    arrays : Sequence of pdarray, Strings, Datetime, or Timedelta
+        The arrays to merge, all of the same type (and dtype), each sorted in
+        ascending order. Numeric arrays are int64, uint64, or float64 with any
+        NaNs last, as ak.sort leaves them.
+    return_permutation : bool, default=True
+        Whether to also return the permutation that merges the arrays.
+
+    Returns
+    -------
+    pdarray, Strings, Datetime, or Timedelta, or a tuple of it and a pdarray
+        The merged array, and if return_permutation is True, the indices into
+        ``ak.concatenate(arrays)`` that put it in merged order
+
+    Raises
+    ------
+    TypeError
+        Raised if the arrays are of different types or dtypes, or of an
+        unsupported dtype
+    ValueError
+        Raised if no arrays are given, or an array is not 1-D
+
+    See Also
+    --------
+    sort, concatenate
+
+    Notes
+    -----
+    The arrays are not checked to be sorted; if one is not, the result is not
+    sorted either. The merge is stable: equal elements keep the order of their
+    arrays. Splitters sampled from all the arrays cut them into chunks that are
+    each merged on one locale, so the merge takes one pass over the elements
+    instead of sorting them again.
+
+    Examples
+    --------
+    >>> import arkouda as ak
+    >>> merged, perm = ak.merge_sorted([ak.array([1, 4, 7]), ak.array([2, 4, 9])])
+    >>> merged
+    array([1 2 4 4 7 9])
+    >>> perm
+    array([0 3 1 4 2 5])
+
+    """
+    from arkouda.numpy.pdarraysetops import concatenate
+    from arkouda.numpy.timeclass import Datetime, Timedelta
+
+    if len(arrays) == 0:
+        raise ValueError("merge_sorted requires at least one array")
+    first = arrays[0]
+    if any(type(a) is not type(first) for a in arrays):
+        raise TypeError("All arrays must be of the same type")
+
+    if isinstance(first, (Datetime, Timedelta)):
+        values, perm = merge_sorted([cast(Union[Datetime, Timedelta], a).values for a in arrays])
+        merged = type(first)(values)
+        return (merged, perm) if return_permutation else merged
+
+    starts = [0]
+    for a in arrays:
+        starts.append(starts[-1] + int(a.size))
+    combined = first if len(arrays) == 1 else concatenate(arrays, ordered=True)
+    if isinstance(combined, Strings):
+        repMsg = generic_msg(
+            cmd="mergeSortedStrings",
+            args={"name": combined.entry.name, "nRuns": len(arrays), "starts": starts},
+        )
+    elif isinstance(combined, pdarray):
+        if any(cast(pdarray, a).ndim != 1 for a in arrays):
+            raise ValueError("merge_sorted supports 1-D arrays only")
+        if any(a.dtype != first.dtype for a in arrays):
+            raise TypeError("All arrays must have the same dtype")
+        if combined.dtype not in numeric_dtypes:
+            raise TypeError(f"merge_sorted supports int64, uint64, or float64, not {combined.dtype}")
+        repMsg = generic_msg(
+            cmd=f"mergeSorted<{combined.dtype.name},1>",
+            args={"name": combined, "nRuns": len(arrays), "starts": starts},
+        )
+    else:
+        raise TypeError("merge_sorted supports pdarray, Strings, Datetime, or Timedelta")
+
+    perm = create_pdarray(cast(str, repMsg))
+    merged = combined[perm]
+    if isinstance(merged, pdarray) and all(cast(pdarray, a).is_known_sorted for a in arrays):
+        # the inputs are only assumed sorted, so only known-sorted inputs make a known-sorted result
+        merged.stats.is_sorted = True
+    return (merged, perm) if return_permutation else merged
 
 
 @typechecked
@@ -361,3 +564,50 @@ def searchsorted(
     if scalar_input:
         return int(out[0])
     return out
+
+
+# the largest n for which _top_n_mask selects candidates with maxk/mink
+_TOP_N_MAX = 2**22
+
+
+def _top_n_mask(key, n: int, largest: bool = True) -> Union[pdarray, None]:
+    """
+    Select the candidates for the first n rows of an ordering led by `key`.
+
+    The n-th largest (or smallest) key is found with maxk (or mink), which selects
+    the extreme values on each locale and merges the candidates, so it costs a single
+    pass over key instead of a sort. The rows whose key is at least (at most) that
+    threshold are a superset of the first n rows of any stable ordering that sorts
+    on key first, in descending (ascending) order.
+
+    Parameters
+    ----------
+    key : pdarray
+        The leading sort key
+    n : int
+        The number of rows wanted
+    largest : bool, default=True
+        Whether the ordering is descending in key
+
+    Returns
+    -------
+    pdarray or None
+        A boolean mask of the candidate rows, or None if all rows are needed or
+        key is not a NaN-free int64, uint64 or float64 array (or Datetime/Timedelta)
+
+    """
+    from arkouda.numpy.numeric import isnan
+    from arkouda.numpy.pdarrayclass import maxk, mink
+    from arkouda.numpy.timeclass import Datetime, Timedelta
+
+    if isinstance(key, (Datetime, Timedelta)):
+        key = key.values
+    if not isinstance(key, pdarray) or key.dtype not in numeric_dtypes:
+        return None
+    if not 0 < n < key.size or n > _TOP_N_MAX:
+        return None
+    if key.dtype == float64 and isnan(key).any():
+        return None
+    if largest:
+        return key >= maxk(key, n)[0]
+    return key <= mink(key, n)[n - 1]
@@ -14,7 +14,12 @@ from arkouda.client import generic_msg
 from arkouda.numpy import abs as akabs
 from arkouda.numpy import cast
 from arkouda.numpy.dtypes import int64, int_scalars, intTypes, isSupportedInt
-from arkouda.numpy.pdarrayclass import RegistrationError, create_pdarray, pdarray
+from arkouda.numpy.pdarrayclass import (
+    ArrayStats,
+    RegistrationError,
+    create_pdarray,
+    pdarray,
+)
 from arkouda.numpy.pdarraycreation import from_series
 
 __all__ = [
@@ -127,6 +132,11 @@ class _AbstractBaseTime(pdarray):
                 if self._factor != 1:
                     # Scale inplace because we already created a copy
                     self.values *= self._factor
+                # pandas already knows the order of its data, e.g. for date_range
+                if pda.is_monotonic_increasing:
+                    self.values.stats.is_sorted = True
+                    if pda.is_unique:
+                        self.values.stats.nunique = self.values.size
             elif isinstance(pda, np.ndarray):
                 # Numpy datetime64 and timedelta64
                 # Force through pandas.Series
@@ -149,6 +159,11 @@ class _AbstractBaseTime(pdarray):
         self._data = self.values
         self._is_populated = False
 
+    @property
+    def stats(self) -> ArrayStats:
+        # in-place operations modify self.values, whose statistics are kept current
+        return self.values.stats
+
     @classmethod
     def _get_callback(cls, other, op):
         # Will be overridden by all children
@@ -380,6 +395,7 @@ class _AbstractBaseTime(pdarray):
             else:
                 otherdata = other.values
             self.values.opeq(otherdata, op)
+            self._version += 1
         elif isinstance(other, Datetime) or self._is_datetime_scalar(other):
             raise TypeError(f"{self.__class__.__name__} {op} datetime not supported")
         else:
@@ -425,6 +441,7 @@ class _AbstractBaseTime(pdarray):
             self.values[key] = normval.value
         else:
             return NotImplemented
+        self._version += 1
 
     def min(self):
         __doc__ = super().min.__doc__  # noqa
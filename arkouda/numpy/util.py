@@ -264,6 +264,7 @@ def attach(name: str):
     >>> registered_obj.unregister()
     """
     from arkouda.dataframe import DataFrame
+    from arkouda.hashmap import HashMap
     from arkouda.index import Index, MultiIndex
     from arkouda.numpy.pdarrayclass import pdarray
     from arkouda.numpy.segarray import SegArray
@@ -298,6 +299,8 @@ def attach(name: str):
         rtn_obj = Series.from_return_msg(rep_msg["create"])
     elif rep_msg["objType"].lower() == BitVector.special_objType.lower():
         rtn_obj = BitVector.from_return_msg(rep_msg["create"])
+    elif rep_msg["objType"].lower() == HashMap.objType.lower():
+        rtn_obj = HashMap.from_return_msg(rep_msg["create"])
 
     if rtn_obj is not None:
         rtn_obj.registered_name = name
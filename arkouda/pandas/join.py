@@ -1,4 +1,4 @@
-from typing import Callable, Optional, Sequence, Tuple, Union, cast
+from typing import Callable, List, Optional, Sequence, Tuple, Union, cast
 
 import numpy as np
 from typeguard import typechecked
@@ -7,10 +7,13 @@ from arkouda.alignment import right_align
 from arkouda.categorical import Categorical
 from arkouda.client import generic_msg
 from arkouda.groupbyclass import GroupBy, broadcast
-from arkouda.numpy import cumsum
+from arkouda.numpy import cast as akcast
+from arkouda.numpy import cumsum, hash
 from arkouda.numpy.dtypes import NUMBER_FORMAT_STRINGS
+from arkouda.numpy.dtypes import bool_ as akbool
 from arkouda.numpy.dtypes import int64 as akint64
 from arkouda.numpy.dtypes import resolve_scalar_dtype
+from arkouda.numpy.dtypes import uint64 as akuint64
 from arkouda.numpy.pdarrayclass import create_pdarray, pdarray
 from arkouda.numpy.pdarraycreation import arange, array, ones, zeros
 from arkouda.numpy.pdarraysetops import concatenate, in1d
@@ -336,3 +339,89 @@ def inner_join(
     rightInds = byRight.permutation[filtRanges]
     leftInds = broadcast(filtSegs, arange(left_size)[keep12], filtRanges.size)
     return leftInds, rightInds
+
+
+# the largest side that a broadcast join will copy to every locale when method="auto"
+_BROADCAST_JOIN_MAX_ROWS = 2**22
+
+
+def _hash_join(
+    left: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+    right: Union[pdarray, Strings, Sequence[Union[pdarray, Strings]]],
+    method: str = "auto",
+) -> Tuple[pdarray, pdarray]:
+    """
+    Inner join the values in <left> and <right> using hash tables instead of sorting.
+
+    A single integer column is joined on its values. Any other key (strings, floats
+    or several columns) is joined on its 128-bit hash, in the same way that GroupBy
+    treats keys with equal hashes as equal.
+
+    Parameters
+    ----------
+    left : pdarray, Strings, or Sequence of pdarray or Strings
+        The left values to join
+    right : pdarray, Strings, or Sequence of pdarray or Strings
+        The right values to join
+    method : {"auto", "broadcast", "hash"}, default="auto"
+        "broadcast" builds a hash table of the smaller side and copies it to every
+        locale, where it is probed with the local block of the larger side.
+        "hash" partitions both sides by key hash and joins each partition locally.
+        "auto" broadcasts when the smaller side has at most 2**22 rows.
+
+    Returns
+    -------
+    Tuple[pdarray, pdarray]
+        The left and right indices of pairs of equal values, in no particular order
+
+    """
+    left_keys = list(left) if isinstance(left, Sequence) else [left]
+    right_keys = list(right) if isinstance(right, Sequence) else [right]
+    if len(left_keys) != len(right_keys):
+        raise ValueError("Left must have same num arrays as right")
+    if method not in ("auto", "broadcast", "hash"):
+        raise ValueError(
+            f"Unexpected value of {method} for method. Must be 'auto', 'broadcast' or 'hash'"
+        )
+
+    # the rows of each side that take part in the join, if not all of them
+    rows: List[Optional[pdarray]] = [None, None]
+    if len(left_keys) == 1 and all(
+        isinstance(k, pdarray) and k.dtype in (akint64, akuint64, akbool)
+        for k in (left_keys[0], right_keys[0])
+    ):
+        ints = [cast(pdarray, left_keys[0]), cast(pdarray, right_keys[0])]
+        if {ints[0].dtype, ints[1].dtype} == {akint64, akuint64}:
+            # a negative int64 key equals no uint64 key, but would once cast to uint64
+            side = 0 if ints[0].dtype == akint64 else 1
+            nonneg = arange(ints[side].size)[ints[side] >= 0]
+            rows[side], ints[side] = nonneg, ints[side][nonneg]
+        lk = [akcast(ints[0], akuint64)]
+        rk = [akcast(ints[1], akuint64)]
+    else:
+        lk = list(hash(cast(list, left_keys)))
+        rk = list(hash(cast(list, right_keys)))
+
+    left_size, right_size = lk[0].size, rk[0].size
+    if method == "auto":
+        method = "broadcast" if min(left_size, right_size) <= _BROADCAST_JOIN_MAX_ROWS else "hash"
+    # the server broadcasts the right side, so make it the smaller one
+    swap = method == "broadcast" and left_size < right_size
+    if swap:
+        lk, rk = rk, lk
+    args = {
+        "nkeys": len(lk),
+        "strategy": "broadcast" if method == "broadcast" else "partition",
+    }
+    args.update({f"left{i}": k for i, k in enumerate(lk)})
+    args.update({f"right{i}": k for i, k in enumerate(rk)})
+    repMsg = cast(str, generic_msg(cmd="hashJoin", args=args))
+    left_inds, right_inds = (create_pdarray(name) for name in repMsg.split("+"))
+    if swap:
+        left_inds, right_inds = right_inds, left_inds
+    left_rows, right_rows = rows
+    if left_rows is not None:
+        left_inds = left_rows[left_inds]
+    if right_rows is not None:
+        right_inds = right_rows[right_inds]
+    return left_inds, right_inds
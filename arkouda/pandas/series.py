@@ -28,8 +28,10 @@ from arkouda.numpy.pdarrayclass import (
 )
 from arkouda.numpy.pdarraycreation import arange, array, full, zeros
 from arkouda.numpy.pdarraysetops import argsort, concatenate, in1d, indexof1d
+from arkouda.numpy.sorting import _top_n_mask
 from arkouda.numpy.strings import Strings
 from arkouda.numpy.util import get_callback, is_float
+from arkouda.pandas.join import gen_ranges
 
 if TYPE_CHECKING:
     from arkouda.numpy.segarray import SegArray
@@ -272,12 +274,14 @@ class Series:
                 raise TypeError(
                     "Unexpected key type. Received Strings but expected {}".format(self.index.dtype)
                 )
-            if any(~in1d(key, self.index.values)):
-                raise KeyError("{} not in index".format(key[~in1d(key, self.index.values)]))
+            found = self._labels_found(key)
+            if not found.all():
+                raise KeyError("{} not in index".format(key[~found]))
         elif isinstance(key, pdarray):
             if key.dtype == self.index.dtype:
-                if any(~in1d(key, self.index.values)):
-                    raise KeyError("{} not in index".format(key[~in1d(key, self.index.values)]))
+                found = self._labels_found(key)
+                if not found.all():
+                    raise KeyError("{} not in index".format(key[~found]))
             elif key.dtype == "bool_":
                 if key.size != self.index.size:
                     raise IndexError(
@@ -307,6 +311,16 @@ class Series:
             )
         return key
 
+    def _labels_found(self, key: Union[pdarray, Strings]) -> pdarray:
+        """Return whether each key is a label of the index, probing its hash lookup if it has one."""
+        table = self.index._label_lookup([key])
+        if table is not None:
+            return table.counts([key]) > 0
+        bounds = self.index._label_bounds(key)
+        if bounds is not None:
+            return bounds[1] > bounds[0]
+        return in1d(key, self.index.values)
+
     @typechecked
     def __getitem__(self, _key: Union[supported_scalars, pdarray, Strings, List, Series]):
         """
@@ -330,7 +344,15 @@ class Series:
         if isinstance(key, pdarray) and key.dtype == "bool_":
             # boolean array indexes without sorting
             return Series(index=self.index[key], data=self.values[key])
-        indices = indexof1d(key, self.index.values)
+        table = self.index._label_lookup([key])
+        bounds = self.index._label_bounds(key) if table is None else None
+        if table is not None:
+            indices = table.rows([key])
+        elif bounds is not None:
+            found = bounds[1] > bounds[0]
+            indices = gen_ranges(bounds[0][found], bounds[1][found])[1]
+        else:
+            indices = indexof1d(key, self.index.values)
         if len(indices) == 1:
             return self.values[indices[0]]
         else:
@@ -746,7 +768,7 @@ class Series:
         return self._reindex(idx)
 
     @typechecked
-    def sort_values(self, ascending: bool = True) -> Series:
+    def sort_values(self, ascending: bool = True, limit: Optional[int] = None) -> Series:
         """
         Sort the Series by its values.
 
@@ -754,6 +776,10 @@ class Series:
         ----------
         ascending : bool, default=True
             Whether to sort values in ascending (default) or descending order.
+        limit : int, optional
+            If given, return only the first `limit` values of the sorted Series.
+            For numeric values, the candidates are selected with ak.maxk / ak.mink
+            so that only they are sorted.
 
         Returns
         -------
@@ -761,6 +787,12 @@ class Series:
             A new Series sorted by its values.
 
         """
+        if limit is not None:
+            if limit < 0:
+                raise ValueError("limit must be non-negative")
+            mask = _top_n_mask(self.values, limit, largest=not ascending)
+            candidates = self if mask is None else self._reindex(mask)
+            return candidates.sort_values(ascending=ascending).head(limit)
         if not ascending:
             if isinstance(self.values, pdarray) and self.values.dtype in (
                 int64,
@@ -1694,6 +1726,10 @@ class _LocIndexer:
         self.series = series
 
     def __getitem__(self, key):
+        if isinstance(key, slice):
+            # a zero-copy slice between the positions of the labels, found by binary search
+            s = self.series.index._label_slice(key)
+            return Series(index=self.series.index[s], data=self.series.values[s])
         return self.series[key]
 
     def __setitem__(self, key, val):
@@ -27,12 +27,15 @@ module ArgSortMsg
     use ServerErrorStrings;
 
     use RadixSortLSD;
+    use BoundedSort;
+    use RangeChunk;
     use SegmentedString;
     use Reflection;
     use ServerErrors;
     use Logging;
     use Message;
     use BigInteger;
+    use Sort only;
 
     private config const logLevel = ServerConfig.logLevel;
     private config const logChannel = ServerConfig.logChannel;
@@ -54,7 +57,8 @@ module ArgSortMsg
 
     enum SortingAlgorithm {
       RadixSortLSD,
-      TwoArrayRadixSort
+      TwoArrayRadixSort,
+      Auto
     }
     config const defaultSortAlgorithm: SortingAlgorithm = SortingAlgorithm.RadixSortLSD;
 
@@ -281,6 +285,38 @@ module ArgSortMsg
       // TODO support string? This further increases size (128-bits for each hash), so we
       // need to be OK with memory overhead and comm from the KEY)
       if !hasStr {
+        // Pack keys offset by their minimums into as few bits as they need, so
+        // narrow keys share radix digits instead of taking one or more each
+        var (totalBits, packedWidths, mins) = getPackedWidthsNumericArrays(names, st);
+
+        proc packedArgsort(type keyType) throws {
+          var packed = packNumericArrays(keyType, arrSize, totalBits, packedWidths, mins, names, st);
+          var chosen = "";
+          proc sortPacked() throws {
+            if keyType == uint {
+              const budget = sortScratchBudget(arrSize, numBytes(keyType));
+              if budget > 0 then return argsortBounded(packed, budget);
+            } else {
+              overMemLimit(radixSortLSD_memEst(arrSize, numBytes(keyType)));
+            }
+            if algorithm == SortingAlgorithm.Auto then return argsortAuto(packed, chosen);
+            return argsortDefault(packed, algorithm=algorithm);
+          }
+          var iv = sortPacked();
+          var repMsg = st.insert(new shared SymEntry(iv)).msg;
+          asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                         "packed %i arrays into %i bits".format(n, totalBits));
+          if chosen != "" {
+            asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                          "auto sort chose %s".format(chosen));
+            repMsg += "+" + chosen;
+          }
+          return repMsg;
+        }
+
+        if totalBits <= numBits(uint) { return new MsgTuple(packedArgsort(uint), MsgType.NORMAL); }
+        if totalBits <= 2 * numBits(uint) { return new MsgTuple(packedArgsort(2*uint), MsgType.NORMAL); }
+
         var (totalDigits, bitWidths, negs) = getNumDigitsNumericArrays(names, st);
 
         // TODO support arbitrary size with array-of-arrays or segmented array
@@ -293,10 +329,21 @@ module ArgSortMsg
           var ivname = st.nextName();
           var merged = mergeNumericArrays(numDigits, arrSize, totalDigits, bitWidths, negs, names, st);
 
-          var iv = argsortDefault(merged, algorithm=algorithm);
+          var chosen = "";
+          proc sortMerged() throws {
+            if algorithm == SortingAlgorithm.Auto then return argsortAuto(merged, chosen);
+            return argsortDefault(merged, algorithm=algorithm);
+          }
+          var iv = sortMerged();
           st.addEntry(ivname, createSymEntry(iv));
 
           var repMsg = "created " + st.attrib(ivname);
+          if chosen != "" {
+            // report the algorithm the Auto sort chose after the permutation
+            asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                          "auto sort chose %s".format(chosen));
+            repMsg += "+" + chosen;
+          }
           asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
           return repMsg;
         }
@@ -334,6 +381,253 @@ module ArgSortMsg
       return new MsgTuple(repMsg, MsgType.NORMAL);
     }
 
+    // number of evenly spaced adjacent pairs sampled by the Auto sort to
+    // estimate how presorted an array is
+    config const autoSortSamples = 4096;
+
+    inline proc numDigitsFor(nBits: int): int {
+      return (nBits + bitsPerDigit - 1) / bitsPerDigit;
+    }
+
+    /* Whether offsetting integer keys by their minimum leaves fewer radix digits
+       to sort, and that minimum */
+    proc keyOffset(const ref A: [?D] ?t): (bool, t) throws where isIntegralType(t) {
+      if D.size == 0 then return (false, 0: t);
+      const (nBits, _) = getBitWidth(A);
+      const lo = min reduce A, hi = max reduce A;
+      const span = hi: uint - lo: uint;
+      const spanBits = numBits(uint) - clz(span): int;
+      return (numDigitsFor(spanBits) < numDigitsFor(nBits), lo);
+    }
+
+    /* The number of elements of the first run that precede output position k
+       in a stable merge of the sorted runs A[D.low..<split] and A[split..D.high] */
+    proc mergeCoRank(const ref A: [?D] ?t, split: int, k: int): int {
+      const n1 = split - D.low, n2 = D.high + 1 - split;
+      var lo = max(0, k - n2), hi = min(k, n1);
+      while lo < hi {
+        const i = (lo + hi) / 2, j = k - i;
+        // the ith key of the first run goes before the (j-1)th of the second
+        if A[D.low + i] <= A[split + j - 1] then lo = i + 1; else hi = i;
+      }
+      return lo;
+    }
+
+    /* Find the permutation that sorts an array made of the two sorted runs
+       A[D.low..<split] and A[split..D.high] with one stable merge. Each task
+       finds the part of both runs that fills its block of the output with two
+       binary searches, copies them to its locale and merges them. */
+    proc mergeRunsRanks(const ref A: [?D] ?t, split: int): [D] int throws {
+      var ranks = makeDistArray(D, int);
+      coforall loc in Locales with (ref ranks) do on loc {
+        const myInds = D.localSubdomain().dim(0);
+        coforall task in 0..#numTasks with (ref ranks) {
+          const inds = chunk(myInds, numTasks, task);
+          if inds.size > 0 {
+            const k0 = inds.low - D.low, k1 = inds.high + 1 - D.low;
+            const i0 = mergeCoRank(A, split, k0), i1 = mergeCoRank(A, split, k1);
+            const j0 = k0 - i0, j1 = k1 - i1;
+            const first: [0..#(i1-i0)] t = A[D.low+i0..#(i1-i0)];
+            const second: [0..#(j1-j0)] t = A[split+j0..#(j1-j0)];
+            var i = 0, j = 0;
+            for k in inds {
+              if j == second.size || (i < first.size && first[i] <= second[j]) {
+                ranks[k] = D.low + i0 + i;
+                i += 1;
+              } else {
+                ranks[k] = split + j0 + j;
+                j += 1;
+              }
+            }
+          }
+        }
+      }
+      return ranks;
+    }
+
+    // chunks of the output per task in a merge of sorted runs, for balance
+    config const mergeSortedOversample = 4;
+
+    /* The key an element of a sorted run is merged by: reals by their bits in
+       sort order, so that NaNs go last as they do in a sort */
+    inline proc mergeKey(x: real): uint do return packKey(x);
+    inline proc mergeKey(x) do return x;
+
+    /* The first position in the sorted run A[lo..<hi] with a key of at least k */
+    proc runLowerBound(const ref A, lo: int, hi: int, k): int throws {
+      var l = lo, h = hi;
+      while l < h {
+        const mid = (l + h) / 2;
+        if mergeKey(A[mid]) < k then l = mid + 1; else h = mid;
+      }
+      return l;
+    }
+
+    /* Copy the keys A[lo..#size] to keys[at..#size] */
+    proc gatherRunKeys(ref keys: [] ?kt, at: int, const ref A: [?D] ?t, lo: int, size: int) {
+      const piece: [0..#size] t = A[lo..#size];
+      keys[at..#size] = [x in piece] mergeKey(x);
+    }
+
+    proc gatherRunKeys(ref keys: [] string, at: int, A: SegString, lo: int, size: int) throws {
+      for i in 0..#size do keys[at + i] = A[lo + i];
+    }
+
+    /* Stably merge the sorted runs keys[bounds[r]..<bounds[r+1]] pairwise, in
+       log(runs) passes, permuting idx alongside. Ties go to the earlier run. */
+    proc mergeLocalRuns(ref keys: [?D] ?kt, ref idx: [D] int, const ref bounds: [] int) {
+      const k = bounds.size - 1;
+      var tmpKeys: [D] kt, tmpIdx: [D] int;
+      var width = 1;
+      while width < k {
+        forall lo in 0..<k by 2*width with (ref tmpKeys, ref tmpIdx) {
+          const a = bounds[lo], m = bounds[min(lo + width, k)], e = bounds[min(lo + 2*width, k)];
+          var i = a, j = m;
+          for o in a..<e {
+            if j == e || (i < m && keys[i] <= keys[j]) {
+              tmpKeys[o] = keys[i];
+              tmpIdx[o] = idx[i];
+              i += 1;
+            } else {
+              tmpKeys[o] = keys[j];
+              tmpIdx[o] = idx[j];
+              j += 1;
+            }
+          }
+        }
+        keys <=> tmpKeys;
+        idx <=> tmpIdx;
+        width *= 2;
+      }
+    }
+
+    /*
+      Find the permutation that stably merges the sorted runs
+      A[starts[r]..<starts[r+1]] of A, which is an array or a SegString.
+
+      Splitters chosen from an evenly spaced sample of every run cut each run
+      at its first key of at least each splitter, so the cuts split the output
+      into chunks whose positions are known up front. Each chunk is gathered
+      from all runs and merged on the locale that owns it, so the merge makes
+      one pass over the keys however many runs there are.
+
+      :arg kt: the type of the merge keys of A, as returned by mergeKey
+      :returns: the permutation of the positions of A that sorts it
+    */
+    proc mergeSortedRanks(const ref A, n: int, const ref starts: [] int, type kt) throws {
+      const k = starts.size - 1;
+      var perm = makeDistArray(n, int);
+      if n == 0 then return perm;
+
+      // choose the splitters from a sample of each run
+      const nChunks = max(1, min(n, numLocales * numTasks * mergeSortedOversample));
+      const sampleCounts = [r in 0..<k] min(starts[r+1] - starts[r], nChunks);
+      const sampleStarts = (+ scan sampleCounts) - sampleCounts;
+      var sample: [0..#(+ reduce sampleCounts)] kt;
+      forall r in 0..<k with (ref sample) {
+        const size = starts[r+1] - starts[r];
+        for s in 0..#sampleCounts[r] do
+          sample[sampleStarts[r] + s] = mergeKey(A[starts[r] + (s * size) / sampleCounts[r]]);
+      }
+      Sort.sort(sample);
+      var splitters: [1..<nChunks] kt;
+      forall (sp, c) in zip(splitters, 1..) do sp = sample[(c * sample.size) / nChunks];
+
+      // cut every run at every splitter; chunk c lies between cuts c and c+1
+      var cuts: [0..nChunks, 0..<k] int;
+      forall (c, r) in cuts.domain with (ref cuts) {
+        cuts[c, r] = if c == 0 then starts[r]
+                     else if c == nChunks then starts[r+1]
+                     else runLowerBound(A, starts[r], starts[r+1], splitters[c]);
+      }
+      var outStarts: [0..nChunks] int;
+      forall (o, c) in zip(outStarts, 0..) do o = + reduce [r in 0..<k] (cuts[c, r] - starts[r]);
+
+      forall c in makeDistDom(nChunks) with (ref perm) {
+        const size = outStarts[c+1] - outStarts[c];
+        if size > 0 {
+          var bounds: [0..k] int;
+          for r in 0..<k do bounds[r+1] = bounds[r] + cuts[c+1, r] - cuts[c, r];
+          var keys: [0..#size] kt, idx: [0..#size] int;
+          for r in 0..<k {
+            const runSize = bounds[r+1] - bounds[r];
+            if runSize > 0 {
+              gatherRunKeys(keys, bounds[r], A, cuts[c, r], runSize);
+              idx[bounds[r]..#runSize] = cuts[c, r]..#runSize;
+            }
+          }
+          mergeLocalRuns(keys, idx, bounds);
+          perm[outStarts[c]..#size] = idx;
+        }
+      }
+      return perm;
+    }
+
+    /*
+      Argsort with an algorithm chosen from a sample of the keys:
+
+      - "Presorted": the keys are sorted, so the identity permutation
+      - "MergeRuns": the keys are two sorted runs, merged in one pass
+      - "TwoArrayRadixSort": small arrays, where the per-bucket overhead of an
+        LSD radix sort dominates
+      - "OffsetRadixSortLSD": an LSD radix sort of integer keys offset by their
+        minimum, when their range needs fewer digits than their values
+      - "RadixSortLSD": otherwise
+
+      The sample counts descents among evenly spaced adjacent pairs, and only
+      an array with at most one is checked in full for sorted runs.
+
+      :arg chosen: set to the name of the chosen algorithm
+    */
+    proc argsortAuto(const ref A: [?D] ?t, out chosen: string): [D] int throws
+      where D.rank == 1
+    {
+      const n = D.size;
+      // a descent in the sample already shows the keys are not sorted
+      var sorted = n < 2;
+      if n > 1 {
+        const m = max(1, min(n - 1, autoSortSamples));
+        const stride = (n - 1) / m;
+        const sampled = + reduce [s in 0..#m] (!(A[D.low + s*stride] <= A[D.low + s*stride + 1])): int;
+        if sampled <= 1 {
+          var descents = 0, split = D.high + 1;
+          forall i in D with (+ reduce descents, min reduce split) {
+            if i > D.low && !(A[i-1] <= A[i]) {
+              descents += 1;
+              split = min(split, i);
+            }
+          }
+          sorted = descents == 0;
+          // a NaN compares as a descent, so sorted runs of reals hold none
+          if descents == 1 && t != real {
+            chosen = "MergeRuns";
+            return mergeRunsRanks(A, split);
+          }
+        }
+      }
+      if sorted {
+        chosen = "Presorted";
+        var ranks: [D] int = [i in D] i;
+        return ranks;
+      }
+      if n <= small {
+        chosen = "TwoArrayRadixSort";
+        return argsortDefault(A, algorithm=SortingAlgorithm.TwoArrayRadixSort);
+      }
+      if isIntegralType(t) {
+        const (useOffset, lo) = keyOffset(A);
+        if useOffset {
+          chosen = "OffsetRadixSortLSD";
+          overMemLimit(n * numBytes(uint) + radixSortLSD_memEst(n, numBytes(uint)));
+          var offsetKeys = makeDistArray(D, uint);
+          offsetKeys = [a in A] a: uint - lo: uint;
+          return radixSortLSD_ranks(offsetKeys, checkSorted=false);
+        }
+      }
+      chosen = "RadixSortLSD";
+      return radixSortLSD_ranks(A, checkSorted=false);
+    }
+
     @chplcheck.ignore("UnusedFormal")
     proc argsortDefault(
       A:[?D] ?t,
@@ -354,6 +648,12 @@ module ArgSortMsg
         when SortingAlgorithm.RadixSortLSD {
           iv = radixSortLSD_ranks(A);
         }
+        when SortingAlgorithm.Auto {
+          var chosen: string;
+          iv = argsortAuto(A, chosen);
+          asLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                         "auto sort chose %s".format(chosen));
+        }
         otherwise {
           throw getErrorWithContext(
                                     msg="Unrecognized sorting algorithm: %s".format(algorithm:string),
@@ -402,7 +702,7 @@ module ArgSortMsg
             }
           }
         }
-        when SortingAlgorithm.RadixSortLSD {
+        when SortingAlgorithm.RadixSortLSD, SortingAlgorithm.Auto {
           // TODO: make a version of radixSortLSD_ranks that does the sort on
           // slices of `A` directly instead of creating a copy for each slice
           for idx in DD {
@@ -441,6 +741,29 @@ module ArgSortMsg
               symEntry = st[msgArgs["name"]]: SymEntry(array_dtype, array_nd),
               vals = if array_dtype == bool then (symEntry.a:int) else (symEntry.a: array_dtype);
 
+        if array_nd == 1 {
+          // sort in batches within the given budget, or the memory left if the
+          // scratch space of a full sort does not fit
+          if vals.eltType == int || vals.eltType == uint || vals.eltType == real {
+            const memBudget = if msgArgs.contains("mem_budget")
+                                then msgArgs["mem_budget"].toScalar(int) else 0;
+            const budget = if memBudget > 0 then memBudget
+                                            else sortScratchBudget(vals.size, numBytes(vals.eltType));
+            if budget > 0 {
+              const iv = argsortBounded(vals, budget, strict=memBudget > 0);
+              return st.insert(new shared SymEntry(iv));
+            }
+          }
+          if algorithm == SortingAlgorithm.Auto {
+            // report the chosen algorithm after the permutation
+            var chosen: string;
+            const iv = argsortAuto(vals, chosen);
+            asLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                          "auto sort chose %s".format(chosen));
+            const repMsg = st.insert(new shared SymEntry(iv)).msg + "+" + chosen;
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+          }
+        }
         const iv = argsortDefault(vals, algorithm=algorithm, axis);
         return st.insert(new shared SymEntry(iv));
     }
@@ -463,7 +786,39 @@ module ArgSortMsg
         return st.insert(new shared SymEntry(iv));
     }
 
+    /* mergeSorted takes an array made of sorted runs and returns the
+       permutation that merges them */
+    @arkouda.instantiateAndRegister(prefix='mergeSorted')
+    @chplcheck.ignore("UnusedFormal")
+    proc mergeSortedMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab, type array_dtype, param array_nd: int): MsgTuple throws
+      where array_dtype == int || array_dtype == uint || array_dtype == real
+    {
+        if array_nd != 1 {
+          return MsgTuple.error("mergeSorted supports 1D arrays, not %iD".format(array_nd));
+        } else {
+          const nRuns = msgArgs["nRuns"].toScalar(int),
+                starts = msgArgs["starts"].toScalarArray(int, nRuns + 1),
+                symEntry = st[msgArgs["name"]]: SymEntry(array_dtype, 1);
+          const iv = mergeSortedRanks(symEntry.a, symEntry.size, starts, mergeKey(0: array_dtype).type);
+          return st.insert(new shared SymEntry(iv));
+        }
+    }
+
+    @chplcheck.ignore("UnusedFormal")
+    proc mergeSortedStringsMsg(
+      cmd: string,
+      msgArgs: borrowed MessageArgs,
+      st: borrowed SymTab
+    ): MsgTuple throws {
+        const strings = getSegString(msgArgs["name"].toScalar(string), st),
+              nRuns = msgArgs["nRuns"].toScalar(int),
+              starts = msgArgs["starts"].toScalarArray(int, nRuns + 1);
+        const iv = mergeSortedRanks(strings, strings.size, starts, string);
+        return st.insert(new shared SymEntry(iv));
+    }
+
     use CommandMap;
     registerFunction("argsortStrings", argsortStrings, getModuleName());
+    registerFunction("mergeSortedStrings", mergeSortedStringsMsg, getModuleName());
     registerFunction("coargsort", coargsortMsg, getModuleName());
 }
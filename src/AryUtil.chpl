@@ -679,6 +679,117 @@ module AryUtil
       return (totalDigits, bitWidths, negs);
     }
 
+    /* Map a key to a uint with the same order, for packing several keys into one */
+    inline proc packKey(a: int): uint { return a: uint ^ (1: uint << (numBits(uint) - 1)); }
+
+    inline proc packKey(a: uint): uint { return a; }
+
+    inline proc packKey(a: bool): uint { return a: uint; }
+
+    inline proc packKey(in a: real): uint {
+      var keyu: uint;
+      memcpy(c_ptrTo(keyu), c_ptrTo(a), numBytes(a.type).safeCast(c_size_t));
+      // as in getDigit, negatives are inverted and positives get the sign bit
+      if keyu >> (numBits(uint) - 1) == 1 then return ~keyu;
+      return keyu | (1: uint << (numBits(uint) - 1));
+    }
+
+    inline proc orPackedBits(ref p: uint, v: uint, shift: int) {
+      p |= v << shift;
+    }
+
+    inline proc orPackedBits(ref p: 2*uint, v: uint, shift: int) {
+      if shift >= numBits(uint) {
+        p[0] |= v << (shift - numBits(uint));
+      } else {
+        p[1] |= v << shift;
+        if shift > 0 then p[0] |= v >> (numBits(uint) - shift);
+      }
+    }
+
+    /*
+      Find how many bits each numeric key needs once offset by its minimum,
+      for packing the keys into one composite key with packNumericArrays.
+
+      :returns: (totalBits, bitWidths, mins)
+    */
+    proc getPackedWidthsNumericArrays(names, st: borrowed SymTab) throws {
+      var bitWidths: [names.domain] int;
+      var mins: [names.domain] uint;
+      var totalBits: int;
+
+      for (bitWidth, lo, name) in zip(bitWidths, mins, names) {
+        var g: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        proc widthOf(type t) throws {
+          ref A = toSymEntry(g, t).a;
+          if A.size == 0 then return;
+          lo = min reduce [a in A] packKey(a);
+          const hi = max reduce [a in A] packKey(a);
+          bitWidth = numBits(uint) - clz(hi - lo): int;
+        }
+        select g.dtype {
+          when DType.Int64   { widthOf(int); }
+          when DType.UInt64  { widthOf(uint); }
+          when DType.Float64 { widthOf(real); }
+          when DType.Bool    { widthOf(bool); }
+          otherwise {
+            throw getErrorWithContext(
+                                      msg=dtype2str(g.dtype),
+                                      lineNumber=getLineNumber(),
+                                      routineName=getRoutineName(),
+                                      moduleName=getModuleName(),
+                                      errorClass="TypeError"
+                                      );
+          }
+        }
+        totalBits += bitWidth;
+      }
+      return (totalBits, bitWidths, mins);
+    }
+
+    /*
+      Pack numeric keys into one composite key per row, the first key in the
+      most significant bits, so that sorting the composite key sorts the rows.
+      Each key is offset by its minimum and takes only the bits it needs, so
+      a sort makes one pass per 16 bits of the total rather than per key.
+
+      :arg keyType: uint for up to 64 total bits, or 2*uint for up to 128
+    */
+    proc packNumericArrays(type keyType, size, totalBits, bitWidths, mins, names, st) throws {
+      // the caller checks the memory for sorting the packed keys
+      overMemLimit(size*numBytes(keyType));
+
+      var packed = makeDistArray(size, keyType);
+      var shift = totalBits;
+      for (name, nBits, lo) in zip(names, bitWidths, mins) {
+        shift -= nBits;
+        // a constant key takes no bits
+        if nBits == 0 then continue;
+        var g: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        proc packArray(type t) throws {
+          ref A = toSymEntry(g, t).a;
+          const s = shift;
+          forall (p, a) in zip(packed, A) do orPackedBits(p, packKey(a) - lo, s);
+        }
+        select g.dtype {
+          when DType.Int64   { packArray(int); }
+          when DType.UInt64  { packArray(uint); }
+          when DType.Float64 { packArray(real); }
+          when DType.Bool    { packArray(bool); }
+          otherwise {
+            throw getErrorWithContext(
+                                      msg=dtype2str(g.dtype),
+                                      lineNumber=getLineNumber(),
+                                      routineName=getRoutineName(),
+                                      moduleName=getModuleName(),
+                                      errorClass="IllegalArgumentError"
+                                      );
+          }
+        }
+      }
+      return packed;
+    }
+
     proc mergeNumericArrays(param numDigits, size, totalDigits, bitWidths, negs, names, st) throws {
       // check mem limit for merged array and sort on merged array
       const itemsize = numDigits * bitsPerDigit / 8;
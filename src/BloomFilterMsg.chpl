@@ -0,0 +1,211 @@
+/* Bloom filters of pdarrays
+ * Builds Bloom filters of uint64 keys (or pairs of them, for 128-bit key
+ * hashes) with a full copy on every locale, so that testing keys against
+ * the filter needs no communication
+ */
+
+module BloomFilterMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use HashTable;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const bfLogger = new Logger(logLevel, logChannel);
+
+    /* The two hashes of a key; its j-th bit is (h1 + j*h2) mod the number of bits */
+    inline proc bloomHashes(k): 2*uint {
+      const h1 = keyHash(k);
+      return (h1, splitMix64(h1 ^ 0x5851f42d4c957f2d) | 1);
+    }
+
+    inline proc bloomBit(h: 2*uint, j: int, nBits: int): int {
+      return ((h(0) + j: uint * h(1)) % nBits: uint): int;
+    }
+
+    /*
+    Build a Bloom filter of keys with nWords 64-bit words and nHash bits per
+    key. Each locale sets the bits of its own keys in a filter of its own,
+    then the filters are ORed together and the result copied back to every
+    locale.
+
+    :returns: numLocales*nWords words, of which words[l*nWords..#nWords]
+              is the copy of the filter on locale l
+    */
+    proc buildBloomFilter(const ref keys: [?D] ?t, nWords: int, nHash: int) throws {
+      const nBits = nWords * 64;
+      var words = makeDistArray(numLocales * nWords, uint);
+      coforall loc in Locales with (ref words) do on loc {
+        var bits: [0..#nWords] atomic uint;
+        forall i in keys.localSubdomain() with (ref bits) {
+          const h = bloomHashes(keys[i]);
+          for j in 0..#nHash {
+            const b = bloomBit(h, j, nBits);
+            bits[b / 64].fetchOr(1: uint << (b % 64));
+          }
+        }
+        words[loc.id * nWords..#nWords] = bits.read();
+      }
+
+      // OR the filters of all locales, a block of words per locale
+      var merged = makeDistArray(nWords, uint);
+      coforall loc in Locales with (ref merged) do on loc {
+        const myD = merged.localSubdomain();
+        if myD.size > 0 {
+          var acc: [myD] uint = 0;
+          for l in 0..#numLocales {
+            const part: [myD] uint = words[l * nWords + myD.low..l * nWords + myD.high];
+            acc |= part;
+          }
+          merged[myD] = acc;
+        }
+      }
+      coforall loc in Locales with (ref words) do on loc {
+        const m: [0..#nWords] uint = merged;
+        words[loc.id * nWords..#nWords] = m;
+      }
+      return words;
+    }
+
+    /*
+    Test keys against a Bloom filter built by buildBloomFilter. Each locale
+    reads only its own copy of the filter.
+
+    :returns: false for keys that are certainly not in the filter, and true
+              for keys that may be
+    */
+    proc probeBloomFilter(const ref keys: [?D] ?t, const ref words: [] uint, nWords: int, nHash: int) throws {
+      const nBits = nWords * 64;
+      var maybe = makeDistArray(D, bool);
+      coforall loc in Locales with (ref maybe) do on loc {
+        const base = loc.id * nWords;
+        const ref myWords = words.localSlice[base..#nWords];
+        forall i in keys.localSubdomain() with (ref maybe) {
+          const h = bloomHashes(keys[i]);
+          var hit = true;
+          for j in 0..#nHash {
+            const b = bloomBit(h, j, nBits);
+            if (myWords[base + b / 64] & (1: uint << (b % 64))) == 0 {
+              hit = false;
+              break;
+            }
+          }
+          maybe[i] = hit;
+        }
+      }
+      return maybe;
+    }
+
+    /* The uint64 keys key0[, key1] of a message, checking their dtype */
+    proc bloomKeys(msgArgs: borrowed MessageArgs, st: borrowed SymTab, nkeys: int) throws {
+      param pn = Reflection.getRoutineName();
+      for j in 0..#nkeys {
+        var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st);
+        if gEnt.dtype != DType.UInt64 {
+          throw getErrorWithContext(
+                     msg=notImplementedError(pn, gEnt.dtype),
+                     lineNumber=getLineNumber(),
+                     routineName=getRoutineName(),
+                     moduleName=getModuleName(),
+                     errorClass="TypeError");
+        }
+      }
+    }
+
+    /*
+    Parse, execute, and respond to a buildBloomFilter message
+    :arg msgArgs: nkeys (1, or 2 for 128-bit key hashes), key0[, key1] (uint64 pdarrays),
+                  nwords (the size of the filter in 64-bit words) and nhash (bits per key)
+    :returns: (MsgTuple) the words of the filter, copied once per locale
+    */
+    proc buildBloomFilterMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      const nkeys = msgArgs.get("nkeys").getIntValue();
+      const nWords = msgArgs.get("nwords").getIntValue();
+      const nHash = msgArgs.get("nhash").getIntValue();
+
+      bfLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                     "cmd: %s nkeys: %i nwords: %i nhash: %i".format(cmd, nkeys, nWords, nHash));
+      if (nkeys != 1 && nkeys != 2) || nWords < 1 || nHash < 1 {
+        var errorMsg = "Error: expected nkeys of 1 or 2 and positive nwords and nhash";
+        bfLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+        return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
+      bloomKeys(msgArgs, st, nkeys);
+      proc keys(j: int) throws {
+        return toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st), uint);
+      }
+
+      var repMsg: string;
+      if nkeys == 1 {
+        var words = buildBloomFilter(keys(0).a, nWords, nHash);
+        repMsg = st.insert(new shared SymEntry(words)).msg;
+      } else {
+        const k0 = keys(0), k1 = keys(1);
+        var pairs = makeDistArray(k0.size, 2*uint);
+        forall (k, a, b) in zip(pairs, k0.a, k1.a) do k = (a, b);
+        var words = buildBloomFilter(pairs, nWords, nHash);
+        repMsg = st.insert(new shared SymEntry(words)).msg;
+      }
+      bfLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Parse, execute, and respond to a probeBloomFilter message
+    :arg msgArgs: nkeys, key0[, key1] (uint64 probe keys), filter (the words of a
+                  buildBloomFilter reply), nwords and nhash
+    :returns: (MsgTuple) a bool array that is false where the key is certainly not
+              in the filter
+    */
+    proc probeBloomFilterMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+      const nkeys = msgArgs.get("nkeys").getIntValue();
+      const nWords = msgArgs.get("nwords").getIntValue();
+      const nHash = msgArgs.get("nhash").getIntValue();
+
+      bfLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                     "cmd: %s nkeys: %i nwords: %i nhash: %i".format(cmd, nkeys, nWords, nHash));
+      if (nkeys != 1 && nkeys != 2) || nWords < 1 || nHash < 1 {
+        var errorMsg = "Error: expected nkeys of 1 or 2 and positive nwords and nhash";
+        bfLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+        return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
+      bloomKeys(msgArgs, st, nkeys);
+      proc keys(j: int) throws {
+        return toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st), uint);
+      }
+      const filter = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("filter"), st), uint);
+      if filter.size != numLocales * nWords {
+        var errorMsg = "Error: the filter was built on a different number of locales";
+        bfLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+        return new MsgTuple(errorMsg, MsgType.ERROR);
+      }
+
+      var repMsg: string;
+      if nkeys == 1 {
+        var maybe = probeBloomFilter(keys(0).a, filter.a, nWords, nHash);
+        repMsg = st.insert(new shared SymEntry(maybe)).msg;
+      } else {
+        const k0 = keys(0), k1 = keys(1);
+        var pairs = makeDistArray(k0.size, 2*uint);
+        forall (k, a, b) in zip(pairs, k0.a, k1.a) do k = (a, b);
+        var maybe = probeBloomFilter(pairs, filter.a, nWords, nHash);
+        repMsg = st.insert(new shared SymEntry(maybe)).msg;
+      }
+      bfLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+      return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("buildBloomFilter", buildBloomFilterMsg, getModuleName());
+    registerFunction("probeBloomFilter", probeBloomFilterMsg, getModuleName());
+}
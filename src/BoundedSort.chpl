@@ -0,0 +1,216 @@
+/* Sorting within a memory budget
+ * Sorts arrays whose radix sort scratch space would not fit in memory by
+ * sorting them one range of keys at a time
+ */
+
+module BoundedSort
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use MemoryMgmt;
+    use RangeChunk;
+    use CommAggregation;
+    use Sort only;
+
+    use AryUtil;
+    use RadixSortLSD;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const bsLogger = new Logger(logLevel, logChannel);
+
+    // sampled keys per bucket, for choosing bucket bounds
+    config const boundedSortOversample = 64;
+
+    // every batch takes a pass over all the keys, so budgets given by the
+    // user that would need more batches than this are rejected
+    config const boundedSortMaxBatches = 64;
+
+    /* The bytes a sort of a batch takes per key: the indices and keys of the
+       batch, the sorted ranks and the radix sort scratch space */
+    proc boundedSortBytesPerKey(itemsize: int): int {
+      return 3 * numBytes(int) + itemsize + 2 * (itemsize + numBytes(int));
+    }
+
+    /*
+      The per-locale budget for the scratch space of a sort of n keys of the
+      given size: 0 if a radix sort of all of them fits in memory, and
+      otherwise half the memory left, so that the sort runs in batches
+      instead of failing. Throws the out of memory error if no memory is left.
+    */
+    proc sortScratchBudget(n: int, itemsize: int): int throws {
+      try {
+        overMemLimit(radixSortLSD_memEst(n, itemsize));
+        return 0;
+      } catch e: ErrorWithContext {
+        const free = if memMgmtType == MemMgmtType.STATIC
+                       then getMemLimit(): int - getMemUsed(): int
+                       else getAvailMemory(): int;
+        if free <= 0 then throw e;
+        bsLogger.info(getModuleName(),getRoutineName(),getLineNumber(),
+                      "sorting %i keys in batches within %i bytes per locale".format(n, free / 2));
+        return free / 2;
+      }
+    }
+
+    /* The bucket of a key: 2*i for keys between splitters i-1 and i, and
+       2*i+1 for keys equal to splitter i */
+    inline proc bucketOf(k: uint, const ref splitters: [?sD] uint): int {
+      var lo = 0, hi = sD.size;
+      while lo < hi {
+        const mid = (lo + hi) / 2;
+        if splitters[mid] < k then lo = mid + 1; else hi = mid;
+      }
+      return if lo < sD.size && splitters[lo] == k then 2*lo + 1 else 2*lo;
+    }
+
+    /*
+      Find the permutation that stably sorts A, with sort scratch space for
+      at most budget bytes per locale.
+
+      A sorted sample of the keys splits them into buckets of ranges of keys,
+      with a bucket of its own for each key that is sampled more than once, so
+      that heavily repeated keys are not sorted at all. One pass counts the
+      keys of every bucket in every task's block of A. Then consecutive
+      buckets are batched up to the number of keys that fits in the budget,
+      and each batch is gathered in index order with one more pass, sorted with
+      the LSD radix sort and written to its place in the permutation.
+
+      The keys are not spilled to disk: the budget only bounds the scratch
+      space, and every batch takes one more pass over A.
+
+      :arg budget: bytes per locale for the scratch space of the sort
+      :arg strict: whether the budget was given by the user, who gets an error
+                   rather than a slow sort or a batch beyond the budget
+      :returns: the permutation that sorts A, as radixSortLSD_ranks would
+      :throws: when strict, if the budget would need more than
+               boundedSortMaxBatches batches or a bucket of distinct keys
+               does not fit in it
+    */
+    proc argsortBounded(const ref A: [?D] ?t, budget: int, strict = false): [D] int throws
+      where D.rank == 1 && (t == int || t == uint || t == real)
+    {
+      const n = D.size;
+      const cap = max(1, (budget / boundedSortBytesPerKey(numBytes(t))) * numLocales);
+      var iv = makeDistArray(D, int);
+      if n <= cap {
+        iv = radixSortLSD_ranks(A);
+        return iv;
+      }
+      if strict && (n + cap - 1) / cap > boundedSortMaxBatches {
+        throw getErrorWithContext(
+                 msg="a sort budget of %i bytes per locale needs more than %i batches for %i keys"
+                     .format(budget, boundedSortMaxBatches, n),
+                 lineNumber=getLineNumber(),
+                 routineName=getRoutineName(),
+                 moduleName=getModuleName(),
+                 errorClass="ValueError");
+      }
+
+      // choose the bucket bounds from an evenly spaced sample of the keys
+      const nBounds = 2 * ((n + cap - 1) / cap);
+      const nSample = min(n, nBounds * boundedSortOversample);
+      var sample: [0..#nSample] uint;
+      forall (s, i) in zip(sample, 0..) do s = packKey(A[D.low + (i * (n / nSample))]);
+      Sort.sort(sample);
+      var bounds: [0..#nBounds] uint;
+      forall (b, i) in zip(bounds, 1..) do b = sample[(i * nSample) / (nBounds + 1)];
+      // repeated bounds are merged, and their key gets a bucket of its own
+      var nSplit = 0;
+      for i in 0..#nBounds {
+        if nSplit == 0 || bounds[i] != bounds[nSplit-1] {
+          bounds[nSplit] = bounds[i];
+          nSplit += 1;
+        }
+      }
+      const splitters: [0..#nSplit] uint = bounds[0..#nSplit];
+      const nBuckets = 2 * nSplit + 1;
+      const nTasks = numLocales * numTasks;
+
+      // count the keys of each bucket in each task's block
+      var taskCounts: [0..#nTasks, 0..#nBuckets] int;
+      coforall loc in Locales with (ref taskCounts) do on loc {
+        const mySplitters = splitters;
+        const myInds = D.localSubdomain().dim(0);
+        coforall task in 0..#numTasks with (ref taskCounts) {
+          var counts: [0..#nBuckets] int;
+          for i in chunk(myInds, numTasks, task) do counts[bucketOf(packKey(A[i]), mySplitters)] += 1;
+          taskCounts[loc.id * numTasks + task, ..] = counts;
+        }
+      }
+      const bucketCounts = [b in 0..#nBuckets] + reduce taskCounts[.., b];
+      const bucketStarts = (+ scan bucketCounts) - bucketCounts;
+
+      proc sortBatch(first: int, last: int, size: int) throws {
+        const start = bucketStarts[first];
+        // a bucket of one repeated key is already sorted in index order
+        const presorted = first == last && first % 2 == 1;
+        if size > cap && !presorted {
+          const msg = "a bucket of %i keys exceeds the sort budget of %i keys".format(size, cap);
+          if strict then
+            throw getErrorWithContext(msg=msg,
+                                      lineNumber=getLineNumber(),
+                                      routineName=getRoutineName(),
+                                      moduleName=getModuleName(),
+                                      errorClass="ValueError");
+          bsLogger.warn(getModuleName(),getRoutineName(),getLineNumber(),msg);
+        }
+
+        // where each task's keys of the batch go, in index order
+        const perTask = [task in 0..#nTasks] + reduce taskCounts[task, first..last];
+        const taskStarts = (+ scan perTask) - perTask;
+        var idx = makeDistArray(size, int);
+        coforall loc in Locales with (ref idx) do on loc {
+          const mySplitters = splitters;
+          const myInds = D.localSubdomain().dim(0);
+          const myStarts = taskStarts;
+          coforall task in 0..#numTasks with (ref idx) {
+            var pos = myStarts[loc.id * numTasks + task];
+            var agg = newDstAggregator(int);
+            for i in chunk(myInds, numTasks, task) {
+              const b = bucketOf(packKey(A[i]), mySplitters);
+              if b >= first && b <= last {
+                agg.copy(idx[pos], i);
+                pos += 1;
+              }
+            }
+            agg.flush();
+          }
+        }
+
+        var sorted = makeDistArray(size, int);
+        if presorted {
+          sorted = idx;
+        } else {
+          var keys = makeDistArray(size, t);
+          forall (k, i) in zip(keys, idx) with (var agg = newSrcAggregator(t)) do agg.copy(k, A[i]);
+          const ranks = radixSortLSD_ranks(keys);
+          forall (s, r) in zip(sorted, ranks) with (var agg = newSrcAggregator(int)) do agg.copy(s, idx[r]);
+        }
+        iv[D.low + start..#size] = sorted;
+      }
+
+      var first = 0;
+      var nBatches = 0;
+      while first < nBuckets {
+        // batch buckets up to the capacity, with at least one bucket a batch
+        var last = first;
+        var size = bucketCounts[first];
+        while last + 1 < nBuckets && size + bucketCounts[last+1] <= cap {
+          last += 1;
+          size += bucketCounts[last];
+        }
+        if size > 0 {
+          sortBatch(first, last, size);
+          nBatches += 1;
+        }
+        first = last + 1;
+      }
+      bsLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                     "sorted %i keys in %i batches of at most %i".format(n, nBatches, cap));
+      return iv;
+    }
+}
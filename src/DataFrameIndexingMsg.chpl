@@ -10,6 +10,9 @@
     use SegmentedMsg;
     use AryUtil;
     use BigInteger;
+    use CommAggregation;
+    use SegmentedString;
+    use CTypes;
 
     use MultiTypeSymEntry;
     use MultiTypeSymbolTable;
@@ -214,6 +217,416 @@
         return new MsgTuple(repMsg, MsgType.NORMAL); 
     }
 
+    /*
+    Positions of the rows selected by a key, which is either an integer index
+    or a boolean mask. The positions of the true entries of a mask are found
+    with a single prefix sum, which is shared by every column.
+    */
+    proc selectedRows(gKey: borrowed GenSymEntry, nRows: int): [] int throws {
+        param pn = Reflection.getRoutineName();
+        select gKey.dtype {
+            when DType.Bool {
+                const ref mask = toSymEntry(gKey, bool).a;
+                if mask.size != nRows {
+                    var errorMsg = "Error: %s: mask size %i does not match %i rows".format(pn, mask.size, nRows);
+                    dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    throw new owned IllegalArgumentError(errorMsg);
+                }
+                const ends = + scan (mask:int);
+                const nSelected = if nRows == 0 then 0 else ends[mask.domain.high];
+                var rows = makeDistArray(nSelected, int);
+                forall (i, m, e) in zip(mask.domain, mask, ends) with (var agg = newDstAggregator(int)) {
+                    if m then agg.copy(rows[e-1], i);
+                }
+                return rows;
+            }
+            when DType.Int64, DType.UInt64 {
+                var rows = if gKey.dtype == DType.Int64 then makeDistArray(toSymEntry(gKey, int).a)
+                                                        else makeDistArray(toSymEntry(gKey, uint).a:int);
+                if rows.size > 0 {
+                    const (lo, hi) = (min reduce rows, max reduce rows);
+                    if lo < 0 || hi >= nRows {
+                        var errorMsg = "Error: %s: OOBindex %i..%i not in 0..%i".format(pn, lo, hi, nRows-1);
+                        dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                        throw new owned IllegalArgumentError(errorMsg);
+                    }
+                }
+                return rows;
+            }
+            otherwise {
+                var errorMsg = notImplementedError(pn, dtype2str(gKey.dtype));
+                dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                throw new owned IllegalArgumentError(errorMsg);
+            }
+        }
+    }
+
+    proc takeRows(const ref rows: [] int, const ref a: [] ?t): [] t throws {
+        var res = makeDistArray(rows.size, t);
+        if t == bigint {
+            forall (r, i) in zip(res, rows) do r = a[i];
+        } else {
+            forall (r, i) in zip(res, rows) with (var agg = newSrcAggregator(t)) do agg.copy(r, a[i]);
+        }
+        return res;
+    }
+
+    proc takeSegArrayRows(const ref rows: [] int, const ref segments: [] int, const ref values: [?vD] ?t,
+                          st: borrowed SymTab): string throws {
+        const nSegs = segments.size;
+        var lens = makeDistArray(rows.size, int);
+        forall (l, i) in zip(lens, rows) {
+            l = (if i == nSegs-1 then vD.size else segments[i+1]) - segments[i];
+        }
+        var newSegs = (+ scan lens) - lens;
+        var newVals = makeDistArray(+ reduce lens, t);
+        forall (i, ns, l) in zip(rows, newSegs, lens) with (var agg = newDstAggregator(t)) {
+            var v = new lowLevelLocalizingSlice(values, segments[i]..#l);
+            for j in 0..#l do agg.copy(newVals[ns+j], v.ptr[j]);
+        }
+        return "SegArray+" + st.insert(new shared SymEntry(newSegs)).msg + "+" +
+                             st.insert(new shared SymEntry(newVals)).msg;
+    }
+
+    /*
+    Select the same rows from several columns in one message. The key is a
+    boolean mask or an integer index, and each column is given as "pdarray+name",
+    "Strings+name" or "SegArray+segments+values" (Categoricals are sent as
+    their codes). The reply lists the new columns in the same order.
+    */
+    proc dataframeTakeMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const size = msgArgs.get("size").getIntValue();
+        const nRows = msgArgs.get("nrows").getIntValue();
+        const eleList = msgArgs.get("columns").getList(size);
+        const rows = selectedRows(getGenericTypedArrayEntry(msgArgs.getValueOf("key"), st), nRows);
+
+        var repMsgList: [0..#size] string;
+        for (rpm, ele) in zip(repMsgList, eleList) {
+            const ele_parts = ele.split("+");
+            select ele_parts[0] {
+                when "Strings" {
+                    var strings = getSegString(ele_parts[1], st);
+                    var (newSegs, newVals) = strings[rows];
+                    var newStrings = getSegString(newSegs, newVals, st);
+                    rpm = formatJson("Strings+created %s+created bytes.size %?".format(
+                                     st.attrib(newStrings.name), newStrings.nBytes));
+                }
+                when "SegArray" {
+                    const segments = toSymEntry(getGenericTypedArrayEntry(ele_parts[1], st), int);
+                    var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(ele_parts[2], st);
+                    select gVal.dtype {
+                        when DType.Int64 do rpm = formatJson(takeSegArrayRows(rows, segments.a, toSymEntry(gVal, int).a, st));
+                        when DType.UInt64 do rpm = formatJson(takeSegArrayRows(rows, segments.a, toSymEntry(gVal, uint).a, st));
+                        when DType.Float64 do rpm = formatJson(takeSegArrayRows(rows, segments.a, toSymEntry(gVal, real).a, st));
+                        when DType.Bool do rpm = formatJson(takeSegArrayRows(rows, segments.a, toSymEntry(gVal, bool).a, st));
+                        otherwise {
+                            var errorMsg = notImplementedError(pn,dtype2str(gVal.dtype));
+                            dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                            throw new IllegalArgumentError(errorMsg);
+                        }
+                    }
+                }
+                when "pdarray" {
+                    var gCol: borrowed GenSymEntry = getGenericTypedArrayEntry(ele_parts[1], st);
+                    proc take(type t) throws {
+                        var res = takeRows(rows, toSymEntry(gCol, t).a);
+                        return formatJson("pdarray+" + st.insert(new shared SymEntry(res)).msg);
+                    }
+                    select gCol.dtype {
+                        when DType.Int64 do rpm = take(int);
+                        when DType.UInt64 do rpm = take(uint);
+                        when DType.Float64 do rpm = take(real);
+                        when DType.Bool do rpm = take(bool);
+                        when DType.BigInt do rpm = take(bigint);
+                        otherwise {
+                            var errorMsg = notImplementedError(pn,dtype2str(gCol.dtype));
+                            dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                            throw new IllegalArgumentError(errorMsg);
+                        }
+                    }
+                }
+                otherwise {
+                    var errorMsg = notImplementedError(pn, ele_parts[0]);
+                    dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    throw new IllegalArgumentError(errorMsg);
+                }
+            }
+        }
+        const repMsg = "[%s]".format(",".join(repMsgList));
+        dfiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /* Size in bytes of a buffer of n elements of type t, padded to a multiple of 8 */
+    proc paddedSize(n: int, itemsize: int): int {
+        return (n * itemsize + 7) / 8 * 8;
+    }
+
+    /* Copy A to the buffer at ptr+offset and return the offset of the next buffer */
+    proc copyToBuffer(ptr: c_ptr(uint(8)), offset: int, const ref A: [?D] ?t): int {
+        if D.size > 0 {
+            var localA = makeArrayFromPtr((ptr + offset): c_ptr(t), D.size: uint);
+            localA = A;
+        }
+        return offset + paddedSize(D.size, c_sizeof(t): int);
+    }
+
+    /*
+    Arrow string buffers of a SegString: n+1 offsets into the string bytes
+    with the null terminators removed
+    */
+    proc arrowStringBuffers(strings) throws {
+        const n = strings.size;
+        const ref offs = strings.offsets.a;
+        const ref vals = strings.values.a;
+        var arrowOffsets = makeDistArray(n+1, int);
+        forall (i, o) in zip(offs.domain, offs) with (var agg = newDstAggregator(int)) {
+            agg.copy(arrowOffsets[i], o - i);
+        }
+        arrowOffsets[n] = strings.nBytes - n;
+        var arrowValues = makeDistArray(strings.nBytes - n, uint(8));
+        forall (i, o) in zip(offs.domain, offs) with (var agg = newDstAggregator(uint(8))) {
+            const l = (if i == n-1 then strings.nBytes else offs[i+1]) - o - 1;
+            if l > 0 {
+                var v = new lowLevelLocalizingSlice(vals, o..#l);
+                for j in 0..#l do agg.copy(arrowValues[o-i+j], v.ptr[j]);
+            }
+        }
+        return (arrowOffsets, arrowValues);
+    }
+
+    /*
+    Send several columns to the client in one binary reply, laid out as Arrow
+    buffers. Each column is given as "pdarray+name", "Strings+name" or
+    "SegArray+segments+values". A pdarray contributes its values, and Strings
+    and SegArrays contribute n+1 int64 offsets followed by their values (string
+    bytes without null terminators). Every buffer is padded to a multiple of 8
+    bytes, so the client can find them from the column sizes alone.
+    */
+    proc dataframeToBuffersMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const size = msgArgs.get("size").getIntValue();
+        const eleList = msgArgs.get("columns").getList(size);
+
+        proc checkDType(g: borrowed GenSymEntry) throws {
+            select g.dtype {
+                when DType.Int64, DType.UInt64, DType.Float64, DType.Bool do return;
+                otherwise {
+                    var errorMsg = notImplementedError(pn,dtype2str(g.dtype));
+                    dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    throw new IllegalArgumentError(errorMsg);
+                }
+            }
+        }
+
+        var total = 0;
+        for ele in eleList {
+            const ele_parts = ele.split("+");
+            select ele_parts[0] {
+                when "Strings" {
+                    var strings = getSegString(ele_parts[1], st);
+                    total += paddedSize(strings.size+1, 8) + paddedSize(strings.nBytes - strings.size, 1);
+                }
+                when "SegArray" {
+                    var gSegs: borrowed GenSymEntry = getGenericTypedArrayEntry(ele_parts[1], st);
+                    var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(ele_parts[2], st);
+                    checkDType(gVal);
+                    total += paddedSize(gSegs.size+1, 8) + paddedSize(gVal.size, gVal.itemsize);
+                }
+                when "pdarray" {
+                    var gCol: borrowed GenSymEntry = getGenericTypedArrayEntry(ele_parts[1], st);
+                    checkDType(gCol);
+                    total += paddedSize(gCol.size, gCol.itemsize);
+                }
+                otherwise {
+                    var errorMsg = notImplementedError(pn, ele_parts[0]);
+                    dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    throw new IllegalArgumentError(errorMsg);
+                }
+            }
+        }
+        // the string buffers are staged on the server before the copy
+        overMemLimit(2 * total);
+
+        var ptr = allocate(uint(8), max(total, 1));
+        var offset = 0;
+        proc copyColumn(g: borrowed GenSymEntry) throws {
+            select g.dtype {
+                when DType.Int64 do offset = copyToBuffer(ptr, offset, toSymEntry(g, int).a);
+                when DType.UInt64 do offset = copyToBuffer(ptr, offset, toSymEntry(g, uint).a);
+                when DType.Float64 do offset = copyToBuffer(ptr, offset, toSymEntry(g, real).a);
+                when DType.Bool do offset = copyToBuffer(ptr, offset, toSymEntry(g, bool).a);
+            }
+        }
+        for ele in eleList {
+            const ele_parts = ele.split("+");
+            select ele_parts[0] {
+                when "Strings" {
+                    var strings = getSegString(ele_parts[1], st);
+                    const (arrowOffsets, arrowValues) = arrowStringBuffers(strings);
+                    offset = copyToBuffer(ptr, offset, arrowOffsets);
+                    offset = copyToBuffer(ptr, offset, arrowValues);
+                }
+                when "SegArray" {
+                    const segments = toSymEntry(getGenericTypedArrayEntry(ele_parts[1], st), int);
+                    var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(ele_parts[2], st);
+                    var arrowOffsets = makeDistArray(segments.size+1, int);
+                    arrowOffsets[0..#segments.size] = segments.a;
+                    arrowOffsets[segments.size] = gVal.size;
+                    offset = copyToBuffer(ptr, offset, arrowOffsets);
+                    copyColumn(gVal);
+                }
+                when "pdarray" {
+                    copyColumn(getGenericTypedArrayEntry(ele_parts[1], st));
+                }
+            }
+        }
+        dfiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                        "sending %i columns in %i bytes".format(size, total));
+        return MsgTuple.payload(bytes.createAdoptingBuffer(ptr, total, max(total, 1)));
+    }
+
+    /* Copy n elements of type t at ptr+offset into a new distributed array */
+    proc distArrayFromBuffer(ptr: c_ptr(uint(8)), offset: int, n: int, type t) throws {
+        var A = makeDistArray(n, t);
+        if n > 0 {
+            const localA = makeArrayFromPtr((ptr + offset): c_ptr(t), n: uint);
+            A = localA;
+        }
+        return A;
+    }
+
+    /*
+    Build SegString segments and values from Arrow string buffers: n+1 offsets
+    into string bytes without null terminators
+    */
+    proc segStringFromArrow(const ref arrowOffsets: [] int, const ref arrowValues: [] uint(8), n: int) throws {
+        var segs = makeDistArray(n, int);
+        forall (sg, i) in zip(segs, segs.domain) do sg = arrowOffsets[i] + i;
+        // the values are zero-initialized, which supplies the null terminators
+        var vals = makeDistArray(arrowValues.size + n, uint(8));
+        forall (i, sg) in zip(segs.domain, segs) with (var agg = newDstAggregator(uint(8))) {
+            const o = arrowOffsets[i];
+            const l = arrowOffsets[i+1] - o;
+            if l > 0 {
+                var v = new lowLevelLocalizingSlice(arrowValues, o..#l);
+                for j in 0..#l do agg.copy(vals[sg+j], v.ptr[j]);
+            }
+        }
+        return (segs, vals);
+    }
+
+    /*
+    Create several columns from one binary payload of Arrow buffers, the
+    inverse of dataframe_to_buffers. Each column is given as
+    "pdarray+dtype+size", "Strings+size+nbytes" (n+1 int64 offsets followed by
+    the string bytes without null terminators) or "SegArray+dtype+size+nvalues"
+    (n+1 int64 offsets followed by the values), with every buffer padded to a
+    multiple of 8 bytes. The buffers are copied from the payload straight into
+    distributed arrays. The reply lists the new columns in the same order.
+    */
+    proc dataframeFromBuffersMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const size = msgArgs.get("size").getIntValue();
+        const eleList = msgArgs.get("columns").getList(size);
+
+        proc itemsize(dtype: string): int throws {
+            select dtype {
+                when "int64", "uint64", "float64" do return 8;
+                when "bool" do return 1;
+                otherwise {
+                    var errorMsg = notImplementedError(pn, dtype);
+                    dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    throw new IllegalArgumentError(errorMsg);
+                }
+            }
+        }
+
+        var total = 0;
+        for ele in eleList {
+            const ele_parts = ele.split("+");
+            select ele_parts[0] {
+                when "Strings" {
+                    total += paddedSize(ele_parts[1]: int + 1, 8) + paddedSize(ele_parts[2]: int, 1);
+                }
+                when "SegArray" {
+                    total += paddedSize(ele_parts[2]: int + 1, 8) +
+                             paddedSize(ele_parts[3]: int, itemsize(ele_parts[1]));
+                }
+                when "pdarray" {
+                    total += paddedSize(ele_parts[2]: int, itemsize(ele_parts[1]));
+                }
+                otherwise {
+                    var errorMsg = notImplementedError(pn, ele_parts[0]);
+                    dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    throw new IllegalArgumentError(errorMsg);
+                }
+            }
+        }
+        if total != msgArgs.payload.size {
+            var errorMsg = "Error: expected %i bytes but received %i".format(total, msgArgs.payload.size);
+            dfiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            throw new IllegalArgumentError(errorMsg);
+        }
+        overMemLimit(2 * total);
+
+        const ptr = msgArgs.payload.c_str():c_ptr(void):c_ptr(uint(8));
+        var offset = 0;
+        proc readArray(dtype: string, n: int): string throws {
+            proc read(type t) throws {
+                var A = distArrayFromBuffer(ptr, offset, n, t);
+                offset += paddedSize(n, c_sizeof(t): int);
+                return st.insert(new shared SymEntry(A)).msg;
+            }
+            select dtype {
+                when "int64" do return read(int);
+                when "uint64" do return read(uint);
+                when "float64" do return read(real);
+                otherwise do return read(bool);
+            }
+        }
+        proc readOffsets(n: int) throws {
+            var A = distArrayFromBuffer(ptr, offset, n+1, int);
+            offset += paddedSize(n+1, 8);
+            return A;
+        }
+
+        var repMsgList: [0..#size] string;
+        for (rpm, ele) in zip(repMsgList, eleList) {
+            const ele_parts = ele.split("+");
+            select ele_parts[0] {
+                when "Strings" {
+                    const n = ele_parts[1]: int, nBytes = ele_parts[2]: int;
+                    const arrowOffsets = readOffsets(n);
+                    const arrowValues = distArrayFromBuffer(ptr, offset, nBytes, uint(8));
+                    offset += paddedSize(nBytes, 1);
+                    var (segs, vals) = segStringFromArrow(arrowOffsets, arrowValues, n);
+                    var strings = getSegString(segs, vals, st);
+                    rpm = formatJson("Strings+created %s+created bytes.size %?".format(
+                                     st.attrib(strings.name), strings.nBytes));
+                }
+                when "SegArray" {
+                    const n = ele_parts[2]: int;
+                    const arrowOffsets = readOffsets(n);
+                    var segs = makeDistArray(n, int);
+                    forall (sg, i) in zip(segs, segs.domain) do sg = arrowOffsets[i];
+                    const segsMsg = st.insert(new shared SymEntry(segs)).msg;
+                    rpm = formatJson("SegArray+" + segsMsg + "+" + readArray(ele_parts[1], ele_parts[3]: int));
+                }
+                when "pdarray" {
+                    rpm = formatJson("pdarray+" + readArray(ele_parts[1], ele_parts[2]: int));
+                }
+            }
+        }
+        const repMsg = "[%s]".format(",".join(repMsgList));
+        dfiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
     use CommandMap;
     registerFunction("dataframe_idx", dataframeBatchIndexingMsg, getModuleName());
+    registerFunction("dataframe_take", dataframeTakeMsg, getModuleName());
+    registerFunction("dataframe_to_buffers", dataframeToBuffersMsg, getModuleName());
+    registerFunction("dataframe_from_buffers", dataframeFromBuffersMsg, getModuleName());
 }
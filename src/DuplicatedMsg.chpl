@@ -0,0 +1,115 @@
+/* Duplicate detection with hash tables
+ * Flags the rows of an array of uint64 keys (or pairs of them, for 128-bit
+ * key hashes) whose key also occurs at another row, without sorting
+ */
+
+module DuplicatedMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use CommAggregation;
+    use RadixSortLSD;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use HashTable;
+    use HashJoinMsg only hashPartition;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const dupLogger = new Logger(logLevel, logChannel);
+
+    /*
+    Flag duplicated keys.
+
+    The keys are permuted into numLocales*numTasks partitions by key hash, so
+    that equal keys land in the same partition. The permutation is stable, so
+    each task can build a table of one partition in which the rows of every
+    key are in their original order, and flag all but the first or last of
+    them.
+
+    :arg keep: "first" or "last" to flag all but the first or last occurrence of
+               each key, or "none" to flag every occurrence of a repeated key
+    :returns: a bool array that is true at the duplicated rows
+    */
+    proc hashDuplicated(const ref keys: [?D] ?t, keep: string) throws {
+        const nParts = numLocales * numTasks;
+        const (perm, permKeys, starts, sizes) = hashPartition(keys, nParts);
+
+        var dup = makeDistArray(D.size, bool);
+        coforall loc in Locales with (ref dup) do on loc {
+            coforall task in 0..#numTasks with (ref dup) {
+                const q = loc.id * numTasks + task;
+                const k: [0..#sizes[q]] t = permKeys[starts[q]..#sizes[q]];
+                const p: [0..#sizes[q]] int = perm[starts[q]..#sizes[q]];
+                const table = buildHashTable(k, p);
+                var agg = newDstAggregator(bool);
+                for s in table.slotD {
+                    if table.used[s] && table.count[s] > 1 {
+                        const first = table.start[s];
+                        const last = first + table.count[s] - 1;
+                        for j in first..last {
+                            if keep == "none" || (keep == "first" && j != first) || (keep == "last" && j != last) {
+                                agg.copy(dup[table.rows[j]], true);
+                            }
+                        }
+                    }
+                }
+                agg.flush();
+            }
+        }
+        return dup;
+    }
+
+    /*
+    Parse, execute, and respond to a hashDuplicated message
+    :arg msgArgs: nkeys (1, or 2 for 128-bit key hashes), key0[, key1] (uint64 pdarrays)
+                  and keep ("first", "last" or "none")
+    :returns: (MsgTuple) a bool pdarray flagging the duplicated rows
+    */
+    proc hashDuplicatedMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const nkeys = msgArgs.get("nkeys").getIntValue();
+        const keep = msgArgs.getValueOf("keep");
+
+        dupLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                        "cmd: %s nkeys: %i keep: %s".format(cmd, nkeys, keep));
+        if (nkeys != 1 && nkeys != 2) || (keep != "first" && keep != "last" && keep != "none") {
+            var errorMsg = "Error: expected nkeys of 1 or 2 and keep 'first', 'last' or 'none'";
+            dupLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        for j in 0..#nkeys {
+            var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st);
+            if gEnt.dtype != DType.UInt64 {
+                var errorMsg = notImplementedError(pn, gEnt.dtype);
+                dupLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        proc keys(j: int) throws {
+            return toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st), uint);
+        }
+
+        var repMsg: string;
+        if nkeys == 1 {
+            repMsg = st.insert(new shared SymEntry(hashDuplicated(keys(0).a, keep))).msg;
+        } else {
+            const k0 = keys(0), k1 = keys(1);
+            var pairs = makeDistArray(k0.size, 2*uint);
+            forall (k, a, b) in zip(pairs, k0.a, k1.a) do k = (a, b);
+            repMsg = st.insert(new shared SymEntry(hashDuplicated(pairs, keep))).msg;
+        }
+        dupLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("hashDuplicated", hashDuplicatedMsg, getModuleName());
+}
@@ -0,0 +1,267 @@
+/* Persistent hash indexes of pdarrays
+ * Builds hash tables of uint64 keys (or pairs of them, for 128-bit key
+ * hashes) that are kept in the symbol table as ordinary arrays, so that
+ * later lookups probe them instead of sorting the indexed keys again
+ */
+
+module HashIndexMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use CommAggregation;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use HashTable;
+    use HashJoinMsg only hashPartition;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const hiLogger = new Logger(logLevel, logChannel);
+
+    /*
+    Build a hash index of keys.
+
+    The keys are permuted into numLocales*numTasks partitions by key hash and
+    each task builds a table of one partition, as in a partitioned hash join.
+    The tables are then laid end to end in distributed arrays: partition p
+    owns the slots partSlots[p]..#partSize[p], and the rows of the key in slot
+    s are rows[slotStart[s]..#slotCount[s]], in their original order.
+
+    :returns: (slot keys, slotStart, slotCount, rows, partSlots, partSize)
+    */
+    proc buildHashIndex(const ref keys: [?D] ?t) throws {
+        const nParts = numLocales * numTasks;
+        const (perm, permKeys, starts, sizes) = hashPartition(keys, nParts);
+        // the same number of slots as buildHashTable gives each partition
+        var partSize = makeDistArray(nParts, int);
+        forall (ps, s) in zip(partSize, sizes) {
+            ps = 1;
+            while ps < 2 * s do ps <<= 1;
+        }
+        const partSlots = (+ scan partSize) - partSize;
+        const nSlots = + reduce partSize;
+
+        var slotKeys = makeDistArray(nSlots, t);
+        var slotStart = makeDistArray(nSlots, int);
+        var slotCount = makeDistArray(nSlots, int);
+        var rows = makeDistArray(D.size, int);
+        coforall loc in Locales with (ref slotKeys, ref slotStart, ref slotCount, ref rows) do on loc {
+            coforall task in 0..#numTasks with (ref slotKeys, ref slotStart, ref slotCount, ref rows) {
+                const q = loc.id * numTasks + task;
+                const pK: [0..#sizes[q]] t = permKeys[starts[q]..#sizes[q]];
+                const pP: [0..#sizes[q]] int = perm[starts[q]..#sizes[q]];
+                const table = buildHashTable(pK, pP);
+                const slots = partSlots[q]..#partSize[q];
+                slotKeys[slots] = table.keys;
+                slotStart[slots] = table.start + starts[q];
+                slotCount[slots] = table.count;
+                rows[starts[q]..#sizes[q]] = table.rows;
+            }
+        }
+        return (slotKeys, slotStart, slotCount, rows, partSlots, partSize);
+    }
+
+    inline proc sameKey(const ref sk0: [] uint, const ref sk1: [] uint, s: int, k: uint): bool {
+        return sk0[s] == k;
+    }
+
+    inline proc sameKey(const ref sk0: [] uint, const ref sk1: [] uint, s: int, k: 2*uint): bool {
+        return sk0[s] == k(0) && sk1[s] == k(1);
+    }
+
+    /*
+    Find the slot of every probe key in a hash index, or -1 for keys that
+    are not in it. Each probe reads the slots of one partition, starting from
+    the slot that buildHashTable would have put the key in.
+    */
+    proc probeHashIndex(const ref probe: [?D] ?t, const ref sk0: [] uint, const ref sk1: [] uint,
+                        const ref slotCount: [] int, const ref partSlots: [] int,
+                        const ref partSize: [] int) throws {
+        const nParts = partSlots.size;
+        var slots = makeDistArray(D.size, int);
+        forall (s, k) in zip(slots, probe) with (var localSlots: [0..#nParts] int = partSlots,
+                                                 var localSizes: [0..#nParts] int = partSize) {
+            const h = keyHash(k);
+            const p = ((h >> 32) % nParts: uint): int;
+            const mask = (localSizes[p] - 1): uint;
+            var j = (h & mask): int;
+            s = -1;
+            while slotCount[localSlots[p] + j] > 0 {
+                if sameKey(sk0, sk1, localSlots[p] + j, k) {
+                    s = localSlots[p] + j;
+                    break;
+                }
+                j = ((j + 1): uint & mask): int;
+            }
+        }
+        return slots;
+    }
+
+    /*
+    Parse, execute, and respond to a buildHashIndex message
+    :arg msgArgs: nkeys (1, or 2 for 128-bit key hashes) and key0[, key1] (uint64 pdarrays)
+    :returns: (MsgTuple) the slot keys (one array per key), slot starts, slot counts,
+              rows, partition slots and partition sizes of the index
+    */
+    proc buildHashIndexMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const nkeys = msgArgs.get("nkeys").getIntValue();
+
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s nkeys: %i".format(cmd, nkeys));
+        if nkeys != 1 && nkeys != 2 {
+            var errorMsg = "Error: expected nkeys of 1 or 2";
+            hiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        for j in 0..#nkeys {
+            var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st);
+            if gEnt.dtype != DType.UInt64 {
+                var errorMsg = notImplementedError(pn, gEnt.dtype);
+                hiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        proc keys(j: int) throws {
+            return toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st), uint);
+        }
+
+        proc tableMsg(ref slotStart, ref slotCount, ref rows, ref partSlots, ref partSize) throws {
+            return st.insert(new shared SymEntry(slotStart)).msg + "+" +
+                   st.insert(new shared SymEntry(slotCount)).msg + "+" +
+                   st.insert(new shared SymEntry(rows)).msg + "+" +
+                   st.insert(new shared SymEntry(partSlots)).msg + "+" +
+                   st.insert(new shared SymEntry(partSize)).msg;
+        }
+
+        var repMsg: string;
+        if nkeys == 1 {
+            var (slotKeys, slotStart, slotCount, rows, partSlots, partSize) = buildHashIndex(keys(0).a);
+            repMsg = st.insert(new shared SymEntry(slotKeys)).msg;
+            repMsg += "+" + tableMsg(slotStart, slotCount, rows, partSlots, partSize);
+        } else {
+            const k0 = keys(0), k1 = keys(1);
+            var pairs = makeDistArray(k0.size, 2*uint);
+            forall (k, a, b) in zip(pairs, k0.a, k1.a) do k = (a, b);
+            var (slotKeys, slotStart, slotCount, rows, partSlots, partSize) = buildHashIndex(pairs);
+            var slotKeys0 = makeDistArray(slotKeys.size, uint);
+            var slotKeys1 = makeDistArray(slotKeys.size, uint);
+            forall (k, a, b) in zip(slotKeys, slotKeys0, slotKeys1) do (a, b) = k;
+            repMsg = st.insert(new shared SymEntry(slotKeys0)).msg + "+" +
+                     st.insert(new shared SymEntry(slotKeys1)).msg;
+            repMsg += "+" + tableMsg(slotStart, slotCount, rows, partSlots, partSize);
+        }
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    /*
+    Parse, execute, and respond to a probeHashIndex message
+    :arg msgArgs: nkeys, slotKeys0[, slotKeys1], slotStart, slotCount, rows, partSlots
+                  and partSize (the arrays of a buildHashIndex reply), key0[, key1]
+                  (uint64 probe keys), mode and size (the number of indexed rows)
+    :returns: (MsgTuple) for mode "counts", the number of rows of each probe key;
+              for mode "rows", those counts and the rows of every probe key in
+              turn; for mode "first", the first row of each probe key, or -1 if it
+              is not indexed; for mode "mask", a bool array that is true at the
+              indexed rows whose key is probed
+    */
+    proc probeHashIndexMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const nkeys = msgArgs.get("nkeys").getIntValue();
+        const mode = msgArgs.getValueOf("mode");
+
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s nkeys: %i mode: %s".format(cmd, nkeys, mode));
+        if (nkeys != 1 && nkeys != 2) ||
+           (mode != "counts" && mode != "rows" && mode != "first" && mode != "mask") {
+            var errorMsg = "Error: expected nkeys of 1 or 2 and mode 'counts', 'rows', 'first' or 'mask'";
+            hiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        for j in 0..#nkeys {
+            var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("key" + j:string), st);
+            if gEnt.dtype != DType.UInt64 {
+                var errorMsg = notImplementedError(pn, gEnt.dtype);
+                hiLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        proc uintArray(name: string) throws {
+            return toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf(name), st), uint);
+        }
+        proc intArray(name: string) throws {
+            return toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf(name), st), int);
+        }
+        const sk0 = uintArray("slotKeys0");
+        const sk1 = if nkeys == 2 then uintArray("slotKeys1") else sk0;
+        const slotStart = intArray("slotStart"), slotCount = intArray("slotCount");
+        const rows = intArray("rows");
+        const partSlots = intArray("partSlots"), partSize = intArray("partSize");
+
+        proc reply(const ref slots: [] int): string throws {
+            var repMsg: string;
+            if mode == "mask" {
+                const size = msgArgs.get("size").getIntValue();
+                var mask = makeDistArray(size, bool);
+                forall s in slots with (var agg = newDstAggregator(bool)) {
+                    if s >= 0 {
+                        for j in slotStart.a[s]..#slotCount.a[s] do agg.copy(mask[rows.a[j]], true);
+                    }
+                }
+                repMsg = st.insert(new shared SymEntry(mask)).msg;
+            } else if mode == "first" {
+                // the rows of a slot are in order, so its first is the smallest
+                var first = makeDistArray(slots.size, int);
+                forall (f, s) in zip(first, slots) with (var agg = newSrcAggregator(int)) {
+                    if s < 0 then f = -1;
+                    else agg.copy(f, rows.a[slotStart.a[s]]);
+                }
+                repMsg = st.insert(new shared SymEntry(first)).msg;
+            } else {
+                var counts = makeDistArray(slots.size, int);
+                forall (c, s) in zip(counts, slots) do c = if s < 0 then 0 else slotCount.a[s];
+                repMsg = st.insert(new shared SymEntry(counts)).msg;
+                if mode == "rows" {
+                    const ends = + scan counts;
+                    const total = if counts.size == 0 then 0 else ends[ends.domain.high];
+                    var found = makeDistArray(total, int);
+                    forall (s, e, c) in zip(slots, ends, counts) with (var agg = newDstAggregator(int)) {
+                        if c > 0 {
+                            var pos = e - c;
+                            for j in slotStart.a[s]..#c {
+                                agg.copy(found[pos], rows.a[j]);
+                                pos += 1;
+                            }
+                        }
+                    }
+                    repMsg += "+" + st.insert(new shared SymEntry(found)).msg;
+                }
+            }
+            return repMsg;
+        }
+
+        var repMsg: string;
+        if nkeys == 1 {
+            repMsg = reply(probeHashIndex(uintArray("key0").a, sk0.a, sk1.a, slotCount.a, partSlots.a, partSize.a));
+        } else {
+            const k0 = uintArray("key0"), k1 = uintArray("key1");
+            var pairs = makeDistArray(k0.size, 2*uint);
+            forall (k, a, b) in zip(pairs, k0.a, k1.a) do k = (a, b);
+            repMsg = reply(probeHashIndex(pairs, sk0.a, sk1.a, slotCount.a, partSlots.a, partSize.a));
+        }
+        hiLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("buildHashIndex", buildHashIndexMsg, getModuleName());
+    registerFunction("probeHashIndex", probeHashIndexMsg, getModuleName());
+}
@@ -0,0 +1,210 @@
+/* Hash joins of pdarrays
+ * Inner equi-joins on uint64 keys (or pairs of them, for 128-bit key
+ * hashes) that look keys up in hash tables instead of sorting them
+ */
+
+module HashJoinMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use List;
+    use PrivateDist;
+    use CommAggregation;
+    use RadixSortLSD;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use HashTable;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const hjLogger = new Logger(logLevel, logChannel);
+
+    /*
+    Join by broadcasting a hash table of the build side.
+
+    The build keys are gathered to this locale and inserted into a table,
+    which is copied to every locale. Each locale then probes the table with
+    the keys in its block of the probe side without further communication.
+    A first pass counts the matches of each probe key so that a second pass
+    can write the matching pairs straight to their final positions.
+
+    :returns: (probe indices, build indices) of the matching pairs, ordered by probe index
+    */
+    proc broadcastJoin(const ref probe: [?D] ?t, const ref build: [?bD] t) throws {
+        const localBuild: [0..#bD.size] t = build;
+        const buildRows: [0..#bD.size] int = [i in 0..#bD.size] i;
+        const table = buildHashTable(localBuild, buildRows);
+        var tables: [PrivateSpace] hashTable(t);
+        coforall loc in Locales with (ref tables) do on loc {
+            tables[here.id] = table;
+        }
+
+        var counts = makeDistArray(D.size, int);
+        forall (i, c) in zip(D, counts) {
+            c = tables[here.id].numMatches(probe[i]);
+        }
+        const ends = + scan counts;
+        const total = if D.size == 0 then 0 else ends[D.high];
+
+        var probeIdx = makeDistArray(total, int);
+        var buildIdx = makeDistArray(total, int);
+        forall (i, e, c) in zip(D, ends, counts) with (var pAgg = newDstAggregator(int),
+                                                      var bAgg = newDstAggregator(int)) {
+            if c > 0 {
+                var pos = e - c;
+                for r in tables[here.id].matches(probe[i]) {
+                    pAgg.copy(probeIdx[pos], i);
+                    bAgg.copy(buildIdx[pos], r);
+                    pos += 1;
+                }
+            }
+        }
+        return (probeIdx, buildIdx);
+    }
+
+    /*
+    Permute keys into partition order, where the partition of a key is taken
+    from the high bits of its hash. Since there are only numLocales*numTasks
+    partitions, this is a single pass of the radix sort.
+
+    :returns: (permutation, permuted keys, first position of each partition, size of each partition)
+    */
+    proc hashPartition(const ref keys: [?D] ?t, nParts: int) throws {
+        var part = makeDistArray(D.size, int);
+        forall (p, k) in zip(part, keys) do p = ((keyHash(k) >> 32) % nParts: uint): int;
+        const perm = radixSortLSD_ranks(part, checkSorted=false);
+        var sizes: [0..#nParts] int;
+        forall p in part with (+ reduce sizes) do sizes[p] += 1;
+        const starts = (+ scan sizes) - sizes;
+        var permKeys = makeDistArray(D.size, t);
+        forall (pk, i) in zip(permKeys, perm) with (var agg = newSrcAggregator(t)) {
+            agg.copy(pk, keys[i]);
+        }
+        return (perm, permKeys, starts, sizes);
+    }
+
+    /*
+    Join by hash-partitioning both sides.
+
+    Both sides are permuted into numLocales*numTasks partitions by key hash,
+    so that equal keys land in the same partition. Each task copies one
+    partition of each side to its locale, builds a table from the right
+    side's partition and probes it with the left side's, keeping the matches
+    locally until the output can be sized.
+
+    :returns: (left indices, right indices) of the matching pairs, grouped by partition
+    */
+    proc partitionedJoin(const ref left: [?lD] ?t, const ref right: [?rD] t) throws {
+        const nParts = numLocales * numTasks;
+        const (lPerm, lKeys, lStarts, lSizes) = hashPartition(left, nParts);
+        const (rPerm, rKeys, rStarts, rSizes) = hashPartition(right, nParts);
+
+        var pairs: [PrivateSpace] [0..#numTasks] list((int, int));
+        var nFound: [0..#nParts] int;
+        coforall loc in Locales with (ref pairs, ref nFound) do on loc {
+            coforall task in 0..#numTasks with (ref pairs, ref nFound) {
+                const q = loc.id * numTasks + task;
+                const lK: [0..#lSizes[q]] t = lKeys[lStarts[q]..#lSizes[q]];
+                const lP: [0..#lSizes[q]] int = lPerm[lStarts[q]..#lSizes[q]];
+                const rK: [0..#rSizes[q]] t = rKeys[rStarts[q]..#rSizes[q]];
+                const rP: [0..#rSizes[q]] int = rPerm[rStarts[q]..#rSizes[q]];
+                const table = buildHashTable(rK, rP);
+                ref found = pairs[here.id][task];
+                for (k, i) in zip(lK, lP) {
+                    for r in table.matches(k) do found.pushBack((i, r));
+                }
+                nFound[q] = found.size;
+            }
+        }
+        const ends = + scan nFound;
+        const total = ends[nParts-1];
+
+        var leftIdx = makeDistArray(total, int);
+        var rightIdx = makeDistArray(total, int);
+        coforall loc in Locales with (ref leftIdx, ref rightIdx) do on loc {
+            coforall task in 0..#numTasks with (ref leftIdx, ref rightIdx) {
+                const q = loc.id * numTasks + task;
+                var pos = ends[q] - nFound[q];
+                var lAgg = newDstAggregator(int);
+                var rAgg = newDstAggregator(int);
+                for (i, r) in pairs[here.id][task] {
+                    lAgg.copy(leftIdx[pos], i);
+                    rAgg.copy(rightIdx[pos], r);
+                    pos += 1;
+                }
+                lAgg.flush();
+                rAgg.flush();
+            }
+        }
+        return (leftIdx, rightIdx);
+    }
+
+    proc hashJoin(const ref left: [] ?t, const ref right: [] t, strategy: string) throws {
+        if strategy == "broadcast" then return broadcastJoin(left, right);
+        else return partitionedJoin(left, right);
+    }
+
+    /*
+    Parse, execute, and respond to a hashJoin message
+    :arg msgArgs: nkeys (1, or 2 for 128-bit key hashes), left0[, left1], right0[, right1]
+                  (uint64 pdarrays) and strategy ("broadcast" to broadcast the right side,
+                  or "partition")
+    :returns: (MsgTuple) the left and right indices of the matching pairs
+    */
+    proc hashJoinMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const nkeys = msgArgs.get("nkeys").getIntValue();
+        const strategy = msgArgs.getValueOf("strategy");
+
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s nkeys: %i strategy: %s".format(cmd, nkeys, strategy));
+        if (nkeys != 1 && nkeys != 2) || (strategy != "broadcast" && strategy != "partition") {
+            var errorMsg = "Error: expected nkeys of 1 or 2 and strategy 'broadcast' or 'partition'";
+            hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var names: list(string);
+        for side in ["left", "right"] {
+            for j in 0..#nkeys do names.pushBack(msgArgs.getValueOf(side + j:string));
+        }
+        for name in names {
+            var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+            if gEnt.dtype != DType.UInt64 {
+                var errorMsg = notImplementedError(pn, gEnt.dtype);
+                hjLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+        proc keys(j: int) throws {
+            return toSymEntry(getGenericTypedArrayEntry(names[j], st), uint);
+        }
+
+        var repMsg: string;
+        if nkeys == 1 {
+            var (leftIdx, rightIdx) = hashJoin(keys(0).a, keys(1).a, strategy);
+            repMsg = st.insert(new shared SymEntry(leftIdx)).msg + "+" +
+                     st.insert(new shared SymEntry(rightIdx)).msg;
+        } else {
+            const l0 = keys(0), l1 = keys(1), r0 = keys(2), r1 = keys(3);
+            var left = makeDistArray(l0.size, 2*uint);
+            forall (k, a, b) in zip(left, l0.a, l1.a) do k = (a, b);
+            var right = makeDistArray(r0.size, 2*uint);
+            forall (k, a, b) in zip(right, r0.a, r1.a) do k = (a, b);
+            var (leftIdx, rightIdx) = hashJoin(left, right, strategy);
+            repMsg = st.insert(new shared SymEntry(leftIdx)).msg + "+" +
+                     st.insert(new shared SymEntry(rightIdx)).msg;
+        }
+        hjLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("hashJoin", hashJoinMsg, getModuleName());
+}
@@ -0,0 +1,102 @@
+/* Open-addressing hash tables on uint64 keys
+ * A table is built on one locale from a block of keys, which are either
+ * uint64 values or pairs of them (a 128-bit hash), and maps each distinct
+ * key to the row ids at which it occurs. Tables are copied to other locales
+ * by assignment.
+ */
+
+module HashTable
+{
+    /* splitmix64 finalizer */
+    inline proc splitMix64(in z: uint): uint {
+        z += 0x9e3779b97f4a7c15;
+        z = (z ^ (z >> 30)) * 0xbf58476d1ce4e5b9;
+        z = (z ^ (z >> 27)) * 0x94d049bb133111eb;
+        return z ^ (z >> 31);
+    }
+
+    inline proc keyHash(k: uint): uint {
+        return splitMix64(k);
+    }
+
+    inline proc keyHash(k: 2*uint): uint {
+        return splitMix64(k(0) ^ splitMix64(k(1)));
+    }
+
+    /*
+    Distinct keys and their row ids in compressed form: slot s holds a
+    distinct key when used[s] is set, and rows[start[s]..#count[s]] are the
+    row ids at which that key occurs, in the order they were inserted.
+    Collisions are resolved by linear probing.
+    */
+    record hashTable {
+        type keyType;
+        var mask: uint;
+        var slotD = {0..-1};
+        var used: [slotD] bool;
+        var keys: [slotD] keyType;
+        var start: [slotD] int;
+        var count: [slotD] int;
+        var rowD = {0..-1};
+        var rows: [rowD] int;
+
+        proc init(type keyType) {
+            this.keyType = keyType;
+        }
+
+        /* the slot holding k, or -1 if k is not in the table */
+        proc find(k: keyType): int {
+            if slotD.size == 0 then return -1;
+            var s = (keyHash(k) & mask): int;
+            while used[s] {
+                if keys[s] == k then return s;
+                s = ((s + 1): uint & mask): int;
+            }
+            return -1;
+        }
+
+        /* the number of rows at which k occurs */
+        proc numMatches(k: keyType): int {
+            const s = find(k);
+            return if s < 0 then 0 else count[s];
+        }
+
+        /* the row ids at which k occurs */
+        iter matches(k: keyType): int {
+            const s = find(k);
+            if s >= 0 {
+                for j in start[s]..#count[s] do yield rows[j];
+            }
+        }
+    }
+
+    /*
+    Build a table of local keys, where rowIds[i] is the row id recorded for
+    keys[i]. The table has at least twice as many slots as keys.
+    */
+    proc buildHashTable(const ref keys: [?D] ?t, const ref rowIds: [D] int): hashTable(t) {
+        var table = new hashTable(t);
+        var nSlots = 1;
+        while nSlots < 2 * D.size do nSlots <<= 1;
+        table.mask = (nSlots - 1): uint;
+        table.slotD = {0..#nSlots};
+        table.rowD = {0..#D.size};
+
+        var slotOf: [D] int;
+        for (k, so) in zip(keys, slotOf) {
+            var s = (keyHash(k) & table.mask): int;
+            while table.used[s] && table.keys[s] != k do s = ((s + 1): uint & table.mask): int;
+            table.used[s] = true;
+            table.keys[s] = k;
+            table.count[s] += 1;
+            so = s;
+        }
+        table.start = (+ scan table.count) - table.count;
+        var cursor = table.start;
+        for (so, r) in zip(slotOf, rowIds) {
+            table.rows[cursor[so]] = r;
+            cursor[so] += 1;
+        }
+        return table;
+    }
+}
@@ -0,0 +1,175 @@
+/* As-of joins of pdarrays
+ * Matches each left key to the nearest right key in the same group by
+ * merging two arrays that are sorted by (group, key)
+ */
+
+module MergeAsofMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use RangeChunk;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const maLogger = new Logger(logLevel, logChannel);
+
+    inline proc keyLess(g1: int, v1, g2: int, v2): bool {
+        return g1 < g2 || (g1 == g2 && v1 < v2);
+    }
+
+    inline proc keyLessEq(g1: int, v1, g2: int, v2): bool {
+        return g1 < g2 || (g1 == g2 && v1 <= v2);
+    }
+
+    /* the number of right keys below (g, v), or at most (g, v) when not strict */
+    proc countBelow(const ref rg: [?D] int, const ref rv: [D] ?t, g: int, v: t, strict: bool): int {
+        var lo = 0, hi = D.size;
+        while lo < hi {
+            const mid = (lo + hi) / 2;
+            const below = if strict then keyLess(rg[mid], rv[mid], g, v)
+                                    else keyLessEq(rg[mid], rv[mid], g, v);
+            if below then lo = mid + 1; else hi = mid;
+        }
+        return lo;
+    }
+
+    /*
+    Find the as-of match of every left key.
+
+    Both sides must be sorted by (group, value). Each task takes a block of
+    its locale's left keys, finds where the block starts and ends in the
+    right side with two binary searches, copies that range of the right side
+    to its locale and walks it alongside the block, so every right key is
+    read once per block.
+
+    :arg direction: "backward" to match the last right key at or before the left
+                    key, "forward" for the first right key at or after it, or
+                    "nearest" for the closer of the two (the backward one on ties)
+    :arg allowExact: whether a right key equal to the left key matches
+    :arg hasTol: whether matches further than tol from the left key are dropped
+    :returns: the index of the matching right key of each left key, or -1
+    */
+    proc mergeAsof(const ref lg: [?lD] int, const ref lv: [lD] ?t,
+                   const ref rg: [?rD] int, const ref rv: [rD] t,
+                   direction: string, allowExact: bool, hasTol: bool, tol: t) throws {
+        var result = makeDistArray(lD.size, int);
+        const nR = rD.size;
+        coforall loc in Locales with (ref result) do on loc {
+            const myInds = lD.localSubdomain().dim(0);
+            coforall task in 0..#numTasks with (ref result) {
+                const inds = chunk(myInds, numTasks, task);
+                if inds.size > 0 {
+                    const first = inds.low, last = inds.high;
+                    const firstBelow = countBelow(rg, rv, lg[first], lv[first], true);
+                    const lo = max(firstBelow - 1, 0);
+                    const hi = min(countBelow(rg, rv, lg[last], lv[last], false), nR - 1);
+                    const localG: [lo..hi] int = rg[lo..hi];
+                    const localV: [lo..hi] t = rv[lo..hi];
+
+                    // lt and le count the right keys below and at most the current left key
+                    var lt = firstBelow;
+                    var le = lt;
+                    for i in inds {
+                        const g = lg[i], v = lv[i];
+                        while lt <= hi && keyLess(localG[lt], localV[lt], g, v) do lt += 1;
+                        le = max(le, lt);
+                        while le <= hi && keyLessEq(localG[le], localV[le], g, v) do le += 1;
+
+                        const b = (if allowExact then le else lt) - 1;
+                        const f = if allowExact then lt else le;
+                        var bOk = b >= lo && localG[b] == g;
+                        var fOk = f <= hi && localG[f] == g;
+                        if hasTol {
+                            if bOk && v - localV[b] > tol then bOk = false;
+                            if fOk && localV[f] - v > tol then fOk = false;
+                        }
+                        select direction {
+                            when "backward" do result[i] = if bOk then b else -1;
+                            when "forward" do result[i] = if fOk then f else -1;
+                            otherwise {
+                                if bOk && fOk then
+                                    result[i] = if v - localV[b] <= localV[f] - v then b else f;
+                                else if bOk then result[i] = b;
+                                else if fOk then result[i] = f;
+                                else result[i] = -1;
+                            }
+                        }
+                    }
+                }
+            }
+        }
+        return result;
+    }
+
+    /*
+    Parse, execute, and respond to a mergeAsof message
+    :arg msgArgs: left_on and right_on (pdarrays of the same dtype: int64, uint64 or
+                  float64), grouped (bool), left_by and right_by (int64 group ids,
+                  if grouped), direction, allow_exact_matches, has_tolerance and
+                  tolerance. Both sides must be sorted by (group, value).
+    :returns: (MsgTuple) the index of the right row matching each left row, or -1
+    */
+    proc mergeAsofMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const direction = msgArgs.getValueOf("direction");
+        const grouped = msgArgs.get("grouped").getBoolValue();
+        const allowExact = msgArgs.get("allow_exact_matches").getBoolValue();
+        const hasTol = msgArgs.get("has_tolerance").getBoolValue();
+        var lEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("left_on"), st);
+        var rEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(msgArgs.getValueOf("right_on"), st);
+
+        maLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s direction: %s grouped: %? dtype: %s".format(
+                       cmd, direction, grouped, dtype2str(lEnt.dtype)));
+        if direction != "backward" && direction != "forward" && direction != "nearest" {
+            var errorMsg = "Error: expected direction 'backward', 'forward' or 'nearest'";
+            maLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        if lEnt.dtype != rEnt.dtype {
+            var errorMsg = "Error: left_on and right_on must have the same dtype";
+            maLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        proc doMergeAsof(type t): MsgTuple throws {
+            const l = toSymEntry(lEnt, t), r = toSymEntry(rEnt, t);
+            const tol = if hasTol then msgArgs.get("tolerance").toScalar(t) else 0: t;
+            var repMsg: string;
+            if grouped {
+                const lg = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("left_by"), st), int);
+                const rg = toSymEntry(getGenericTypedArrayEntry(msgArgs.getValueOf("right_by"), st), int);
+                var result = mergeAsof(lg.a, l.a, rg.a, r.a, direction, allowExact, hasTol, tol);
+                repMsg = st.insert(new shared SymEntry(result)).msg;
+            } else {
+                const lg = makeDistArray(l.size, int), rg = makeDistArray(r.size, int);
+                var result = mergeAsof(lg, l.a, rg, r.a, direction, allowExact, hasTol, tol);
+                repMsg = st.insert(new shared SymEntry(result)).msg;
+            }
+            maLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+            return new MsgTuple(repMsg, MsgType.NORMAL);
+        }
+
+        select lEnt.dtype {
+            when DType.Int64 do return doMergeAsof(int);
+            when DType.UInt64 do return doMergeAsof(uint);
+            when DType.Float64 do return doMergeAsof(real);
+            otherwise {
+                var errorMsg = notImplementedError(pn, lEnt.dtype);
+                maLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
+    use CommandMap;
+    registerFunction("mergeAsof", mergeAsofMsg, getModuleName());
+}
@@ -30,6 +30,7 @@ module MultiTypeRegEntry {
                 IndexRegEntry, 
                 SeriesRegEntry,
                 BitVectorRegEntry,           
+                HashMapRegEntry,
     }
 
     class AbstractRegEntry {
@@ -341,4 +342,37 @@ module MultiTypeRegEntry {
             return rtnMap;
         }
     }
+
+    class HashMapRegEntry: GenRegEntry {
+        var keys: list(shared ArrayRegEntry);
+        var values: shared ArrayRegEntry;
+        var tableNames: list(string); // names of the arrays of the hash table, by component
+        var table: list(string);
+
+        proc init(keys: list(shared ArrayRegEntry), values: shared ArrayRegEntry,
+                  tableNames: list(string), table: list(string)) {
+            super.init(ObjType.HASHMAP);
+            this.keys = keys;
+            this.values = values;
+            this.tableNames = tableNames;
+            this.table = table;
+        }
+
+        proc asMap(st: borrowed SymTab): map(string, string) throws {
+            var rtnMap: map(string, string);
+            rtnMap.add("objType", this.objType: string);
+            var comp_create: map(string, string);
+            for (k, i) in zip(this.keys, 0..) {
+                var k_map = k.asMap(st);
+                comp_create.add("KEY_%i".format(i), "%s+|+%s".format(k_map["objType"], k_map["create"]));
+            }
+            var v_map = this.values.asMap(st);
+            comp_create.add("values", "%s+|+%s".format(v_map["objType"], v_map["create"]));
+            for (n, t) in zip(this.tableNames, this.table) {
+                comp_create.add("TABLE_" + n, "created " + st.attrib(t));
+            }
+            rtnMap.add("create", formatJson(comp_create));
+            return rtnMap;
+        }
+    }
 }
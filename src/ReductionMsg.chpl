@@ -21,6 +21,7 @@ module ReductionMsg
     use AryUtil;
     use PrivateDist;
     use RadixSortLSD;
+    use Sort only;
 
     private config const lBins = 2**25 * numLocales;
     private config const logLevel = ServerConfig.logLevel;
@@ -1096,63 +1097,160 @@ module ReductionMsg
     }
 
     proc segMedian(ref values:[?vD] ?intype, segments:[?D] int, skipNan=false): [D] real throws {
-      type t = if intype == bool then int else intype;
+      const flat = segQuantiles(values, segments, [0.5], skipNan);
       var res = makeDistArray(D, real);
-      if (D.size == 0) { return res; }
+      res = flat;
+      return res;
+    }
 
-      var counts = segCount(segments, values.size);
-      var noNanVals = makeDistArray(values.domain, t);
-      noNanVals = values: t;
-      // First deal with any nans
-      if isRealType(t) && skipNan {
-        // calculate counts with nan values excluded and replace nan with max(real)
-        // this will force them at the very end of the sorted segment and since
-        // counts has been corrected, they won't affect the result
-        noNanVals = [elem in values] if isNan(elem) then max(real) else elem;
-        counts -= nanCounts(values, segments);
-      }
+    /* Segments with more values than this are sorted across all locales
+       instead of selected by a single task */
+    config const segQuantileLocalMax = 2**20;
 
-      // then sort values within their segment (from segNumUnique)
-      // keys will indicate which segment we are in
-      const keys = expandKeys(vD, segments);
-      const firstIV = radixSortLSD_ranks(noNanVals);
-      var intermediate = makeDistArray(vD, int);
-      forall (ii, idx) in zip(intermediate, firstIV) with (var agg = newSrcAggregator(int)) {
-          agg.copy(ii, keys[idx]);
-      }
-      const deltaIV = radixSortLSD_ranks(intermediate);
-      var IV = makeDistArray(vD, int);
-      forall (IVi, idx) in zip(IV, deltaIV) with (var agg = newSrcAggregator(int)) {
-          agg.copy(IVi, firstIV[idx]);
-      }
-      var sortedVals = makeDistArray(vD, t);
-      forall (sv, idx) in zip(sortedVals, IV) with (var valsAgg = newSrcAggregator(t)) {
-        valsAgg.copy(sv, noNanVals[idx]);
-      }
+    /* Exact per-segment quantiles with linear interpolation (numpy's default).
+       Each segment is copied into a task-local buffer once, and the order
+       statistics around every q are found by selection, so values never need
+       to be sorted within their segments. Segments too large for one task are
+       instead copied into a distributed array and sorted in parallel. A
+       segment with no (non-nan) values yields nan, as does a segment
+       containing a nan when skipNan is false.
 
-      var tmp1 = makeDistArray(D, t);
-      var tmp2 = makeDistArray(D, t);
-      forall (s, c, r, t1, t2) in zip(segments, counts, res, tmp1, tmp2) with (var resAgg = newSrcAggregator(t)) {
-        if c % 2 != 0 {
-          // odd case: grab middle of sorted values
-          resAgg.copy(t1, sortedVals[s + (c + 1)/2 - 1]);
-        }
-        else {
-          // even case: average the 2 middles of the sorted values
-          resAgg.copy(t1, sortedVals[s + c/2 - 1]);
-          resAgg.copy(t2, sortedVals[s + c/2]);
+       :returns: the quantile qs[j] of segment i at index j*D.size + i
+     */
+    proc segQuantiles(ref values:[?vD] ?intype, segments:[?D] int, qs: [] real, skipNan=false) throws {
+      type t = if intype == bool then int else intype;
+      const nq = qs.size;
+      const nSeg = D.size;
+      var flat = makeDistArray(nSeg * nq, real);
+      if nSeg == 0 then return flat;
+      const counts = segCount(segments, values.size);
+
+      // the quantiles in ascending order, so that each selection narrows the next
+      var qOrder: [0..#nq] (real, int);
+      for (o, q, j) in zip(qOrder, qs, 0..) do o = (q, j);
+      Sort.sort(qOrder);
+
+      // the value of a quantile from its two neighbouring order statistics
+      inline proc interp(h: real, lo: int, xlo: real, xhi: real): real {
+        return if h > lo then xlo + (h - lo) * (xhi - xlo) else xlo;
+      }
+
+      forall (s, c, i) in zip(segments, counts, D) with (ref values, var agg = newDstAggregator(real)) {
+        if c <= segQuantileLocalMax {
+          var buf: [0..#c] t;
+          var n = 0;
+          var hasNan = false;
+          var v = new lowLevelLocalizingSlice(values, s..#c);
+          for k in 0..#c {
+            const x = v.ptr[k]:t;
+            if isRealType(t) && isNan(x) {
+              hasNan = true;
+            } else {
+              buf[n] = x;
+              n += 1;
+            }
+          }
+          if n == 0 || (hasNan && !skipNan) {
+            for j in 0..#nq do agg.copy(flat[j*nSeg + i], nan);
+          } else {
+            ref vals = buf[0..#n];
+            var from = 0;
+            for (q, j) in qOrder {
+              const h = (n - 1) * q;
+              const lo = floor(h): int;
+              // values before from are no larger than any value from there on
+              ref rest = vals[from..];
+              quickSelect(rest, lo);
+              from = lo;
+              var xhi = vals[lo];
+              if lo + 1 < n && h > lo {
+                // everything after lo is >= vals[lo], so the next order statistic is their minimum
+                xhi = vals[lo+1];
+                for x in vals[lo+2..] {
+                  if x < xhi then xhi = x;
+                }
+              }
+              agg.copy(flat[j*nSeg + i], interp(h, lo, vals[lo]: real, xhi: real));
+            }
+          }
         }
       }
 
-      forall (c, r, t1, t2) in zip(counts, res, tmp1, tmp2) {
-        if c % 2 != 0 {
-          r = t1:real;
-        } else {
-          r = ((t1+t2):real)/2.0;
+      // the segments too large for one task, each sorted by all locales
+      const isBig = [c in counts] (c > segQuantileLocalMax): int;
+      const nBig = + reduce isBig;
+      if nBig > 0 {
+        const pos = (+ scan isBig) - isBig;
+        var bigSegs: [0..#nBig] int;
+        forall (b, p, i) in zip(isBig, pos, D) with (ref bigSegs) do if b == 1 then bigSegs[p] = i;
+        for i in bigSegs {
+          const s = segments[i], c = counts[i];
+          var seg = makeDistArray(c, t);
+          forall (x, y) in zip(seg, values[s..#c]) do x = y: t;
+          var n = c;
+          if isRealType(t) {
+            const nNan = + reduce [x in seg] isNan(x): int;
+            if nNan > 0 && !skipNan {
+              for j in 0..#nq do flat[j*nSeg + i] = nan;
+              continue;
+            }
+            // nans sort last, past the n values that count
+            if nNan > 0 then seg = [x in seg] if isNan(x) then max(t) else x;
+            n -= nNan;
+          }
+          if n == 0 {
+            for j in 0..#nq do flat[j*nSeg + i] = nan;
+            continue;
+          }
+          const sorted = radixSortLSD_keys(seg);
+          for (q, j) in qOrder {
+            const h = (n - 1) * q;
+            const lo = floor(h): int;
+            const xhi = if lo + 1 < n then sorted[lo+1]: real else sorted[lo]: real;
+            flat[j*nSeg + i] = interp(h, lo, sorted[lo]: real, xhi);
+          }
         }
       }
+      return flat;
+    }
 
-      return res;
+    /* In-place introselect: afterwards buf[k] holds the value that would be at
+       index k if buf were sorted, with no larger value before it and no smaller
+       value after it. Falls back to sorting the remaining range if partitioning
+       stops making progress. */
+    proc quickSelect(ref buf: [?bD] ?t, k: int) {
+      use Sort only sort;
+      if bD.size < 2 then return;
+      var lo = bD.low, hi = bD.high;
+      var depth = 2 * log2(bD.size) + 2;
+      while hi > lo {
+        if depth == 0 {
+          ref rest = buf[lo..hi];
+          sort(rest);
+          return;
+        }
+        depth -= 1;
+        // median-of-three pivot guards against already sorted input
+        const mid = lo + (hi - lo) / 2;
+        if buf[mid] < buf[lo] then buf[mid] <=> buf[lo];
+        if buf[hi] < buf[lo] then buf[hi] <=> buf[lo];
+        if buf[hi] < buf[mid] then buf[hi] <=> buf[mid];
+        const pivot = buf[mid];
+        var i = lo, j = hi;
+        while i <= j {
+          while buf[i] < pivot do i += 1;
+          while pivot < buf[j] do j -= 1;
+          if i <= j {
+            buf[i] <=> buf[j];
+            i += 1;
+            j -= 1;
+          }
+        }
+        // [lo..j] <= pivot, [i..hi] >= pivot, and anything in between equals pivot
+        if k <= j then hi = j;
+        else if k >= i then lo = i;
+        else return;
+      }
     }
 
     proc segMin(values:[?vD] ?t, segments:[?D] int, skipNan=false): [D] t throws {
@@ -1658,7 +1756,621 @@ module ReductionMsg
       return res;
     }
 
+    proc segmentedQuantileHelper(ref values:[?vD] ?t, segments:[?D] int, qs: list(real), skipNan: bool,
+                                 st: borrowed SymTab): MsgTuple throws {
+      // every segment is gathered once for all of the quantiles
+      const flat = segQuantiles(values, segments, qs.toArray(), skipNan);
+      var repMsgs: list(string);
+      for j in 0..#qs.size {
+        var res = makeDistArray(D, real);
+        res = flat[j*D.size..#D.size];
+        repMsgs.pushBack(st.insert(new shared SymEntry(res)).msg);
+      }
+      return new MsgTuple("+".join(repMsgs.toArray()), MsgType.NORMAL);
+    }
+
+    proc segmentedQuantileMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        // 'values' is the segmented (already permuted) array of values
+        // 'segments' is the segment offsets
+        // 'q' is the list of quantiles to compute, each in [0, 1]
+        const skipNan = msgArgs.get("skip_nan").getBoolValue();
+        const values_name = msgArgs.getValueOf("values");
+        const segments_name = msgArgs.getValueOf("segments");
+        const qs = msgArgs.get("q").toScalarList(real);
+
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "cmd: %s values_name: %s segments_name: %s q: %?".format(
+                                       cmd,values_name,segments_name,qs));
+        var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(values_name, st);
+        var gSeg: borrowed GenSymEntry = getGenericTypedArrayEntry(segments_name, st);
+        if (gSeg.dtype != DType.Int64) {
+            var errorMsg = "Error: array of segment offsets must be int dtype";
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var segments = toSymEntry(gSeg, int);
+        select (gVal.dtype) {
+            when (DType.Int64) {
+                var values = toSymEntry(gVal, int);
+                return segmentedQuantileHelper(values.a, segments.a, qs, skipNan, st);
+            }
+            when (DType.UInt64) {
+                var values = toSymEntry(gVal, uint);
+                return segmentedQuantileHelper(values.a, segments.a, qs, skipNan, st);
+            }
+            when (DType.Float64) {
+                var values = toSymEntry(gVal, real);
+                return segmentedQuantileHelper(values.a, segments.a, qs, skipNan, st);
+            }
+            when (DType.Bool) {
+                var values = toSymEntry(gVal, bool);
+                return segmentedQuantileHelper(values.a, segments.a, qs, skipNan, st);
+            }
+            otherwise {
+                var errorMsg = notImplementedError(pn,"quantile",gVal.dtype);
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
+    /* Segmented scans of the form: segCum<Op>(values:[] t, segments: [] int)
+       Like the segmented reductions above, <values> must already be grouped
+       so that each segment is contiguous. Instead of one value per segment,
+       the result has one value per element: the running aggregate of the
+       elements seen so far in that element's segment.
+     */
+
+    // gather values into grouped order
+    proc segScanGather(const ref values: [?vD] ?t, const ref perm: [?pD] int) throws {
+      var permuted = makeDistArray(pD, t);
+      forall (pv, p) in zip(permuted, perm) with (var agg = newSrcAggregator(t)) {
+        agg.copy(pv, values[p]);
+      }
+      return permuted;
+    }
+
+    // scatter grouped results back to the original order
+    proc segScanScatter(const ref permuted: [?D] ?t, const ref perm: [?pD] int) throws {
+      var res = makeDistArray(D, t);
+      forall (pv, p) in zip(permuted, perm) with (var agg = newDstAggregator(t)) {
+        agg.copy(res[p], pv);
+      }
+      return res;
+    }
+
+    // first index (inclusive) and last index (exclusive) of each element's segment
+    proc segBounds(vD, const ref segments: [?D] int) throws {
+      var segEnds = makeDistArray(D, int);
+      forall (e, i) in zip(segEnds, D) {
+        e = if i < D.high then segments[i+1] else vD.high + 1;
+      }
+      const keys = expandKeys(vD, segments);
+      var starts = makeDistArray(vD, int);
+      var ends = makeDistArray(vD, int);
+      forall (s, e, k) in zip(starts, ends, keys) with (var startAgg = newSrcAggregator(int),
+                                                        var endAgg = newSrcAggregator(int)) {
+        startAgg.copy(s, segments[k]);
+        endAgg.copy(e, segEnds[k]);
+      }
+      return (starts, ends);
+    }
+
+    proc segCumSum(const ref values:[?vD] ?intype, const ref segments:[?D] int, skipNan=false) throws {
+      type t = if intype == bool then int else intype;
+      var res = makeDistArray(vD, t);
+      if (D.size == 0) { return res; }
+      var flagvalues = makeDistArray(vD, (bool, t));
+      if isRealType(t) && skipNan {
+        forall (fv, val) in zip(flagvalues, values) {
+          fv = if isNan(val) then (false, 0.0) else (false, val);
+        }
+      } else {
+        forall (fv, val) in zip(flagvalues, values) {
+          fv = (false, val:t);
+        }
+      }
+      forall s in segments with (var agg = newDstAggregator(bool)) {
+        agg.copy(flagvalues[s][0], true);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t)+1) * flagvalues.size);
+      const scanresult = ResettingPlusScanOp scan flagvalues;
+      forall (r, (_, v)) in zip(res, scanresult) {
+        r = v;
+      }
+      if isRealType(t) && skipNan {
+        // positions holding a nan stay nan, the running sum skips over them
+        forall (r, val) in zip(res, values) {
+          if isNan(val) then r = nan;
+        }
+      }
+      return res;
+    }
+
+    proc segCumProd(const ref values:[?vD] ?intype, const ref segments:[?D] int, skipNan=false) throws {
+      type t = if intype == bool then int else intype;
+      var res = makeDistArray(vD, t);
+      if (D.size == 0) { return res; }
+      var flagvalues = makeDistArray(vD, (bool, t));
+      if isRealType(t) && skipNan {
+        forall (fv, val) in zip(flagvalues, values) {
+          fv = if isNan(val) then (false, 1.0) else (false, val);
+        }
+      } else {
+        forall (fv, val) in zip(flagvalues, values) {
+          fv = (false, val:t);
+        }
+      }
+      forall s in segments with (var agg = newDstAggregator(bool)) {
+        agg.copy(flagvalues[s][0], true);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t)+1) * flagvalues.size);
+      const scanresult = ResettingProdScanOp scan flagvalues;
+      forall (r, (_, v)) in zip(res, scanresult) {
+        r = v;
+      }
+      if isRealType(t) && skipNan {
+        forall (r, val) in zip(res, values) {
+          if isNan(val) then r = nan;
+        }
+      }
+      return res;
+    }
+
+    /* Same as ResettingPlusScanOp, but multiplies instead of adding. */
+    class ResettingProdScanOp: ReduceScanOp {
+      type eltType;
+      var value: eltType = if eltType == (bool, real) then (false, 1.0)
+                           else if eltType == (bool, uint) then (false, 1:uint)
+                           else (false, 1);
+
+      proc identity {
+        if eltType == (bool, real) then return (false, 1.0);
+        else if eltType == (bool, uint) then return (false, 1:uint);
+        else return (false, 1);
+      }
+
+      proc accumulate(x) {
+        const (reset, other) = x;
+        const (hasReset, v) = value;
+        value = (hasReset | reset, if reset then other else (v * other));
+      }
+
+      proc accumulateOntoState(ref state, x) {
+        const (prevReset, other) = x;
+        const (hasReset, v) = state;
+        state = (hasReset | prevReset, if hasReset then v else (v * other));
+      }
+
+      proc combine(x) {
+        const (xHasReset, other) = x.value;
+        const (hasReset, v) = value;
+        value = (hasReset | xHasReset, if hasReset then v else (v * other));
+      }
+
+      proc generate() {
+        return value;
+      }
+
+      proc clone() {
+        return new unmanaged ResettingProdScanOp(eltType=eltType);
+      }
+    }
+
+    proc segCumMax(const ref values:[?vD] ?intype, const ref segments:[?D] int, skipNan=false) throws {
+      type t = if intype == bool then int else intype;
+      var res = makeDistArray(vD, t);
+      if (D.size == 0) { return res; }
+      // keys increase from one segment to the next, so a max scan over
+      // (key, value) pairs never carries a value across a segment boundary
+      var keys = expandKeys(vD, segments);
+      var kv = makeDistArray(vD, (int, t));
+      if isRealType(t) && skipNan {
+        kv = [(k, v) in zip(keys, values)] if isNan(v) then (k, min(real)) else (k, v);
+      } else {
+        kv = [(k, v) in zip(keys, values)] (k, v:t);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t) + numBytes(int)) * kv.size);
+      const cummax = max scan kv;
+      forall (r, (_, v)) in zip(res, cummax) {
+        r = v;
+      }
+      if isRealType(t) && skipNan {
+        forall (r, val) in zip(res, values) {
+          if isNan(val) then r = nan;
+        }
+      }
+      return res;
+    }
+
+    proc segCumMin(const ref values:[?vD] ?intype, const ref segments:[?D] int, skipNan=false) throws {
+      type t = if intype == bool then int else intype;
+      var res = makeDistArray(vD, t);
+      if (D.size == 0) { return res; }
+      // negated keys decrease from one segment to the next, so a min scan
+      // over (-key, value) pairs never carries a value across a segment boundary
+      var keys = expandKeys(vD, segments);
+      var kv = makeDistArray(vD, (int, t));
+      if isRealType(t) && skipNan {
+        kv = [(k, v) in zip(keys, values)] if isNan(v) then (-k, max(real)) else (-k, v);
+      } else {
+        kv = [(k, v) in zip(keys, values)] (-k, v:t);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t) + numBytes(int)) * kv.size);
+      const cummin = min scan kv;
+      forall (r, (_, v)) in zip(res, cummin) {
+        r = v;
+      }
+      if isRealType(t) && skipNan {
+        forall (r, val) in zip(res, values) {
+          if isNan(val) then r = nan;
+        }
+      }
+      return res;
+    }
+
+    // 1-based position of each element within its segment
+    proc segRank(vD, const ref segments:[?D] int) throws {
+      var res = makeDistArray(vD, int);
+      if (D.size == 0) { return res; }
+      const (starts, _) = segBounds(vD, segments);
+      forall (r, i, s) in zip(res, vD, starts) {
+        r = i - s + 1;
+      }
+      return res;
+    }
+
+    // value n places earlier in the same segment (later, if n is negative)
+    proc segShift(const ref values:[?vD] ?t, const ref segments:[?D] int, n: int, fill: t) throws {
+      var res = makeDistArray(vD, t);
+      if (D.size == 0) { return res; }
+      const (starts, ends) = segBounds(vD, segments);
+      forall (r, i, s, e) in zip(res, vD, starts, ends) with (var agg = newSrcAggregator(t)) {
+        const j = i - n;
+        if j >= s && j < e {
+          agg.copy(r, values[j]);
+        } else {
+          r = fill;
+        }
+      }
+      return res;
+    }
+
+    proc segDiff(const ref values:[?vD] ?t, const ref segments:[?D] int, n: int) throws {
+      var res = makeDistArray(vD, real);
+      if (D.size == 0) { return res; }
+      const (starts, ends) = segBounds(vD, segments);
+      var prev = makeDistArray(vD, t);
+      forall (p, i, s, e) in zip(prev, vD, starts, ends) with (var agg = newSrcAggregator(t)) {
+        const j = i - n;
+        if j >= s && j < e then agg.copy(p, values[j]);
+      }
+      forall (r, v, p, i, s, e) in zip(res, values, prev, vD, starts, ends) {
+        const j = i - n;
+        r = if j >= s && j < e then v:real - p:real else nan;
+      }
+      return res;
+    }
+
+    // running sums that restart at the start of each segment and every `window`
+    // elements after it, so that no running sum spans more than one window
+    proc segBlockCumSum(const ref values:[?vD] ?t, const ref starts:[vD] int, window: int) throws {
+      var flagvalues = makeDistArray(vD, (bool, t));
+      forall (fv, v, i, s) in zip(flagvalues, values, vD, starts) {
+        fv = ((i - s) % window == 0, v);
+      }
+      // check there's enough room to create a copy for scan and throw if creating a copy would go over memory limit
+      overMemLimit((numBytes(t)+1) * flagvalues.size);
+      const scanresult = ResettingPlusScanOp scan flagvalues;
+      var res = makeDistArray(vD, t);
+      forall (r, (_, v)) in zip(res, scanresult) {
+        r = v;
+      }
+      return res;
+    }
+
+    // sum over a trailing window of each element's segment, from the running sums of
+    // segBlockCumSum: the window ending at i covers the start of i's block up to i, and
+    // the end of the previous block after i - window
+    proc segWindowSum(const ref bsum:[?vD] ?t, const ref starts:[vD] int, window: int) throws {
+      var res = makeDistArray(vD, t);
+      var blockEnd = makeDistArray(vD, t);
+      var lagged = makeDistArray(vD, t);
+      forall (b, l, i, s) in zip(blockEnd, lagged, vD, starts) with (var endAgg = newSrcAggregator(t),
+                                                                    var lagAgg = newSrcAggregator(t)) {
+        if i - window >= s {
+          endAgg.copy(b, bsum[s + ((i - s) / window) * window - 1]);
+          lagAgg.copy(l, bsum[i - window]);
+        }
+      }
+      forall (r, c, b, l) in zip(res, bsum, blockEnd, lagged) {
+        r = c + (b - l);
+      }
+      return res;
+    }
+
+    // sum (or mean) over a trailing window of each element's segment, skipping NaNs;
+    // minPeriods and the divisor of the mean count the values that are not NaN
+    proc segRolling(const ref values:[?vD] ?t, const ref segments:[?D] int, window: int,
+                    minPeriods: int, isMean: bool) throws {
+      var res = makeDistArray(vD, real);
+      if (D.size == 0) { return res; }
+      var realValues = makeDistArray(vD, real);
+      var valid = makeDistArray(vD, int);
+      forall (rv, c, v) in zip(realValues, valid, values) {
+        const x = v:real;
+        rv = if isNan(x) then 0.0 else x;
+        c = if isNan(x) then 0 else 1;
+      }
+      const (starts, _) = segBounds(vD, segments);
+      const sums = segWindowSum(segBlockCumSum(realValues, starts, window), starts, window);
+      const counts = segWindowSum(segBlockCumSum(valid, starts, window), starts, window);
+      forall (r, sm, c) in zip(res, sums, counts) {
+        if c < minPeriods || (isMean && c == 0) {
+          r = nan;
+        } else {
+          r = if isMean then sm / c:real else sm;
+        }
+      }
+      return res;
+    }
+
+    proc segmentedScanHelper(const ref values:[?vD] ?t, const ref perm:[?pD] int, const ref segments:[?D] int,
+                             op: string, n: int, minPeriods: int, skipNan: bool, fill: ParameterObj,
+                             st: borrowed SymTab): MsgTuple throws {
+      param pn = Reflection.getRoutineName();
+      const permuted = segScanGather(values, perm);
+      var repMsg: MsgTuple;
+      select op {
+        when "cumsum" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segCumSum(permuted, segments, skipNan), perm)));
+        }
+        when "cumprod" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segCumProd(permuted, segments, skipNan), perm)));
+        }
+        when "cummax" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segCumMax(permuted, segments, skipNan), perm)));
+        }
+        when "cummin" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segCumMin(permuted, segments, skipNan), perm)));
+        }
+        when "rank" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segRank(pD, segments), perm)));
+        }
+        when "shift" {
+          const fillValue = fill.toScalar(t);
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segShift(permuted, segments, n, fillValue), perm)));
+        }
+        when "diff" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segDiff(permuted, segments, n), perm)));
+        }
+        when "rolling_sum" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segRolling(permuted, segments, n, minPeriods, false), perm)));
+        }
+        when "rolling_mean" {
+          repMsg = st.insert(new shared SymEntry(segScanScatter(segRolling(permuted, segments, n, minPeriods, true), perm)));
+        }
+        otherwise {
+          var errorMsg = notImplementedError(pn, op, whichDtype(t));
+          rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          repMsg = new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+      }
+      return repMsg;
+    }
+
+    proc segmentedScanMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        // 'values' is in the original (ungrouped) order
+        // 'permutation' and 'segments' describe the grouping
+        // 'op' is the scan operator
+        const values_name = msgArgs.getValueOf("values");
+        const perm_name = msgArgs.getValueOf("permutation");
+        const segments_name = msgArgs.getValueOf("segments");
+        const op = msgArgs.getValueOf("op");
+        const n = msgArgs.get("n").getIntValue();
+        const minPeriods = msgArgs.get("min_periods").getIntValue();
+        const skipNan = msgArgs.get("skip_nan").getBoolValue();
+        const fill = msgArgs.get("fill_value");
+
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "cmd: %s values_name: %s segments_name: %s operator: %s n: %i".format(
+                                       cmd,values_name,segments_name,op,n));
+        var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(values_name, st);
+        var gPerm: borrowed GenSymEntry = getGenericTypedArrayEntry(perm_name, st);
+        var gSeg: borrowed GenSymEntry = getGenericTypedArrayEntry(segments_name, st);
+        if (gSeg.dtype != DType.Int64 || gPerm.dtype != DType.Int64) {
+            var errorMsg = "Error: permutation and segment offsets must be int dtype";
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var perm = toSymEntry(gPerm, int);
+        var segments = toSymEntry(gSeg, int);
+        select (gVal.dtype) {
+            when (DType.Int64) {
+                var values = toSymEntry(gVal, int);
+                return segmentedScanHelper(values.a, perm.a, segments.a, op, n, minPeriods, skipNan, fill, st);
+            }
+            when (DType.UInt64) {
+                var values = toSymEntry(gVal, uint);
+                return segmentedScanHelper(values.a, perm.a, segments.a, op, n, minPeriods, skipNan, fill, st);
+            }
+            when (DType.Float64) {
+                var values = toSymEntry(gVal, real);
+                return segmentedScanHelper(values.a, perm.a, segments.a, op, n, minPeriods, skipNan, fill, st);
+            }
+            when (DType.Bool) {
+                var values = toSymEntry(gVal, bool);
+                return segmentedScanHelper(values.a, perm.a, segments.a, op, n, minPeriods, skipNan, fill, st);
+            }
+            otherwise {
+                var errorMsg = notImplementedError(pn,op,gVal.dtype);
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
+    /* Reductions over integer keys known to lie in lo..#nbins, computed without
+       sorting: each task accumulates into its own nbins-long array, and the
+       task-local arrays are combined once by the reduce intent. */
+
+    // widest key range reduced densely, which bounds the task-local arrays
+    config const denseMaxBins = 2**20;
+
+    proc denseBin(k, lo: int, nbins: int): int {
+      const b = k:int - lo;
+      return if b >= 0 && b < nbins then b else -1;
+    }
+
+    proc denseCount(keys: [?D] ?kt, values: [D] ?t, lo: int, nbins: int, skipNan: bool) throws {
+      var acc: [0..#nbins] int;
+      var outOfRange = false;
+      forall (k, v) in zip(keys, values) with (+ reduce acc, || reduce outOfRange) {
+        const b = denseBin(k, lo, nbins);
+        if b < 0 {
+          outOfRange = true;
+        } else if !(isRealType(t) && skipNan && isNan(v)) {
+          acc[b] += 1;
+        }
+      }
+      if outOfRange then throw new Error("Key outside of the dense range %i..%i".format(lo, lo+nbins-1));
+      var res = makeDistArray(nbins, int);
+      res = acc;
+      return res;
+    }
+
+    proc denseSum(keys: [?D] ?kt, values: [D] ?intype, lo: int, nbins: int, skipNan: bool) throws {
+      type t = if intype == bool then int else intype;
+      var acc: [0..#nbins] t;
+      var outOfRange = false;
+      forall (k, v) in zip(keys, values) with (+ reduce acc, || reduce outOfRange) {
+        const b = denseBin(k, lo, nbins);
+        if b < 0 {
+          outOfRange = true;
+        } else if !(isRealType(t) && skipNan && isNan(v)) {
+          acc[b] += v:t;
+        }
+      }
+      if outOfRange then throw new Error("Key outside of the dense range %i..%i".format(lo, lo+nbins-1));
+      var res = makeDistArray(nbins, t);
+      res = acc;
+      return res;
+    }
+
+    proc denseMean(keys: [?D] ?kt, values: [D] ?t, lo: int, nbins: int, skipNan: bool) throws {
+      const sums = denseSum(keys, values, lo, nbins, skipNan);
+      const counts = denseCount(keys, values, lo, nbins, skipNan);
+      var res = makeDistArray(nbins, real);
+      forall (r, s, c) in zip(res, sums, counts) {
+        // an empty or all-NaN bin has a mean of 0.0, as in segMean
+        r = if c == 0 then 0.0 else s:real / c:real;
+      }
+      return res;
+    }
+
+    proc denseReductionHelper(keys: [?D] ?kt, values: [D] ?t, lo: int, nbins: int, op: string,
+                              skipNan: bool, st: borrowed SymTab): MsgTuple throws {
+      param pn = Reflection.getRoutineName();
+      var repMsg: MsgTuple;
+      select op {
+        when "size" {
+          repMsg = st.insert(new shared SymEntry(denseCount(keys, values, lo, nbins, false)));
+        }
+        when "count" {
+          repMsg = st.insert(new shared SymEntry(denseCount(keys, values, lo, nbins, skipNan)));
+        }
+        when "sum" {
+          repMsg = st.insert(new shared SymEntry(denseSum(keys, values, lo, nbins, skipNan)));
+        }
+        when "mean" {
+          repMsg = st.insert(new shared SymEntry(denseMean(keys, values, lo, nbins, skipNan)));
+        }
+        otherwise {
+          var errorMsg = notImplementedError(pn, op, whichDtype(t));
+          rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+          return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+      }
+      rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg.msg);
+      return repMsg;
+    }
+
+    proc denseReductionMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        // 'keys' are integers in lo..#nbins, 'values' are reduced per key
+        // 'op' is one of size, count, sum, mean
+        const lo = msgArgs.get("lo").getIntValue();
+        const nbins = msgArgs.get("nbins").getIntValue();
+        const op = msgArgs.getValueOf("op");
+        const skipNan = msgArgs.get("skip_nan").getBoolValue();
+        const keys_name = msgArgs.getValueOf("keys");
+        const values_name = msgArgs.getValueOf("values");
+
+        rmLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                      "cmd: %s keys_name: %s values_name: %s lo: %i nbins: %i op: %s".format(
+                                       cmd,keys_name,values_name,lo,nbins,op));
+        if nbins < 1 || nbins > denseMaxBins {
+            var errorMsg = "Error: dense key range of %i values is not between 1 and %i".format(nbins, denseMaxBins);
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        // every task holds its own nbins-long accumulator
+        overMemLimit(here.maxTaskPar * nbins * numBytes(real));
+        var gKey: borrowed GenSymEntry = getGenericTypedArrayEntry(keys_name, st);
+        var gVal: borrowed GenSymEntry = getGenericTypedArrayEntry(values_name, st);
+        if gKey.size != gVal.size {
+            var errorMsg = "Error: keys and values must have the same size";
+            rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+
+        proc withKeys(keys: [?D] ?kt): MsgTuple throws {
+            select (gVal.dtype) {
+                when (DType.Int64) {
+                    return denseReductionHelper(keys, toSymEntry(gVal, int).a, lo, nbins, op, skipNan, st);
+                }
+                when (DType.UInt64) {
+                    return denseReductionHelper(keys, toSymEntry(gVal, uint).a, lo, nbins, op, skipNan, st);
+                }
+                when (DType.Float64) {
+                    return denseReductionHelper(keys, toSymEntry(gVal, real).a, lo, nbins, op, skipNan, st);
+                }
+                when (DType.Bool) {
+                    return denseReductionHelper(keys, toSymEntry(gVal, bool).a, lo, nbins, op, skipNan, st);
+                }
+                otherwise {
+                    var errorMsg = notImplementedError(pn,op,gVal.dtype);
+                    rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                    return new MsgTuple(errorMsg, MsgType.ERROR);
+                }
+            }
+        }
+
+        select (gKey.dtype) {
+            when (DType.Int64) {
+                return withKeys(toSymEntry(gKey, int).a);
+            }
+            when (DType.UInt64) {
+                return withKeys(toSymEntry(gKey, uint).a);
+            }
+            otherwise {
+                var errorMsg = "Error: dense keys must be int64 or uint64, not %s".format(dtype2str(gKey.dtype));
+                rmLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+                return new MsgTuple(errorMsg, MsgType.ERROR);
+            }
+        }
+    }
+
     use CommandMap;
     registerFunction("segmentedReduction", segmentedReductionMsg, getModuleName());
     registerFunction("sizeReduction", sizeReductionMsg, getModuleName());
+    registerFunction("segmentedScan", segmentedScanMsg, getModuleName());
+    registerFunction("segmentedQuantile", segmentedQuantileMsg, getModuleName());
+    registerFunction("denseReduction", denseReductionMsg, getModuleName());
 }
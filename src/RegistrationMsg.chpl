@@ -271,6 +271,47 @@ module RegistrationMsg {
         return new MsgTuple("Registered BitVector", MsgType.NORMAL);
     }
 
+    proc register_hashmap(msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        var reg_name = msgArgs.getValueOf("name");
+        var num_keys = msgArgs.get("num_keys").getIntValue();
+        var keys: list(string) = new list(msgArgs.get("keys").getList(num_keys));
+        var key_objTypes: list(string) = new list(msgArgs.get("key_objTypes").getList(num_keys));
+        var num_table = msgArgs.get("num_table").getIntValue();
+        var table_names: list(string) = new list(msgArgs.get("table_names").getList(num_table));
+        var table: list(string) = new list(msgArgs.get("table").getList(num_table));
+
+        var key_list: list(shared ArrayRegEntry);
+        for (k, ot) in zip(keys, key_objTypes) {
+            var objType: ObjType = ot.toUpper(): ObjType;
+            if objType == ObjType.PDARRAY || objType == ObjType.STRINGS {
+                key_list.pushBack(new shared ArrayRegEntry(k, objType));
+            }
+            else {
+                var errorMsg = "HashMaps only support pdarray and Strings keys. Found %s".format(objType: string);
+                throw getErrorWithContext(
+                    msg=errorMsg,
+                    lineNumber=getLineNumber(),
+                    routineName=getRoutineName(),
+                    moduleName=getModuleName(),
+                    errorClass="IllegalArgumentError");
+            }
+        }
+        var val_type = msgArgs.getValueOf("val_type").toUpper(): ObjType;
+        if val_type != ObjType.PDARRAY && val_type != ObjType.STRINGS {
+            var errorMsg = "HashMaps only support pdarray and Strings values. Found %s".format(val_type: string);
+            throw getErrorWithContext(
+                msg=errorMsg,
+                lineNumber=getLineNumber(),
+                routineName=getRoutineName(),
+                moduleName=getModuleName(),
+                errorClass="IllegalArgumentError");
+        }
+        var are = new shared ArrayRegEntry(msgArgs.getValueOf("values"), val_type);
+        var hre = new shared HashMapRegEntry(key_list, are, table_names, table);
+        st.registry.register_hashmap(reg_name, hre);
+        return new MsgTuple("Registered HashMap", MsgType.NORMAL);
+    }
+
     proc registerMsg(cmd: string, msgArgs: borrowed MessageArgs,
                         st: borrowed SymTab): MsgTuple throws {
         var objtype = msgArgs.getValueOf("objType").toUpper(): ObjType;
@@ -302,6 +343,9 @@ module RegistrationMsg {
             when ObjType.BITVECTOR {
                 return register_bitvector(msgArgs, st);
             }
+            when ObjType.HASHMAP {
+                return register_hashmap(msgArgs, st);
+            }
             otherwise {
                 var errorMsg = "ObjType Not Supported by Registry: %s".format(objtype: string);
                 throw getErrorWithContext(
@@ -355,6 +399,10 @@ module RegistrationMsg {
                 var bre = gre: shared BitVectorRegEntry;
                 st.registry.unregister_bitvector(bre);
             }
+            when ObjType.HASHMAP {
+                var hre = gre: shared HashMapRegEntry;
+                st.registry.unregister_hashmap(hre);
+            }
             otherwise {
                 var errorMsg = "ObjType Not Supported by Registry: %s".format(gre.objType: string);
                 throw getErrorWithContext(
@@ -426,6 +474,10 @@ module RegistrationMsg {
                 var bre = gre: shared BitVectorRegEntry;
                 rtnMap = bre.asMap(st);
             }
+            when ObjType.HASHMAP {
+                var hre = gre: shared HashMapRegEntry;
+                rtnMap = hre.asMap(st);
+            }
             otherwise {
                 var errorMsg = "Unexpected ObjType, %s, found in registry.".format(gre.objType: string);
                 throw getErrorWithContext(
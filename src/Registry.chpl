@@ -159,6 +159,15 @@ module Registry {
             bre.setName(name);
         }
 
+        proc register_hashmap(name: string, hre: shared HashMapRegEntry) throws {
+            checkAvailability(name);
+            tab.addOrReplace(name, hre);
+            for k in hre.keys do registered_entries.pushBack(k.array);
+            registered_entries.pushBack(hre.values.array);
+            for t in hre.table do registered_entries.pushBack(t);
+            hre.setName(name);
+        }
+
         proc unregister_array(are: shared ArrayRegEntry) throws {
             registered_entries.remove(are.array);
             tab.remove(are.name);
@@ -283,6 +292,13 @@ module Registry {
             tab.remove(bre.name);
         }
 
+        proc unregister_hashmap(hre: shared HashMapRegEntry) throws {
+            for k in hre.keys do registered_entries.remove(k.array);
+            registered_entries.remove(hre.values.array);
+            for t in hre.table do registered_entries.remove(t);
+            tab.remove(hre.name);
+        }
+
         proc lookup(name: string): shared AbstractRegEntry throws {
             checkTable(name, "lookup");
             // TODO update to return tab[name]; when 1.31 is our lowest supported version
@@ -36,6 +36,7 @@ module ServerConfig
       SERIES=11,
       INDEX=12,
       MULTIINDEX=13,
+      HASHMAP=14,
     };
 
     /*
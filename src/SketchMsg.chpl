@@ -0,0 +1,165 @@
+/* Probabilistic summaries of pdarrays
+ * Count-min frequency sketches and the heavy hitters (top-k most frequent
+ * values) found with them
+ */
+
+module SketchMsg
+{
+    use ServerConfig;
+
+    use Reflection;
+    use ServerErrors;
+    use Logging;
+    use Message;
+    use List;
+    use Map;
+    use PrivateDist;
+
+    use MultiTypeSymbolTable;
+    use MultiTypeSymEntry;
+    use ServerErrorStrings;
+
+    use ArkoudaSortCompat;
+    use HashTable only splitMix64;
+
+    private config const logLevel = ServerConfig.logLevel;
+    private config const logChannel = ServerConfig.logChannel;
+    const skLogger = new Logger(logLevel, logChannel);
+
+    /* position of key's counter in row `row` of a row-major depth x width sketch */
+    inline proc sketchCell(key: uint, row: int, width: int): int {
+        return row * width + (splitMix64(key + (row + 1):uint * 0x632be59bd9b4e019) % width:uint): int;
+    }
+
+    /* count-min estimate of the number of occurrences of key (never an underestimate) */
+    inline proc sketchEstimate(const ref sketch: [] int, key: uint, depth: int, width: int): int {
+        var est = max(int);
+        for row in 0..#depth do est = min(est, sketch[sketchCell(key, row, width)]);
+        return est;
+    }
+
+    /*
+    Build a count-min sketch of keys. Each task counts into its own copy of
+    the depth x width counters, and the copies are summed by the reduce intent.
+    */
+    proc countMinSketch(const ref keys: [?D] uint, depth: int, width: int) {
+        var sketch: [0..#(depth*width)] int;
+        forall key in keys with (+ reduce sketch) {
+            for row in 0..#depth do sketch[sketchCell(key, row, width)] += 1;
+        }
+        return sketch;
+    }
+
+    record estimateDescending: keyComparator {
+      inline proc key(c) { const (est, idx, _) = c; return (-est, idx); }
+    }
+
+    /*
+    Find the (approximately) k most frequent keys.
+
+    The keys are counted into a count-min sketch, which is then copied to
+    every locale. Each task scans its block of keys and keeps the `capacity`
+    distinct keys with the largest estimates, together with the index of one
+    occurrence; since the estimate of a key does not depend on where it is
+    seen, a key is rejected with one comparison once the task's candidate set
+    is full. The candidate sets of all tasks are merged on this locale and
+    the k best are returned.
+
+    :returns: (indices of one occurrence of each heavy hitter, estimated counts),
+              sorted by decreasing estimate
+    */
+    proc topKSketch(const ref keys: [?D] uint, k: int, depth: int, width: int, capacity: int) throws {
+        const sketch = countMinSketch(keys, depth, width);
+        var perLocale: [PrivateSpace] list((int, int, uint));
+        coforall loc in Locales with (ref perLocale) do on loc {
+            const localSketch = sketch;
+            const myInds = D.localSubdomain().dim(0);
+            const nTasks = max(1, min(here.maxTaskPar, myInds.size));
+            var taskCands: [0..#nTasks] list((int, int, uint));
+            coforall tid in 0..#nTasks with (ref taskCands) {
+                const lo = myInds.low + (myInds.size * tid) / nTasks,
+                      hi = myInds.low + (myInds.size * (tid + 1)) / nTasks - 1;
+                var cands = new map(uint, (int, int));
+                var threshold = 0;
+                for i in lo..hi {
+                    const key = keys[i];
+                    const est = sketchEstimate(localSketch, key, depth, width);
+                    if (cands.size == capacity && est <= threshold) || cands.contains(key) then continue;
+                    if cands.size == capacity {
+                        // evict the candidate with the smallest estimate
+                        var minKey: uint;
+                        var minEst = max(int);
+                        for (ck, cv) in cands.items() {
+                            if cv(0) < minEst { minKey = ck; minEst = cv(0); }
+                        }
+                        cands.remove(minKey);
+                    }
+                    cands.add(key, (est, i));
+                    if cands.size == capacity {
+                        threshold = max(int);
+                        for cv in cands.values() do threshold = min(threshold, cv(0));
+                    }
+                }
+                for (ck, cv) in cands.items() do taskCands[tid].pushBack((cv(0), cv(1), ck));
+            }
+            for t in taskCands do perLocale[here.id].pushBack(t);
+        }
+
+        var merged = new map(uint, (int, int));
+        for loc in Locales {
+            for (est, idx, key) in perLocale[loc.id] {
+                if !merged.contains(key) then merged.add(key, (est, idx));
+            }
+        }
+        var ranked: [0..#merged.size] (int, int, uint);
+        for ((key, v), r) in zip(merged.items(), ranked) do r = (v(0), v(1), key);
+        sort(ranked, comparator=new estimateDescending());
+
+        const n = min(k, ranked.size);
+        var idx = makeDistArray(n, int);
+        var counts = makeDistArray(n, int);
+        for j in 0..#n {
+            counts[j] = ranked[j](0);
+            idx[j] = ranked[j](1);
+        }
+        return (idx, counts);
+    }
+
+    /*
+    Parse, execute, and respond to a topKSketch message
+    :arg msgArgs: keys (uint64 pdarray of key hashes), k, depth, width, capacity
+    :returns: (MsgTuple) the indices and the estimated counts of the heavy hitters
+    */
+    proc topKSketchMsg(cmd: string, msgArgs: borrowed MessageArgs, st: borrowed SymTab): MsgTuple throws {
+        param pn = Reflection.getRoutineName();
+        const name = msgArgs.getValueOf("keys");
+        const k = msgArgs.get("k").getIntValue();
+        const depth = msgArgs.get("depth").getIntValue();
+        const width = msgArgs.get("width").getIntValue();
+        const capacity = msgArgs.get("capacity").getIntValue();
+
+        skLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                       "cmd: %s keys: %s k: %i depth: %i width: %i capacity: %i".format(
+                                        cmd, name, k, depth, width, capacity));
+        if k < 0 || depth < 1 || width < 1 || capacity < k {
+            var errorMsg = "Error: expected k >= 0, depth >= 1, width >= 1 and capacity >= k";
+            skLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        var gEnt: borrowed GenSymEntry = getGenericTypedArrayEntry(name, st);
+        if gEnt.dtype != DType.UInt64 {
+            var errorMsg = notImplementedError(pn, gEnt.dtype);
+            skLogger.error(getModuleName(),getRoutineName(),getLineNumber(),errorMsg);
+            return new MsgTuple(errorMsg, MsgType.ERROR);
+        }
+        const e = toSymEntry(gEnt, uint);
+        var (idx, counts) = topKSketch(e.a, k, depth, width, capacity);
+        const repMsg = st.insert(new shared SymEntry(idx)).msg + "+" +
+                       st.insert(new shared SymEntry(counts)).msg;
+        skLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),repMsg);
+        return new MsgTuple(repMsg, MsgType.NORMAL);
+    }
+
+    use CommandMap;
+    registerFunction("topKSketch", topKSketchMsg, getModuleName());
+}
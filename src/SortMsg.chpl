@@ -48,6 +48,24 @@ module SortMsg
         var sorted = makeDistArray(array);
         DynamicSort.dynamicTwoArrayRadixSort(sorted, comparator=myDefaultComparator);
         return sorted;
+      } else if algorithm == SortingAlgorithm.Auto {
+        // sort integer keys offset by their minimum if that needs fewer digits
+        if isIntegralType(t) {
+          const (useOffset, lo) = keyOffset(array);
+          if useOffset {
+            sortLogger.debug(getModuleName(),getRoutineName(),getLineNumber(),
+                             "auto sort chose OffsetRadixSortLSD");
+            overMemLimit(d.size * numBytes(uint));
+            var offsetKeys = makeDistArray(d, uint);
+            offsetKeys = [a in array] a: uint - lo: uint;
+            const sortedOffsets = radixSortLSD_keys(offsetKeys);
+            var sorted = makeDistArray(d, t);
+            sorted = [k in sortedOffsets] (k + lo: uint): t;
+            return sorted;
+          }
+        }
+        var sorted = radixSortLSD_keys(array);
+        return sorted;
       } else {
         var sorted = radixSortLSD_keys(array);
         return sorted;
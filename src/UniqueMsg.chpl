@@ -27,6 +27,7 @@ module UniqueMsg
     use ServerErrorStrings;
 
     use RadixSortLSD;
+    use BoundedSort;
     use Unique;
     use SipHash;
     use CommAggregation;
@@ -150,13 +151,28 @@ module UniqueMsg
           permutation.a = permutation.a.domain;
         }
         else {
-          // Sort the keys
-          overMemLimit(radixSortLSD_memEst(keys.size, itemsize));
-          var kr = radixSortLSD(keys);
-          // Unpack the permutation and sorted keys
-          ref perm = permutation.a;
-          forall (sh, p, val) in zip(sortedKeys, perm, kr) {
-            (sh, p) = val;
+          // Sort the keys, in batches if a full sort does not fit in memory
+          var sortedInBatches = false;
+          if t == uint {
+            const budget = sortScratchBudget(keys.size, itemsize);
+            if budget > 0 {
+              ref perm = permutation.a;
+              perm = argsortBounded(keys, budget);
+              forall (sh, p) in zip(sortedKeys, perm) with (var agg = newSrcAggregator(t)) {
+                agg.copy(sh, keys[p]);
+              }
+              sortedInBatches = true;
+            }
+          } else {
+            overMemLimit(radixSortLSD_memEst(keys.size, itemsize));
+          }
+          if !sortedInBatches {
+            var kr = radixSortLSD(keys);
+            // Unpack the permutation and sorted keys
+            ref perm = permutation.a;
+            forall (sh, p, val) in zip(sortedKeys, perm, kr) {
+              (sh, p) = val;
+            }
           }
         }
         // Get the unique keys and the count of each
@@ -239,6 +255,13 @@ module UniqueMsg
         // If row values can fit in 128 bits (8 digits) and all strings are small,
         // then pack into tuples of uint(16) for sorting keys.
         if !hasStr || allSmallStrs {
+          // Pack keys offset by their minimums into one uint or uint pair if they fit
+          var (totalBits, packedWidths, mins) = getPackedWidthsNumericArrays(helperNames, st);
+          if totalBits <= numBits(uint) {
+            return helper(numBytes(uint), uint, packNumericArrays(uint, size, totalBits, packedWidths, mins, helperNames, st));
+          } else if totalBits <= 2 * numBits(uint) {
+            return helper(2 * numBytes(uint), 2*uint, packNumericArrays(2*uint, size, totalBits, packedWidths, mins, helperNames, st));
+          }
           var (totalDigits, bitWidths, negs) = getNumDigitsNumericArrays(helperNames, st);
           if totalDigits <= 2 { return helper(2 * bitsPerDigit / 8, 2*uint(bitsPerDigit), mergeNumericArrays(2, size, totalDigits, bitWidths, negs, helperNames, st)); }
           else if totalDigits <= 4 { return helper(4 * bitsPerDigit / 8, 4*uint(bitsPerDigit), mergeNumericArrays(4, size, totalDigits, bitWidths, negs, helperNames, st)); }
@@ -170,3 +170,31 @@ class TestAlignment:
             values, intervals, tiebreak=tiebreak_smallest, hierarchical=False
         )
         assert smallest_result.to_list() == smallest_answer
+
+    def test_find_hash_matches_sort(self):
+        space = ak.randint(0, 20, 50, seed=1)
+        query = ak.randint(0, 25, 40, seed=2)
+        strs = ak.random_strings_uniform(1, 2, 50, seed=3)
+        qstrs = ak.random_strings_uniform(1, 2, 40, seed=4)
+        unique_space = ak.arange(30) * 3
+        cases = [
+            (query, space),
+            (qstrs, strs),
+            ([query, qstrs], [space, strs]),
+            (query, unique_space),
+        ]
+        for q, s in cases:
+            for remove_missing in [False, True]:
+                hashed = ak.find(q, s, remove_missing=remove_missing, method="hash")
+                sorted_ = ak.find(q, s, remove_missing=remove_missing, method="sort")
+                assert hashed.to_list() == sorted_.to_list()
+        for q, s in [(query, space), (qstrs, strs)]:
+            hashed = ak.find(q, s, all_occurrences=True, method="hash")
+            sorted_ = ak.find(q, s, all_occurrences=True, method="sort")
+            assert hashed.to_list() == sorted_.to_list()
+            assert ak.indexof1d(q, s).to_list() == sorted_.values.to_list()
+
+        with pytest.raises(TypeError):
+            ak.find(ak.Categorical(qstrs), ak.Categorical(strs), method="hash")
+        with pytest.raises(ValueError):
+            ak.find(query, space, method="binary")
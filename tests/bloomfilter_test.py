@@ -0,0 +1,52 @@
+import pytest
+
+import arkouda as ak
+
+
+class TestBloomFilter:
+    def test_bloomfilter_docstrings(self):
+        import doctest
+
+        from arkouda import bloomfilter
+
+        result = doctest.testmod(
+            bloomfilter, optionflags=doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE
+        )
+        assert result.failed == 0, f"Doctest failed: {result.failed} failures"
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.float64, ak.str_])
+    def test_contains(self, size, dtype):
+        values = ak.arange(size) * 2
+        absent = ak.arange(size) * 2 + 1
+        if dtype != ak.int64:
+            values, absent = ak.cast(values, dtype), ak.cast(absent, dtype)
+        bf = ak.BloomFilter(values, fp_rate=0.01)
+        assert len(bf) == size
+        # no false negatives, and false positives near the target rate
+        assert bf.contains(values).all()
+        assert ak.sum(bf.contains(absent)) <= max(10, 0.05 * size)
+        assert not bf.in1d(absent).any()
+        assert bf.in1d(values).all()
+
+    def test_multiple_arrays(self):
+        keys = [ak.array([1, 1, 2]), ak.array(["a", "b", "a"])]
+        bf = ak.BloomFilter(keys)
+        args = [ak.array([2, 2, 1]), ak.array(["a", "b", "b"])]
+        assert bf.in1d(args).to_list() == [True, False, True]
+        assert bf.in1d(args, invert=True).to_list() == [False, True, False]
+
+    def test_modified_values(self):
+        values = ak.arange(10)
+        bf = ak.BloomFilter(values)
+        assert bf.in1d(ak.array([3])).to_list() == [True]
+        values[3] = 100
+        assert bf.in1d(ak.array([3, 100])).to_list() == [False, True]
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            ak.BloomFilter(ak.arange(10), fp_rate=1.5)
+        with pytest.raises(ValueError):
+            ak.BloomFilter([ak.arange(3), ak.arange(4)])
+        with pytest.raises(TypeError):
+            ak.BloomFilter(ak.arange(10)).contains(ak.array(["a"]))
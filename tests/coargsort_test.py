@@ -156,3 +156,23 @@ class TestCoargsort:
         singleton = ak.array([42])
         assert ak.coargsort([empty]).to_list() == []
         assert ak.coargsort([singleton]).to_list() == [0]
+
+    @pytest.mark.parametrize("prob_size", pytest.prob_size)
+    @pytest.mark.parametrize("algo", SortingAlgorithm)
+    def test_coargsort_packed_keys(self, prob_size, algo):
+        # narrow keys of several dtypes, some offset far from zero, that fit in 64
+        # and in 128 bits once packed
+        rng = np.random.default_rng(3)
+        port = rng.integers(0, 2**16, prob_size).astype(np.uint64)
+        proto = rng.integers(0, 256, prob_size)
+        hour = rng.integers(-12, 12, prob_size)
+        day = rng.integers(2**40, 2**40 + 365, prob_size)
+        flag = rng.integers(0, 2, prob_size).astype(bool)
+        value = rng.uniform(-1, 1, prob_size)
+        for cols in [port, proto, hour, day], [flag, value, port, hour, day]:
+            perm = ak.coargsort([ak.array(c) for c in cols], algo)
+            assert perm.to_list() == np.lexsort(cols[::-1]).tolist()
+
+            g = ak.GroupBy([ak.array(c) for c in cols])
+            _, counts = np.unique(np.rec.fromarrays(cols), return_counts=True)
+            assert g.size()[1].to_list() == counts.tolist()
@@ -305,6 +305,101 @@ class TestDataFrame:
 
         pd_assert_frame_equal(df.to_pandas(retain_index=True), expected_df)
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_to_pandas_column_types(self, size):
+        ints = ak.randint(-10, 10, size, seed=1)
+        df = ak.DataFrame(
+            {
+                "ints": ints,
+                "uints": ak.cast(ints + 10, ak.uint64),
+                "floats": ak.randint(0, 1, size, dtype=ak.float64, seed=2),
+                "bools": ints % 2 == 0,
+                "strs": ak.random_strings_uniform(0, 5, size, seed=3),
+                "cats": ak.Categorical(ak.random_strings_uniform(1, 2, size, seed=4)),
+                "segs": ak.SegArray(ak.arange(0, 2 * size, 2), ak.arange(2 * size)),
+                "dates": ak.Datetime(ints * 10**9),
+                "deltas": ak.Timedelta(ints * 10**9),
+                "big": ak.cast(ints + 10, ak.bigint) + 2**70,
+            }
+        )
+        expected_df = pd.DataFrame(
+            {
+                "ints": ints.to_ndarray(),
+                "uints": df["uints"].to_ndarray(),
+                "floats": df["floats"].to_ndarray(),
+                "bools": df["bools"].to_ndarray(),
+                "strs": df["strs"].to_ndarray(),
+                "cats": df["cats"].to_pandas(),
+                "segs": df["segs"].to_list(),
+                "dates": df["dates"].to_ndarray(),
+                "deltas": df["deltas"].to_ndarray(),
+                "big": df["big"].to_ndarray(),
+            }
+        )
+        result = df.to_pandas()
+        pd_assert_frame_equal(result, expected_df)
+        assert result["strs"].dtype == expected_df["strs"].dtype
+        assert all(type(cell) is list for cell in result["segs"])
+
+        # a selection of columns, with the index kept
+        indexed = ak.DataFrame({"strs": df["strs"], "cats": df["cats"]}, index=ak.arange(size) * 2)
+        pd_assert_frame_equal(
+            indexed.to_pandas(retain_index=True),
+            expected_df[["strs", "cats"]].set_axis(np.arange(size) * 2),
+        )
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_from_arrow(self, size):
+        import pyarrow as pa
+
+        rng = np.random.default_rng(5)
+        ints = rng.integers(-10, 10, size)
+        pd_df = pd.DataFrame(
+            {
+                "ints": ints,
+                "uints": (ints + 10).astype(np.uint64),
+                "floats": rng.random(size),
+                "bools": ints % 2 == 0,
+                "strs": [f"s{i}" * (i % 3) for i in ints],
+                "cats": pd.Categorical([f"c{i % 4}" for i in ints]),
+                "segs": [np.arange(i % 3) for i in ints],
+            },
+            index=np.arange(size) * 2,
+        )
+        ak_df = ak.DataFrame.from_pandas(pd_df, engine="arrow")
+        assert_frame_equal(ak_df.to_pandas(retain_index=True), pd_df)
+        assert isinstance(ak_df["cats"], ak.Categorical)
+
+        # sliced, chunked and narrow-typed arrays
+        table = pa.table(
+            {
+                "i8": pa.chunked_array([pa.array([1, 2], pa.int8()), pa.array([3], pa.int8())]),
+                "strs": pa.array(["a", "bc", "", "d"]).slice(1),
+                "dates": pa.array(pd.to_datetime(["2020-01-01", "2021-01-01", "2022-01-01"])),
+            }
+        )
+        ak_df = ak.DataFrame.from_arrow(table)
+        assert ak_df["i8"].to_list() == [1, 2, 3]
+        assert ak_df["strs"].to_list() == ["bc", "", "d"]
+        assert isinstance(ak_df["dates"], ak.Datetime)
+        assert np.array_equal(ak_df["dates"].to_ndarray(), table["dates"].to_numpy())
+
+        # null categories become the NA value of the Categorical
+        pd_cats = pd.DataFrame({"cats": pd.Categorical(["a", None, "b", "a", None])})
+        cats = ak.DataFrame.from_pandas(pd_cats, engine="arrow")["cats"]
+        assert cats.isna().to_list() == [False, True, False, False, True]
+        assert cats[ak.array([0, 2, 3])].to_list() == ["a", "b", "a"]
+        cats = ak.DataFrame.from_arrow(
+            pa.table({"cats": pa.array(["N/A", None, "x"]).dictionary_encode()})
+        )["cats"]
+        assert cats.to_list() == ["N/A", "N/A", "x"]
+        assert cats.isna().to_list() == [True, True, False]
+
+        with pytest.raises(ValueError):
+            ak.DataFrame.from_arrow(pa.table({"x": pa.array([1, None])}))
+        with pytest.raises(ValueError):
+            ak.DataFrame.from_pandas(pd_df, engine="bogus")
+
     def test_convenience_init(self):
         dict1 = {"0": [1, 2], "1": [True, False], "2": ["foo", "bar"], "3": [2.3, -1.8]}
         dict2 = {"0": (1, 2), "1": (True, False), "2": ("foo", "bar"), "3": (2.3, -1.8)}
@@ -372,6 +467,40 @@ class TestDataFrame:
         assert len(row) == 1
         assert ref_df[ref_df["userName"] == "Carol"].equals(row.to_pandas(retain_index=True))
 
+    def test_row_selection_column_types(self):
+        size = 100
+        ints = ak.randint(0, 10, size, seed=1)
+        df = ak.DataFrame(
+            {
+                "ints": ints,
+                "uints": ak.cast(ints, ak.uint64),
+                "floats": ak.randint(0, 1, size, dtype=ak.float64, seed=2),
+                "bools": ints % 2 == 0,
+                "strs": ak.random_strings_uniform(1, 5, size, seed=3),
+                "cats": ak.Categorical(ak.random_strings_uniform(1, 2, size, seed=4)),
+                "segs": ak.SegArray(ak.arange(0, 2 * size, 2), ak.arange(2 * size)),
+                "dates": ak.Datetime(ints * 10**9),
+                "big": ak.cast(ints, ak.bigint) + 2**70,
+            },
+            index=ak.Index(ak.arange(size) * 3, name="idx"),
+        )
+        df["big"].max_bits = 72
+        mask = ints > 4
+        rows = ak.arange(size)[mask]
+        for key in (mask, rows, ak.cast(rows, ak.uint64)):
+            result = df[key]
+            assert result.index.name == "idx"
+            assert result.index.to_list() == df.index.values[rows].to_list()
+            for col in df.columns.values:
+                assert type(result[col]) is type(df[col])
+                assert result[col].to_list() == df[col][rows].to_list()
+            assert result["big"].max_bits == 72
+
+        with pytest.raises(RuntimeError):
+            df[mask[:10]]
+        with pytest.raises(RuntimeError):
+            df[ak.array([0, size])]
+
     def test_column_indexing(self):
         df = self.build_ak_df()
         ref_df = self.build_pd_df()
@@ -472,6 +601,31 @@ class TestDataFrame:
 
         assert_frame_equal(dedup_pd_test, dedup_test)
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_duplicated(self, size):
+        rng = np.random.default_rng(11)
+        pd_df = pd.DataFrame(
+            {
+                "ints": rng.integers(0, 5, size),
+                "strs": [f"s{i}" for i in rng.integers(0, 3, size)],
+                "floats": rng.integers(0, 2, size) / 2,
+            }
+        )
+        df = ak.DataFrame(pd_df)
+        for subset in (None, ["ints"], "strs", ["ints", "floats"]):
+            for keep in ("first", "last", False):
+                expected = pd_df.duplicated(subset, keep=keep)
+                assert df.duplicated(subset, keep=keep).to_list() == expected.to_list()
+                assert_frame_equal(
+                    df.drop_duplicates(subset, keep=keep).to_pandas(retain_index=True),
+                    pd_df.drop_duplicates(subset, keep=keep),
+                )
+
+        with pytest.raises(KeyError):
+            df.duplicated(["bogus"])
+        with pytest.raises(ValueError):
+            df.duplicated(keep="middle")
+
     def test_shape(self):
         df = self.build_ak_df()
 
@@ -556,6 +710,28 @@ class TestDataFrame:
         with pytest.raises(TypeError):
             df.append(df_typeerror)
 
+    def test_append_defer(self):
+        df = self.build_ak_df()
+        for _ in range(3):
+            df.append(self.build_ak_append(), defer=True)
+        assert len(df) == 14
+
+        ref_df = pd.concat(
+            [self.build_pd_df()] + [self.build_pd_df_append().iloc[6:]] * 3, ignore_index=True
+        )
+        assert_frame_equal(ref_df, df.to_pandas())
+        assert df.index.to_list() == list(range(14))
+
+        # batches with mismatched columns are rejected when they are appended
+        with pytest.raises(KeyError):
+            df.append(self.build_ak_keyerror(), defer=True)
+        with pytest.raises(TypeError):
+            df.append(self.build_ak_typeerror(), defer=True)
+
+        df.append(self.build_ak_append(), defer=True)
+        assert df.compact() is df
+        assert len(df["userName"]) == 16
+
     def test_concat(self):
         df = self.build_ak_df()
 
@@ -658,6 +834,16 @@ class TestDataFrame:
         pd_result = getattr(pd_df.groupby(group_on), agg)()
         assert_frame_equal(ak_result.to_pandas(retain_index=True), pd_result)
 
+    @pytest.mark.parametrize("q", [0.1, 0.5, 0.8])
+    def test_gb_quantile(self, q):
+        df = self.build_ak_df_example_numeric_types()
+        pd_df = df.to_pandas()
+
+        group_on = "gb_id"
+        ak_result = df.groupby(group_on).quantile(q, colnames=["float64", "int64"])
+        pd_result = pd_df.groupby(group_on)[["float64", "int64"]].quantile(q)
+        assert_frame_equal(ak_result.to_pandas(retain_index=True), pd_result, check_dtype=False)
+
     @pytest.mark.parametrize("dropna", [True, False])
     @pytest.mark.parametrize("agg", ["count", "max", "mean", "median", "min", "std", "sum", "var"])
     def test_gb_aggregations_with_nans(self, agg, dropna):
@@ -968,6 +1154,57 @@ class TestDataFrame:
         ord_ref = ord_ref.reindex(perm_list).reset_index(drop=True)
         assert_frame_equal(ord_ref, ord.to_pandas())
 
+    @pytest.mark.parametrize("n", [0, 1, 10, 150])
+    @pytest.mark.parametrize("keep", ["first", "last"])
+    def test_nlargest_nsmallest(self, n, keep):
+        size = 100
+        df = ak.DataFrame(
+            {
+                "a": ak.randint(0, 10, size, seed=1),
+                "b": ak.cast(ak.randint(0, 3, size, seed=2), ak.float64),
+                "c": ak.arange(size),
+            }
+        )
+        pd_df = df.to_pandas()
+        # pandas only promises which rows are kept among full ties for a single column
+        all_columns = ["a", "b"] if keep == "last" else ["a", "b", ["a", "b"], ["b", "a"]]
+        for columns in all_columns:
+            for name in ["nlargest", "nsmallest"]:
+                result = getattr(df, name)(n, columns, keep=keep).to_pandas(retain_index=True)
+                expected = getattr(pd_df, name)(n, columns, keep=keep)
+                assert_frame_equal(result, expected)
+
+        with pytest.raises(ValueError):
+            df.nlargest(3, "a", keep="all")
+
+    @pytest.mark.parametrize("ascending", [True, False])
+    @pytest.mark.parametrize("by", [None, "a", ["a", "b"], ["s", "a"]])
+    def test_sort_values_limit(self, ascending, by):
+        size = 100
+        df = ak.DataFrame(
+            {
+                "a": ak.randint(0, 10, size, seed=1),
+                "b": ak.randint(0, 3, size, dtype=ak.float64, seed=2),
+                "s": ak.random_strings_uniform(1, 2, size, seed=3),
+            }
+        )
+        full = df.sort_values(by, ascending=ascending).to_pandas(retain_index=True)
+        for limit in [0, 1, 7, size, 2 * size]:
+            result = df.sort_values(by, ascending=ascending, limit=limit)
+            assert_frame_equal(result.to_pandas(retain_index=True), full[:limit])
+
+    @pytest.mark.parametrize("on", ["t", "d", ["t", "v"]])
+    def test_merge_sorted(self, on):
+        frames = []
+        for i, size in enumerate([40, 0, 25, 60]):
+            t = ak.randint(0, 20, size, seed=i)
+            df = ak.DataFrame({"t": t, "v": ak.randint(0, 5, size, seed=10 + i), "d": ak.Datetime(t)})
+            frames.append(df.sort_values(on) if size else df)
+        merged = ak.DataFrame.merge_sorted(frames, on=on)
+        expected = pd.concat([f.to_pandas(retain_index=True) for f in frames if not f.empty])
+        expected = expected.sort_values(on, kind="stable")
+        assert_frame_equal(merged.to_pandas(retain_index=True), expected)
+
     def test_filter_by_range(self):
         userid = ak.array([111, 222, 111, 333, 222, 111])
         amount = ak.array([0, 1, 1, 2, 3, 15])
@@ -1279,6 +1516,102 @@ class TestDataFrame:
                 else:
                     assert (np.sort(from_ak) == np.sort(from_pd.astype(str))).all()
 
+    @pytest.mark.parametrize("method", ["hash", "broadcast", "auto"])
+    @pytest.mark.parametrize("how", ["inner", "left", "right", "outer"])
+    @pytest.mark.parametrize("on", ["k", "s", ["k", "j"]])
+    def test_merge_methods(self, method, how, on):
+        size = 1000
+        left_df = ak.DataFrame(
+            {
+                "k": ak.randint(0, 50, size, seed=1),
+                "j": ak.randint(0, 3, size, seed=2),
+                "a": ak.arange(size),
+            }
+        )
+        left_df["s"] = pda_to_str_helper(left_df["k"])
+        right_df = ak.DataFrame(
+            {
+                "k": ak.randint(25, 75, size // 10, seed=3),
+                "j": ak.randint(0, 3, size // 10, seed=4),
+                "b": ak.arange(size // 10),
+            }
+        )
+        right_df["s"] = pda_to_str_helper(right_df["k"])
+
+        def rows(df):
+            pd_df = df.to_pandas()
+            return sorted(pd_df[sorted(pd_df.columns)].astype(str).itertuples(index=False))
+
+        for left, right in [(left_df, right_df), (right_df, left_df)]:
+            expected = ak.merge(left, right, on=on, how=how, method="sort")
+            result = ak.merge(left, right, on=on, how=how, method=method)
+            assert rows(result) == rows(expected)
+            unsorted = left.merge(right, on=on, how=how, sort=False, method=method)
+            assert rows(unsorted) == rows(expected)
+
+        with pytest.raises(ValueError):
+            ak.merge(left_df, right_df, on="k", method="nested_loop")
+
+    @pytest.mark.parametrize("method", ["hash", "broadcast"])
+    def test_merge_methods_mixed_int_dtypes(self, method):
+        # -1 and 2**64 - 1 have the same bits but are not equal
+        left = ak.DataFrame({"k": ak.array([-1, 0, 5, -1]), "a": ak.arange(4)})
+        right = ak.DataFrame({"k": ak.array([2**64 - 1, 5, 0], dtype=ak.uint64), "b": ak.arange(3)})
+        for lf, rt in [(left, right), (right, left)]:
+            result = ak.merge(lf, rt, on="k", method=method).to_pandas()
+            assert sorted(zip(result["a"], result["b"])) == [(1, 2), (2, 1)]
+
+    @pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+    def test_merge_asof(self, direction):
+        rng = np.random.default_rng(5)
+        pd_left = pd.DataFrame(
+            {"t": rng.integers(0, 1000, 200), "g": rng.integers(0, 4, 200), "a": np.arange(200)}
+        )
+        pd_right = pd.DataFrame(
+            {
+                "t": rng.choice(1000, 100, replace=False),
+                "g": rng.integers(0, 4, 100),
+                "b": rng.integers(0, 10, 100),
+            }
+        )
+        left, right = ak.DataFrame(pd_left), ak.DataFrame(pd_right)
+        sorted_left = pd_left.sort_values("t", kind="stable")
+        sorted_right = pd_right.sort_values("t", kind="stable")
+        for kwargs in ({}, {"by": "g"}, {"tolerance": 5}, {"allow_exact_matches": False}):
+            expected = pd.merge_asof(
+                sorted_left, sorted_right, on="t", direction=direction, **kwargs
+            ).sort_values("a")
+            result = ak.merge_asof(left, right, on="t", direction=direction, **kwargs).to_pandas()
+            assert result.columns.to_list() == expected.columns.to_list()
+            assert result["a"].to_list() == expected["a"].to_list()
+            np.testing.assert_array_equal(
+                result["b"].to_numpy(dtype=float), expected["b"].to_numpy(dtype=float)
+            )
+
+        # Datetime keys, already sorted
+        pd_left["t"] = pd.to_datetime(pd_left["t"], unit="s")
+        sorted_right["t"] = pd.to_datetime(sorted_right["t"], unit="s")
+        left, right = ak.DataFrame(pd_left), ak.DataFrame(sorted_right)
+        expected = pd.merge_asof(
+            pd_left.sort_values("t", kind="stable"),
+            sorted_right,
+            on="t",
+            by="g",
+            direction=direction,
+            tolerance=pd.Timedelta("20s"),
+        ).sort_values("a")
+        result = ak.merge_asof(
+            left, right, on="t", by="g", direction=direction, tolerance="20s"
+        ).to_pandas()
+        np.testing.assert_array_equal(
+            result["b"].to_numpy(dtype=float), expected["b"].to_numpy(dtype=float)
+        )
+
+        with pytest.raises(ValueError):
+            ak.merge_asof(left, right, on="t", direction="sideways")
+        with pytest.raises(TypeError):
+            ak.merge_asof(left, right, left_on="t", right_on="b")
+
     @pytest.mark.parametrize(
         "df_init, merge",
         [
@@ -1009,3 +1009,242 @@ class TestGroupBy:
         expected_nuniq = [8, 3]
         assert expected_unique_keys == unique_keys.to_list()
         assert expected_nuniq == nuniq.to_list()
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("vname", ["int64", "float64"])
+    def test_window_functions(self, size, vname):
+        data = self.make_arrays(size)
+        df = pd.DataFrame(data)
+        g = ak.GroupBy(ak.array(data["keys"]))
+        pdg = df.groupby("keys")[vname]
+        vals = ak.array(data[vname])
+
+        assert np.allclose(g.cumsum(vals).to_ndarray(), pdg.cumsum().values)
+        assert np.allclose(g.cummax(vals).to_ndarray(), pdg.cummax().values)
+        assert np.allclose(g.cummin(vals).to_ndarray(), pdg.cummin().values)
+        assert np.array_equal(g.rank().to_ndarray(), df.groupby("keys").cumcount().values + 1)
+        assert np.array_equal(
+            g.rank(vals).to_ndarray(), pdg.rank(method="first").values.astype(np.int64)
+        )
+        assert np.array_equal(
+            g.rank(vals, ascending=False).to_ndarray(),
+            pdg.rank(method="first", ascending=False).values.astype(np.int64),
+        )
+        for periods in (1, 3, -2):
+            assert np.allclose(
+                g.shift(vals, periods).to_ndarray(), pdg.shift(periods).values, equal_nan=True
+            )
+            assert np.allclose(
+                g.diff(vals, periods).to_ndarray(), pdg.diff(periods).values, equal_nan=True
+            )
+        for window, min_periods in ((3, None), (4, 1)):
+            pdr = pdg.rolling(window, min_periods=min_periods)
+            assert np.allclose(
+                g.rolling(window, min_periods).sum(vals).to_ndarray(),
+                pdr.sum().sort_index(level=1).values,
+                equal_nan=True,
+            )
+            assert np.allclose(
+                g.rolling(window, min_periods).mean(vals).to_ndarray(),
+                pdr.mean().sort_index(level=1).values,
+                equal_nan=True,
+            )
+
+    def test_window_functions_nan(self):
+        keys = ak.array([0, 1, 0, 1, 0, 0])
+        vals = ak.array([1.0, np.nan, np.nan, 2.0, 3.0, 4.0])
+        g = ak.GroupBy(keys)
+        assert np.allclose(
+            g.cumsum(vals).to_ndarray(), [1.0, np.nan, np.nan, 2.0, 4.0, 8.0], equal_nan=True
+        )
+        assert np.allclose(
+            g.cummax(vals).to_ndarray(), [1.0, np.nan, np.nan, 2.0, 3.0, 4.0], equal_nan=True
+        )
+        assert g.shift(ak.array([1, 2, 3, 4, 5, 6]), fill_value=0).to_list() == [0, 0, 1, 2, 3, 5]
+
+        # a NaN only affects the windows that contain it, and does not count toward min_periods
+        pdg = pd.Series(vals.to_ndarray()).groupby(keys.to_ndarray())
+        for window, min_periods in ((2, None), (2, 1), (3, 2), (3, 0)):
+            pdr = pdg.rolling(window, min_periods=min_periods)
+            assert np.allclose(
+                g.rolling(window, min_periods).sum(vals).to_ndarray(),
+                pdr.sum().sort_index(level=1).values,
+                equal_nan=True,
+            )
+            assert np.allclose(
+                g.rolling(window, min_periods).mean(vals).to_ndarray(),
+                pdr.mean().sort_index(level=1).values,
+                equal_nan=True,
+            )
+
+        with pytest.raises(ValueError):
+            g.rolling(0)
+        with pytest.raises(ValueError):
+            g.cumsum(ak.arange(3))
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("vname", ["int64", "float64"])
+    def test_quantile(self, size, vname):
+        data = self.make_arrays(size)
+        df = pd.DataFrame(data)
+        g = ak.GroupBy(ak.array(data["keys"]))
+        pdg = df.groupby("keys")[vname]
+        vals = ak.array(data[vname])
+
+        for q in (0.0, 0.1, 0.5, 0.75, 1.0):
+            _, res = g.quantile(vals, q)
+            assert np.allclose(res.to_ndarray(), pdg.quantile(q).values)
+        _, res = g.median(vals)
+        assert np.allclose(res.to_ndarray(), pdg.median().values)
+        _, res = g.quantile(vals, [0.25, 0.9])
+        assert np.allclose(res[0].to_ndarray(), pdg.quantile(0.25).values)
+        assert np.allclose(res[1].to_ndarray(), pdg.quantile(0.9).values)
+
+    def test_quantile_nan(self):
+        keys = ak.array([0, 1, 0, 1, 0, 2])
+        vals = ak.array([1.0, np.nan, 5.0, 2.0, np.nan, np.nan])
+        g = ak.GroupBy(keys)
+        _, res = g.quantile(vals, 0.5)
+        assert np.allclose(res.to_ndarray(), [3.0, 2.0, np.nan], equal_nan=True)
+        _, res = g.quantile(vals, 0.5, skipna=False)
+        assert np.isnan(res.to_ndarray()).all()
+
+        with pytest.raises(ValueError):
+            g.quantile(vals, 1.5)
+
+    def test_groupby_cache(self):
+        df = ak.DataFrame({"src": ak.array([1, 2, 1, 3]), "val": ak.array([1, 2, 3, 4])})
+        ak.disable_groupby_cache()
+        df.groupby("src").sum()
+        assert ak.groupby_cache_info().entries == 0
+
+        ak.enable_groupby_cache()
+        ak.clear_groupby_cache()
+        try:
+            first = df.groupby("src").sum()
+            df.groupby("src").count()
+            second = df.groupby("src").sum()
+            info = ak.groupby_cache_info()
+            assert (info.hits, info.misses, info.entries) == (2, 1, 1)
+            assert info.nbytes > 0
+            assert first["val"].to_list() == second["val"].to_list()
+
+            # modifying a key column in place rebuilds the cached GroupBy
+            df["src"][0] = 3
+            assert df.groupby("src").sum()["val"].to_list() == [3, 2, 5]
+            assert ak.groupby_cache_info().misses == 2
+
+            # as does putmask, or shuffling it
+            ak.putmask(df["src"], df["val"] == 2, ak.array([1]))
+            assert df.groupby("src").sum()["val"].to_list() == [5, 5]
+            ak.random.default_rng(pytest.seed).shuffle(df["src"])
+            expected = df.to_pandas().groupby("src")["val"].sum().to_list()
+            assert df.groupby("src").sum()["val"].to_list() == expected
+            assert ak.groupby_cache_info().misses == 4
+
+            # reassigning a key column drops its entries
+            df["src"] = ak.array([0, 0, 1, 1])
+            assert ak.groupby_cache_info().entries == 0
+            assert df.groupby("src").sum()["val"].to_list() == [3, 7]
+
+            # entries beyond the memory budget are evicted least-recently-used first
+            ak.enable_groupby_cache(max_bytes=ak.groupby_cache_info().nbytes * 5 // 2)
+            df.groupby(["src", "val"]).count()
+            info = ak.groupby_cache_info()
+            assert info.entries == 1 and info.evictions == 1
+        finally:
+            ak.disable_groupby_cache()
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_dense_range(self, size):
+        keys = ak.randint(-3, 20, size)
+        vals = ak.randint(0, 100, size, dtype=ak.float64)
+        vals[ak.arange(0, size, 7)] = np.nan
+        dense = ak.GroupBy(keys, dense_range=(-5, 24))
+        general = ak.GroupBy(keys)
+
+        assert dense.unique_keys.to_list() == general.unique_keys.to_list()
+        assert dense.segments.to_list() == general.segments.to_list()
+        assert dense.size()[1].to_list() == general.size()[1].to_list()
+        for op in ("sum", "count", "mean", "max", "median"):
+            assert np.allclose(
+                dense.aggregate(vals, op)[1].to_ndarray(),
+                general.aggregate(vals, op)[1].to_ndarray(),
+                equal_nan=True,
+            )
+        assert dense.sum(keys)[1].to_list() == general.sum(keys)[1].to_list()
+        assert dense.permutation.to_list() == general.permutation.to_list()
+        assert (
+            dense.broadcast(dense.sum(keys)[1]).to_list()
+            == general.broadcast(general.sum(keys)[1]).to_list()
+        )
+
+        with pytest.raises(ValueError):
+            ak.GroupBy(keys, dense_range=(5, 0))
+        with pytest.raises(TypeError):
+            ak.GroupBy(ak.array(["a", "b"]), dense_range=(0, 1))
+        with pytest.raises(RuntimeError):
+            ak.GroupBy(keys, dense_range=(0, 5))
+
+        # a range too wide for per-task counters is grouped by sorting
+        wide = ak.GroupBy(keys, dense_range=(-5, 2**40))
+        assert wide._dense is None
+        assert wide.segments.to_list() == general.segments.to_list()
+
+    def test_dense_uint_and_nan_groups(self):
+        # uint64 keys keep their dtype, and keys past the int64 range are sorted
+        ukeys = ak.array([7, 5, 7, 6], dtype=ak.uint64)
+        dense = ak.GroupBy(ukeys, dense_range=(5, 7))
+        assert dense._dense is not None
+        assert dense.unique_keys.dtype == ak.uint64
+        assert dense.unique_keys.to_list() == [5, 6, 7]
+        big = ak.GroupBy(ukeys + ak.uint64(2**63), dense_range=(2**63 + 5, 2**63 + 7))
+        assert big._dense is None
+        assert big.unique_keys.to_list() == [2**63 + 5, 2**63 + 6, 2**63 + 7]
+
+        # an all-NaN group has the same mean on both paths
+        keys = ak.array([0, 0, 1, 1, 2])
+        vals = ak.array([np.nan, np.nan, 1.0, np.nan, 4.0])
+        dense = ak.GroupBy(keys, dense_range=(0, 2))
+        general = ak.GroupBy(keys)
+        assert dense._dense is not None and general._dense is None
+        assert dense.mean(vals)[1].to_list() == general.mean(vals)[1].to_list()
+
+    def test_dense_categorical(self):
+        cat = ak.Categorical(ak.array(["b", "a", "c", "a", "b", "a"]))
+        vals = ak.array([1, 2, 3, 4, 5, 6])
+        g = ak.GroupBy(cat)
+        keys, sums = g.sum(vals)
+        assert keys.to_list() == ["a", "b", "c"]
+        assert sums.to_list() == [12, 6, 3]
+        assert g.count(vals)[1].to_list() == [3, 2, 1]
+        assert g.min(vals)[1].to_list() == [2, 1, 3]
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_top_k(self, size):
+        keys = ak.randint(0, 10, size)
+        vals = ak.randint(0, 20, size)
+        g = ak.GroupBy(keys)
+        top_keys, top_vals, top_counts = g.top_k(vals, 3)
+
+        df = pd.DataFrame({"keys": keys.to_ndarray(), "vals": vals.to_ndarray()})
+        expected = (
+            df.groupby(["keys", "vals"])
+            .size()
+            .reset_index(name="count")
+            .sort_values(["keys", "count", "vals"], ascending=[True, False, True], kind="stable")
+            .groupby("keys")
+            .head(3)
+        )
+        assert top_keys.to_list() == expected["keys"].to_list()
+        assert top_vals.to_list() == expected["vals"].to_list()
+        assert top_counts.to_list() == expected["count"].to_list()
+
+        strs = ak.array(["a", "b", "b", "c", "c", "c"])
+        top_keys, top_vals, top_counts = ak.GroupBy(ak.array([1, 1, 1, 2, 2, 2])).top_k(strs, 5)
+        assert top_keys.to_list() == [1, 1, 2]
+        assert top_vals.to_list() == ["b", "a", "c"]
+        assert top_counts.to_list() == [2, 1, 3]
+
+        with pytest.raises(ValueError):
+            g.top_k(vals, 0)
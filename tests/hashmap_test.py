@@ -0,0 +1,129 @@
+import os
+import tempfile
+
+import numpy as np
+import pytest
+
+import arkouda as ak
+from arkouda import io_util
+
+
+@pytest.fixture
+def hm_test_base_tmp(request):
+    hm_test_base_tmp = "{}/.hashmap_test".format(os.getcwd())
+    io_util.get_directory(hm_test_base_tmp)
+
+    def finalizer():
+        io_util.delete_directory(hm_test_base_tmp)
+
+    request.addfinalizer(finalizer)
+    return hm_test_base_tmp
+
+
+class TestHashMap:
+    def test_hashmap_docstrings(self):
+        import doctest
+
+        from arkouda import hashmap
+
+        result = doctest.testmod(hashmap, optionflags=doctest.ELLIPSIS | doctest.NORMALIZE_WHITESPACE)
+        assert result.failed == 0, f"Doctest failed: {result.failed} failures"
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64, ak.str_])
+    def test_get_matches_lookup(self, size, dtype):
+        rng = ak.random.default_rng(pytest.seed)
+        keys = rng.permutation(ak.arange(size) * 2)
+        if dtype != ak.int64:
+            keys = ak.cast(keys, dtype)
+        values = ak.arange(size) * 3
+        args = keys[rng.integers(0, size, size)]
+        hm = ak.HashMap(keys, values)
+        assert len(hm) == size
+        assert hm.get(args).to_list() == ak.lookup(keys, values, args).to_list()
+        assert hm.contains(args).all()
+
+        missing = ak.arange(size) * 2 + 1
+        missing = ak.cast(missing, dtype)
+        assert not hm.contains(missing).any()
+        assert hm.get(missing, default=7).to_list() == [7] * size
+
+    def test_multi_key_and_strings_values(self):
+        k1 = ak.array([1, 1, 2, 2])
+        k2 = ak.array(["a", "b", "a", "b"])
+        values = ak.array(["w", "x", "y", "z"])
+        hm = ak.HashMap([k1, k2], values)
+        args = [ak.array([2, 1, 3]), ak.array(["b", "a", "a"])]
+        assert hm.get(args).to_list() == ["z", "w", ""]
+        assert hm.contains(args).to_list() == [True, True, False]
+
+    def test_errors(self):
+        with pytest.raises(ak.NonUniqueError):
+            ak.HashMap(ak.array([1, 2, 1]), ak.arange(3))
+        with pytest.raises(ValueError):
+            ak.HashMap(ak.arange(3), ak.arange(4))
+        hm = ak.HashMap(ak.arange(3), ak.arange(3))
+        with pytest.raises(TypeError):
+            hm.get(ak.array(["a"]))
+        with pytest.raises(TypeError):
+            hm.update(ak.array([5]), ak.array([1.5]))
+
+    def test_update(self):
+        hm = ak.HashMap(ak.array([10, 20, 30]), ak.array([1, 2, 3]))
+        hm.update(ak.array([20, 40]), ak.array([5, 6]))
+        assert len(hm) == 4
+        assert hm.get(ak.array([10, 20, 30, 40, 50])).to_list() == [1, 5, 3, 6, -1]
+        with pytest.raises(ak.NonUniqueError):
+            hm.update(ak.array([60, 60]), ak.array([1, 2]))
+        # a key already in the map, repeated in the update
+        with pytest.raises(ak.NonUniqueError):
+            hm.update(ak.array([20, 20]), ak.array([7, 8]))
+        assert hm.get(ak.array([20])).to_list() == [5]
+
+    def test_modified_keys(self):
+        keys = ak.arange(5)
+        hm = ak.HashMap(keys, ak.arange(5) * 10)
+        keys[0] = 9
+        assert hm.get(ak.array([9, 0])).to_list() == [0, -1]
+
+    def test_registration(self):
+        hm = ak.HashMap([ak.arange(4), ak.array(["a", "b", "c", "d"])], ak.array([1.5, 2.5, 3.5, 4.5]))
+        args = [ak.array([3, 0, 1]), ak.array(["d", "a", "a"])]
+        hm.register("test_hashmap")
+        try:
+            assert hm.is_registered()
+            attached = ak.attach("test_hashmap")
+            assert isinstance(attached, ak.HashMap)
+            assert attached.get(args).to_list() == hm.get(args).to_list()
+
+            # an update keeps the registration, with the new keys
+            hm.update([ak.array([7]), ak.array(["h"])], ak.array([8.5]))
+            assert hm.is_registered()
+            assert ak.attach("test_hashmap").get([ak.array([7]), ak.array(["h"])]).to_list() == [8.5]
+        finally:
+            hm.unregister()
+        assert not hm.is_registered()
+
+    def test_registration_modified_keys(self):
+        keys = ak.arange(5)
+        hm = ak.HashMap(keys, ak.arange(5) * 10)
+        hm.register("test_hashmap_modified")
+        try:
+            keys[0] = 9
+            assert hm.get(ak.array([9, 0])).to_list() == [0, -1]
+            # rebuilding the table keeps the registration, with the new table
+            assert hm.is_registered()
+            assert ak.attach("test_hashmap_modified").get(ak.array([9, 0])).to_list() == [0, -1]
+        finally:
+            hm.unregister()
+
+    def test_hdf(self, hm_test_base_tmp):
+        keys = ak.array(["x", "y", "z"])
+        values = ak.array([3, 1, 2])
+        hm = ak.HashMap(keys, values)
+        with tempfile.TemporaryDirectory(dir=hm_test_base_tmp) as tmp_dirname:
+            hm.to_hdf(f"{tmp_dirname}/hm")
+            read = ak.HashMap.read_hdf(f"{tmp_dirname}/hm")
+        args = ak.array(["z", "w", "x"])
+        assert read.get(args).to_list() == hm.get(args).to_list()
+        assert np.array_equal(read.values.to_ndarray(), values.to_ndarray())
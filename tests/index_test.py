@@ -514,6 +514,39 @@ class TestIndex:
 
         assert result.to_list() == [i in truth for i in range(size)]
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_build_lookup(self, size):
+        labels = ak.arange(size) % 7
+        keys = ak.array([3, 5, 9])
+        idx = ak.Index(labels).build_lookup()
+        assert idx.lookup(keys).to_list() == ak.in1d(labels, keys).to_list()
+
+        str_idx = ak.Index(ak.array([f"s{i % 7}" for i in range(size)])).build_lookup()
+        str_keys = ak.array(["s3", "s9"])
+        assert str_idx.lookup(str_keys).to_list() == ak.in1d(str_idx.values, str_keys).to_list()
+
+        multi = ak.MultiIndex([labels, ak.arange(size) % 3]).build_lookup()
+        multi_keys = [ak.array([3, 5]), ak.array([0, 2])]
+        assert multi.lookup(multi_keys).to_list() == ak.in1d(multi.levels, multi_keys).to_list()
+
+        s = ak.Series(ak.arange(size), index=ak.arange(size) * 2)
+        s.index.build_lookup()
+        assert s[ak.array([4, 0, 6])].to_list() == [2, 0, 3]
+        assert s[2] == 1
+        assert s.locate([2, 4]).to_list() == [1, 2]
+        with pytest.raises(KeyError):
+            s[ak.array([1])]
+
+        # int64 labels are not probed with uint64 keys, where -1 would match 2**64-1
+        signed = ak.Index(ak.array([-1, 2])).build_lookup()
+        assert signed._label_lookup([ak.array([2**64 - 1, 2], dtype=ak.uint64)]) is None
+        assert signed._label_lookup([ak.array([True, False])]) is not None
+
+        # the table is dropped once the labels are modified
+        labels[0] = 9
+        assert idx.lookup(keys).to_list() == ak.in1d(labels, keys).to_list()
+        assert idx._label_lookup([keys]) is None
+
     def test_save(self, df_test_base_tmp):
         locale_count = ak.get_config()["numLocales"]
         with tempfile.TemporaryDirectory(dir=df_test_base_tmp) as tmp_dirname:
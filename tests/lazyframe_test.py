@@ -0,0 +1,137 @@
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import arkouda as ak
+from arkouda import io_util
+
+
+@pytest.fixture
+def lazy_test_base_tmp(request):
+    lazy_test_base_tmp = "{}/.lazy_test".format(os.getcwd())
+    io_util.get_directory(lazy_test_base_tmp)
+
+    # Define a finalizer function for teardown
+    def finalizer():
+        # Clean up any resources if needed
+        io_util.delete_directory(lazy_test_base_tmp)
+
+    # Register the finalizer to ensure cleanup
+    request.addfinalizer(finalizer)
+    return lazy_test_base_tmp
+
+
+def make_frames(size):
+    rng = np.random.default_rng(17)
+    pd_df = pd.DataFrame(
+        {
+            "src": rng.integers(0, 10, size),
+            "port": rng.integers(20, 25, size),
+            "bytes": rng.integers(0, 1000, size),
+            "weight": rng.random(size),
+        }
+    )
+    return ak.DataFrame(pd_df), pd_df
+
+
+class TestLazyFrame:
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_filter_select_assign(self, size):
+        df, pd_df = make_frames(size)
+        lf = (
+            df.lazy()
+            .assign(kb=ak.col("bytes") / 1000)
+            .filter((ak.col("port") == 22) & (ak.col("bytes") > 100))
+            .select(["src", "kb"])
+        )
+        result = lf.collect().to_pandas()
+        pd_sel = pd_df[(pd_df["port"] == 22) & (pd_df["bytes"] > 100)]
+        assert result["src"].to_list() == pd_sel["src"].to_list()
+        assert np.allclose(result["kb"].values, pd_sel["bytes"].values / 1000)
+        assert lf.columns == ["src", "kb"]
+
+        # the source DataFrame is not modified by assignments
+        assert "kb" not in df.columns.values
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_groupby_agg(self, size):
+        df, pd_df = make_frames(size)
+        lf = (
+            df.lazy()
+            .filter(ak.col("port").isin([21, 23]))
+            .groupby("src")
+            .agg({"bytes": "sum"}, weight_max=("weight", "max"))
+        )
+        result = lf.collect().to_pandas()
+        expected = (
+            pd_df[pd_df["port"].isin([21, 23])]
+            .groupby("src")
+            .agg(bytes=("bytes", "sum"), weight_max=("weight", "max"))
+            .reset_index()
+        )
+        assert result["src"].to_list() == expected["src"].to_list()
+        assert result["bytes"].to_list() == expected["bytes"].to_list()
+        assert np.allclose(result["weight_max"].values, expected["weight_max"].values)
+
+    def test_merge(self):
+        left = ak.DataFrame({"k": ak.array([1, 2, 3, 4]), "a": ak.array([10, 20, 30, 40])})
+        right = ak.DataFrame({"k": ak.array([2, 3, 4, 5]), "a": ak.array([5, 6, 7, 8])})
+        lf = left.lazy().merge(right.lazy(), on="k").filter(ak.col("k") > 2).select(["k", "a_y"])
+        result = lf.collect()
+        assert sorted(zip(result["k"].to_list(), result["a_y"].to_list())) == [(3, 6), (4, 7)]
+
+        plan = lf.explain()
+        # the join-key predicate is pushed into both scans
+        assert plan.count("predicate=(col('k') > 2)") == 2
+
+    def test_pushdown_plan(self):
+        df, _ = make_frames(10)
+        lf = (
+            df.lazy()
+            .assign(unused=ak.col("weight") * 2)
+            .filter(ak.col("port") == 22)
+            .groupby("src")
+            .agg(total=("bytes", "sum"))
+        )
+        plan = lf.explain().splitlines()
+        assert plan[0].startswith("Aggregate")
+        assert plan[1].strip() == (
+            "Scan DataFrame columns=['src', 'bytes'] predicate=(col('port') == 22)"
+        )
+        assert "Assign" in lf.explain(optimized=False)
+
+    def test_scan_parquet(self, lazy_test_base_tmp):
+        df, pd_df = make_frames(100)
+        with tempfile.TemporaryDirectory(dir=lazy_test_base_tmp) as tmp_dirname:
+            file_name = f"{tmp_dirname}/lazy_pq"
+            df.to_parquet(file_name)
+            lf = ak.scan_parquet(f"{file_name}*").filter(ak.col("port") >= 23).select(["src"])
+            assert "columns=['src']" in lf.explain()
+            result = lf.collect()
+            assert result.columns.values == ["src"]
+            assert result["src"].to_list() == pd_df[pd_df["port"] >= 23]["src"].to_list()
+
+    def test_scan_hdf(self, lazy_test_base_tmp):
+        df, pd_df = make_frames(100)
+        with tempfile.TemporaryDirectory(dir=lazy_test_base_tmp) as tmp_dirname:
+            file_name = f"{tmp_dirname}/lazy_hdf"
+            df.to_hdf(file_name)
+            lf = ak.scan_hdf(f"{file_name}*").filter(ak.col("src") < 5)
+            result = lf.groupby("port").agg(n=("bytes", "count")).collect().to_pandas()
+            expected = pd_df[pd_df["src"] < 5].groupby("port")["bytes"].count()
+            assert result["port"].to_list() == expected.index.to_list()
+            assert result["n"].to_list() == expected.to_list()
+
+    def test_errors(self):
+        df, _ = make_frames(10)
+        with pytest.raises(TypeError):
+            df.lazy().filter(df["src"] > 3)
+        with pytest.raises(ValueError):
+            df.lazy().groupby("src").agg(x=("bytes", "bogus"))
+        with pytest.raises(ValueError):
+            df.lazy().merge(df.lazy())
+        with pytest.raises(ValueError):
+            ak.scan_parquet("file", datasets=["a"])
@@ -594,6 +594,34 @@ class TestNumeric:
         with pytest.raises(TypeError):
             ak.value_counts([0])
 
+    @pytest.mark.parametrize("method", ["exact", "sketch"])
+    def test_top_k_frequent(self, method):
+        counts = [50, 40, 30, 20, 10, 5]
+        np_ints = np.random.permutation(np.repeat(np.array([-7, 3, 11, 0, 2**40, 9]), counts))
+        pda = ak.array(np_ints)
+        vals, cnts = ak.top_k_frequent(pda, 3, method=method)
+        assert vals.to_list() == [-7, 3, 11]
+        assert cnts.to_list() == [50, 40, 30]
+
+        vals, cnts = ak.top_k_frequent(ak.cast(pda, ak.float64) / 2, 2, method=method)
+        assert vals.to_list() == [-3.5, 1.5]
+        assert cnts.to_list() == [50, 40]
+
+        strs = ak.array([f"s{i}" for i in np_ints])
+        vals, cnts = ak.top_k_frequent(strs, 2, method=method)
+        assert vals.to_list() == ["s-7", "s3"]
+        assert cnts.to_list() == [50, 40]
+
+        vals, cnts = ak.top_k_frequent(ak.Categorical(strs), 10, method=method)
+        assert vals.to_list() == [f"s{i}" for i in [-7, 3, 11, 0, 2**40, 9]]
+        assert cnts.to_list() == counts
+
+    def test_top_k_frequent_error(self):
+        with pytest.raises(ValueError):
+            ak.top_k_frequent(ak.arange(10), 0)
+        with pytest.raises(ValueError):
+            ak.top_k_frequent(ak.arange(10), 3, method="approx")
+
     def test_isnan(self):
         """
         Test isnan; it returns a pdarray of element-wise T/F values for whether it is NaN
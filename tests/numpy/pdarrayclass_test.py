@@ -1,6 +1,7 @@
 from typing import Optional, Tuple, Union
 
 import numpy as np
+import pandas as pd
 import pytest
 
 import arkouda as ak
@@ -465,6 +466,110 @@ class TestPdarrayClass:
             ak_assert_almost_equivalent(np.std(nda, ddof=1, axis=axis), pda.std(ddof=1, axis=axis))
             ak.assert_almost_equivalent(np.std(nda, ddof=1, axis=axis), ak.std(pda, ddof=1, axis=axis))
 
+    def test_stats(self):
+        a = ak.arange(10)
+        assert a.stats.is_sorted and a.stats.min == 0 and a.stats.max == 9
+        assert a.stats.nunique == 10 and a.stats.has_nan is False
+
+        # in-place modification discards the statistics
+        a[0] = 20
+        assert a.stats.is_sorted is None and a.stats.min is None
+        assert not a.is_sorted()
+        assert a.stats.is_sorted is False
+        assert a.max() == 20 and a.stats.max == 20
+        a += 1
+        assert a.stats.max is None
+        assert a.max() == 21
+
+        b = ak.array([3.0, np.nan, 1.0])
+        stats = b.compute_stats()
+        assert stats.has_nan and stats.is_sorted is False and stats.nunique is None
+
+        # sorting records the sort and keeps the other statistics
+        s = ak.sort(a)
+        assert s.stats.is_sorted and s.stats.max == 21
+        assert ak.sort(s).to_list() == s.to_list()
+        assert ak.argsort(s).to_list() == list(range(10))
+
+        c = ak.array([1, 1, 2, 5, 5, 5])
+        assert c.compute_stats().nunique == 3
+        g = ak.GroupBy(c)
+        assert g.assume_sorted
+        assert g.unique_keys.to_list() == [1, 2, 5]
+        assert g.size()[1].to_list() == [2, 1, 3]
+
+        f = ak.array([0.5, 1.5, 0.5])
+        f.compute_stats()
+        assert f.stats.has_nan is False
+        assert ak.GroupBy(f).unique_keys.to_list() == [0.5, 1.5]
+        assert f.stats.nunique == 2
+
+    def test_stats_in_place_functions(self):
+        # putmask and shuffle modify their argument in place, so they discard its statistics
+        a = ak.arange(10)
+        ak.putmask(a, a < 3, ak.array([20]))
+        assert a.stats.is_sorted is None and a.stats.min is None
+        assert a.min() == 3 and a.max() == 20
+        assert ak.sort(a).to_list() == [3, 4, 5, 6, 7, 8, 9, 20, 20, 20]
+        assert ak.argsort(a).to_list() == [3, 4, 5, 6, 7, 8, 9, 0, 1, 2]
+        assert ak.GroupBy(a).unique_keys.to_list() == [3, 4, 5, 6, 7, 8, 9, 20]
+
+        b = ak.arange(100)
+        ak.random.default_rng(pytest.seed).shuffle(b)
+        assert b.stats.is_sorted is None
+        assert ak.sort(b).to_list() == list(range(100))
+        assert ak.argsort(b).to_list() == np.argsort(b.to_ndarray()).tolist()
+        g = ak.GroupBy(b)
+        assert g.unique_keys.to_list() == list(range(100))
+        assert b[g.permutation].to_list() == list(range(100))
+
+    def test_known_sortedness(self):
+        a = ak.arange(20)
+        assert a.is_known_sorted and a.is_known_unique
+        assert a[3:15:2].is_known_sorted and a[3:15:2].is_known_unique
+        assert not a[::-1].is_known_sorted and a[::-1].is_known_unique
+        m = a[a % 3 == 0]
+        assert m.is_known_sorted and m.is_known_unique
+        assert m.to_list() == list(range(0, 20, 3))
+        assert not ak.array([1, 2, 3]).is_known_sorted
+
+        # ordered concatenation of sorted, non-overlapping arrays
+        lo, hi = ak.arange(5), ak.arange(5, 10)
+        c = ak.concatenate([lo, hi])
+        assert c.is_known_sorted and c.is_known_unique
+        assert c.stats.min == 0 and c.stats.max == 9
+        c = ak.concatenate([lo, ak.arange(4, 10)])
+        assert c.is_known_sorted and not c.is_known_unique
+        assert not ak.concatenate([hi, lo]).is_known_sorted
+
+        u = ak.unique(ak.array([5, 3, 5, 1]))
+        assert u.to_list() == [1, 3, 5]
+        assert u.is_known_sorted and u.is_known_unique
+        assert ak.unique(u).to_list() == [1, 3, 5]
+        assert ak.coargsort([u, ak.array([9, 0, 4])]).to_list() == [0, 1, 2]
+        assert ak.is_cosorted([u, ak.array([9, 0, 4])])
+
+        # set operations on known unique inputs, compared to numpy
+        x, y = ak.arange(0, 20, 2), ak.arange(0, 20, 3)
+        nx, ny = x.to_ndarray(), y.to_ndarray()
+        assert ak.intersect1d(x, y).to_list() == np.intersect1d(nx, ny).tolist()
+        assert ak.setdiff1d(x, y).to_list() == np.setdiff1d(nx, ny).tolist()
+        assert ak.setxor1d(x, y).to_list() == np.setxor1d(nx, ny).tolist()
+        assert ak.union1d(x, y).to_list() == np.union1d(nx, ny).tolist()
+        v = ak.union1d(ak.arange(10, 15), ak.arange(5))
+        assert v.to_list() == list(range(5)) + list(range(10, 15))
+        assert v.is_known_sorted and v.is_known_unique
+
+        # the statistics of a Datetime follow in-place changes to it
+        d = ak.Datetime(pd.date_range("2024-01-01", periods=5, freq="D"))
+        assert d.is_known_sorted and d.is_known_unique
+        d[0] = pd.Timestamp("2030-01-01")
+        assert not d.is_known_sorted
+        assert ak.argsort(d).to_list() == [1, 2, 3, 4, 0]
+        d -= ak.Timedelta(ak.array([0, 0, 0, 0, 10**9]))
+        assert ak.argsort(d).to_list() == [1, 2, 3, 4, 0]
+        assert d.stats.min is None
+
     @pytest.mark.parametrize(
         "data,expected",
         [
@@ -234,6 +234,37 @@ class TestSetOps:
         stringsTwo = ak.Categorical(ak.array(["String {}".format(i % 2) for i in range(10)]))
         assert [(x % 3) < 2 for x in range(10)] == ak.in1d(stringsOne, stringsTwo).to_list()
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64])
+    def test_in1d_bloom(self, size, dtype):
+        a, b = self.make_np_arrays(size, dtype)
+        pda, pdb = ak.array(a), ak.array(b)
+        expected = ak.in1d(pda, pdb)
+        assert ak.in1d(pda, pdb, method="bloom").to_list() == expected.to_list()
+        assert ak.in1d(pda, pdb, method="bloom", invert=True).to_list() == (~expected).to_list()
+
+        # a filter passed as the second argument is reused
+        bf = ak.BloomFilter(pdb)
+        assert ak.in1d(pda, bf).to_list() == expected.to_list()
+
+        s1 = ak.array([str(x) for x in a])
+        s2 = ak.array([str(x) for x in b])
+        assert (
+            ak.in1d([s1, pda], [s2, pdb], method="bloom").to_list()
+            == ak.in1d([s1, pda], [s2, pdb]).to_list()
+        )
+
+        with pytest.raises(ValueError):
+            ak.in1d(pda, pdb, method="bloom", symmetric=True)
+        with pytest.raises(ValueError):
+            ak.in1d(pda, pdb, method="table")
+
+        # int64 and uint64 values are not compared, as -1 would match 2**64-1
+        with pytest.raises(TypeError):
+            ak.in1d(ak.array([-1]), ak.array([2**64 - 1], dtype=ak.uint64), method="bloom")
+        with pytest.raises(TypeError):
+            ak.BloomFilter(ak.array([2**64 - 1], dtype=ak.uint64)).in1d(ak.array([-1]))
+
     @pytest.mark.parametrize("size", pytest.prob_size)
     @pytest.mark.parametrize("dtype", INTEGRAL_TYPES)
     def test_intersect1d_multiarray_numeric_types(self, size, dtype):
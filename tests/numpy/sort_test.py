@@ -130,6 +130,104 @@ class TestSort:
         for npa in neg_arr, pos_arr:
             assert np.allclose(np.sort(npa), ak.sort(ak.array(npa), algo).to_ndarray(), equal_nan=True)
 
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_argsort_auto(self, size):
+        rng = np.random.default_rng(17)
+        runs = np.concatenate(
+            [np.sort(rng.integers(0, 50, size // 3)), np.sort(rng.integers(0, 50, size))]
+        )
+        cases = [
+            np.arange(size),  # presorted
+            runs,  # two sorted runs with ties across them
+            rng.integers(2**60, 2**60 + 1000, size),  # narrow range of wide values
+            rng.integers(-(2**63), 2**63 - 1, size, dtype=np.int64),
+            rng.integers(0, 2**64 - 1, size, dtype=np.uint64),
+            rng.integers(0, 10, 100),  # small
+            rng.uniform(-1, 1, size),
+        ]
+        for npa in cases:
+            pda = ak.array(npa)
+            expected = np.argsort(npa, kind="stable").tolist()
+            assert ak.argsort(pda, "auto").to_list() == expected
+            assert ak.argsort(pda, SortingAlgorithm.Auto).to_list() == expected
+            if npa.dtype != np.float64:
+                assert ak.sort(pda, "auto").to_list() == np.sort(npa).tolist()
+
+        a = ak.array(runs)
+        b = ak.array(rng.integers(0, 5, runs.size))
+        expected = np.lexsort([b.to_ndarray(), runs]).tolist()
+        assert ak.coargsort([a, b], "auto").to_list() == expected
+
+        with pytest.raises(ValueError):
+            ak.argsort(a, "quicksort")
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_argsort_mem_budget(self, size):
+        rng = np.random.default_rng(5)
+        heavy = rng.integers(0, 1000, size)
+        heavy[rng.random(size) < 0.5] = 7  # one key in its own bucket
+        floats = rng.uniform(-1, 1, size)
+        floats[::97] = np.nan
+        cases = [
+            rng.integers(-(2**40), 2**40, size),
+            rng.integers(0, 2**64 - 1, size, dtype=np.uint64),
+            heavy,
+            floats,
+            np.arange(size)[::-1].copy(),
+        ]
+        # a budget for about a tenth of the keys per batch
+        budget = max(1, size // 10) * 56
+        for npa in cases:
+            pda = ak.array(npa)
+            expected = np.argsort(npa, kind="stable").tolist()
+            assert ak.argsort(pda, mem_budget=budget).to_list() == expected
+            assert pda.argsort(mem_budget=budget).to_list() == expected
+
+        with pytest.raises(ValueError):
+            ak.argsort(ak.arange(10)[::-1], mem_budget=0)
+
+        # budgets that cannot be honoured raise instead of being ignored
+        for unsupported in (
+            ak.array(["b", "a"]),
+            ak.Categorical(ak.array(["b", "a"])),
+            ak.array([2**70, 1], dtype=ak.bigint),
+        ):
+            with pytest.raises(ValueError):
+                ak.argsort(unsupported, mem_budget=budget)
+        with pytest.raises(RuntimeError):
+            ak.argsort(ak.randint(0, 2**40, 1000, seed=1), mem_budget=1)
+
+    @pytest.mark.parametrize("size", pytest.prob_size)
+    def test_merge_sorted(self, size):
+        rng = np.random.default_rng(6)
+        sizes = [size // 2, 0, size // 3, 1, size - size // 2 - size // 3 - 1]
+        floats = [np.sort(rng.uniform(-1, 1, n)) for n in sizes]
+        floats[0][-3:] = np.nan  # NaNs go last, as ak.sort leaves them
+        cases = [
+            [np.sort(rng.integers(0, 100, n)) for n in sizes],
+            [np.sort(rng.integers(0, 2**64 - 1, n, dtype=np.uint64)) for n in sizes],
+            floats,
+        ]
+        for parts in cases:
+            expected = np.argsort(np.concatenate(parts), kind="stable")
+            merged, perm = ak.merge_sorted([ak.array(p) for p in parts])
+            assert perm.to_list() == expected.tolist()
+            assert np.allclose(merged.to_ndarray(), np.concatenate(parts)[expected], equal_nan=True)
+
+        words = [np.sort(rng.choice(["a", "ab", "b", "ba", "c"], n)) for n in sizes]
+        expected = np.argsort(np.concatenate(words), kind="stable")
+        merged, perm = ak.merge_sorted([ak.array(w) for w in words])
+        assert perm.to_list() == expected.tolist()
+        assert merged.to_list() == np.concatenate(words)[expected].tolist()
+
+        times = [np.sort(rng.integers(0, 10**15, n)) for n in sizes]
+        merged = ak.merge_sorted([ak.Datetime(ak.array(t)) for t in times], return_permutation=False)
+        assert isinstance(merged, ak.Datetime)
+        assert merged.values.to_list() == np.sort(np.concatenate(times), kind="stable").tolist()
+
+        with pytest.raises(TypeError):
+            ak.merge_sorted([ak.arange(3), ak.array(["a", "b"])])
+
     @pytest.mark.parametrize("size", pytest.prob_size)
     @pytest.mark.parametrize("dtype", [ak.float64, ak.int64, ak.bigint, ak.uint64])
     @pytest.mark.parametrize("v_shape", [(), (10,), (4, 5), (2, 2, 3)])
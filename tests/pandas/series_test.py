@@ -169,6 +169,16 @@ class TestSeries:
         assert val_sort.index.to_pandas().tolist() == perm.to_list()
         assert val_sort.values.to_list() == ordered.to_list()
 
+    @pytest.mark.parametrize("dtype", [ak.int64, ak.uint64, ak.float64])
+    @pytest.mark.parametrize("ascending", [True, False])
+    def test_sort_values_limit(self, dtype, ascending):
+        s = ak.Series(ak.cast(ak.randint(0, 20, 100, seed=7), dtype))
+        full = s.sort_values(ascending=ascending)
+        for limit in [0, 1, 25, 100, 200]:
+            top = s.sort_values(ascending=ascending, limit=limit)
+            assert top.values.to_list() == full.values.to_list()[:limit]
+            assert top.index.to_list() == full.index.to_list()[:limit]
+
     @pytest.mark.parametrize("dtype", DTYPES)
     def test_head_tail(self, dtype):
         n = 10
@@ -712,6 +722,47 @@ class TestSeries:
         s2[ak.array(["A", "C", "F"])] = [10, 11, 12]
         assert s2.values.to_list() == _s2.values.tolist()
 
+    def test_loc_sorted_index(self):
+        labels = [1, 3, 3, 4, 8, 9]
+        data = [10, 11, 12, 13, 14, 15]
+        s = ak.Series(index=ak.array(labels), data=ak.array(data))
+        _s = pd.Series(index=np.array(labels), data=np.array(data))
+        assert s.index._sorted_values() is not None
+
+        for key in ([3, 8], [9, 1, 3]):
+            assert s.loc[key].index.to_list() == _s.loc[key].index.tolist()
+            assert s.loc[key].values.to_list() == _s.loc[key].values.tolist()
+        assert s.loc[4] == 13
+        assert (
+            s.index.lookup(ak.array([3, 9, 5])).to_list()
+            == ak.in1d(s.index.values, ak.array([3, 9, 5])).to_list()
+        )
+        with pytest.raises(KeyError):
+            s.loc[[5]]
+
+        for key in (
+            slice(3, 8),
+            slice(2, 5),
+            slice(None, 3),
+            slice(4, None),
+            slice(1, 9, 2),
+            slice(1.5, None),
+            slice(None, 7.5),
+            slice(2.5, 3.5),
+        ):
+            assert s.loc[key].index.to_list() == _s.loc[key].index.tolist()
+            assert s.loc[key].values.to_list() == _s.loc[key].values.tolist()
+
+        dt = ak.Series(
+            index=ak.Datetime(pd.date_range("2024-01-01", periods=5, freq="D")), data=ak.arange(5)
+        )
+        assert dt.loc["2024-01-02":"2024-01-04"].values.to_list() == [1, 2, 3]
+
+        unsorted = ak.Series(index=ak.array([3, 1, 2]), data=ak.arange(3))
+        assert unsorted.loc[[1, 3]].values.to_list() == [1, 0]
+        with pytest.raises(KeyError):
+            unsorted.loc[1:2]
+
     def test_iloc(self):
         floats = [0.0, 1.5, 0.5, 1.5, -1.0]
         strings = ["A", "C", "C", "DE", "Z"]